@@ -1,8 +1,107 @@
-from sqlalchemy import create_engine
+"""
+Database engines and sessions.
+
+The engine is configured for the backend named in ``DATABASE_URL``:
+
+- SQLite: WAL journal (readers no longer block on a writer), a busy timeout
+  so concurrent writers wait instead of failing with "database is locked",
+  and ``synchronous=NORMAL`` (safe with WAL); connections may be shared
+  across threads
+- PostgreSQL (and other servers): a sized connection pool with overflow,
+  pre-ping to drop dead connections and periodic recycling
+
+``DATABASE_READ_URL`` optionally points at a read replica; ``get_read_db``
+(used by GET routes) then reads from it, while ``get_db`` always uses the
+primary. Without it both use the primary.
+"""
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker
 import os
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./test.db")
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+
+
+def _configure_sqlite(engine: Engine, wal: bool) -> None:
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if wal:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        cursor.close()
+
+
+def build_engine(url: str, **kwargs) -> Engine:
+    """
+    Create an engine tuned for the database backend in ``url``.
+
+    Args:
+        url: SQLAlchemy database URL
+        **kwargs: Extra ``create_engine`` arguments (override the defaults)
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        in_memory = parsed.database in (None, "", ":memory:") or parsed.query.get("mode") == "memory"
+        options = {
+            "connect_args": {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+            **kwargs,
+        }
+        engine = create_engine(url, **options)
+        # WAL needs a file; in-memory databases keep the default journal
+        _configure_sqlite(engine, wal=not in_memory)
+        return engine
+    options = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+        **kwargs,
+    }
+    return create_engine(url, **options)
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+
+engine = build_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+read_engine = build_engine(DATABASE_READ_URL) if DATABASE_READ_URL else engine
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine) if DATABASE_READ_URL else SessionLocal
+
+
+def get_db():
+    """FastAPI dependency: a session on the primary database."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_db():
+    """FastAPI dependency for read-only routes: a session on the replica, if configured."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def init_db():
+    """Create missing tables and indexes (indexes added to existing tables too)."""
+    from app.models.company import Base
+
+    Base.metadata.create_all(bind=engine)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
@@ -15,14 +15,21 @@ from app.views.hpi_calculator import router as hpi_router
 from app.views.global_hiring_score import router as ghs_router
 from app.views.telegram_teaser import router as telegram_teaser_router
 from app.views.intent_classification_engine import router as intent_engine_router
+from app.views.jobs import router as jobs_router
+from app.views.cache import router as cache_router
+from app.views.metrics import router as metrics_router
+from app.utils.request_metrics import RequestMetricsMiddleware
 
 
+from app.db.session import init_db
 from app.tasks.scheduler import start_scheduler
 
 app = FastAPI()
+app.add_middleware(RequestMetricsMiddleware)
 
 @app.on_event("startup")
 def startup_event():
+    init_db()
     start_scheduler()
 
 @app.get("/")
@@ -41,3 +48,6 @@ app.include_router(ghs_router)
 app.include_router(telegram_teaser_router)
 app.include_router(intent_engine_router)
 app.include_router(osint_lead_scorer.router)
+app.include_router(jobs_router)
+app.include_router(cache_router)
+app.include_router(metrics_router)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 import datetime
 
@@ -6,6 +6,15 @@ Base = declarative_base()
 
 class Company(Base):
     __tablename__ = "companies"
+    # Keyset pagination of /companies: each index ends in (sort column, id)
+    # after the equality filters, so any page is a single index range scan
+    __table_args__ = (
+        Index("ix_companies_hiring_probability_id", "hiring_probability", "id"),
+        Index("ix_companies_region_hiring_probability_id", "region", "hiring_probability", "id"),
+        Index("ix_companies_funding_stage_hiring_probability_id", "funding_stage", "hiring_probability", "id"),
+        Index("ix_companies_region_id", "region", "id"),
+        Index("ix_companies_funding_stage_id", "funding_stage", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True)
     region = Column(String)
@@ -1,8 +1,144 @@
 from app.models.company import Company
 from app.schemas.company import CompanySchema
 from app.db.session import SessionLocal
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import base64
+import datetime
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Columns /companies can be sorted by; each has a (filter..., column, id)
+# index on Company so keyset pages are index range scans
+SORT_COLUMNS = {
+    'id': Company.id,
+    'hiring_probability': Company.hiring_probability,
+    'region': Company.region,
+    'funding_stage': Company.funding_stage,
+}
+
+
+# Default projection of scored-lead exports
+LEAD_COLUMNS = [
+    'id', 'name', 'region', 'country', 'city', 'website', 'funding_stage', 'total_funding',
+    'last_funding_amount', 'last_funding_date', 'team_size', 'hiring_probability', 'confidence',
+    'prediction_label', 'status', 'status_reason', 'predicted_at',
+]
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor is malformed or was issued for another sort."""
+
+
+def encode_cursor(sort: str, value: Any, last_id: int) -> str:
+    payload = json.dumps([sort, value, last_id], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[Any, int]:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort, value, last_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Malformed cursor: {cursor}") from e
+    if cursor_sort != sort or not isinstance(last_id, int):
+        raise InvalidCursor(f"Cursor was not issued for sort '{sort}'")
+    return value, last_id
+
+
+# Columns a bulk upload may set, with the Python type values are coerced to
+UPSERT_COLUMNS = {
+    column.key: column.type.python_type
+    for column in Company.__table__.columns
+    if column.key != 'id'
+}
+_TRUE = {'true', '1', 'yes', 'y', 't'}
+_FALSE = {'false', '0', 'no', 'n', 'f'}
+
+
+def coerce_company_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate one uploaded company and coerce its values to the column types.
+
+    Empty strings become None (CSV cells); unknown keys are ignored.
+
+    Raises:
+        ValueError: If the name is missing or a value cannot be coerced
+    """
+    values = {}
+    for key, value in row.items():
+        python_type = UPSERT_COLUMNS.get(key)
+        if python_type is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if value == '':
+                value = None
+        if value is not None and not isinstance(value, python_type):
+            if python_type is bool:
+                lowered = str(value).lower()
+                if lowered not in _TRUE | _FALSE:
+                    raise ValueError(f"{key}: not a boolean: {value!r}")
+                value = lowered in _TRUE
+            elif python_type is datetime.datetime:
+                value = datetime.datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+            elif python_type is int:
+                number = float(value)
+                if not number.is_integer():
+                    raise ValueError(f"{key}: not an integer: {value!r}")
+                value = int(number)
+            else:
+                value = python_type(value)
+        values[key] = value
+    if not values.get('name'):
+        raise ValueError("name is required")
+    return values
+
+
+def resolve_columns(columns: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Validate a column projection (all columns when empty).
+
+    Raises:
+        ValueError: On an unknown column name
+    """
+    table_columns = Company.__table__.columns
+    columns = list(columns or table_columns.keys())
+    unknown = [name for name in columns if name not in table_columns]
+    if unknown:
+        raise ValueError(f"Unknown column(s): {', '.join(unknown)}")
+    return columns
+
+
+def filter_companies(
+    statement,
+    regions: Optional[Sequence[str]] = None,
+    funding_stages: Optional[Sequence[str]] = None,
+    min_hiring_probability: Optional[float] = None,
+    max_hiring_probability: Optional[float] = None,
+    is_active: Optional[bool] = None,
+    scored_only: bool = False
+):
+    """Apply the /companies filters to an ORM query or Core select."""
+    if regions:
+        statement = statement.filter(Company.region.in_(regions))
+    if funding_stages:
+        statement = statement.filter(Company.funding_stage.in_(funding_stages))
+    if min_hiring_probability is not None:
+        statement = statement.filter(Company.hiring_probability >= min_hiring_probability)
+    if max_hiring_probability is not None:
+        statement = statement.filter(Company.hiring_probability <= max_hiring_probability)
+    if is_active is not None:
+        statement = statement.filter(Company.is_active == is_active)
+    if scored_only:
+        statement = statement.filter(Company.hiring_probability.isnot(None))
+    return statement
+
 
 # Example service for company data
 class CompanyService:
@@ -10,7 +146,204 @@ class CompanyService:
         self.db = db
 
     def get_companies(self, skip: int = 0, limit: int = 100) -> List[Company]:
-        return self.db.query(Company).offset(skip).limit(limit).all()
+        return self.db.query(Company).order_by(Company.id).offset(skip).limit(limit).all()
+
+    def list_companies(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        sort: str = 'id',
+        descending: bool = False,
+        regions: Optional[Sequence[str]] = None,
+        funding_stages: Optional[Sequence[str]] = None,
+        min_hiring_probability: Optional[float] = None,
+        max_hiring_probability: Optional[float] = None,
+        is_active: Optional[bool] = None
+    ) -> Tuple[List[Company], Optional[str]]:
+        """
+        One page of companies, filtered and sorted in the database.
+
+        Pages are keyset-paginated on (sort column, id): the cursor holds the
+        last row's values and the next page starts right after them, so it
+        costs the same at any depth. Rows without a value for the sort column
+        come after all rows that have one, in id order. ``skip`` (offset
+        paging, kept for old clients) is only honored without a cursor and
+        slows down with depth.
+
+        Returns:
+            (companies, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            InvalidCursor: If the cursor is malformed or for another sort
+        """
+        column = SORT_COLUMNS[sort]
+        query = filter_companies(self.db.query(Company), regions, funding_stages,
+                                 min_hiring_probability, max_hiring_probability, is_active)
+
+        order = (lambda expression: expression.desc()) if descending else (lambda expression: expression.asc())
+        after = (lambda left, right: left < right) if descending else (lambda left, right: left > right)
+        value, last_id = decode_cursor(cursor, sort) if cursor else (None, None)
+
+        if skip and cursor is None:
+            rows = (query.order_by(column.is_(None), order(column), order(Company.id))
+                    .offset(skip).limit(limit + 1).all())
+        elif sort == 'id':
+            page_query = query if last_id is None else query.filter(after(Company.id, last_id))
+            rows = page_query.order_by(order(Company.id)).limit(limit + 1).all()
+        else:
+            # Portable NULLS LAST as two range scans: rows with a value, then
+            # rows without one (only reached once the first part runs out)
+            rows = []
+            if cursor is None or value is not None:
+                valued = query.filter(column.isnot(None))
+                if cursor is not None:
+                    valued = valued.filter(after(tuple_(column, Company.id), tuple_(value, last_id)))
+                rows = valued.order_by(order(column), order(Company.id)).limit(limit + 1).all()
+            if len(rows) <= limit:
+                nulls = query.filter(column.is_(None))
+                if cursor is not None and value is None:
+                    nulls = nulls.filter(after(Company.id, last_id))
+                rows += nulls.order_by(order(Company.id)).limit(limit + 1 - len(rows)).all()
+
+        page = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit and page:
+            last = page[-1]
+            next_cursor = encode_cursor(sort, getattr(last, column.key), last.id)
+        return page, next_cursor
+
+    def iter_company_rows(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        chunk_size: int = 1000,
+        **filters: Any
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield filtered companies in id order as chunks of plain dicts.
+
+        Each chunk is one Core query of the projected columns resuming after
+        the previous chunk's last id, so no ORM objects are built and memory
+        stays bounded by ``chunk_size`` however many rows match.
+
+        Args:
+            columns: Column names to include (default: all)
+            chunk_size: Rows per query
+            **filters: ``filter_companies`` keyword arguments
+
+        Raises:
+            ValueError: On an unknown column name
+        """
+        table = Company.__table__
+        columns = resolve_columns(columns)
+        selected = [table.columns[name] for name in columns]
+        if 'id' not in columns:
+            selected.append(table.c.id)
+
+        base = filter_companies(select(*selected), **filters).order_by(table.c.id).limit(chunk_size)
+        last_id = None
+        while True:
+            statement = base if last_id is None else base.where(table.c.id > last_id)
+            rows = self.db.execute(statement).mappings().all()
+            if not rows:
+                return
+            last_id = rows[-1]['id']
+            yield [{name: row[name] for name in columns} for row in rows]
+            if len(rows) < chunk_size:
+                return
+
+    def bulk_upsert_companies(self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000) -> Dict[str, Any]:
+        """
+        Insert or update many companies by name, one transaction per chunk.
+
+        Rows are written with a Core ``INSERT ... ON CONFLICT (name) DO
+        UPDATE`` (SQLite and PostgreSQL; other databases use a bulk UPDATE of
+        the existing names plus a bulk INSERT) and only the columns present in
+        a row are updated. If a chunk fails, its rows are retried one by one
+        so a bad row only fails itself. Within a chunk a repeated name keeps
+        its last row; the earlier ones are reported as ``duplicate``.
+
+        Args:
+            rows: Company dicts (JSON objects, NDJSON lines or CSV records)
+            chunk_size: Rows per transaction
+
+        Returns:
+            ``{'inserted', 'updated', 'failed', 'duplicate', 'rows': [{'row', 'name', 'status', 'error'?}]}``
+            with rows in input order (``row`` is the 0-based input index)
+        """
+        results: List[Dict[str, Any]] = []
+        chunk: List[Tuple[int, Dict[str, Any]]] = []
+        for index, row in enumerate(rows):
+            try:
+                chunk.append((index, coerce_company_row(row)))
+            except (ValueError, TypeError, AttributeError) as e:
+                results.append({'row': index, 'name': row.get('name') if isinstance(row, dict) else None,
+                                'status': 'failed', 'error': str(e)})
+            if len(chunk) >= chunk_size:
+                results.extend(self._upsert_chunk(chunk))
+                chunk = []
+        if chunk:
+            results.extend(self._upsert_chunk(chunk))
+
+        results.sort(key=lambda result: result['row'])
+        summary = {status: 0 for status in ('inserted', 'updated', 'failed', 'duplicate')}
+        for result in results:
+            summary[result['status']] += 1
+        summary['rows'] = results
+        return summary
+
+    def _upsert_chunk(self, chunk: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        latest = {values['name']: index for index, values in chunk}
+        results = [{'row': index, 'name': values['name'], 'status': 'duplicate'}
+                   for index, values in chunk if latest[values['name']] != index]
+        unique = [(index, values) for index, values in chunk if latest[values['name']] == index]
+        try:
+            statuses = self._write_rows([values for _, values in unique])
+            self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            if len(unique) == 1:
+                index, values = unique[0]
+                return results + [{'row': index, 'name': values['name'], 'status': 'failed',
+                                   'error': str(getattr(e, 'orig', None) or e)}]
+            logger.warning(f"Bulk upsert chunk failed ({e.__class__.__name__}); retrying {len(unique)} rows one by one")
+            for item in unique:
+                results.extend(self._upsert_chunk([item]))
+            return results
+        return results + [{'row': index, 'name': values['name'], 'status': status}
+                          for (index, values), status in zip(unique, statuses)]
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """Upsert rows with distinct names in the current transaction; returns inserted/updated per row."""
+        names = [values['name'] for values in rows]
+        existing = set(self.db.execute(select(Company.name).where(Company.name.in_(names))).scalars())
+        now = datetime.datetime.utcnow()
+        dialect = self.db.get_bind().dialect.name
+
+        # Executemany needs the same keys in every row: one statement per key set
+        by_keys: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for values in rows:
+            by_keys.setdefault(tuple(sorted(values)), []).append({**values, 'updated_at': values.get('updated_at') or now})
+        for keys, batch in by_keys.items():
+            keys = tuple(sorted(set(keys) | {'updated_at'}))
+            if dialect in ('sqlite', 'postgresql'):
+                insert = (sqlite.insert if dialect == 'sqlite' else postgresql.insert)(Company)
+                statement = insert.on_conflict_do_update(
+                    index_elements=[Company.name],
+                    set_={key: insert.excluded[key] for key in keys if key != 'name'}
+                )
+                self.db.execute(statement, batch)
+            else:
+                updates = [values for values in batch if values['name'] in existing]
+                inserts = [values for values in batch if values['name'] not in existing]
+                if updates:
+                    ids = dict(self.db.execute(
+                        select(Company.name, Company.id).where(Company.name.in_([values['name'] for values in updates]))
+                    ).all())
+                    self.db.execute(update(Company), [{**values, 'id': ids[values['name']]} for values in updates])
+                if inserts:
+                    self.db.execute(Company.__table__.insert(), inserts)
+        return ['updated' if name in existing else 'inserted' for name in names]
 
     def get_company(self, company_id: int) -> Company:
         return self.db.query(Company).filter(Company.id == company_id).first()
@@ -1,12 +1,13 @@
 """Service for Intent Classification Engine (Orchestrator)."""
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
 import logging
 from app.services.sec_edgar_scraper_service import sec_scraper
 from app.services.osint_lead_scorer_service import osint_lead_scorer
 from app.services.intent_classifier_service import intent_classifier
 from app.services.global_hiring_score_service import global_hiring_score_calculator
+from app.utils.metrics import current_stage, stage
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -100,7 +101,8 @@ class IntentClassificationEngine:
         analysis['recommendation'] = self._generate_recommendation(analysis)
         return analysis
 
-    def run_market_scan(self, target_tickers: Optional[List[str]] = None, news_queries: Optional[List[str]] = None) -> Dict:
+    @stage('market_scan')
+    def run_market_scan(self, target_tickers: Optional[List[str]] = None, news_queries: Optional[List[str]] = None, on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
         results = {
             'scan_timestamp': datetime.now().isoformat(),
             'sec_filings': [],
@@ -111,10 +113,14 @@ class IntentClassificationEngine:
         # SEC Form D Filings
         if target_tickers:
             try:
-                filings = self.sec_scraper.scrape_recent_form_d(target_tickers, limit=10)
+                with stage('market_scan.sec_filings') as run:
+                    filings = self.sec_scraper.scrape_recent_form_d(target_tickers, limit=10)
+                    run.add_items(len(filings))
                 results['sec_filings'] = filings
             except Exception as e:
                 results['sec_filings'] = {'error': str(e)}
+            if on_progress:
+                on_progress({'stage': 'sec_filings', 'sec_filings': results['sec_filings']})
         # OSINT News
         if news_queries is None:
             news_queries = [
@@ -125,8 +131,12 @@ class IntentClassificationEngine:
         all_osint_leads = []
         for query in news_queries:
             try:
-                leads = self.osint_scorer.score_news_batch(query=query, regions=["US"], period="7d", max_results_per_region=20, min_score=30)
+                with stage('market_scan.osint_news') as run:
+                    leads = self.osint_scorer.score_news_batch(query=query, regions=["US"], period="7d", max_results_per_region=20, min_score=30)
+                    run.add_items(len(leads))
                 all_osint_leads.extend(leads)
+                if on_progress:
+                    on_progress({'stage': 'osint_leads', 'query': query, 'leads': leads})
             except Exception as e:
                 pass
         seen_urls = set()
@@ -146,6 +156,7 @@ class IntentClassificationEngine:
                     results['qualified_leads'].append(qualified_lead)
             except Exception:
                 pass
+        current_stage().add_items(len(results['qualified_leads']))
         results['summary'] = {
             'total_sec_filings': len(results['sec_filings']),
             'total_osint_leads': len(results['osint_leads']),
@@ -4,7 +4,7 @@ import logging
 import time
 import json
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 from pathlib import Path
 import re
 from urllib.parse import quote_plus
@@ -148,7 +148,7 @@ class LinkedInGoogleScraper:
         except Exception as e:
             logger.error(f"Error with Google API: {e}")
         return jobs
-    def scrape_latam_jobs(self, max_per_location: int = 10, focus_countries: Optional[List[str]] = None) -> List[Dict]:
+    def scrape_latam_jobs(self, max_per_location: int = 10, focus_countries: Optional[List[str]] = None, on_progress: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
         if focus_countries is None:
             focus_countries = ['Brazil', 'Mexico']
         all_jobs = []
@@ -175,6 +175,8 @@ class LinkedInGoogleScraper:
                         job['keywords'] = keyword
                     all_jobs.extend(jobs)
                     logger.info(f"    Found {len(jobs)} jobs")
+                    if on_progress:
+                        on_progress({'country': country, 'city': main_city, 'keywords': keyword, 'jobs': jobs})
                     time.sleep(3)
                 except Exception as e:
                     logger.error(f"Error scraping {keyword} in {main_city}: {e}")
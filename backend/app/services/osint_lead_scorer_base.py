@@ -4,7 +4,7 @@ import json
 import re
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from pathlib import Path
 from collections import defaultdict
 
@@ -233,7 +233,7 @@ class OSINTLeadScorer:
             'outsourcing_potential': len(signal_details.get('outsourcing', [])) > 0,
             'analyzed_at': datetime.now().isoformat()
         }
-    def score_news_batch(self, query: str = "tech startup funding OR expansion OR hiring", regions: List[str] = ["US"], period: str = "7d", max_results_per_region: int = 50, min_score: int = 20) -> List[Dict]:
+    def score_news_batch(self, query: str = "tech startup funding OR expansion OR hiring", regions: List[str] = ["US"], period: str = "7d", max_results_per_region: int = 50, min_score: int = 20, on_progress: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
         all_scored_leads = []
         for region in regions:
             logger.info(f"Processing region: {region}")
@@ -243,13 +243,17 @@ class OSINTLeadScorer:
                 period=period,
                 max_results=max_results_per_region
             )
+            region_leads = []
             for article in articles:
                 try:
                     scored_lead = self.score_article(article)
                     if scored_lead['growth_score'] >= min_score:
-                        all_scored_leads.append(scored_lead)
+                        region_leads.append(scored_lead)
                 except Exception as e:
                     logger.error(f"Error scoring article: {e}")
+            all_scored_leads.extend(region_leads)
+            if on_progress:
+                on_progress({'region': region, 'articles': len(articles), 'leads': region_leads})
         all_scored_leads.sort(key=lambda x: x['growth_score'], reverse=True)
         seen_companies = set()
         unique_leads = []
@@ -3,7 +3,7 @@ from bs4 import BeautifulSoup
 import time
 import re
 import logging
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List
 from urllib.parse import quote_plus
 import random
 
@@ -82,13 +82,15 @@ class LinkedInScraper:
         except Exception as e:
             result['error'] = str(e)
             return result
-    def batch_extract(self, companies: List[Dict]) -> List[Dict]:
+    def batch_extract(self, companies: List[Dict], on_progress: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
         results = []
         total = len(companies)
         for idx, company in enumerate(companies, 1):
             logger.info(f"Processing {idx}/{total}: {company['company_name']}")
             result = self.get_company_data(company['company_name'], company.get('country'))
             results.append(result)
+            if on_progress:
+                on_progress({'index': idx, 'total': total, 'result': result})
         return results
 
 class FallbackDataEnricher:
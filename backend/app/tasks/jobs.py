@@ -0,0 +1,204 @@
+"""
+Background jobs for long-running scrape and scan requests.
+
+- ``JobManager.submit`` returns a job immediately; the work runs on a
+  bounded thread pool, so request handlers never block on a scrape
+- Identical requests (same kind and parameters) share one in-flight job
+  instead of starting the same scrape twice
+- Work functions receive their job and may ``publish`` partial results,
+  which clients poll or stream (``Job.wait_for_events``)
+- Finished jobs are kept for ``ttl_seconds`` and purged lazily afterwards
+- When the pool and its pending queue are full, ``submit`` raises
+  ``JobQueueFull`` rather than queueing without bound
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFull(Exception):
+    """Raised when no more jobs can be accepted until running ones finish."""
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
+
+class Job:
+    """
+    One submitted unit of background work and its partial/final results.
+    """
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+
+    def __init__(self, kind: str, params: Dict, key: str):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.key = key
+        self.status = self.QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.events: List[Any] = []
+        self._condition = threading.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self.status in (self.SUCCEEDED, self.FAILED)
+
+    def publish(self, data: Any) -> None:
+        """Record a partial result and wake up streaming clients."""
+        with self._condition:
+            self.events.append(data)
+            self._condition.notify_all()
+
+    def _set_status(self, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        with self._condition:
+            self.status = status
+            if status == self.RUNNING:
+                self.started_at = time.time()
+            else:
+                self.result = result
+                self.error = error
+                self.finished_at = time.time()
+            self._condition.notify_all()
+
+    def wait_for_events(self, since: int, timeout: float) -> Tuple[List[Any], bool]:
+        """
+        Block until there are partial results after index ``since``, the job
+        finishes, or ``timeout`` seconds pass.
+
+        Returns:
+            ``(new_events, done)``
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: len(self.events) > since or self.done, timeout=timeout)
+            return self.events[since:], self.done
+
+    def to_dict(self, include_result: bool = True) -> Dict:
+        data = {
+            'job_id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'params': self.params,
+            'created_at': _iso(self.created_at),
+            'started_at': _iso(self.started_at),
+            'finished_at': _iso(self.finished_at),
+            'partial_results': len(self.events),
+        }
+        if include_result:
+            data['result'] = self.result
+            data['error'] = self.error
+        return data
+
+
+class JobManager:
+    """
+    Bounded background executor with in-flight deduplication and result TTL.
+    """
+
+    def __init__(self, workers: int = 4, max_pending: int = 32, ttl_seconds: float = 3600):
+        """
+        Initialize the manager.
+
+        Args:
+            workers: Jobs running at the same time
+            max_pending: Jobs waiting for a worker before submissions are refused
+            ttl_seconds: How long finished jobs (and their results) are kept
+        """
+        self.workers = max(1, workers)
+        self.max_pending = max(0, max_pending)
+        self.ttl_seconds = ttl_seconds
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='job')
+        self._jobs: Dict[str, Job] = {}
+        self._in_flight: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def job_key(kind: str, params: Dict) -> str:
+        """Stable hash of a job's kind and parameters, used for deduplication."""
+        payload = json.dumps({'kind': kind, 'params': params}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def submit(self, kind: str, params: Dict, work: Callable[[Job], Any]) -> Tuple[Job, bool]:
+        """
+        Start ``work(job)`` in the background, or join an identical in-flight job.
+
+        Args:
+            kind: Job type (e.g. 'osint-leads.score-batch')
+            params: JSON-serializable request parameters
+            work: Called on a worker thread with the job; its return value
+                becomes the job result
+
+        Returns:
+            ``(job, created)``; ``created`` is False for a deduplicated request
+
+        Raises:
+            JobQueueFull: When workers and pending slots are all taken
+        """
+        key = self.job_key(kind, params)
+        with self._lock:
+            self._purge()
+            existing = self._in_flight.get(key)
+            if existing is not None:
+                return existing, False
+            if len(self._in_flight) >= self.workers + self.max_pending:
+                raise JobQueueFull(f"{len(self._in_flight)} jobs already queued or running")
+            job = Job(kind, params, key)
+            self._jobs[job.id] = job
+            self._in_flight[key] = job
+        self._executor.submit(self._run, job, work)
+        logger.info(f"Submitted job {job.id} ({kind})")
+        return job, True
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            self._purge()
+            return self._jobs.get(job_id)
+
+    def _run(self, job: Job, work: Callable[[Job], Any]) -> None:
+        job._set_status(Job.RUNNING)
+        try:
+            result = work(job)
+        except Exception as e:
+            logger.exception(f"Job {job.id} ({job.kind}) failed")
+            status, result, error = Job.FAILED, None, str(e)
+        else:
+            status, error = Job.SUCCEEDED, None
+        with self._lock:
+            self._in_flight.pop(job.key, None)
+        job._set_status(status, result, error)
+        logger.info(f"Job {job.id} ({job.kind}) {status}")
+
+    def _purge(self) -> None:
+        """Drop finished jobs older than the TTL (caller holds the lock)."""
+        cutoff = time.time() - self.ttl_seconds
+        expired = [job_id for job_id, job in self._jobs.items() if job.done and job.finished_at <= cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+job_manager = JobManager(
+    workers=int(os.getenv('JOB_WORKERS', 4)),
+    max_pending=int(os.getenv('JOB_MAX_PENDING', 32)),
+    ttl_seconds=float(os.getenv('JOB_TTL_SECONDS', 3600))
+)
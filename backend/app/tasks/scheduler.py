@@ -1,24 +1,82 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from app.services.linkedin_google_scraper import LinkedInGoogleScraper
 from app.services.sec_rss_scraper import SECRSSFeedScraper
+from app.tasks.work_queue import RunInProgress, ScrapeWorkQueue, WorkItem
+from app.utils.seen_job_filter import SeenJobFilter
 import logging
+import os
+import threading
 
 logger = logging.getLogger(__name__)
 
 scheduler = BackgroundScheduler()
 
+
+def build_linkedin_work_items(scraper: LinkedInGoogleScraper, max_results: int = 5):
+    """One work item per (city, keyword) search, tagged for yield-based priority."""
+    return [
+        WorkItem(
+            key=f"{country}:{city}:{keyword}",
+            payload={'keyword': keyword, 'city': city, 'country': country, 'max_results': max_results},
+            host='www.google.com',
+            tags={'city': city, 'keyword': keyword}
+        )
+        for country, cities in scraper.LATAM_LOCATIONS.items()
+        for city in cities
+        for keyword in scraper.JOB_KEYWORDS
+    ]
+
+
+def build_linkedin_queue() -> ScrapeWorkQueue:
+    """Work queue of the LinkedIn scrape, configured from the environment."""
+    return ScrapeWorkQueue(
+        'linkedin_scrape',
+        state_dir=os.getenv('SCHEDULER_STATE_DIR', 'data/scheduler'),
+        workers=int(os.getenv('SCRAPE_WORKERS', 4)),
+        per_host=int(os.getenv('SCRAPE_PER_HOST', 1)),
+        min_interval=float(os.getenv('SCRAPE_MIN_INTERVAL', 3.0)),
+        resume_window=float(os.getenv('SCRAPE_RESUME_WINDOW_HOURS', 20)) * 3600
+    )
+
+
 # Example: scrape LinkedIn jobs every day at 2am
-@scheduler.scheduled_job('cron', hour=2)
+@scheduler.scheduled_job('cron', hour=2, max_instances=1, coalesce=True)
 def scheduled_linkedin_scrape():
     scraper = LinkedInGoogleScraper()
-    for country, cities in scraper.LATAM_LOCATIONS.items():
-        for city in cities:
-            for keyword in scraper.JOB_KEYWORDS:
-                jobs = scraper.search_linkedin_jobs(keyword, city, max_results=5)
-                logger.info(f"Scraped {len(jobs)} jobs for {keyword} in {city}")
+    queue = build_linkedin_queue()
+    # Tracks postings this job has already reported; kept apart from the ghost
+    # pusher's filter, which only marks postings once they reach Supabase
+    seen_filter = SeenJobFilter(
+        os.getenv('SCHEDULER_SEEN_JOBS_FILTER_PATH', os.path.join(queue.state_dir, 'seen_linkedin_jobs.json'))
+    )
+    filter_lock = threading.Lock()
+
+    def search(payload):
+        jobs = scraper.search_linkedin_jobs(payload['keyword'], payload['city'], max_results=payload['max_results'])
+        with filter_lock:
+            fresh = seen_filter.filter_new(jobs)
+            seen_filter.mark_seen(fresh)
+        logger.info(f"Scraped {len(jobs)} jobs for {payload['keyword']} in {payload['city']} ({len(fresh)} new)")
+        return fresh
+
+    try:
+        summary = queue.run(build_linkedin_work_items(scraper), search)
+    except RunInProgress as e:
+        logger.warning(f"Skipping LinkedIn scrape: {e}")
+        return
+    finally:
+        seen_filter.save()
+
+    stats = seen_filter.get_stats()
+    logger.info(
+        f"LinkedIn scrape: {summary['completed_items']} searches done, {summary['failed_items']} failed, "
+        f"{summary['total_results']} new jobs, {stats['seen']} already seen; "
+        f"filter holds {stats['postings']} postings in {stats['memory_bytes']} bytes "
+        f"(est. false-positive rate {stats['estimated_fpr']:.5f})"
+    )
 
 # Example: fetch SEC Form D filings every day at 3am
-@scheduler.scheduled_job('cron', hour=3)
+@scheduler.scheduled_job('cron', hour=3, max_instances=1, coalesce=True)
 def scheduled_sec_scrape():
     scraper = SECRSSFeedScraper()
     filings = scraper.fetch_form_d_filings()
@@ -26,3 +84,8 @@ def scheduled_sec_scrape():
 
 def start_scheduler():
     scheduler.start()
+    # The cron only fires at 2am, by when an interrupted run is past its resume
+    # window: finish it now instead
+    if build_linkedin_queue().has_resumable_run():
+        logger.info("Resuming the interrupted LinkedIn scrape")
+        scheduler.add_job(scheduled_linkedin_scrape, id='linkedin_scrape_catch_up', replace_existing=True)
@@ -0,0 +1,301 @@
+"""
+Persistent priority work queue for scheduled scraping jobs.
+
+- Work items carry tags (e.g. city, keyword); priority is the product of the
+  learned yield (results per item, EWMA) of each tag, so productive cities and
+  keywords are searched first and unseen ones are tried optimistically
+- A worker pool drains the queue under per-host concurrency limits with a
+  minimum interval between requests to the same host
+- A non-blocking file lock prevents overlapping runs of the same job, also
+  across processes (several API workers each start the scheduler)
+- Completed items are persisted as they finish; a run interrupted by a
+  restart resumes with the remaining items instead of starting over, as
+  long as it started within the resume window (an older unfinished run is
+  dropped, so failing items cannot hold back the next scheduled sweep).
+  ``has_resumable_run`` tells a restarted scheduler to catch up right away
+- Tag yields are learned from every run's completed items, even when some
+  items failed
+- Per-item and per-run metrics are kept in the state file
+"""
+
+import heapq
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: overlap prevention is per process only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_DIR = 'data/scheduler'
+# Shorter than the daily schedule, so each cron window gets a fresh run
+DEFAULT_RESUME_WINDOW = 20 * 3600
+
+
+class RunInProgress(Exception):
+    """Raised when another run of the same job holds the lock."""
+
+
+class WorkItem:
+    """
+    One unit of scheduled work (e.g. a search for keyword in city).
+    """
+
+    def __init__(self, key: str, payload: Dict, host: str = 'default', tags: Optional[Dict[str, str]] = None):
+        self.key = key
+        self.payload = payload
+        self.host = host
+        self.tags = tags or {}
+        self.priority = 1.0
+
+    def __lt__(self, other: 'WorkItem') -> bool:
+        # heapq is a min-heap: higher priority first, key as a stable tie-breaker
+        return (-self.priority, self.key) < (-other.priority, other.key)
+
+
+class HostLimiter:
+    """
+    Per-host concurrency limit with a minimum interval between request starts.
+    """
+
+    def __init__(self, per_host: int = 1, min_interval: float = 0.0):
+        self.per_host = max(1, per_host)
+        self.min_interval = min_interval
+        self._semaphores: Dict[str, threading.Semaphore] = {}
+        self._last_start: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str) -> None:
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.Semaphore(self.per_host))
+        semaphore.acquire()
+        while True:
+            with self._lock:
+                wait = self.min_interval - (time.monotonic() - self._last_start.get(host, float('-inf')))
+                if wait <= 0:
+                    self._last_start[host] = time.monotonic()
+                    return
+            time.sleep(wait)
+
+    def release(self, host: str) -> None:
+        self._semaphores[host].release()
+
+
+class ScrapeWorkQueue:
+    """
+    Priority work queue with a worker pool, host limits, overlap prevention
+    and resumable progress for one scheduled job.
+    """
+
+    def __init__(
+        self,
+        job_name: str,
+        state_dir: str = DEFAULT_STATE_DIR,
+        workers: int = 4,
+        per_host: int = 1,
+        min_interval: float = 0.0,
+        yield_alpha: float = 0.3,
+        resume_window: Optional[float] = DEFAULT_RESUME_WINDOW
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            job_name: Name of the scheduled job (state and lock file names)
+            state_dir: Directory for state and lock files
+            workers: Worker pool size
+            per_host: Max in-flight items per host
+            min_interval: Minimum seconds between item starts per host
+            yield_alpha: EWMA weight of the latest run in tag yields
+            resume_window: Max age in seconds of an unfinished run that is
+                resumed; older ones are replaced by a fresh run (None: no limit)
+        """
+        self.job_name = job_name
+        self.state_dir = Path(state_dir)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.state_path = self.state_dir / f'{job_name}_state.json'
+        self.lock_path = self.state_dir / f'{job_name}.lock'
+        self.workers = max(1, workers)
+        self.host_limiter = HostLimiter(per_host, min_interval)
+        self.yield_alpha = yield_alpha
+        self.resume_window = resume_window
+
+        self._state_lock = threading.Lock()
+        self._process_lock = threading.Lock()
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict:
+        if self.state_path.exists():
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read queue state {self.state_path}: {e}")
+        return {'run': None, 'yields': {}, 'last_run': None}
+
+    def _save_state(self) -> None:
+        tmp_path = self.state_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+    def has_resumable_run(self) -> bool:
+        """True if an unfinished run within the resume window is waiting to be resumed."""
+        run = self.state.get('run')
+        return bool(run) and not run.get('finished_at') and not self._is_stale(run)
+
+    def tag_yield(self, tag: str, value: str) -> float:
+        """Learned results per item for a tag value (1.0 when unseen)."""
+        return self.state['yields'].get(tag, {}).get(value, 1.0)
+
+    def prioritize(self, items: List[WorkItem]) -> List[WorkItem]:
+        """Set item priorities from tag yields and return them best first."""
+        for item in items:
+            item.priority = 1.0
+            for tag, value in item.tags.items():
+                # Floor keeps zero-yield tags explorable
+                item.priority *= max(self.tag_yield(tag, value), 0.05)
+        return sorted(items)
+
+    def run(self, items: List[WorkItem], handler: Callable[[Dict], List]) -> Dict:
+        """
+        Process items, resuming an interrupted run of the same job.
+
+        Args:
+            items: All work items of the job
+            handler: Called with each item's payload; returns the item's results
+
+        Returns:
+            Run summary with per-item metrics
+
+        Raises:
+            RunInProgress: If another run of this job is still active
+        """
+        if not self._process_lock.acquire(blocking=False):
+            raise RunInProgress(f"{self.job_name} is already running")
+        lock_file = open(self.lock_path, 'w')
+        try:
+            if fcntl:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    raise RunInProgress(f"{self.job_name} is already running in another process")
+            return self._run_locked(items, handler)
+        finally:
+            lock_file.close()
+            self._process_lock.release()
+
+    def _run_locked(self, items: List[WorkItem], handler: Callable[[Dict], List]) -> Dict:
+        run = self.state.get('run')
+        if run and not run.get('finished_at') and self._is_stale(run):
+            logger.warning(f"{self.job_name}: unfinished run started {run['started_at']} is older than the "
+                           f"resume window, starting a fresh run ({len(run['items'])} items were done)")
+            run = None
+        if run and not run.get('finished_at'):
+            logger.info(f"{self.job_name}: resuming run started {run['started_at']} "
+                        f"({len(run['items'])} items already done)")
+        else:
+            run = {'started_at': datetime.utcnow().isoformat(), 'finished_at': None, 'items': {}}
+            self.state['run'] = run
+            self._save_state()
+
+        pending = [item for item in self.prioritize(items) if item.key not in run['items']]
+        heap = list(pending)
+        heapq.heapify(heap)
+        heap_lock = threading.Lock()
+        results: Dict[str, List] = {}
+
+        def worker() -> None:
+            while True:
+                with heap_lock:
+                    if not heap:
+                        return
+                    item = heapq.heappop(heap)
+                self.host_limiter.acquire(item.host)
+                started = time.monotonic()
+                error = None
+                try:
+                    item_results = handler(item.payload) or []
+                except Exception as e:
+                    logger.error(f"{self.job_name}: item {item.key} failed: {e}")
+                    item_results, error = [], str(e)
+                finally:
+                    self.host_limiter.release(item.host)
+                metrics = {
+                    'results': len(item_results),
+                    'duration_s': round(time.monotonic() - started, 3),
+                    'priority': round(item.priority, 4),
+                    'tags': item.tags,
+                    'error': error
+                }
+                with self._state_lock:
+                    results[item.key] = item_results
+                    # Failed items are not recorded, so a resumed run retries them
+                    if error is None:
+                        run['items'][item.key] = metrics
+                        self._save_state()
+
+        logger.info(f"{self.job_name}: {len(pending)} items queued, {self.workers} workers")
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for future in [executor.submit(worker) for _ in range(self.workers)]:
+                future.result()
+
+        with self._state_lock:
+            # Items completed by this call only, so resumed runs count each item once
+            completed = [run['items'][item.key] for item in pending if item.key in run['items']]
+            self._update_yields(completed)
+            failed = len(pending) - len(completed)
+            if not failed:
+                run['finished_at'] = datetime.utcnow().isoformat()
+            summary = self._summarize(run, failed)
+            self.state['last_run'] = summary
+            self._save_state()
+
+        return {**summary, 'results': results}
+
+    def _is_stale(self, run: Dict) -> bool:
+        if self.resume_window is None:
+            return False
+        try:
+            started = datetime.fromisoformat(run['started_at'])
+        except (KeyError, TypeError, ValueError):
+            return True
+        return datetime.utcnow() - started > timedelta(seconds=self.resume_window)
+
+    def _update_yields(self, metrics: List[Dict]) -> None:
+        totals: Dict[str, Dict[str, List[int]]] = {}
+        for item in metrics:
+            for tag, value in item['tags'].items():
+                count = totals.setdefault(tag, {}).setdefault(value, [0, 0])
+                count[0] += item['results']
+                count[1] += 1
+        for tag, values in totals.items():
+            yields = self.state['yields'].setdefault(tag, {})
+            for value, (found, runs) in values.items():
+                observed = found / runs
+                previous = yields.get(value)
+                yields[value] = round(observed if previous is None
+                                      else self.yield_alpha * observed + (1 - self.yield_alpha) * previous, 4)
+
+    def _summarize(self, run: Dict, failed: int) -> Dict:
+        items = list(run['items'].values())
+        durations = sorted(item['duration_s'] for item in items)
+        return {
+            'job': self.job_name,
+            'started_at': run['started_at'],
+            'finished_at': run['finished_at'],
+            'completed_items': len(items),
+            'failed_items': failed,
+            'total_results': sum(item['results'] for item in items),
+            'p50_duration_s': durations[len(durations) // 2] if durations else 0.0,
+            'max_duration_s': durations[-1] if durations else 0.0
+        }
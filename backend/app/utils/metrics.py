@@ -0,0 +1,436 @@
+# Extracted from src/metrics.py for FastAPI service use
+"""
+Metrics - Pipeline Stage and Request Timing
+-------------------------------------------
+Dependency-free metrics registry with Prometheus text exposition, shared by
+the batch pipelines and the FastAPI service:
+
+- ``Counter``, ``Gauge`` and ``Histogram`` families with labels; histograms
+  use cumulative ``le`` buckets like the Prometheus client libraries
+- ``stage(name)`` times a pipeline stage, as a context manager or a
+  decorator, and counts its runs, failures, items processed, bytes fetched
+  and cache hits/misses; code deeper in the call stack reaches the running
+  stage with ``current_stage()``
+- ``MetricsRegistry.render_prometheus`` formats everything for a
+  ``/metrics`` scrape; ``dump_json`` writes a snapshot with per-stage
+  summaries, and ``with_metrics_dump`` does so when a batch script's
+  ``main()`` returns (or exits)
+
+Families are thread-safe; the module-level ``REGISTRY`` is shared by
+everything in the process.
+"""
+
+import contextvars
+import functools
+import json
+import logging
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+CONTENT_TYPE_LATEST = 'text/plain; version=0.0.4; charset=utf-8'
+DEFAULT_METRICS_DIR = Path(__file__).parent.parent / 'data' / 'output' / 'metrics'
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if value == math.inf:
+        return '+Inf'
+    if value == -math.inf:
+        return '-Inf'
+    if math.isnan(value):
+        return 'NaN'
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(pairs: Iterable[Tuple[str, str]]) -> str:
+    rendered = ','.join(f'{name}="{_escape_label(value)}"' for name, value in pairs)
+    return f'{{{rendered}}}' if rendered else ''
+
+
+class _Family:
+    """Metric family: one name, a fixed set of label names, one series per label values."""
+
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(sorted(labels))}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _items(self) -> List[Tuple[Tuple[str, ...], object]]:
+        with self._lock:
+            return [(key, self._copy(value)) for key, value in self._series.items()]
+
+    @staticmethod
+    def _copy(value):
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class Counter(_Family):
+    """Monotonically increasing total (``*_total``)."""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        key = self._key(labels)
+        with self._lock:
+            return self._series.get(key, 0.0)
+
+    def _samples(self):
+        for key, value in self._items():
+            yield self.name, tuple(zip(self.labelnames, key)), value
+
+
+class Gauge(Counter):
+    """Value that can go up and down (set at scrape time, e.g. cache sizes)."""
+
+    kind = 'gauge'
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0.0) + amount
+
+
+class Histogram(_Family):
+    """Observations counted into cumulative ``le`` buckets, with their sum and count."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        if 'le' in labelnames:
+            raise ValueError("'le' is reserved for histogram buckets")
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets if bound != math.inf))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # Per-bucket (non-cumulative) counts, the last one is +Inf
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @staticmethod
+    def _copy(value):
+        return [list(value[0]), value[1], value[2]]
+
+    def get(self, **labels) -> Dict:
+        """Count, sum and cumulative bucket counts of one series."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._copy(self._series.get(key, [[0] * (len(self.buckets) + 1), 0.0, 0]))
+        return self._summary(series)
+
+    def _summary(self, series) -> Dict:
+        counts, total, count = series
+        cumulative, running = {}, 0
+        for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+            running += bucket_count
+            cumulative[_format_value(bound)] = running
+        return {'count': count, 'sum': total, 'buckets': cumulative}
+
+    def _samples(self):
+        for key, series in self._items():
+            labels = tuple(zip(self.labelnames, key))
+            summary = self._summary(series)
+            for bound, running in summary['buckets'].items():
+                yield f'{self.name}_bucket', labels + (('le', bound),), running
+            yield f'{self.name}_sum', labels, summary['sum']
+            yield f'{self.name}_count', labels, summary['count']
+
+
+class MetricsRegistry:
+    """Named metric families; ``counter``/``gauge``/``histogram`` get or create one."""
+
+    def __init__(self):
+        self._families: Dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, family_class, name: str, documentation: str, labelnames: Sequence[str], **options):
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = family_class(name, documentation, labelnames, **options)
+            elif type(family) is not family_class or family.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered as a {family.kind} with labels {family.labelnames}")
+            return family
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def families(self) -> List[_Family]:
+        with self._lock:
+            return list(self._families.values())
+
+    def render_prometheus(self) -> str:
+        """All families in the Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for family in self.families():
+            lines.append(f'# HELP {family.name} {family.documentation}')
+            lines.append(f'# TYPE {family.name} {family.kind}')
+            for sample_name, labels, value in family._samples():
+                lines.append(f'{sample_name}{_format_labels(labels)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> Dict:
+        """JSON-serializable copy of every series."""
+        snapshot = {}
+        for family in self.families():
+            series = []
+            for key, value in family._items():
+                labels = dict(zip(family.labelnames, key))
+                if isinstance(family, Histogram):
+                    series.append({'labels': labels, **family._summary(value)})
+                else:
+                    series.append({'labels': labels, 'value': value})
+            snapshot[family.name] = {'type': family.kind, 'help': family.documentation, 'series': series}
+        return snapshot
+
+    def clear(self) -> None:
+        """Drop all recorded series (families stay registered)."""
+        for family in self.families():
+            family.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+
+# ---------------------------------------------------------------------------
+# Pipeline stages
+# ---------------------------------------------------------------------------
+
+_current_stage: contextvars.ContextVar = contextvars.ContextVar('pulse_current_stage', default=None)
+
+
+def _stage_metrics(registry: MetricsRegistry) -> Dict:
+    # Get-or-create on the registry itself; families live exactly as long as it does
+    return {
+        'duration': registry.histogram('pulse_stage_duration_seconds', 'Pipeline stage duration.', ('stage',)),
+        'runs': registry.counter('pulse_stage_runs_total', 'Pipeline stage runs by outcome.', ('stage', 'outcome')),
+        'items': registry.counter('pulse_stage_items_total', 'Items processed by a pipeline stage.', ('stage',)),
+        'bytes': registry.counter('pulse_stage_bytes_total', 'Bytes fetched by a pipeline stage.', ('stage',)),
+        'cache_hits': registry.counter('pulse_stage_cache_hits_total', 'Cache hits in a pipeline stage.', ('stage',)),
+        'cache_misses': registry.counter('pulse_stage_cache_misses_total', 'Cache misses in a pipeline stage.', ('stage',)),
+    }
+
+
+class Stage:
+    """
+    One timed run of a pipeline stage.
+
+    Counts are added to the registry as they are reported, so a scrape
+    during a long stage sees its progress; the duration and outcome
+    (``ok``/``error``) are recorded when the stage exits.
+
+    Used as a decorator, every call of the function is a separate run.
+    """
+
+    def __init__(self, name: str, registry: Optional[MetricsRegistry] = None):
+        self.name = name
+        self.registry = registry or REGISTRY
+        self.items = 0
+        self.bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.duration: Optional[float] = None
+        self._metrics = _stage_metrics(self.registry)
+        self._started: Optional[float] = None
+        self._token = None
+
+    def add_items(self, count: int = 1) -> None:
+        self.items += count
+        self._metrics['items'].inc(count, stage=self.name)
+
+    def add_bytes(self, count: int) -> None:
+        self.bytes += count
+        self._metrics['bytes'].inc(count, stage=self.name)
+
+    def cache_hit(self, count: int = 1) -> None:
+        self.cache_hits += count
+        self._metrics['cache_hits'].inc(count, stage=self.name)
+
+    def cache_miss(self, count: int = 1) -> None:
+        self.cache_misses += count
+        self._metrics['cache_misses'].inc(count, stage=self.name)
+
+    def __enter__(self) -> 'Stage':
+        self._started = time.perf_counter()
+        self._token = _current_stage.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        self.duration = time.perf_counter() - self._started
+        _current_stage.reset(self._token)
+        self._metrics['duration'].observe(self.duration, stage=self.name)
+        self._metrics['runs'].inc(stage=self.name, outcome='error' if exc_type else 'ok')
+        return False
+
+    def __call__(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with Stage(self.name, self.registry):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def stage(name: str, registry: Optional[MetricsRegistry] = None) -> Stage:
+    """
+    Time a pipeline stage.
+
+    Example:
+        with stage('oracle.process_filings') as run:
+            for filing in filings:
+                ...
+                run.add_items()
+
+        @stage('supabase.push_artifacts')
+        def push_artifacts(...): ...
+    """
+    return Stage(name, registry)
+
+
+class _NullStage:
+    """Stand-in returned by ``current_stage`` outside any stage; discards counts."""
+
+    name = None
+
+    def add_items(self, count: int = 1) -> None:
+        pass
+
+    def add_bytes(self, count: int) -> None:
+        pass
+
+    def cache_hit(self, count: int = 1) -> None:
+        pass
+
+    def cache_miss(self, count: int = 1) -> None:
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+def current_stage():
+    """Innermost running stage in this context (a no-op stand-in outside one)."""
+    return _current_stage.get() or _NULL_STAGE
+
+
+def stage_summaries(registry: Optional[MetricsRegistry] = None) -> Dict[str, Dict]:
+    """Per-stage runs, errors, seconds, items/bytes totals, throughput and cache hit rate."""
+    metrics = _stage_metrics(registry or REGISTRY)
+    summaries: Dict[str, Dict] = {}
+    for key, series in metrics['duration']._items():
+        name = key[0]
+        timing = metrics['duration']._summary(series)
+        items = metrics['items'].value(stage=name)
+        hits = metrics['cache_hits'].value(stage=name)
+        misses = metrics['cache_misses'].value(stage=name)
+        summaries[name] = {
+            'runs': timing['count'],
+            'errors': int(metrics['runs'].value(stage=name, outcome='error')),
+            'seconds': round(timing['sum'], 6),
+            'items': int(items),
+            'bytes': int(metrics['bytes'].value(stage=name)),
+            'items_per_second': round(items / timing['sum'], 3) if timing['sum'] else None,
+            'cache_hits': int(hits),
+            'cache_misses': int(misses),
+            'cache_hit_rate': round(hits / (hits + misses), 4) if hits + misses else None,
+        }
+    return summaries
+
+
+def dump_json(run_name: str, output_dir: Optional[str] = None, registry: Optional[MetricsRegistry] = None) -> str:
+    """
+    Write a metrics snapshot to ``<output_dir>/<run_name>_metrics_<timestamp>.json``.
+
+    Args:
+        run_name: Script or pipeline name, used in the file name
+        output_dir: Target directory (default: env PULSE_METRICS_DIR or data/output/metrics)
+        registry: Registry to dump (default: the process-wide one)
+
+    Returns:
+        Path of the written file
+    """
+    registry = registry or REGISTRY
+    output_path = Path(output_dir or os.environ.get('PULSE_METRICS_DIR') or DEFAULT_METRICS_DIR)
+    output_path.mkdir(parents=True, exist_ok=True)
+    generated_at = datetime.now()
+    path = output_path / f"{run_name}_metrics_{generated_at.strftime('%Y%m%d_%H%M%S')}.json"
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'run': run_name,
+            'generated_at': generated_at.isoformat(),
+            'stages': stage_summaries(registry),
+            'metrics': registry.snapshot(),
+        }, f, indent=2)
+    return str(path)
+
+
+def with_metrics_dump(run_name: str, output_dir: Optional[str] = None) -> Callable:
+    """
+    Decorator for a batch script's ``main()``: dump metrics however it ends
+    (return, early return or ``sys.exit``). A failed dump is logged, never raised.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                try:
+                    path = dump_json(run_name, output_dir)
+                    logger.info(f"📈 Metrics written to {path}")
+                except Exception as e:
+                    logger.warning(f"Could not write metrics dump: {e}")
+        return wrapper
+    return decorator
@@ -0,0 +1,107 @@
+"""
+Record formats for bulk upload and export endpoints.
+
+``read_records`` turns a request body into a list of dicts from any of:
+
+- JSON: an array of objects, or an object wrapping one (``{"companies": [...]}``)
+- NDJSON / JSON Lines: one object per line, blank lines ignored
+- CSV: a header row followed by one record per row
+
+``write_records`` does the reverse for exports: it turns chunks of dicts
+into NDJSON or CSV bytes, one block per chunk, for a streaming response.
+"""
+
+import csv
+import datetime
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+FORMATS = ('json', 'ndjson', 'csv')
+EXPORT_FORMATS = ('ndjson', 'csv')
+MEDIA_TYPES = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv; charset=utf-8'}
+
+
+def detect_format(content_type: Optional[str]) -> str:
+    """Record format from a Content-Type header (JSON when unknown)."""
+    content_type = (content_type or '').lower()
+    if 'csv' in content_type:
+        return 'csv'
+    if 'ndjson' in content_type or 'jsonl' in content_type or 'json-seq' in content_type:
+        return 'ndjson'
+    return 'json'
+
+
+def read_records(body: bytes, record_format: str, wrapper_key: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Parse a request body into records.
+
+    Args:
+        body: Raw request body (UTF-8, optional BOM)
+        record_format: 'json', 'ndjson' or 'csv'
+        wrapper_key: Key holding the array when a JSON body is an object
+
+    Raises:
+        ValueError: If the body is not valid for the format (nothing has
+            been written yet when this is raised)
+    """
+    text = body.decode('utf-8-sig')
+    if record_format == 'csv':
+        return list(csv.DictReader(io.StringIO(text, newline='')))
+    if record_format == 'ndjson':
+        records = []
+        for line_number, line in enumerate(text.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError as e:
+                raise ValueError(f"Line {line_number}: invalid JSON ({e})") from e
+        return records
+    if record_format != 'json':
+        raise ValueError(f"Unknown format '{record_format}' (expected one of {', '.join(FORMATS)})")
+    try:
+        data = json.loads(text) if text.strip() else []
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON ({e})") from e
+    if isinstance(data, dict) and wrapper_key and isinstance(data.get(wrapper_key), list):
+        data = data[wrapper_key]
+    if not isinstance(data, list):
+        raise ValueError("Expected a JSON array of records")
+    return data
+
+
+def _export_value(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return value
+
+
+def write_records(chunks: Iterable[List[Dict[str, Any]]], record_format: str, columns: Sequence[str]) -> Iterator[bytes]:
+    """
+    Serialize chunks of records as NDJSON or CSV (with a header row).
+
+    Args:
+        chunks: Lists of dicts, e.g. from a chunked database read
+        record_format: 'ndjson' or 'csv'
+        columns: Field order (CSV header)
+
+    Yields:
+        UTF-8 bytes, one block per chunk
+    """
+    if record_format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(columns)
+        yield buffer.getvalue().encode('utf-8')
+        for chunk in chunks:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_export_value(record[name]) for name in columns] for record in chunk)
+            yield buffer.getvalue().encode('utf-8')
+    elif record_format == 'ndjson':
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=_export_value)
+        for chunk in chunks:
+            yield ''.join(encoder.encode(record) + '\n' for record in chunk).encode('utf-8')
+    else:
+        raise ValueError(f"Unknown export format '{record_format}' (expected one of {', '.join(EXPORT_FORMATS)})")
@@ -0,0 +1,60 @@
+"""
+Request timing for the FastAPI service.
+
+``RequestMetricsMiddleware`` is a plain ASGI middleware (it does not buffer
+or wrap streaming and SSE responses) that records, per route template,
+method and status code:
+
+- ``pulse_http_request_duration_seconds``: latency histogram, measured
+  until the last body chunk is sent
+- ``pulse_http_requests_in_progress``: requests currently being served
+
+Routes are labelled by their template (``/companies/{company_id}``), never
+the raw path, so label cardinality stays bounded; requests that match no
+route share the ``unmatched`` label.
+"""
+
+import time
+
+from app.utils.metrics import REGISTRY, MetricsRegistry
+
+UNMATCHED_ROUTE = 'unmatched'
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class RequestMetricsMiddleware:
+    """Latency histogram per route, method and status (see module docstring)."""
+
+    def __init__(self, app, registry: MetricsRegistry = REGISTRY):
+        self.app = app
+        self.duration = registry.histogram(
+            'pulse_http_request_duration_seconds', 'HTTP request latency.',
+            ('method', 'route', 'status'), buckets=LATENCY_BUCKETS
+        )
+        self.in_progress = registry.gauge(
+            'pulse_http_requests_in_progress', 'HTTP requests being served.', ('method',)
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        status = 500  # Unless the app starts a response
+
+        async def send_with_status(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        started = time.perf_counter()
+        self.in_progress.inc(method=method)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.in_progress.inc(-1, method=method)
+            # The router stores the matched route in the (shared) scope
+            route = getattr(scope.get('route'), 'path', None) or UNMATCHED_ROUTE
+            self.duration.observe(time.perf_counter() - started, method=method, route=route, status=status)
@@ -0,0 +1,256 @@
+"""
+Response cache for deterministic FastAPI routes.
+
+Routes whose response is a pure function of their parameters (the hiring
+score and HPI calculators, mock employee data) are marked with
+``@cached_response()`` on a router created with ``route_class=CachedRoute``:
+
+- Responses are kept in an in-process LRU keyed by method, path, sorted
+  query parameters and the canonical JSON body, so the same request is
+  neither recomputed nor re-serialized
+- An optional shared backend (Redis, ``RESPONSE_CACHE_REDIS_URL``) lets
+  several API workers reuse each other's responses
+- Every cached response carries a strong ``ETag``; ``If-None-Match``
+  requests for an unchanged response get ``304 Not Modified``
+- Hits, misses, 304s and evictions are counted (``ResponseCache.stats``)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+try:
+    import redis
+except ImportError:  # Shared backend is optional
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse:
+    """Serialized response body with its media type and ETag."""
+
+    def __init__(self, body: bytes, media_type: str, expires_at: Optional[float] = None):
+        self.body = body
+        self.media_type = media_type
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        self.expires_at = expires_at
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+    def dumps(self) -> bytes:
+        return self.media_type.encode('utf-8') + b'\n' + self.body
+
+    @classmethod
+    def loads(cls, data: bytes, expires_at: Optional[float] = None) -> 'CachedResponse':
+        media_type, body = data.split(b'\n', 1)
+        return cls(body, media_type.decode('utf-8'), expires_at)
+
+
+class RedisCacheBackend:
+    """
+    Shared cache backend on Redis, so API workers share responses.
+    """
+
+    def __init__(self, url: str, prefix: str = 'response-cache:'):
+        if redis is None:
+            raise ImportError("redis is required for the shared response cache backend")
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float]) -> None:
+        self.client.set(self.prefix + key, value, ex=int(ttl_seconds) if ttl_seconds else None)
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU of serialized responses with an optional shared backend.
+    """
+
+    def __init__(self, max_entries: int = 1024, backend=None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Responses kept in process before the least recently
+                used one is evicted
+            backend: Optional shared store with ``get(key)`` and
+                ``set(key, value, ttl_seconds)`` (e.g. RedisCacheBackend)
+        """
+        self.max_entries = max(1, max_entries)
+        self.backend = backend
+        self._entries: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {'hits': 0, 'misses': 0, 'not_modified': 0, 'evictions': 0, 'backend_hits': 0, 'backend_errors': 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def get(self, key: str, ttl_seconds: Optional[float] = None) -> Optional[CachedResponse]:
+        """
+        Look up a response locally, then in the shared backend.
+
+        Args:
+            key: Request cache key
+            ttl_seconds: Local lifetime of an entry fetched from the backend
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expired:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._counts['hits'] += 1
+                return entry
+        if self.backend is not None:
+            try:
+                data = self.backend.get(key)
+            except Exception as e:
+                logger.warning(f"Response cache backend unavailable: {e}")
+                self._count('backend_errors')
+                data = None
+            if data is not None:
+                entry = CachedResponse.loads(data, time.time() + ttl_seconds if ttl_seconds else None)
+                self._store(key, entry)
+                with self._lock:
+                    self._counts['hits'] += 1
+                    self._counts['backend_hits'] += 1
+                return entry
+        self._count('misses')
+        return None
+
+    def put(self, key: str, body: bytes, media_type: str, ttl_seconds: Optional[float] = None) -> CachedResponse:
+        entry = CachedResponse(body, media_type, time.time() + ttl_seconds if ttl_seconds else None)
+        self._store(key, entry)
+        if self.backend is not None:
+            try:
+                self.backend.set(key, entry.dumps(), ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Response cache backend unavailable: {e}")
+                self._count('backend_errors')
+        return entry
+
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counts['evictions'] += 1
+
+    def record_not_modified(self) -> None:
+        self._count('not_modified')
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._counts = dict.fromkeys(self._counts, 0)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self._counts['hits'] + self._counts['misses']
+            return {
+                **self._counts,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hit_rate': round(self._counts['hits'] / lookups, 4) if lookups else 0.0,
+                'shared_backend': type(self.backend).__name__ if self.backend is not None else None,
+            }
+
+
+def _backend_from_env():
+    url = os.getenv('RESPONSE_CACHE_REDIS_URL')
+    if not url:
+        return None
+    try:
+        return RedisCacheBackend(url)
+    except ImportError as e:
+        logger.warning(f"Shared response cache disabled: {e}")
+        return None
+
+
+response_cache = ResponseCache(
+    max_entries=int(os.getenv('RESPONSE_CACHE_SIZE', 1024)),
+    backend=_backend_from_env()
+)
+
+
+def cached_response(ttl_seconds: Optional[float] = None) -> Callable:
+    """
+    Mark a route as deterministic so ``CachedRoute`` caches its response.
+
+    Args:
+        ttl_seconds: Expire entries after this long (for results that drift
+            slowly, e.g. scores relative to today's date); None keeps them
+            until evicted
+    """
+    def mark(endpoint: Callable) -> Callable:
+        endpoint.response_cache_ttl = ttl_seconds
+        endpoint.response_cache_enabled = True
+        return endpoint
+    return mark
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in candidates or etag in candidates or f'W/{etag}' in candidates
+
+
+async def request_cache_key(request: Request) -> str:
+    """Method, path, sorted query parameters and canonical JSON body."""
+    query = sorted(request.query_params.multi_items())
+    body = await request.body()
+    if body:
+        try:
+            body = json.dumps(json.loads(body), sort_keys=True, separators=(',', ':')).encode('utf-8')
+        except ValueError:
+            pass
+    digest = hashlib.sha256(json.dumps([request.method, request.url.path, query]).encode('utf-8') + b'\n' + body)
+    return digest.hexdigest()
+
+
+class CachedRoute(APIRoute):
+    """
+    Route class serving ``@cached_response()`` endpoints from ``response_cache``.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        if not getattr(self.endpoint, 'response_cache_enabled', False):
+            return handler
+        ttl_seconds = self.endpoint.response_cache_ttl
+
+        async def cached_handler(request: Request) -> Response:
+            key = await request_cache_key(request)
+            entry = response_cache.get(key, ttl_seconds)
+            status = 'HIT'
+            if entry is None:
+                response = await handler(request)
+                if response.status_code != 200 or not hasattr(response, 'body'):
+                    return response
+                entry = response_cache.put(key, response.body, response.media_type or 'application/json', ttl_seconds)
+                status = 'MISS'
+            headers = {'ETag': entry.etag, 'Cache-Control': 'no-cache', 'X-Cache': status}
+            if _etag_matches(request.headers.get('if-none-match'), entry.etag):
+                response_cache.record_not_modified()
+                return Response(status_code=304, headers=headers)
+            return Response(entry.body, media_type=entry.media_type, headers=headers)
+
+        return cached_handler
@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+
+from app.utils.response_cache import response_cache
+
+router = APIRouter(prefix="/cache", tags=["Cache"])
+
+@router.get("/stats", summary="Response cache hit rate and size")
+def cache_stats():
+    """Hits, misses, 304s, evictions and hit rate of the deterministic-route response cache."""
+    return response_cache.stats()
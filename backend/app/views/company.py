@@ -1,26 +1,154 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
-from app.services.company_service import CompanyService
+from app.db.session import get_db, get_read_db
+from app.services.company_service import CompanyService, InvalidCursor, LEAD_COLUMNS, SORT_COLUMNS, resolve_columns
 from app.schemas.company import CompanySchema
-from typing import List
+from app.utils.records import EXPORT_FORMATS, FORMATS, MEDIA_TYPES, detect_format, read_records, write_records
+from typing import List, Optional
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+SORT_PATTERN = "^-?(" + "|".join(SORT_COLUMNS) + ")$"
 
 @router.get("/companies", response_model=List[CompanySchema])
-def list_companies(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def list_companies(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+    sort: str = Query("id", pattern=SORT_PATTERN, description="Sort column; prefix with '-' for descending (e.g. -hiring_probability)"),
+    region: Optional[List[str]] = Query(None, description="Only these regions"),
+    funding_stage: Optional[List[str]] = Query(None, description="Only these funding stages"),
+    min_hiring_probability: Optional[float] = Query(None, description="Minimum hiring probability"),
+    max_hiring_probability: Optional[float] = Query(None, description="Maximum hiring probability"),
+    is_active: Optional[bool] = Query(None, description="Only active / inactive companies"),
+    skip: int = Query(0, ge=0, description="Deprecated offset paging; use cursor"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    List companies with server-side filters, sorting and keyset pagination.
+
+    The next page's cursor is returned in the `X-Next-Cursor` header (and a
+    `Link: rel="next"` URL); it is absent on the last page.
+    """
+    service = CompanyService(db)
+    try:
+        companies, next_cursor = service.list_companies(
+            limit=limit,
+            cursor=cursor,
+            skip=skip,
+            sort=sort.lstrip("-"),
+            descending=sort.startswith("-"),
+            regions=region,
+            funding_stages=funding_stage,
+            min_hiring_probability=min_hiring_probability,
+            max_hiring_probability=max_hiring_probability,
+            is_active=is_active
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        next_url = request.url.remove_query_params(["cursor", "skip"]).include_query_params(cursor=next_cursor)
+        response.headers["X-Next-Cursor"] = next_cursor
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return companies
+
+@router.post("/companies/bulk", summary="Bulk insert/update companies by name")
+async def bulk_upsert_companies(
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(" + "|".join(FORMATS) + ")$",
+                                  description="json, ndjson or csv (default: from Content-Type)"),
+    chunk_size: int = Query(1000, ge=1, le=10000, description="Rows per transaction"),
+    report: str = Query("all", pattern="^(all|errors)$", description="Per-row statuses to return: all, or only failed/duplicate rows"),
+    db: Session = Depends(get_db)
+):
+    """
+    Upsert thousands of companies in one request, keyed on `name`.
+
+    The body is a JSON array (or `{"companies": [...]}`), NDJSON
+    (`application/x-ndjson`) or CSV with a header row (`text/csv`). Only the
+    fields present in a row are updated on existing companies. Returns
+    counts and a status per row (`inserted`, `updated`, `duplicate`, `failed`).
+    """
+    try:
+        rows = read_records(await request.body(), format or detect_format(request.headers.get("content-type")), "companies")
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     service = CompanyService(db)
-    return service.get_companies(skip=skip, limit=limit)
+    result = await run_in_threadpool(service.bulk_upsert_companies, rows, chunk_size)
+    if report == "errors":
+        result["rows"] = [row for row in result["rows"] if row["status"] in ("failed", "duplicate")]
+    return result
+
+def export_response(
+    db: Session,
+    filename: str,
+    format: str,
+    columns: Optional[List[str]],
+    chunk_size: int,
+    **filters
+) -> StreamingResponse:
+    """Stream filtered companies as NDJSON/CSV, reading `chunk_size` rows per query."""
+    try:
+        # Comma-separated and repeated ?columns= both work
+        columns = resolve_columns([name.strip() for value in columns or [] for name in value.split(",") if name.strip()])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    chunks = CompanyService(db).iter_company_rows(columns, chunk_size=chunk_size, **filters)
+    return StreamingResponse(
+        write_records(chunks, format, columns),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{format}"'}
+    )
+
+EXPORT_FORMAT_PATTERN = "^(" + "|".join(EXPORT_FORMATS) + ")$"
+
+@router.get("/companies/export", summary="Stream all matching companies as NDJSON or CSV")
+def export_companies(
+    format: str = Query("ndjson", pattern=EXPORT_FORMAT_PATTERN, description="ndjson or csv"),
+    columns: Optional[List[str]] = Query(None, description="Columns to include, comma-separated or repeated (default: all)"),
+    region: Optional[List[str]] = Query(None, description="Only these regions"),
+    funding_stage: Optional[List[str]] = Query(None, description="Only these funding stages"),
+    min_hiring_probability: Optional[float] = Query(None, description="Minimum hiring probability"),
+    max_hiring_probability: Optional[float] = Query(None, description="Maximum hiring probability"),
+    is_active: Optional[bool] = Query(None, description="Only active / inactive companies"),
+    chunk_size: int = Query(1000, ge=1, le=10000, description="Rows read per database query"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Export every company matching the `/companies` filters in one response,
+    in id order. Rows are read and written in chunks, so memory use does not
+    grow with the table.
+    """
+    return export_response(
+        db, "companies", format, columns, chunk_size,
+        regions=region, funding_stages=funding_stage, min_hiring_probability=min_hiring_probability,
+        max_hiring_probability=max_hiring_probability, is_active=is_active
+    )
+
+@router.get("/leads/export", summary="Stream scored leads as NDJSON or CSV")
+def export_leads(
+    format: str = Query("ndjson", pattern=EXPORT_FORMAT_PATTERN, description="ndjson or csv"),
+    columns: Optional[List[str]] = Query(None, description="Columns to include (default: lead columns)"),
+    region: Optional[List[str]] = Query(None, description="Only these regions"),
+    funding_stage: Optional[List[str]] = Query(None, description="Only these funding stages"),
+    min_hiring_probability: Optional[float] = Query(None, description="Minimum hiring probability"),
+    max_hiring_probability: Optional[float] = Query(None, description="Maximum hiring probability"),
+    is_active: Optional[bool] = Query(None, description="Only active / inactive companies"),
+    chunk_size: int = Query(1000, ge=1, le=10000, description="Rows read per database query"),
+    db: Session = Depends(get_read_db)
+):
+    """Export companies that have a hiring-probability score, with the lead columns by default."""
+    return export_response(
+        db, "leads", format, columns or LEAD_COLUMNS, chunk_size,
+        regions=region, funding_stages=funding_stage, min_hiring_probability=min_hiring_probability,
+        max_hiring_probability=max_hiring_probability, is_active=is_active, scored_only=True
+    )
 
 @router.get("/companies/{company_id}", response_model=CompanySchema)
-def get_company(company_id: int, db: Session = Depends(get_db)):
+def get_company(company_id: int, db: Session = Depends(get_read_db)):
     service = CompanyService(db)
     company = service.get_company(company_id)
     if not company:
@@ -1,12 +1,14 @@
 from fastapi import APIRouter, Query
 from typing import Optional
 from app.services.global_hiring_score_service import GlobalHiringScoreCalculator
+from app.utils.response_cache import CachedRoute, cached_response
 
-router = APIRouter(prefix="/global-hiring-score", tags=["Global Hiring Score"])
+router = APIRouter(prefix="/global-hiring-score", tags=["Global Hiring Score"], route_class=CachedRoute)
 
 calculator = GlobalHiringScoreCalculator()
 
 @router.get("/calculate", summary="Calcular Global Hiring Score (GHS)")
+@cached_response()
 def calculate_ghs(
     funding_amount: float = Query(..., description="Total funding (USD)"),
     company_stage: str = Query("series_a", description="Etapa de funding"),
@@ -24,6 +26,7 @@ def calculate_ghs(
     )
 
 @router.get("/roi", summary="Calcular ROI de offshore hiring")
+@cached_response()
 def calculate_roi(
     team_size: int = Query(..., description="Tamaño total del equipo"),
     offshore_percentage: float = Query(..., description="% offshore (0-100)"),
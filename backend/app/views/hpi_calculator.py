@@ -5,12 +5,14 @@ from fastapi import APIRouter, UploadFile, File
 from typing import Dict, Any
 import pandas as pd
 from ..services.hpi_calculator_service import hpi_calculator
+from ..utils.response_cache import CachedRoute, cached_response
 
-router = APIRouter(prefix="/hpi", tags=["Hiring Potential Index"])
+router = APIRouter(prefix="/hpi", tags=["Hiring Potential Index"], route_class=CachedRoute)
 
 @router.post("/calculate", response_model=Dict[str, Any])
+@cached_response(ttl_seconds=3600)
 def calculate_hpi(company_data: Dict[str, Any]):
-    """Calculate HPI for a single company."""
+    """Calculate HPI for a single company (cached; funding recency is relative to today, hence the TTL)."""
     return hpi_calculator.calculate_hpi(company_data)
 
 @router.post("/batch-calculate")
@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Body
 from typing import Dict, Any, List, Optional
 from ..services.intent_classification_engine_service import intent_classification_engine
+from .jobs import submit_job
 
 router = APIRouter(prefix="/intent-engine", tags=["Intent Classification Engine"])
 
@@ -17,10 +18,17 @@ def analyze_company(payload: Dict[str, Any] = Body(...)):
         funding_stage=payload.get("funding_stage", "series_a")
     )
 
-@router.post("/market-scan", response_model=Dict[str, Any])
+@router.post("/market-scan", response_model=Dict[str, Any], status_code=202)
 def market_scan(payload: Dict[str, Any] = Body(...)):
-    """Run a market-wide scan for leads and intelligence."""
-    return intent_classification_engine.run_market_scan(
-        target_tickers=payload.get("target_tickers"),
-        news_queries=payload.get("news_queries")
-    )
+    """
+    Run a market-wide scan for leads and intelligence as a background job.
+
+    Poll `/jobs/{job_id}` for the scan result or stream the SEC filings and
+    per-query leads from `/jobs/{job_id}/events`.
+    """
+    params = {
+        "target_tickers": payload.get("target_tickers"),
+        "news_queries": payload.get("news_queries")
+    }
+    return submit_job("intent-engine.market-scan", params,
+                      lambda job: intent_classification_engine.run_market_scan(**params, on_progress=job.publish))
@@ -0,0 +1,78 @@
+import json
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.tasks.jobs import Job, JobQueueFull, job_manager
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+# Seconds between SSE keep-alive comments while a job has nothing new
+KEEPALIVE_SECONDS = 15
+
+
+def submit_job(kind: str, params: Dict, work: Callable[[Job], Any]) -> JSONResponse:
+    """Submit background work and answer 202 with the job id and its status/events URLs."""
+    try:
+        job, created = job_manager.submit(kind, params, work)
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+    return JSONResponse(
+        status_code=202,
+        headers={"Location": f"/jobs/{job.id}"},
+        content={
+            **job.to_dict(include_result=False),
+            "deduplicated": not created,
+            "status_url": f"/jobs/{job.id}",
+            "events_url": f"/jobs/{job.id}/events",
+        },
+    )
+
+
+def _get_job(job_id: str) -> Job:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
+
+
+def _sse(event: str, data: Any, event_id: Optional[int] = None) -> str:
+    message = f"id: {event_id}\n" if event_id is not None else ""
+    return message + f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.get("/{job_id}", summary="Job status and result")
+def get_job(job_id: str, include_partial: bool = False):
+    """Poll a job; `result` is set once status is `succeeded`."""
+    job = _get_job(job_id)
+    data = job.to_dict()
+    if include_partial:
+        data["partial"] = list(job.events)
+    return data
+
+
+@router.get("/{job_id}/events", summary="Stream partial results (Server-Sent Events)")
+def stream_job_events(job_id: str, last_event_id: Optional[int] = Header(None)):
+    """
+    Stream each partial result as a `partial` event, then one final event
+    named after the job status carrying the full job. Reconnecting clients
+    resume after the `Last-Event-ID` they received.
+    """
+    job = _get_job(job_id)
+
+    def events():
+        seq = last_event_id + 1 if last_event_id is not None else 0
+        while True:
+            new_events, done = job.wait_for_events(seq, timeout=KEEPALIVE_SECONDS)
+            for data in new_events:
+                yield _sse("partial", data, seq)
+                seq += 1
+            if done:
+                yield _sse(job.status, job.to_dict())
+                return
+            if not new_events:
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Query
 from typing import List, Optional
 from app.services.linkedin_google_scraper_service import LinkedInGoogleScraper
+from app.views.jobs import submit_job
 
 router = APIRouter(prefix="/linkedin-google", tags=["LinkedIn Google Scraper"])
 
@@ -15,10 +16,17 @@ def search_linkedin_jobs(
     """Buscar empleos de LinkedIn usando Google Search scraping."""
     return scraper.search_linkedin_jobs(keywords=keywords, location=location, max_results=max_results)
 
-@router.get("/latam", summary="Scrapear empleos de LinkedIn para LATAM")
+@router.get("/latam", summary="Scrapear empleos de LinkedIn para LATAM (job en segundo plano)", status_code=202)
 def scrape_latam_jobs(
     max_per_location: int = Query(5, description="Máximo por ubicación"),
     focus_countries: Optional[List[str]] = Query(None, description="Países a enfocar (ej: Brazil, Mexico)")
 ):
-    """Scrapear empleos de LinkedIn para ubicaciones LATAM."""
-    return scraper.scrape_latam_jobs(max_per_location=max_per_location, focus_countries=focus_countries)
+    """
+    Scrapear empleos de LinkedIn para ubicaciones LATAM.
+
+    Devuelve un job de inmediato; consultar `/jobs/{job_id}` o seguir cada
+    búsqueda terminada en `/jobs/{job_id}/events`.
+    """
+    params = {"max_per_location": max_per_location, "focus_countries": focus_countries}
+    return submit_job("linkedin-google.latam", params,
+                      lambda job: scraper.scrape_latam_jobs(**params, on_progress=job.publish))
@@ -0,0 +1,18 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.utils.metrics import CONTENT_TYPE_LATEST, REGISTRY
+from app.utils.response_cache import response_cache
+
+router = APIRouter(tags=["Metrics"])
+
+_cache_gauge = REGISTRY.gauge('pulse_response_cache', 'Response cache counters and size (see /cache/stats).', ('stat',))
+
+
+@router.get("/metrics", response_class=PlainTextResponse, summary="Prometheus metrics")
+def metrics():
+    """Request latencies, pipeline stage timings and response cache stats in the Prometheus text format."""
+    for name, value in response_cache.stats().items():
+        if isinstance(value, (int, float)):
+            _cache_gauge.set(value, stat=name)
+    return PlainTextResponse(REGISTRY.render_prometheus(), media_type=CONTENT_TYPE_LATEST)
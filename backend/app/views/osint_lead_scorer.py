@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Query
 from typing import List, Optional
 from app.services.osint_lead_scorer_service import OSINTLeadScorer
+from app.views.jobs import submit_job
 
 router = APIRouter(prefix="/osint-leads", tags=["OSINT Leads"])
 
@@ -26,7 +27,7 @@ def score_lead(article: dict):
     """Score a single news article for lead potential."""
     return scorer.score_article(article)
 
-@router.get("/score-batch", summary="Scrape and score a batch of news articles")
+@router.get("/score-batch", summary="Scrape and score a batch of news articles (background job)", status_code=202)
 def score_news_batch(
     query: str = Query("tech startup funding OR hiring", description="Search query for news"),
     regions: List[str] = Query(["US"], description="List of region codes"),
@@ -34,11 +35,18 @@ def score_news_batch(
     max_results_per_region: int = Query(20, description="Max results per region"),
     min_score: int = Query(20, description="Minimum score to include")
 ):
-    """Scrape and score a batch of news articles for lead potential."""
-    return scorer.score_news_batch(
-        query=query,
-        regions=regions,
-        period=period,
-        max_results_per_region=max_results_per_region,
-        min_score=min_score
-    )
+    """
+    Scrape and score a batch of news articles for lead potential.
+
+    Returns a job immediately; poll `/jobs/{job_id}` for the leads or stream
+    each region's leads from `/jobs/{job_id}/events`.
+    """
+    params = {
+        "query": query,
+        "regions": regions,
+        "period": period,
+        "max_results_per_region": max_results_per_region,
+        "min_score": min_score
+    }
+    return submit_job("osint-leads.score-batch", params,
+                      lambda job: scorer.score_news_batch(**params, on_progress=job.publish))
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Query
 from typing import List, Dict, Optional
 from app.services.web_scraper_service import LinkedInScraper, FallbackDataEnricher
+from app.utils.response_cache import CachedRoute, cached_response
+from app.views.jobs import submit_job
 
-router = APIRouter(prefix="/web-scraper", tags=["Web Scraper"])
+router = APIRouter(prefix="/web-scraper", tags=["Web Scraper"], route_class=CachedRoute)
 
 scraper = LinkedInScraper()
 
@@ -14,12 +16,19 @@ def get_company_data(
     """Obtiene datos de LinkedIn para una empresa."""
     return scraper.get_company_data(company_name, country)
 
-@router.post("/batch", summary="Extraer datos de varias empresas")
+@router.post("/batch", summary="Extraer datos de varias empresas (job en segundo plano)", status_code=202)
 def batch_extract(companies: List[Dict]):
-    """Extrae datos de LinkedIn para una lista de empresas."""
-    return scraper.batch_extract(companies)
+    """
+    Extrae datos de LinkedIn para una lista de empresas.
+
+    Devuelve un job de inmediato; consultar `/jobs/{job_id}` o seguir cada
+    empresa procesada en `/jobs/{job_id}/events`.
+    """
+    return submit_job("web-scraper.batch", {"companies": companies},
+                      lambda job: scraper.batch_extract(companies, on_progress=job.publish))
 
 @router.get("/mock", summary="Generar datos mock de empleados por funding stage")
+@cached_response()
 def generate_mock_data(
     company_name: str = Query(..., description="Nombre de la empresa"),
     funding_stage: str = Query(..., description="Etapa de funding (ej: Series A)"),
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.company import Base, Company
+from app.services.company_service import CompanyService, coerce_company_row
+from app.views import company as company_view
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def client(session_factory):
+    app = FastAPI()
+    app.include_router(company_view.router)
+
+    def get_db():
+        with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[company_view.get_db] = get_db
+    app.dependency_overrides[company_view.get_read_db] = get_db
+    return TestClient(app)
+
+
+def companies(session_factory):
+    with session_factory() as db:
+        return {company.name: company for company in db.query(Company).all()}
+
+
+def test_coerce_company_row():
+    row = coerce_company_row({'name': ' Nimbus ', 'team_size': '40', 'hiring_probability': '0.8',
+                              'is_active': 'no', 'last_funding_date': '2025-11-02T00:00:00Z',
+                              'region': '', 'unknown': 'x'})
+    assert row['name'] == 'Nimbus' and row['team_size'] == 40 and row['hiring_probability'] == 0.8
+    assert row['is_active'] is False and row['region'] is None and 'unknown' not in row
+    assert row['last_funding_date'].year == 2025
+    with pytest.raises(ValueError):
+        coerce_company_row({'region': 'LATAM'})
+    with pytest.raises(ValueError):
+        coerce_company_row({'name': 'x', 'team_size': '4.5'})
+
+
+def test_json_upsert_reports_each_row(client, session_factory):
+    response = client.post('/companies/bulk', json=[
+        {'name': 'Nimbus', 'region': 'LATAM', 'hiring_probability': 0.7},
+        {'name': 'Orbit', 'region': 'NA'},
+        {'region': 'EU'},
+        {'name': 'Orbit', 'region': 'EU'},
+    ])
+    result = response.json()
+    assert response.status_code == 200
+    assert [row['status'] for row in result['rows']] == ['inserted', 'duplicate', 'failed', 'inserted']
+    assert (result['inserted'], result['duplicate'], result['failed']) == (2, 1, 1)
+    assert companies(session_factory)['Orbit'].region == 'EU'
+
+    # Only the fields sent are updated
+    result = client.post('/companies/bulk', json={'companies': [{'name': 'Nimbus', 'team_size': 40}]}).json()
+    assert result['rows'][0]['status'] == 'updated'
+    nimbus = companies(session_factory)['Nimbus']
+    assert nimbus.team_size == 40 and nimbus.region == 'LATAM' and nimbus.hiring_probability == 0.7
+
+
+def test_ndjson_and_csv_uploads(client, session_factory):
+    ndjson = '\n'.join(json.dumps({'name': f'company-{i}', 'team_size': i}) for i in range(5)) + '\n\n'
+    result = client.post('/companies/bulk', content=ndjson, headers={'Content-Type': 'application/x-ndjson'}).json()
+    assert result['inserted'] == 5
+
+    csv_body = 'name,region,team_size,is_active\ncompany-1,LATAM,12,true\nNew Co,,,false\n'
+    result = client.post('/companies/bulk?chunk_size=1&report=errors', content=csv_body,
+                         headers={'Content-Type': 'text/csv'}).json()
+    assert (result['inserted'], result['updated'], result['rows']) == (1, 1, [])
+    stored = companies(session_factory)
+    assert stored['company-1'].team_size == 12 and stored['company-1'].region == 'LATAM'
+    assert stored['New Co'].is_active is False and stored['New Co'].predicted_at is not None
+
+
+def test_malformed_body_writes_nothing(client, session_factory):
+    body = '{"name": "a"}\n{"name": \n'
+    response = client.post('/companies/bulk', content=body, headers={'Content-Type': 'application/x-ndjson'})
+    assert response.status_code == 400
+    assert 'Line 2' in response.json()['detail']
+    assert companies(session_factory) == {}
+
+
+def test_failed_chunk_is_retried_row_by_row(session_factory, monkeypatch):
+    with session_factory() as db:
+        service = CompanyService(db)
+        write_rows = service._write_rows
+
+        def flaky(rows):
+            if any(values['name'] == 'bad' for values in rows):
+                raise IntegrityError('INSERT', {}, Exception('constraint failed'))
+            return write_rows(rows)
+
+        monkeypatch.setattr(service, '_write_rows', flaky)
+        result = service.bulk_upsert_companies([{'name': 'a'}, {'name': 'bad'}, {'name': 'c'}], chunk_size=10)
+
+    assert [row['status'] for row in result['rows']] == ['inserted', 'failed', 'inserted']
+    assert set(companies(session_factory)) == {'a', 'c'}
@@ -0,0 +1,93 @@
+import csv
+import datetime
+import io
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.company import Base, Company
+from app.services.company_service import CompanyService
+from app.views import company as company_view
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add_all(
+            Company(
+                id=i,
+                name=f'company-{i}',
+                region='LATAM' if i % 2 else 'NA',
+                hiring_probability=None if i % 3 == 0 else i / 100,
+                last_funding_date=datetime.datetime(2025, 1, 1) + datetime.timedelta(days=i),
+                description='Says "hi", then\nleaves'
+            )
+            for i in range(1, 26)
+        )
+        db.commit()
+    return factory
+
+
+@pytest.fixture
+def client(session_factory):
+    app = FastAPI()
+    app.include_router(company_view.router)
+
+    def get_db():
+        with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[company_view.get_db] = get_db
+    app.dependency_overrides[company_view.get_read_db] = get_db
+    return TestClient(app)
+
+
+def test_ndjson_export_with_filters_and_projection(client):
+    response = client.get('/companies/export', params={'region': 'LATAM', 'columns': 'name,last_funding_date',
+                                                       'chunk_size': 4})
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert 'companies.ndjson' in response.headers['content-disposition']
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record['name'] for record in records] == [f'company-{i}' for i in range(1, 26, 2)]
+    assert records[0] == {'name': 'company-1', 'last_funding_date': '2025-01-02T00:00:00'}
+
+
+def test_csv_export_round_trips_quoting(client):
+    response = client.get('/companies/export', params={'format': 'csv', 'columns': ['id', 'description']})
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 25
+    assert rows[0] == {'id': '1', 'description': 'Says "hi", then\nleaves'}
+
+
+def test_lead_export_only_scored_companies(client):
+    records = [json.loads(line) for line in client.get('/leads/export', params={'min_hiring_probability': 0.1}).text.splitlines()]
+    assert [record['id'] for record in records] == [i for i in range(10, 26) if i % 3]
+    assert 'hiring_probability' in records[0] and 'description' not in records[0]
+
+
+def test_unknown_column_is_rejected(client):
+    response = client.get('/companies/export', params={'columns': 'name,password'})
+    assert response.status_code == 400
+    assert 'password' in response.json()['detail']
+
+
+def test_rows_are_read_in_bounded_chunks(session_factory):
+    with session_factory() as db:
+        statements = []
+        event.listen(db.get_bind(), 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        chunks = list(CompanyService(db).iter_company_rows(['name'], chunk_size=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert len(statements) == 3
+    assert all('LIMIT' in statement for statement in statements)
@@ -0,0 +1,123 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.company import Base, Company
+from app.services.company_service import CompanyService
+from app.views import company as company_view
+
+REGIONS = ['LATAM', 'NA', 'EU']
+STAGES = ['Seed', 'Series A', 'Series B']
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add_all(
+            Company(
+                id=i,
+                name=f'company-{i}',
+                region=REGIONS[i % 3],
+                funding_stage=STAGES[i % 4] if i % 4 < 3 else None,
+                # Repeated values and NULLs exercise the (value, id) tie-break
+                hiring_probability=None if i % 5 == 0 else round((i * 37 % 11) / 10, 1),
+                is_active=i % 7 != 0
+            )
+            for i in range(1, 61)
+        )
+        db.commit()
+    return factory
+
+
+@pytest.fixture
+def client(session_factory):
+    app = FastAPI()
+    app.include_router(company_view.router)
+
+    def get_db():
+        with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[company_view.get_db] = get_db
+    app.dependency_overrides[company_view.get_read_db] = get_db
+    return TestClient(app)
+
+
+def walk(client, **params):
+    ids, cursor = [], None
+    while True:
+        response = client.get('/companies', params={**params, **({'cursor': cursor} if cursor else {})})
+        assert response.status_code == 200
+        ids += [company['id'] for company in response.json()]
+        cursor = response.headers.get('x-next-cursor')
+        if not cursor:
+            return ids
+
+
+def expected(session_factory, key, descending=False, where=lambda c: True):
+    with session_factory() as db:
+        companies = [c for c in db.query(Company).all() if where(c)]
+    valued = sorted((c for c in companies if getattr(c, key) is not None),
+                    key=lambda c: (getattr(c, key), c.id), reverse=descending)
+    nulls = sorted((c for c in companies if getattr(c, key) is None), key=lambda c: c.id, reverse=descending)
+    return [c.id for c in valued + nulls]
+
+
+@pytest.mark.parametrize('sort', ['id', '-id', 'hiring_probability', '-hiring_probability', 'funding_stage'])
+def test_cursor_walk_matches_full_sort(client, session_factory, sort):
+    key = sort.lstrip('-')
+    assert walk(client, sort=sort, limit=7) == expected(session_factory, key, sort.startswith('-'))
+
+
+def test_filters_are_applied_in_the_database(client, session_factory):
+    ids = walk(client, sort='-hiring_probability', limit=4, region=['LATAM', 'EU'],
+               min_hiring_probability=0.3, is_active=True)
+    assert ids == expected(
+        session_factory, 'hiring_probability', True,
+        lambda c: c.region in ('LATAM', 'EU') and c.hiring_probability is not None
+        and c.hiring_probability >= 0.3 and c.is_active
+    )
+    assert walk(client, funding_stage='Seed') == expected(session_factory, 'id', where=lambda c: c.funding_stage == 'Seed')
+
+
+def test_legacy_skip_and_next_link(client, session_factory):
+    response = client.get('/companies', params={'skip': 10, 'limit': 5, 'sort': 'hiring_probability'})
+    order = expected(session_factory, 'hiring_probability')
+    assert [c['id'] for c in response.json()] == order[10:15]
+    assert 'rel="next"' in response.headers['link']
+
+    following = client.get('/companies', params={'limit': 5, 'sort': 'hiring_probability',
+                                                  'cursor': response.headers['x-next-cursor']})
+    assert [c['id'] for c in following.json()] == order[15:20]
+
+
+def test_bad_cursor(client):
+    cursor = client.get('/companies', params={'limit': 2}).headers['x-next-cursor']
+    assert client.get('/companies', params={'cursor': 'not-a-cursor'}).status_code == 400
+    assert client.get('/companies', params={'cursor': cursor, 'sort': 'region'}).status_code == 400
+    assert client.get('/companies', params={'sort': 'name'}).status_code == 422
+
+
+def test_pages_use_composite_indexes(session_factory):
+    with session_factory() as db:
+        service = CompanyService(db)
+        _, cursor = service.list_companies(limit=5, sort='hiring_probability', descending=True, regions=['NA'])
+        captured = []
+
+        def capture(conn, cursor_, statement, parameters, context, executemany):
+            captured.append((statement, parameters))
+
+        event.listen(db.get_bind(), 'before_cursor_execute', capture)
+        service.list_companies(limit=5, cursor=cursor, sort='hiring_probability', descending=True, regions=['NA'])
+        event.remove(db.get_bind(), 'before_cursor_execute', capture)
+
+        statement, parameters = captured[0]
+        plan = ' '.join(row[-1] for row in db.connection().exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters))
+        assert 'ix_companies_region_hiring_probability_id' in plan
+        assert 'TEMP B-TREE' not in plan
@@ -1,6 +1,7 @@
 
 import sys
 import os
+import time
 import pytest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from fastapi.testclient import TestClient
@@ -31,7 +32,15 @@ def test_market_scan_endpoint():
         ]
     }
     response = client.post("/intent-engine/market-scan", json=payload)
-    assert response.status_code == 200
-    data = response.json()
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+    deadline = time.time() + 300
+    while time.time() < deadline:
+        job = client.get(f"/jobs/{job_id}").json()
+        if job["status"] in ("succeeded", "failed"):
+            break
+        time.sleep(1)
+    assert job["status"] == "succeeded"
+    data = job["result"]
     assert "scan_timestamp" in data
     assert "summary" in data
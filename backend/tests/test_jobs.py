@@ -0,0 +1,129 @@
+import threading
+import time
+from typing import List
+
+import pytest
+from fastapi import Body, FastAPI
+from fastapi.testclient import TestClient
+
+from app.tasks.jobs import Job, JobManager, JobQueueFull
+from app.views import jobs as jobs_view
+
+
+def wait_done(job, timeout=5):
+    deadline = time.time() + timeout
+    while not job.done and time.time() < deadline:
+        time.sleep(0.01)
+    assert job.done
+
+
+def test_submit_returns_before_work_finishes():
+    manager = JobManager(workers=1)
+    release = threading.Event()
+    job, created = manager.submit('scan', {'q': 1}, lambda job: release.wait(5) and 'done')
+
+    assert created
+    assert job.status in (Job.QUEUED, Job.RUNNING)
+    release.set()
+    wait_done(job)
+    assert job.status == Job.SUCCEEDED
+    assert job.result == 'done'
+    assert manager.get(job.id) is job
+
+
+def test_identical_in_flight_requests_share_a_job():
+    manager = JobManager(workers=2)
+    release = threading.Event()
+    calls = []
+
+    def work(job):
+        calls.append(job.id)
+        release.wait(5)
+        return len(calls)
+
+    first, _ = manager.submit('scan', {'regions': ['US'], 'q': 'saas'}, work)
+    second, created = manager.submit('scan', {'q': 'saas', 'regions': ['US']}, work)
+    other, _ = manager.submit('scan', {'q': 'fintech', 'regions': ['US']}, work)
+    assert second is first and not created
+    assert other is not first
+
+    release.set()
+    wait_done(first)
+    wait_done(other)
+    assert len(calls) == 2
+
+    # Finished jobs are not joined: the same request starts a fresh scrape
+    again, created = manager.submit('scan', {'q': 'saas', 'regions': ['US']}, work)
+    assert created and again is not first
+    wait_done(again)
+
+
+def test_failure_is_recorded():
+    manager = JobManager(workers=1)
+    job, _ = manager.submit('scan', {}, lambda job: 1 / 0)
+    wait_done(job)
+    assert job.status == Job.FAILED
+    assert 'division by zero' in job.error
+
+
+def test_bounded_queue_refuses_new_jobs():
+    manager = JobManager(workers=1, max_pending=1)
+    release = threading.Event()
+    manager.submit('scan', {'n': 1}, lambda job: release.wait(5))
+    manager.submit('scan', {'n': 2}, lambda job: release.wait(5))
+    with pytest.raises(JobQueueFull):
+        manager.submit('scan', {'n': 3}, lambda job: None)
+    release.set()
+
+
+def test_finished_jobs_expire_after_ttl():
+    manager = JobManager(workers=1, ttl_seconds=0.05)
+    job, _ = manager.submit('scan', {}, lambda job: 'ok')
+    wait_done(job)
+    assert manager.get(job.id) is job
+    time.sleep(0.1)
+    assert manager.get(job.id) is None
+
+
+@pytest.fixture
+def client(monkeypatch):
+    manager = JobManager(workers=2)
+    monkeypatch.setattr(jobs_view, 'job_manager', manager)
+    app = FastAPI()
+    app.include_router(jobs_view.router)
+
+    @app.post('/scan')
+    def scan(regions: List[str] = Body(...)):
+        def work(job):
+            for region in regions:
+                job.publish({'region': region, 'leads': [f'{region}-lead']})
+            return [f'{region}-lead' for region in regions]
+        return jobs_view.submit_job('scan', {'regions': regions}, work)
+
+    return TestClient(app)
+
+
+def test_api_submit_poll_and_stream(client):
+    response = client.post('/scan', json=['US', 'BR'])
+    assert response.status_code == 202
+    job_id = response.json()['job_id']
+    assert response.headers['location'] == f'/jobs/{job_id}'
+
+    with client.stream('GET', f'/jobs/{job_id}/events') as stream:
+        body = ''.join(stream.iter_text())
+    assert body.index('"region": "US"') < body.index('"region": "BR"')
+    assert 'event: partial' in body and 'event: succeeded' in body
+
+    job = client.get(f'/jobs/{job_id}', params={'include_partial': True}).json()
+    assert job['status'] == 'succeeded'
+    assert job['result'] == ['US-lead', 'BR-lead']
+    assert [event['region'] for event in job['partial']] == ['US', 'BR']
+
+    # Resuming after the first event skips it
+    with client.stream('GET', f'/jobs/{job_id}/events', headers={'Last-Event-ID': '0'}) as stream:
+        body = ''.join(stream.iter_text())
+    assert '"region": "US"' not in body and '"region": "BR"' in body
+
+
+def test_api_unknown_job(client):
+    assert client.get('/jobs/missing').status_code == 404
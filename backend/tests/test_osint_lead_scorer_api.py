@@ -2,12 +2,23 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
 
+import time
+
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
 
 client = TestClient(app)
 
+def wait_for_job(job_id, timeout=300):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = client.get(f"/jobs/{job_id}").json()
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(1)
+    raise AssertionError(f"job {job_id} did not finish")
+
 def test_news_endpoint():
     response = client.get("/osint-leads/news?query=tech+startup&region=US&period=7d&max_results=2")
     assert response.status_code == 200
@@ -26,5 +37,7 @@ def test_score_lead_endpoint():
 
 def test_score_batch_endpoint():
     response = client.get("/osint-leads/score-batch?query=tech+startup&regions=US&period=7d&max_results_per_region=2&min_score=0")
-    assert response.status_code == 200
-    assert isinstance(response.json(), list)
+    assert response.status_code == 202
+    job = wait_for_job(response.json()["job_id"])
+    assert job["status"] == "succeeded"
+    assert isinstance(job["result"], list)
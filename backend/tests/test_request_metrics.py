@@ -0,0 +1,64 @@
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.utils.metrics import MetricsRegistry
+from app.utils.request_metrics import RequestMetricsMiddleware
+from app.views import metrics as metrics_view
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def client(registry):
+    router = APIRouter(prefix="/items")
+
+    @router.get("/{item_id}")
+    def get_item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=404, detail="Not found")
+        return {"id": item_id}
+
+    @router.get("/stream/all")
+    def stream():
+        return StreamingResponse(iter([b"a\n", b"b\n"]), media_type="application/x-ndjson")
+
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware, registry=registry)
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_latency_is_labelled_by_route_template_and_status(client, registry):
+    for item_id in (1, 2, 0):
+        client.get(f"/items/{item_id}")
+    client.get("/items/stream/all")
+    client.get("/nowhere")
+
+    duration = registry.histogram('pulse_http_request_duration_seconds', 'HTTP request latency.',
+                                  ('method', 'route', 'status'))
+    assert duration.get(method='GET', route='/items/{item_id}', status=200)['count'] == 2
+    assert duration.get(method='GET', route='/items/{item_id}', status=404)['count'] == 1
+    assert duration.get(method='GET', route='/items/stream/all', status=200)['count'] == 1
+    assert duration.get(method='GET', route='unmatched', status=404)['count'] == 1
+    assert registry.gauge('pulse_http_requests_in_progress', 'HTTP requests being served.',
+                          ('method',)).value(method='GET') == 0
+
+
+def test_metrics_endpoint_serves_prometheus_text():
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware)
+    app.include_router(metrics_view.router)
+    client = TestClient(app)
+
+    client.get("/metrics")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'text/plain; version=0.0.4; charset=utf-8'
+    assert '# TYPE pulse_http_request_duration_seconds histogram' in response.text
+    assert 'pulse_http_request_duration_seconds_count{method="GET",route="/metrics",status="200"}' in response.text
+    assert 'pulse_response_cache{stat="hits"}' in response.text
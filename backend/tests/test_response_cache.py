@@ -0,0 +1,109 @@
+import time
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.utils import response_cache as cache_module
+from app.utils.response_cache import CachedRoute, ResponseCache, cached_response
+
+
+class DictBackend:
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl_seconds):
+        self.data[key] = value
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResponseCache(max_entries=2)
+    monkeypatch.setattr(cache_module, 'response_cache', cache)
+    return cache
+
+
+@pytest.fixture
+def app_calls(cache):
+    calls = []
+    router = APIRouter(route_class=CachedRoute)
+
+    @router.get('/score')
+    @cached_response()
+    def score(a: int, b: int = 1):
+        calls.append((a, b))
+        return {'score': a * b}
+
+    @router.post('/hpi')
+    @cached_response(ttl_seconds=0.05)
+    def hpi(data: dict):
+        calls.append(data)
+        return {'hpi': len(data)}
+
+    @router.get('/live')
+    def live():
+        calls.append('live')
+        return {'ok': True}
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app), calls
+
+
+def test_repeated_requests_hit_cache_regardless_of_param_order(app_calls, cache):
+    client, calls = app_calls
+    first = client.get('/score?a=2&b=3')
+    second = client.get('/score?b=3&a=2')
+
+    assert first.json() == second.json() == {'score': 6}
+    assert first.headers['x-cache'] == 'MISS' and second.headers['x-cache'] == 'HIT'
+    assert first.headers['etag'] == second.headers['etag']
+    assert calls == [(2, 3)]
+    assert cache.stats()['hit_rate'] == 0.5
+
+
+def test_if_none_match_returns_304(app_calls, cache):
+    client, calls = app_calls
+    etag = client.get('/score?a=2').headers['etag']
+
+    response = client.get('/score?a=2', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.content == b''
+    assert client.get('/score?a=2', headers={'If-None-Match': '"stale"'}).status_code == 200
+    assert cache.stats()['not_modified'] == 1
+
+
+def test_json_body_is_canonicalized_and_ttl_expires(app_calls):
+    client, calls = app_calls
+    client.post('/hpi', content='{"x": 1, "y": 2}', headers={'Content-Type': 'application/json'})
+    assert client.post('/hpi', json={'y': 2, 'x': 1}).headers['x-cache'] == 'HIT'
+    time.sleep(0.1)
+    assert client.post('/hpi', json={'y': 2, 'x': 1}).headers['x-cache'] == 'MISS'
+    assert len(calls) == 2
+
+
+def test_unmarked_routes_and_lru_eviction(app_calls, cache):
+    client, calls = app_calls
+    client.get('/live')
+    client.get('/live')
+    assert calls == ['live', 'live']
+
+    for a in (1, 2, 3):
+        client.get(f'/score?a={a}')
+    assert cache.stats()['evictions'] == 1
+    assert client.get('/score?a=1').headers['x-cache'] == 'MISS'
+
+
+def test_shared_backend_serves_other_workers():
+    backend = DictBackend()
+    worker_a = ResponseCache(backend=backend)
+    worker_b = ResponseCache(backend=backend)
+    stored = worker_a.put('key', b'{"score": 6}', 'application/json')
+
+    entry = worker_b.get('key')
+    assert entry.body == b'{"score": 6}' and entry.etag == stored.etag
+    assert worker_b.stats()['backend_hits'] == 1
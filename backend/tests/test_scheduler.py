@@ -0,0 +1,63 @@
+import pytest
+from app.tasks import scheduler as scheduler_module
+
+
+class FakeScraper:
+    LATAM_LOCATIONS = {'Colombia': ['Bogotá', 'Medellín']}
+    JOB_KEYWORDS = ['python', 'qa']
+    calls = []
+    failing = set()
+
+    def search_linkedin_jobs(self, keywords, location, max_results=20):
+        FakeScraper.calls.append((location, keywords))
+        if location in FakeScraper.failing:
+            raise ConnectionError('connection reset')
+        return [{'job_id': f'{location}-{keywords}', 'url': f'https://www.linkedin.com/jobs/view/{location}-{keywords}'}]
+
+
+class FakeScheduler:
+
+    def __init__(self):
+        self.started = False
+        self.jobs = []
+
+    def start(self):
+        self.started = True
+
+    def add_job(self, func, **kwargs):
+        self.jobs.append(func)
+
+
+@pytest.fixture
+def restartable(tmp_path, monkeypatch):
+    monkeypatch.setenv('SCHEDULER_STATE_DIR', str(tmp_path))
+    monkeypatch.setenv('SCRAPE_MIN_INTERVAL', '0')
+    monkeypatch.setattr(scheduler_module, 'LinkedInGoogleScraper', FakeScraper)
+    monkeypatch.setattr(scheduler_module, 'scheduler', FakeScheduler())
+    FakeScraper.calls = []
+    FakeScraper.failing = set()
+    return scheduler_module
+
+
+def test_restart_resumes_interrupted_scrape(restartable):
+    FakeScraper.failing = {'Medellín'}
+    restartable.scheduled_linkedin_scrape()
+    assert len(FakeScraper.calls) == 4
+
+    # Process restarts long before the next 2am cron
+    FakeScraper.calls = []
+    FakeScraper.failing = set()
+    restartable.start_scheduler()
+    assert restartable.scheduler.started
+    assert restartable.scheduler.jobs == [restartable.scheduled_linkedin_scrape]
+
+    restartable.scheduler.jobs[0]()
+    assert sorted(FakeScraper.calls) == [('Medellín', 'python'), ('Medellín', 'qa')]
+    assert not restartable.build_linkedin_queue().has_resumable_run()
+
+
+def test_restart_after_finished_scrape_waits_for_cron(restartable):
+    restartable.scheduled_linkedin_scrape()
+
+    restartable.start_scheduler()
+    assert restartable.scheduler.jobs == []
@@ -0,0 +1,119 @@
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from app.tasks.work_queue import RunInProgress, ScrapeWorkQueue, WorkItem
+
+
+def make_items():
+    return [
+        WorkItem(f"{city}:{keyword}", {'city': city, 'keyword': keyword}, host='search', tags={'city': city, 'keyword': keyword})
+        for city in ('Bogotá', 'Lima')
+        for keyword in ('python', 'qa')
+    ]
+
+
+def test_yields_prioritize_next_run(tmp_path):
+    queue = ScrapeWorkQueue('job', state_dir=str(tmp_path), workers=1)
+    found = {'Bogotá': 4, 'Lima': 0}
+    queue.run(make_items(), lambda p: ['job'] * (found[p['city']] + (p['keyword'] == 'python')))
+
+    order = []
+    queue = ScrapeWorkQueue('job', state_dir=str(tmp_path), workers=1)
+    summary = queue.run(make_items(), lambda p: order.append((p['city'], p['keyword'])) or [])
+    assert order[0] == ('Bogotá', 'python')
+    assert order[-1] == ('Lima', 'qa')
+    assert summary['completed_items'] == 4
+
+
+def test_interrupted_run_resumes(tmp_path):
+    def flaky(payload):
+        if payload['city'] == 'Lima':
+            raise RuntimeError('connection reset')
+        return ['job']
+
+    summary = ScrapeWorkQueue('job', state_dir=str(tmp_path)).run(make_items(), flaky)
+    assert summary['failed_items'] == 2
+    assert summary['finished_at'] is None
+
+    calls = []
+    summary = ScrapeWorkQueue('job', state_dir=str(tmp_path)).run(make_items(), lambda p: calls.append(p) or ['job'])
+    assert sorted(p['city'] for p in calls) == ['Lima', 'Lima']
+    assert summary['finished_at'] is not None
+    assert summary['completed_items'] == 4
+    assert summary['total_results'] == 4
+
+
+def test_yields_are_learned_when_some_items_fail(tmp_path):
+    def flaky(payload):
+        if payload['city'] == 'Lima':
+            raise RuntimeError('connection reset')
+        return ['job'] * 3
+
+    queue = ScrapeWorkQueue('job', state_dir=str(tmp_path))
+    summary = queue.run(make_items(), flaky)
+    assert summary['failed_items'] == 2
+    assert queue.tag_yield('city', 'Bogotá') == 3.0
+    assert queue.tag_yield('city', 'Lima') == 1.0
+    assert queue.has_resumable_run()
+
+    # Resuming learns from the retried items only
+    queue.run(make_items(), lambda p: [])
+    assert queue.tag_yield('city', 'Bogotá') == 3.0
+    assert queue.tag_yield('city', 'Lima') == 0.0
+    assert not queue.has_resumable_run()
+
+
+def test_stale_unfinished_run_starts_fresh(tmp_path):
+    done = {'results': 1, 'duration_s': 0.1, 'priority': 1.0, 'tags': {'city': 'Bogotá', 'keyword': 'python'}, 'error': None}
+    state = {
+        'run': {'started_at': (datetime.utcnow() - timedelta(days=2)).isoformat(), 'finished_at': None,
+                'items': {'Bogotá:python': done}},
+        'yields': {},
+        'last_run': None
+    }
+    (tmp_path / 'job_state.json').write_text(json.dumps(state), encoding='utf-8')
+
+    calls = []
+    summary = ScrapeWorkQueue('job', state_dir=str(tmp_path)).run(make_items(), lambda p: calls.append(p) or ['job'])
+    assert len(calls) == 4
+    assert summary['finished_at'] is not None
+    assert summary['started_at'] > state['run']['started_at']
+
+
+def test_overlapping_runs_are_rejected(tmp_path):
+    started, release = threading.Event(), threading.Event()
+
+    def slow(payload):
+        started.set()
+        release.wait(5)
+        return []
+
+    first = ScrapeWorkQueue('job', state_dir=str(tmp_path), workers=1)
+    thread = threading.Thread(target=first.run, args=(make_items()[:1], slow))
+    thread.start()
+    started.wait(5)
+    with pytest.raises(RunInProgress):
+        ScrapeWorkQueue('job', state_dir=str(tmp_path)).run(make_items(), lambda p: [])
+    release.set()
+    thread.join()
+
+
+def test_per_host_limit(tmp_path):
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def handler(payload):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return []
+
+    queue = ScrapeWorkQueue('job', state_dir=str(tmp_path), workers=4, per_host=2)
+    queue.run(make_items(), handler)
+    assert peak[0] <= 2
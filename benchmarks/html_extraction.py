@@ -0,0 +1,143 @@
+"""
+HTML Extraction Benchmark
+=========================
+Parse time and peak memory of the Oracle page extraction on heavy pages:
+
+- baseline: decoded body + full ``BeautifulSoup(html, 'html.parser')`` tree + ``get_text().lower()``
+- bounded:  ``extract_page`` fed in 64 KB chunks (as ``fetch_page`` streams
+            the response) with the default byte cap: lxml target parser,
+            script/style/SVG contents dropped as they arrive, no tree
+
+The fixture set is generated deterministically (single-page apps with
+multi-MB inline JS bundles, inline CSS and SVG sprites, and a long
+content page), so no large files are kept in the repository. Peak memory
+is measured as resident-set growth in a fresh process (Linux /proc), since
+lxml allocates outside the Python heap where tracemalloc cannot see it.
+
+Usage:
+    python benchmarks/html_extraction.py
+"""
+
+import multiprocessing
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.html_extraction import CHUNK_SIZE, extract_page
+
+
+def _content(rng: random.Random, paragraphs: int) -> str:
+    words = ['we', 'are', 'hiring', 'python', 'engineers', 'kubernetes', 'platform', 'series', 'remote',
+             'team', 'product', 'customers', 'analytics', 'react', 'growth', 'latam', 'cloud', 'data']
+    return '\n'.join(
+        f"<section><h2>Section {i}</h2><p>{' '.join(rng.choice(words) for _ in range(60))}</p>"
+        f"<ul><li><a href='/careers/{i}'>Open role {i}</a></li></ul></section>"
+        for i in range(paragraphs)
+    )
+
+
+def make_spa_page(seed: int, js_bytes: int, css_bytes: int = 200_000, svg_icons: int = 300) -> str:
+    """Single-page app shell: huge inline bundle, inline CSS, SVG sprite, little text."""
+    rng = random.Random(seed)
+    bundle = ''.join(f"function f{i}(a,b){{return a+b*{i}}};" for i in range(js_bytes // 32))
+    state = '{"items":[' + ','.join(f'{{"id":{i},"html":"<p>item {i}</p>"}}' for i in range(js_bytes // 200)) + ']}'
+    css = ''.join(f".c{i}{{margin:{i % 9}px;color:#{i % 999:03d}}}" for i in range(css_bytes // 30))
+    icons = ''.join(f'<symbol id="i{i}"><path d="M{i} 0 L{i} 10 Z"/></symbol>' for i in range(svg_icons))
+    return (
+        f"<!DOCTYPE html><html><head><title>App {seed}</title>"
+        f"<meta name='description' content='Company {seed} builds analytics.'><style>{css}</style></head>"
+        f"<body><svg style='display:none'>{icons}</svg><div id='root'>{_content(rng, 20)}</div>"
+        f"<script>window.__STATE__={state}</script><script>{bundle}</script>"
+        f"<script src='https://boards.greenhouse.io/embed/job_board/js?for=company{seed}'></script></body></html>"
+    )
+
+
+def make_content_page(seed: int, paragraphs: int = 3000) -> str:
+    """Long server-rendered page (blog archive / press list)."""
+    rng = random.Random(seed)
+    return f"<html><head><title>Blog</title></head><body>{_content(rng, paragraphs)}</body></html>"
+
+
+FIXTURES = {
+    'spa_2mb_js': lambda: make_spa_page(1, 2_000_000),
+    'spa_5mb_js': lambda: make_spa_page(2, 5_000_000),
+    'spa_8mb_js': lambda: make_spa_page(3, 8_000_000),
+    'content_3000_sections': lambda: make_content_page(4),
+}
+
+
+def baseline(body: bytes) -> str:
+    # response.text, then a full tree
+    soup = BeautifulSoup(body.decode('utf-8'), 'html.parser')
+    return soup.get_text().lower()
+
+
+def bounded(body: bytes) -> str:
+    data = body
+    chunks = (data[start:start + CHUNK_SIZE] for start in range(0, len(data), CHUNK_SIZE))
+    return extract_page(chunks, 'https://example.com/').text
+
+
+def _status_kb(field: str) -> int:
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith(field + ':'):
+                return int(line.split()[1])
+    return 0
+
+
+def _rss_child(fn_name: str, fixture: str, conn):
+    body = FIXTURES[fixture]().encode('utf-8')
+    before = _status_kb('VmRSS')
+    with open('/proc/self/clear_refs', 'w') as clear_refs:
+        clear_refs.write('5')  # reset the peak-RSS watermark
+    globals()[fn_name](body)
+    conn.send(max(0, _status_kb('VmHWM') - before) * 1024)
+    conn.close()
+
+
+def _peak_rss_growth(fn, fixture: str) -> int:
+    """Run ``fn`` on a fixture in a fresh process and return its peak RSS growth in bytes (Linux)."""
+    context = multiprocessing.get_context('spawn')
+    parent_conn, child_conn = context.Pipe()
+    process = context.Process(target=_rss_child, args=(fn.__name__, fixture, child_conn))
+    process.start()
+    growth = parent_conn.recv()
+    process.join()
+    return growth
+
+
+def measure(fn, fixture: str, body: bytes, repeats: int = 3):
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn(body)
+        times.append(time.perf_counter() - started)
+    return statistics.median(times), _peak_rss_growth(fn, fixture)
+
+
+def run(repeats: int = 3):
+    rows = []
+    for name, make in FIXTURES.items():
+        body = make().encode('utf-8')
+        base_time, base_peak = measure(baseline, name, body, repeats)
+        new_time, new_peak = measure(bounded, name, body, repeats)
+        rows.append((name, len(body) / 1e6, base_time, new_time, base_peak / 1e6, new_peak / 1e6))
+    return rows
+
+
+def main():
+    print(f"{'page':<24}{'size MB':>8}{'parse s (base→new)':>24}{'speedup':>9}{'peak MB (base→new)':>24}{'saved':>8}")
+    for name, size, base_time, new_time, base_peak, new_peak in run():
+        print(f"{name:<24}{size:>8.1f}{base_time:>12.3f} → {new_time:<9.3f}{base_time / new_time:>8.1f}x"
+              f"{base_peak:>12.1f} → {new_peak:<9.1f}{1 - new_peak / base_peak:>8.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Money Extraction Benchmark
+==========================
+Throughput of funding-amount extraction over a synthetic news / company
+page corpus:
+
+- legacy: the per-module regex lists this extractor replaced (Oracle,
+          regional NLP, intent engine), each tried in sequence over the
+          full text, as one multi-engine analysis used to run them
+- shared: one ``find_money_amounts`` scan, reused by every consumer
+
+The corpus is generated deterministically: English, Spanish and Portuguese
+sentences with and without amounts, mixed with filler text.
+
+Usage:
+    python benchmarks/money_extraction.py
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.money_amounts import extract_funding_amount, find_money_amounts
+
+LEGACY_PATTERNS = [
+    # OracleFundingDetector.FUNDING_PATTERNS
+    [r'\$\s*(\d+(?:\.\d+)?)\s*(million|m|mm)',
+     r'\$\s*(\d+(?:\.\d+)?)\s*(billion|b)',
+     r'(\d+(?:\.\d+)?)\s*(million|m|mm)\s*(?:dollars?|usd|\$)',
+     r'raised\s+\$\s*(\d+(?:\.\d+)?)\s*(million|m|mm)',
+     r'funding\s+of\s+\$\s*(\d+(?:\.\d+)?)\s*(million|m|mm)'],
+    # RegionalEntityRecognizer.FUNDING_PATTERNS
+    [r'\$(\d+(?:\.\d+)?)\s*(M|million|B|billion)',
+     r'raised\s+\$?(\d+(?:\.\d+)?)\s*(M|million|B|billion)',
+     r'secured\s+\$?(\d+(?:\.\d+)?)\s*(M|million|B|billion)',
+     r'closed\s+\$?(\d+(?:\.\d+)?)\s*(M|million|B|billion)',
+     r'(Series [A-D]|Seed|Pre-seed)\s+round'],
+    # IntentClassificationEngine._extract_funding_from_text
+    [r'\$(\d+(?:\.\d+)?)\s*(?:million|M)\b',
+     r'\$(\d+(?:\.\d+)?)\s*(?:billion|B)\b',
+     r'raised\s+\$(\d+(?:\.\d+)?)\s*(?:million|M)\b',
+     r'secured\s+\$(\d+(?:\.\d+)?)\s*(?:million|M)\b'],
+]
+
+SENTENCES = [
+    'Nimbus raised ${n}M in a Series B led by Sequoia.',
+    'The company closed a ${n}.5 billion round to expand in LATAM.',
+    'La startup levantó {n},2 millones de dólares en su ronda semilla.',
+    'A fintech captou R$ {n} milhões de investidores em São Paulo.',
+    'La fintech levantó MXN {n}00 millones para crecer en Monterrey.',
+    'Plans start at ${n}9/month for small teams.',
+]
+FILLER = ('We are hiring engineers across Colombia, Mexico and Brazil to build our '
+          'analytics platform, with a remote-first culture and a growing team. ')
+
+
+def make_corpus(documents: int = 2000, seed: int = 7):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(documents):
+        parts = [FILLER * rng.randint(1, 6)]
+        for _ in range(rng.randint(0, 3)):
+            parts.append(rng.choice(SENTENCES).format(n=rng.randint(1, 90)))
+            parts.append(FILLER * rng.randint(0, 3))
+        corpus.append(' '.join(parts))
+    return corpus
+
+
+def legacy(text: str):
+    found = []
+    for patterns in LEGACY_PATTERNS:
+        for pattern in patterns:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                found.append(match.group(0))
+                break
+    return found
+
+
+def shared(text: str):
+    amounts = find_money_amounts(text)
+    return [amount for amount in amounts if amount.scale >= 1e6 or amount.usd >= 1e6]
+
+
+def measure(fn, corpus, repeats: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for text in corpus:
+            fn(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    corpus = make_corpus()
+    size_mb = sum(len(text) for text in corpus) / 1e6
+    found = sum(1 for text in corpus if extract_funding_amount(text))
+    print(f"corpus: {len(corpus)} documents, {size_mb:.1f} MB, {found} with a funding amount")
+    print(f"{'extractor':<10}{'seconds':>10}{'MB/s':>10}{'docs/s':>12}")
+    for name, fn in (('legacy', legacy), ('shared', shared)):
+        seconds = measure(fn, corpus)
+        print(f"{name:<10}{seconds:>10.3f}{size_mb / seconds:>10.1f}{len(corpus) / seconds:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
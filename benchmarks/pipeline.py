@@ -0,0 +1,379 @@
+"""
+Pipeline Benchmark Suite
+========================
+End-to-end throughput, latency and peak memory of each pipeline stage on a
+synthetic corpus (``benchmarks/synthetic.py``), with every external service
+answered by the local stand-in server (``benchmarks/stub_services.py``):
+
+- feed_parse:            ``OracleFundingDetector.fetch_sec_filings`` on the Form D Atom feed
+- enrichment:            ``OracleFundingDetector.process_filings`` (triage, DuckDuckGo
+                         resolution, site crawl, ATS board, scoring); latency per filing
+- pulse_scoring:         ``PulseIntegrator.enhance_oracle_data``; latency per company
+- hpi_ghs:               ``HPICalculator.calculate_hpi`` + ``GlobalHiringScoreCalculator.calculate_ghs``
+- intent_classification: ``OutsourcingIntentClassifier.detect_outsourcing_intent`` (keyword
+                         path) over news summaries and job descriptions
+- supabase_push:         ``SupabaseClient`` batched inserts of the pusher artifacts
+                         against PostgREST; latency per request
+- telegram_send:         ``TelegramNotifier.send_message`` of one alert per company
+
+Each stage runs in a fresh process, so its peak RSS is its own (imports
+included) and one stage's caches do not warm the next. The stand-in server
+runs in the parent. A stage that fails is recorded with its error and the
+rest still run.
+
+The JSON report (default ``benchmarks/results/pipeline_<commit>_<timestamp>.json``)
+holds per stage: items, seconds, throughput, latency percentiles
+(p50/p90/p95/p99/max, nearest rank) and peak RSS, plus the commit and
+parameters. ``--baseline`` compares the run against an earlier report.
+
+Usage:
+    python benchmarks/pipeline.py --scale 200
+    python benchmarks/pipeline.py --stages enrichment,pulse_scoring --latency-ms 20
+    python benchmarks/pipeline.py --baseline benchmarks/results/pipeline_<commit>_<ts>.json
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import logging
+import math
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from stub_services import StubServices, StubRoutingAdapter
+from synthetic import SyntheticCorpus
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_RESULTS_DIR = Path(__file__).parent / 'results'
+FEED_PARSE_REPEATS = 5
+
+
+class StageContext:
+    """What a stage function gets: the corpus, the stub URL, a scratch directory and a latency recorder."""
+
+    def __init__(self, corpus: SyntheticCorpus, stub_url: str, workdir: str):
+        self.corpus = corpus
+        self.stub_url = stub_url
+        self.workdir = workdir
+        self.latencies: List[float] = []
+
+    def timed(self, func: Callable) -> Callable:
+        """Wrap ``func`` so each call's duration is recorded as one latency sample."""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.latencies.append(time.perf_counter() - start)
+        return wrapper
+
+    def oracle_detector(self):
+        from oracle_funding_detector import OracleFundingDetector
+        from src.adaptive_throttle import AdaptiveThrottle
+        from src.resolution_index import CompanyResolutionIndex
+
+        detector = OracleFundingDetector(
+            output_dir=self.workdir,
+            use_google_cache=False,
+            resolution_index=CompanyResolutionIndex(os.path.join(self.workdir, 'resolution_index.json')),
+            # The stub never throttles; keep pacing out of the measurement
+            throttle=AdaptiveThrottle(initial_rate=1000, max_rate=1000)
+        )
+        detector.SEC_RSS_FEEDS = {
+            'recent': f"{self.stub_url}/cgi-bin/browse-edgar?action=getcurrent&type=D"
+                      f"&count={self.corpus.scale}&output=atom"
+        }
+        adapter = StubRoutingAdapter(self.stub_url.split('://', 1)[1])
+        detector.session.mount('https://', adapter)
+        detector.session.mount('http://', adapter)
+        return detector
+
+
+# -- Stages -----------------------------------------------------------------
+# Each returns ``(items, seconds)`` with seconds measured around the work
+# only, so imports and fixture setup are not counted.
+
+def stage_feed_parse(ctx: StageContext):
+    detector = ctx.oracle_detector()
+    fetch = ctx.timed(detector.fetch_sec_filings)
+    start = time.perf_counter()
+    items = sum(len(fetch(max_items=ctx.corpus.scale, max_retries=1)) for _ in range(FEED_PARSE_REPEATS))
+    return items, time.perf_counter() - start
+
+
+def stage_enrichment(ctx: StageContext):
+    detector = ctx.oracle_detector()
+    filings = detector.fetch_sec_filings(max_items=ctx.corpus.scale, max_retries=1)
+    detector.process_filing = ctx.timed(detector.process_filing)
+    start = time.perf_counter()
+    detector.process_filings(filings)
+    return len(ctx.latencies), time.perf_counter() - start
+
+
+def stage_pulse_scoring(ctx: StageContext):
+    import pandas as pd
+    from integrate_pulse_intelligence import PulseIntegrator
+
+    integrator = PulseIntegrator(verbose=False)
+    integrator.engine.calculate_pulse_score = ctx.timed(integrator.engine.calculate_pulse_score)
+    oracle_df = pd.DataFrame(ctx.corpus.pulse_rows())
+    start = time.perf_counter()
+    integrator.enhance_oracle_data(oracle_df)
+    return len(ctx.latencies), time.perf_counter() - start
+
+
+def stage_hpi_ghs(ctx: StageContext):
+    from src.global_hiring_score import GlobalHiringScoreCalculator
+    from src.hpi_calculator import HPICalculator
+
+    hpi, ghs = HPICalculator(), GlobalHiringScoreCalculator()
+
+    @ctx.timed
+    def score(company: Dict) -> None:
+        hpi.calculate_hpi(company)
+        ghs.calculate_ghs(funding_amount=company['last_funding_amount'], company_stage=company['company_stage'],
+                          current_team_size=company['employee_count'])
+
+    companies = ctx.corpus.hpi_inputs()
+    start = time.perf_counter()
+    for company in companies:
+        score(company)
+    return len(companies), time.perf_counter() - start
+
+
+def stage_intent_classification(ctx: StageContext):
+    from src.intent_classifier import OutsourcingIntentClassifier
+
+    classifier = OutsourcingIntentClassifier(use_transformers=False)
+    detect = ctx.timed(classifier.detect_outsourcing_intent)
+    texts = ([article['summary'] for article in ctx.corpus.news_articles]
+             + [post['description'] for post in ctx.corpus.job_posts])
+    start = time.perf_counter()
+    for text in texts:
+        detect(text, use_ml=False)
+    return len(texts), time.perf_counter() - start
+
+
+def stage_supabase_push(ctx: StageContext):
+    from src.ghost_supabase_client import SupabaseClient
+
+    client = SupabaseClient(ctx.stub_url, 'bench-service-key')
+    client.insert = ctx.timed(client.insert)
+    artifacts = ctx.corpus.pusher_artifacts()
+    writes = [
+        (client.insert_companies, artifacts['sec_funding.json']),
+        (client.insert_funding_rounds, artifacts['sec_funding.json']),
+        (client.insert_job_postings, artifacts['linkedin_jobs.json']),
+        (client.insert_news_articles, artifacts['osint_news.json']),
+        (client.insert_lead_scores, artifacts['lead_scores.json']),
+    ]
+    inserted = 0
+    start = time.perf_counter()
+    for insert, records in writes:
+        # Same batch size as the pusher's job postings
+        for offset in range(0, len(records), 50):
+            result = insert([dict(record) for record in records[offset:offset + 50]])
+            if not result['success']:
+                raise RuntimeError(f"Insert failed: {result['error']}")
+            inserted += result['count']
+    return inserted, time.perf_counter() - start
+
+
+def stage_telegram_send(ctx: StageContext):
+    import pandas as pd
+    from telegram_notifier import TelegramNotifier
+
+    os.environ.update({'TELEGRAM_BOT_TOKEN': '123456:bench', 'TELEGRAM_CHAT_ID': '-1001'})
+    notifier = TelegramNotifier()
+    notifier.api_url = f"{ctx.stub_url}/bot{notifier.bot_token}"
+    send = ctx.timed(notifier.send_message)
+    rows = [row for _, row in pd.DataFrame(ctx.corpus.oracle_rows).iterrows()]
+    start = time.perf_counter()
+    sent = sum(1 for row in rows if send(notifier.format_company_alert(row)))
+    return sent, time.perf_counter() - start
+
+
+STAGES = {
+    'feed_parse': stage_feed_parse,
+    'enrichment': stage_enrichment,
+    'pulse_scoring': stage_pulse_scoring,
+    'hpi_ghs': stage_hpi_ghs,
+    'intent_classification': stage_intent_classification,
+    'supabase_push': stage_supabase_push,
+    'telegram_send': stage_telegram_send,
+}
+
+
+# -- Measurement ------------------------------------------------------------
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(items: int, seconds: float, latencies: List[float]) -> Dict:
+    result = {
+        'items': items,
+        'operations': len(latencies),
+        'seconds': round(seconds, 4),
+        'throughput_per_s': round(items / seconds, 2) if seconds > 0 else None,
+        'latency_ms': None,
+    }
+    if latencies:
+        ordered = sorted(latencies)
+        result['latency_ms'] = {
+            **{f'p{pct}': round(percentile(ordered, pct) * 1000, 3) for pct in (50, 90, 95, 99)},
+            'max': round(ordered[-1] * 1000, 3),
+            'mean': round(sum(ordered) / len(ordered) * 1000, 3),
+        }
+    return result
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (2**20 if sys.platform == 'darwin' else 2**10), 1)
+
+
+def _run_stage(name: str, scale: int, seed: int, stub_url: str, queue) -> None:
+    """Child process body: run one stage quietly and send back its summary."""
+    sys.path.insert(0, str(PROJECT_ROOT))
+    sys.path.insert(0, str(PROJECT_ROOT / 'scripts'))
+    logging.disable(logging.CRITICAL)
+    result = {'error': None}
+    with tempfile.TemporaryDirectory(prefix=f'pulse-bench-{name}-') as workdir:
+        ctx = StageContext(SyntheticCorpus(scale, seed), stub_url, workdir)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                items, seconds = STAGES[name](ctx)
+            result.update(summarize(items, seconds, ctx.latencies))
+        except Exception as e:
+            # First meaningful line only (NLTK and pandas errors span many)
+            message = next((line.strip() for line in str(e).splitlines() if line.strip().strip('*')), '')
+            result['error'] = f"{type(e).__name__}: {message}"
+    result['peak_rss_mb'] = _peak_rss_mb()
+    queue.put(result)
+
+
+def run_stage(name: str, scale: int, seed: int, stub_url: str) -> Dict:
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_run_stage, args=(name, scale, seed, stub_url, queue))
+    process.start()
+    try:
+        result = queue.get()
+    except Exception as e:
+        result = {'error': f"stage process failed: {e}"}
+    process.join()
+    return result
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(stages: List[str], scale: int, seed: int, latency_ms: float = 0) -> Dict:
+    report = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'scale': scale,
+        'seed': seed,
+        'stub_latency_ms': latency_ms,
+        'stages': {},
+    }
+    with StubServices(SyntheticCorpus(scale, seed), latency_ms=latency_ms) as stub:
+        for name in stages:
+            report['stages'][name] = run_stage(name, scale, seed, stub.url)
+        report['stub_requests'] = dict(stub.requests)
+    return report
+
+
+# -- Output -----------------------------------------------------------------
+
+def _fmt(value, spec: str = '.1f') -> str:
+    return '-' if value is None else format(value, spec)
+
+
+def print_report(report: Dict) -> None:
+    print(f"commit {report['commit'] or 'unknown'}, scale {report['scale']}, seed {report['seed']}, "
+          f"stub latency {report['stub_latency_ms']} ms")
+    print(f"{'stage':<24}{'items':>8}{'items/s':>11}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'RSS MB':>9}")
+    for name, result in report['stages'].items():
+        if result.get('error'):
+            print(f"{name:<24}  error: {result['error']}")
+            continue
+        latency = result['latency_ms'] or {}
+        print(f"{name:<24}{result['items']:>8}{_fmt(result['throughput_per_s']):>11}{_fmt(latency.get('p50'), '.2f'):>10}"
+              f"{_fmt(latency.get('p95'), '.2f'):>10}{_fmt(latency.get('p99'), '.2f'):>10}{result['peak_rss_mb']:>9.1f}")
+
+
+def _change(current, previous) -> str:
+    if current is None or not previous:
+        return '-'
+    return f"{(current - previous) / previous:+.1%}"
+
+
+def compare_reports(report: Dict, baseline: Dict) -> None:
+    print(f"\nvs baseline {baseline.get('commit') or 'unknown'} (scale {baseline.get('scale')})")
+    print(f"{'stage':<24}{'items/s':>11}{'p95 ms':>11}{'RSS MB':>11}")
+    for name, result in report['stages'].items():
+        previous = baseline.get('stages', {}).get(name)
+        if not previous or result.get('error') or previous.get('error'):
+            print(f"{name:<24}  not comparable")
+            continue
+        p95 = (result['latency_ms'] or {}).get('p95')
+        previous_p95 = (previous['latency_ms'] or {}).get('p95')
+        print(f"{name:<24}{_change(result['throughput_per_s'], previous['throughput_per_s']):>11}"
+              f"{_change(p95, previous_p95):>11}{_change(result['peak_rss_mb'], previous['peak_rss_mb']):>11}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scale', type=int, default=200, help='Number of Form D filings / companies')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--stages', default=','.join(STAGES), help=f"Comma-separated subset of: {', '.join(STAGES)}")
+    parser.add_argument('--latency-ms', type=float, default=0, help='Added delay per stub response')
+    parser.add_argument('--output', help='Report path (default: benchmarks/results/pipeline_<commit>_<timestamp>.json)')
+    parser.add_argument('--baseline', help='Earlier report to compare against')
+    args = parser.parse_args()
+
+    stages = [name.strip() for name in args.stages.split(',') if name.strip()]
+    unknown = [name for name in stages if name not in STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)}")
+
+    report = run_suite(stages, args.scale, args.seed, args.latency_ms)
+    print_report(report)
+    if args.baseline:
+        compare_reports(report, json.loads(Path(args.baseline).read_text(encoding='utf-8')))
+
+    output = Path(args.output) if args.output else DEFAULT_RESULTS_DIR / (
+        f"pipeline_{report['commit'] or 'nocommit'}_{datetime.now():%Y%m%d_%H%M%S}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    print(f"\nreport: {output}")
+
+
+if __name__ == '__main__':
+    main()
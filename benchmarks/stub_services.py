@@ -0,0 +1,225 @@
+"""
+Local Stand-in Services
+=======================
+One threaded HTTP server on localhost that answers for every external
+service the pipelines call, from a ``SyntheticCorpus``:
+
+- SEC EDGAR:       ``/cgi-bin/browse-edgar`` (Form D Atom feed), ``.../primary_doc.xml``
+- DuckDuckGo:      ``/html/?q=`` (result page linking to the company site)
+- Google CSE:      ``/customsearch/v1`` (LinkedIn job results)
+- Company sites:   ``<slug>.example.com`` pages; Greenhouse board API
+- PostgREST:       ``/rest/v1/<table>`` (Supabase; echoes inserted rows)
+- Telegram Bot API: ``/bot<token>/getMe`` and ``/sendMessage``
+
+Code that takes a base URL (Supabase, Telegram, the SEC feed) is pointed at
+``StubServices.url`` directly. Code with hard-coded hosts (DuckDuckGo,
+company sites, ATS boards) keeps its URLs: ``StubServices.route_session``
+mounts a transport adapter on its ``requests.Session`` that sends every
+request to the stub with the original host in ``X-Stub-Host``.
+
+``latency_ms`` adds a fixed delay to every response to model network
+round trips; the default of 0 measures the pipeline's own cost.
+
+Usage:
+    python benchmarks/stub_services.py --port 8765 --scale 200   # serve until Ctrl+C
+"""
+
+import argparse
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from synthetic import SyntheticCorpus
+
+SITE_SUFFIX = '.example.com'
+
+
+class StubRoutingAdapter(HTTPAdapter):
+    """Sends every request of a session to the stub server, keeping the original host in a header."""
+
+    def __init__(self, stub_netloc: str, pool_maxsize: int = 32):
+        super().__init__(pool_connections=4, pool_maxsize=pool_maxsize)
+        self.stub_netloc = stub_netloc
+
+    def send(self, request, **kwargs):
+        original_url = request.url
+        parts = urlsplit(original_url)
+        request.headers['X-Stub-Host'] = parts.netloc
+        request.url = urlunsplit(('http', self.stub_netloc, parts.path or '/', parts.query, ''))
+        response = super().send(request, **kwargs)
+        # Callers resolve links against the page URL they asked for
+        response.url = original_url
+        return response
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: '_StubHTTPServer'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, body, content_type: str = 'application/json') -> None:
+        if not isinstance(body, (bytes, str)):
+            body = json.dumps(body)
+        data = body.encode('utf-8') if isinstance(body, str) else body
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'null') if length else None
+
+    def _dispatch(self, method: str) -> None:
+        host = (self.headers.get('X-Stub-Host') or '').split(':')[0]
+        parts = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        service, status, body, content_type = self.server.services.handle(method, host, parts.path, query,
+                                                                          self._body() if method != 'GET' else None)
+        self.server.services.count(service)
+        self._reply(status, body, content_type)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PATCH(self):
+        self._dispatch('PATCH')
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class StubServices:
+    """The stand-in server (see module docstring); use as a context manager."""
+
+    def __init__(self, corpus: SyntheticCorpus, port: int = 0, latency_ms: float = 0):
+        self.corpus = corpus
+        self.requests: Counter = Counter()
+        self.rows_received: Counter = Counter()
+        self.messages_sent = 0
+        self._lock = threading.Lock()
+        self._server = _StubHTTPServer(('127.0.0.1', port), _Handler)
+        self._server.services = self
+        self._server.latency = latency_ms / 1000
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'StubServices':
+        self._thread = threading.Thread(target=self._server.serve_forever, name='stub-services', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'StubServices':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def route_session(self, session: requests.Session) -> requests.Session:
+        """Send all of ``session``'s HTTP(S) traffic to the stub."""
+        adapter = StubRoutingAdapter(urlsplit(self.url).netloc)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def count(self, service: str) -> None:
+        with self._lock:
+            self.requests[service] += 1
+
+    def handle(self, method: str, host: str, path: str, query: Dict, body) -> Tuple[str, int, object, str]:
+        """Return ``(service, status, body, content_type)`` for one request."""
+        corpus = self.corpus
+        html = 'text/html; charset=utf-8'
+        if host.endswith(SITE_SUFFIX):
+            page = corpus.site_page(host[:-len(SITE_SUFFIX)], path)
+            return ('site', 200, page, html) if page else ('site', 404, 'Not found', 'text/plain')
+        if host == 'boards-api.greenhouse.io':
+            board = corpus.greenhouse_board(path.split('/')[3]) if path.count('/') >= 4 else None
+            return ('greenhouse', 200, board) + ('application/json',) if board else ('greenhouse', 404, {}, 'application/json')
+        if host in ('html.duckduckgo.com', 'duckduckgo.com') or path.startswith('/html'):
+            return 'duckduckgo', 200, corpus.duckduckgo_results(query.get('q', '')), html
+        if host == 'www.googleapis.com' or path.startswith('/customsearch/v1'):
+            return 'google_cse', 200, corpus.cse_results(query.get('q', ''), int(query.get('num', 10))), 'application/json'
+        if host == 'webcache.googleusercontent.com':
+            return 'google_cache', 404, 'Not found', 'text/plain'
+        if path.startswith('/Archives/edgar/data/') and path.endswith('/primary_doc.xml'):
+            doc = corpus.form_d_primary_doc(path.split('/')[-2])
+            return ('sec', 200, doc, 'application/xml') if doc else ('sec', 404, 'Not found', 'text/plain')
+        if host in ('www.sec.gov', 'sec.gov') or path.startswith('/cgi-bin/browse-edgar'):
+            count = int(query.get('count', corpus.scale))
+            return 'sec', 200, corpus.form_d_feed(min(count, corpus.scale)), 'application/atom+xml'
+        if path.startswith('/rest/v1/'):
+            return self._postgrest(method, path[len('/rest/v1/'):], body)
+        if host == 'api.telegram.org' or path.startswith('/bot'):
+            return self._telegram(path.rsplit('/', 1)[-1], body)
+        return 'unknown', 404, {'error': f'No stub for {host}{path}'}, 'application/json'
+
+    def _postgrest(self, method: str, table: str, body) -> Tuple[str, int, object, str]:
+        if method == 'GET':
+            return 'postgrest', 200, [], 'application/json'
+        rows = body if isinstance(body, list) else [body] if body else []
+        with self._lock:
+            self.rows_received[table] += len(rows)
+        return 'postgrest', 201 if method == 'POST' else 200, rows, 'application/json'
+
+    def _telegram(self, api_method: str, body) -> Tuple[str, int, object, str]:
+        if api_method == 'getMe':
+            return 'telegram', 200, {'ok': True, 'result': {'id': 1, 'is_bot': True, 'username': 'pulse_bench_bot'}}, 'application/json'
+        if api_method == 'sendMessage':
+            if not body or not body.get('text'):
+                return 'telegram', 400, {'ok': False, 'description': 'Bad Request: message text is empty'}, 'application/json'
+            with self._lock:
+                self.messages_sent += 1
+                message_id = self.messages_sent
+            return 'telegram', 200, {'ok': True, 'result': {'message_id': message_id, 'text': body['text']}}, 'application/json'
+        return 'telegram', 404, {'ok': False, 'description': 'Not Found'}, 'application/json'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--scale', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    args = parser.parse_args()
+
+    with StubServices(SyntheticCorpus(args.scale, args.seed), args.port, args.latency_ms) as stub:
+        print(f"Stand-in services on {stub.url}")
+        print(f"  SEC feed:  {stub.url}/cgi-bin/browse-edgar?action=getcurrent&type=D&output=atom")
+        print(f"  Supabase:  SUPABASE_URL={stub.url}")
+        print(f"  Telegram:  {stub.url}/bot<token>/sendMessage")
+        print("  Other hosts: route a requests.Session through StubRoutingAdapter")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,375 @@
+"""
+Synthetic Corpora
+=================
+Deterministic, configurable-scale inputs for the pipeline benchmarks, shaped
+like what each stage reads in production:
+
+- SEC EDGAR Form D "getcurrent" Atom feed and Form D primary documents
+- company websites (home, about, careers, engineering, press pages) with
+  tech-stack and hiring text, some embedding a Greenhouse job board
+- Greenhouse board JSON, DuckDuckGo HTML results, Google CSE JSON
+- news articles and job posts (the OSINT / LinkedIn artifact formats)
+- Oracle prediction CSV rows, SEC funding and lead score artifacts
+
+Everything is derived from ``(scale, seed)``, so a run in another process
+(the stub server, a benchmark child) sees the same corpus without sharing
+files.
+
+Usage:
+    python benchmarks/synthetic.py --scale 500 --output /tmp/pulse-corpus
+"""
+
+import argparse
+import csv
+import json
+import random
+from datetime import datetime, timedelta
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+PREFIXES = ['Nimbus', 'Quantum', 'Vertex', 'Lumen', 'Cobalt', 'Helix', 'Orbit', 'Pioneer', 'Atlas', 'Kite',
+            'Signal', 'Harbor', 'Ember', 'Northwind', 'Juniper', 'Cascade', 'Falcon', 'Prism', 'Summit', 'Zephyr']
+SUFFIXES = ['Data Labs', 'Software', 'Cloud Systems', 'Analytics', 'AI', 'Robotics', 'Networks', 'Digital',
+            'Platforms', 'Technologies', 'Cyber', 'Bio']
+# A share of filings are investment vehicles that triage skips before enrichment
+VEHICLES = ['Growth Fund IV LP', 'Realty Partners', 'Oil & Gas Royalty LP', 'Capital Holdings']
+TECH = ['Python', 'React', 'Kubernetes', 'AWS', 'PostgreSQL', 'TypeScript', 'Go', 'Terraform', 'Kafka',
+        'Snowflake', 'Django', 'Node.js', 'GraphQL', 'Docker', 'Rust', 'TensorFlow']
+ROLES = ['Senior Backend Engineer', 'Staff Frontend Engineer', 'Data Engineer', 'DevOps Engineer',
+         'Machine Learning Engineer', 'Engineering Manager', 'QA Automation Engineer', 'Mobile Developer']
+LOCATIONS = [('Sao Paulo, Brazil', 'Brazil'), ('Mexico City, Mexico', 'Mexico'), ('Bogota, Colombia', 'Colombia'),
+             ('Buenos Aires, Argentina', 'Argentina'), ('Remote - LATAM', 'Brazil'), ('New York, NY', 'United States')]
+STAGES = ['seed', 'series_a', 'series_b', 'series_c']
+FILLER = ['we', 'build', 'tools', 'for', 'teams', 'that', 'ship', 'faster', 'customers', 'platform', 'growth',
+          'remote', 'distributed', 'across', 'latam', 'product', 'scale', 'engineering', 'culture', 'data']
+HIRING = ["We're hiring engineers to scale our platform.", 'Join our growing team - open positions below.',
+          'We are expanding our engineering team in LATAM and EMEA.', 'Careers: remote-first, hiring now.']
+OUTSOURCING = ['We partner with nearshore development teams to extend our capacity.',
+               'Looking for an offshore agency to build our mobile app.',
+               'Our distributed team works with staff augmentation partners in Latin America.',
+               'We keep all engineering in-house at our headquarters.']
+NEWS_TEMPLATES = ['{name} raises ${amount}M Series {round} to expand engineering',
+                  '{name} opens new hub in {city} and plans to hire {hires} engineers',
+                  '{name} secures ${amount} million in funding led by {investor}',
+                  '{name} announces layoffs amid restructuring']
+INVESTORS = ['Sequoia', 'Kaszek', 'Andreessen Horowitz', 'SoftBank Latin America', 'Accel', 'monashees']
+
+BASE_DATE = datetime(2025, 12, 1, 12, 0, 0)
+
+
+class SyntheticCorpus:
+    """All synthetic inputs for one ``(scale, seed)``; ``scale`` is the number of Form D filings."""
+
+    def __init__(self, scale: int = 200, seed: int = 7, page_paragraphs: int = 40):
+        self.scale = scale
+        self.seed = seed
+        self.page_paragraphs = page_paragraphs
+
+    def _rng(self, *key) -> random.Random:
+        return random.Random(f"{self.seed}:{':'.join(map(str, key))}")
+
+    # -- Companies and Form D filings -------------------------------------
+
+    @cached_property
+    def companies(self) -> List[Dict]:
+        companies = []
+        for i in range(self.scale):
+            rng = self._rng('company', i)
+            if i % 10 == 9:
+                name = f"{rng.choice(PREFIXES)} {rng.choice(VEHICLES)}"
+            else:
+                name = f"{rng.choice(PREFIXES)} {rng.choice(SUFFIXES)} {i}"
+            slug = ''.join(ch for ch in name.lower() if ch.isalnum())
+            cik = f"{1_900_000 + i:010d}"
+            companies.append({
+                'index': i,
+                'name': name,
+                'slug': slug,
+                'cik': cik,
+                'accession': f"{cik}-25-{i:06d}",
+                'website': f"https://{slug}.example.com/",
+                'has_board': rng.random() < 0.5,
+                'tech': rng.sample(TECH, rng.randint(3, 8)),
+                'amount_musd': round(rng.uniform(0.5, 60), 1),
+                'stage': rng.choice(STAGES),
+                'employees': rng.randint(8, 400),
+                'filed': BASE_DATE - timedelta(hours=i * 3),
+            })
+        return companies
+
+    @cached_property
+    def by_name(self) -> Dict[str, Dict]:
+        return {company['name'].lower(): company for company in self.companies}
+
+    @cached_property
+    def by_slug(self) -> Dict[str, Dict]:
+        return {company['slug']: company for company in self.companies}
+
+    def form_d_feed(self, count: Optional[int] = None) -> str:
+        """EDGAR ``getcurrent`` Atom feed of the first ``count`` filings."""
+        entries = []
+        for company in self.companies[:count or self.scale]:
+            link = (f"https://www.sec.gov/Archives/edgar/data/{int(company['cik'])}/"
+                    f"{company['accession'].replace('-', '')}/{company['accession']}-index.htm")
+            updated = company['filed'].strftime('%Y-%m-%dT%H:%M:%S-05:00')
+            entries.append(
+                f"<entry><title>D - {escape(company['name'])} ({company['cik']}) (Filer)</title>"
+                f"<link rel=\"alternate\" type=\"text/html\" href=\"{link}\"/>"
+                f"<summary type=\"html\"> &lt;b&gt;Filed:&lt;/b&gt; {company['filed']:%Y-%m-%d} "
+                f"&lt;b&gt;AccNo:&lt;/b&gt; {company['accession']} &lt;b&gt;Size:&lt;/b&gt; 5 KB</summary>"
+                f"<updated>{updated}</updated><category scheme=\"https://www.sec.gov/\" label=\"form type\" term=\"D\"/>"
+                f"<id>urn:tag:sec.gov,2008:accession-number={company['accession']}</id></entry>"
+            )
+        return (
+            '<?xml version="1.0" encoding="ISO-8859-1" ?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom"><title>Latest Filings - Form D</title>'
+            f'<updated>{BASE_DATE:%Y-%m-%dT%H:%M:%S}-05:00</updated>'
+            + ''.join(entries) + '</feed>'
+        )
+
+    def form_d_primary_doc(self, accession_folder: str) -> Optional[str]:
+        """Form D ``primary_doc.xml`` of a filing (accession number without dashes)."""
+        company = next((c for c in self.companies if c['accession'].replace('-', '') == accession_folder), None)
+        if company is None:
+            return None
+        vehicle = company['index'] % 10 == 9
+        return (
+            f"<?xml version=\"1.0\"?><edgarSubmission><primaryIssuer><cik>{company['cik']}</cik>"
+            f"<entityName>{escape(company['name'])}</entityName>"
+            f"<entityType>{'Limited Partnership' if vehicle else 'Corporation'}</entityType></primaryIssuer>"
+            f"<offeringData><industryGroup><industryGroupType>"
+            f"{'Pooled Investment Fund' if vehicle else 'Other Technology'}</industryGroupType></industryGroup>"
+            f"<offeringSalesAmounts><totalOfferingAmount>{int(company['amount_musd'] * 1_000_000)}</totalOfferingAmount>"
+            f"<totalAmountSold>{int(company['amount_musd'] * 600_000)}</totalAmountSold></offeringSalesAmounts>"
+            f"</offeringData></edgarSubmission>"
+        )
+
+    # -- Company websites and ATS boards ----------------------------------
+
+    def _paragraphs(self, rng: random.Random, count: int, extra: List[str]) -> str:
+        return ''.join(
+            f"<p>{' '.join(rng.choice(FILLER) for _ in range(40))} {rng.choice(extra)}</p>" for _ in range(count)
+        )
+
+    def site_page(self, slug: str, path: str) -> Optional[str]:
+        """HTML of one page of a company site, or None for an unknown page."""
+        company = self.by_slug.get(slug)
+        pages = ('/', '/about', '/careers', '/engineering', '/press')
+        path = path.rstrip('/') or '/'
+        if company is None or path not in pages:
+            return None
+        rng = self._rng('page', slug, path)
+        stack = ', '.join(company['tech'])
+        nav = ''.join(f"<a href='{page}'>{page.strip('/') or 'home'}</a>" for page in pages)
+        extra = HIRING + OUTSOURCING if path in ('/careers', '/engineering') else FILLER
+        body = self._paragraphs(rng, self.page_paragraphs if path == '/' else self.page_paragraphs // 2, extra)
+        board = (f"<script src='https://boards.greenhouse.io/embed/job_board/js?for={slug}'></script>"
+                 if company['has_board'] and path in ('/', '/careers') else '')
+        return (
+            f"<!DOCTYPE html><html><head><title>{escape(company['name'])}</title>"
+            f"<meta name='description' content='{escape(company['name'])} builds software with {stack}.'>"
+            f"<style>{'.c{margin:0}' * 200}</style></head><body><nav>{nav}</nav>"
+            f"<main><h1>{escape(company['name'])}</h1><p>Our stack: {stack}.</p>{body}</main>"
+            f"<script>{'var x=1;' * 500}</script>{board}</body></html>"
+        )
+
+    def greenhouse_board(self, slug: str) -> Optional[Dict]:
+        company = self.by_slug.get(slug)
+        if company is None or not company['has_board']:
+            return None
+        rng = self._rng('board', slug)
+        return {'jobs': [
+            {'id': 4_000_000 + company['index'] * 100 + n,
+             'title': rng.choice(ROLES),
+             'location': {'name': rng.choice(LOCATIONS)[0]},
+             'first_published': (BASE_DATE - timedelta(hours=rng.randint(1, 240))).isoformat() + 'Z',
+             'absolute_url': f"https://boards.greenhouse.io/{slug}/jobs/{4_000_000 + company['index'] * 100 + n}"}
+            for n in range(rng.randint(1, 25))
+        ]}
+
+    def duckduckgo_results(self, query: str) -> str:
+        """DuckDuckGo HTML results page for ``<company> official website``."""
+        name = query.replace('+', ' ').replace(' official website', '').strip().lower()
+        company = self.by_name.get(name)
+        results = ''
+        if company is not None:
+            target = quote(company['website'], safe='')
+            results = (f"<div class='result'><a class='result__a' href='//duckduckgo.com/l/?uddg={target}&rut=1'>"
+                       f"{escape(company['name'])}</a></div>")
+        filler = ''.join(f"<div class='result'><a class='result__a' href='https://directory.example.org/{n}'>"
+                         f"Directory {n}</a></div>" for n in range(9))
+        return f"<html><body><div id='links'>{results}{filler}</div></body></html>"
+
+    def cse_results(self, query: str, num: int = 10) -> Dict:
+        """Google Custom Search JSON: LinkedIn job URLs matching a query."""
+        rng = self._rng('cse', query)
+        return {'items': [
+            {'title': f"{rng.choice(ROLES)} - {rng.choice(self.companies)['name']} | LinkedIn",
+             'link': f"https://www.linkedin.com/jobs/view/{rng.randint(3_000_000_000, 3_999_999_999)}",
+             'snippet': ' '.join(rng.choice(FILLER) for _ in range(25))}
+            for _ in range(min(num, 10))
+        ]}
+
+    # -- News, jobs and Oracle / pusher artifacts -------------------------
+
+    @cached_property
+    def news_articles(self) -> List[Dict]:
+        articles = []
+        for i in range(self.scale * 2):
+            rng = self._rng('news', i)
+            company = rng.choice(self.companies)
+            template = rng.choice(NEWS_TEMPLATES)
+            title = template.format(name=company['name'], amount=company['amount_musd'], round=rng.choice('ABC'),
+                                    city=rng.choice(LOCATIONS)[0], hires=rng.randint(10, 200),
+                                    investor=rng.choice(INVESTORS))
+            articles.append({
+                'company': company['name'],
+                'title': title,
+                'summary': f"{title}. {rng.choice(OUTSOURCING)} {' '.join(rng.choice(FILLER) for _ in range(60))}",
+                'url': f"https://news.example.net/{company['slug']}/{i}",
+                'published': (BASE_DATE - timedelta(hours=i)).isoformat(),
+                'source': 'googlenews',
+                'event_type': 'layoffs' if 'layoffs' in title else 'funding',
+                'sentiment': round(rng.uniform(-1, 1), 2),
+            })
+        return articles
+
+    @cached_property
+    def job_posts(self) -> List[Dict]:
+        posts = []
+        for i in range(self.scale * 3):
+            rng = self._rng('job', i)
+            company = rng.choice(self.companies)
+            location, country = rng.choice(LOCATIONS)
+            posts.append({
+                'job_id': str(3_500_000_000 + i),
+                'company': company['name'],
+                'title': rng.choice(ROLES),
+                'description': f"{rng.choice(HIRING)} {rng.choice(OUTSOURCING)} Stack: {', '.join(company['tech'])}. "
+                               + ' '.join(rng.choice(FILLER) for _ in range(80)),
+                'location': location,
+                'country': country,
+                'url': f"https://www.linkedin.com/jobs/view/{3_500_000_000 + i}",
+                'keywords': rng.sample(TECH, 3),
+                'remote': 'Remote' in location,
+                'posted_date': (BASE_DATE - timedelta(hours=rng.randint(1, 400))).isoformat(),
+            })
+        return posts
+
+    @cached_property
+    def oracle_rows(self) -> List[Dict]:
+        """Rows in the column layout of ``oracle_predictions_*.csv``."""
+        rows = []
+        for company in self.companies:
+            rng = self._rng('oracle', company['index'])
+            board = self.greenhouse_board(company['slug'])
+            job_posts = [{'title': job['title'], 'posted_date': job['first_published']}
+                         for job in board['jobs']] if board else []
+            rows.append({
+                'Company Name': company['name'],
+                'Funding Date': company['filed'].strftime('%Y-%m-%d'),
+                'Days Since Filing': (BASE_DATE - company['filed']).days,
+                'Estimated Amount (M)': f"${company['amount_musd']:.1f}M",
+                'Funding Source': 'SEC Form D',
+                'Tech Stack': ', '.join(company['tech']),
+                'Tech Count': len(company['tech']),
+                'Hiring Signals': rng.randint(0, 12),
+                'Open Roles': len(job_posts),
+                'ATS': 'greenhouse' if board else '',
+                'Job Posts': json.dumps(job_posts) if job_posts else '',
+                'Hiring Probability (%)': round(rng.uniform(20, 99), 1),
+                'Website': company['website'],
+                'Description': f"{company['name']} builds software with {', '.join(company['tech'])}.",
+                'CIK': company['cik'],
+                'Accession Number': company['accession'],
+                'Filing URL': f"https://www.sec.gov/Archives/edgar/data/{int(company['cik'])}/",
+            })
+        return rows
+
+    def pulse_rows(self) -> List[Dict]:
+        """Oracle rows plus the free-text fields ``PulseIntegrator.enhance_oracle_data`` reads."""
+        rows = []
+        for row, company in zip(self.oracle_rows, self.companies):
+            rng = self._rng('pulse', company['index'])
+            rows.append(dict(
+                row,
+                company_name=company['name'],
+                description=row['Description'],
+                tech_stack=row['Tech Stack'],
+                website_content=' '.join(
+                    f"{' '.join(rng.choice(FILLER) for _ in range(40))} {rng.choice(HIRING + OUTSOURCING)}"
+                    for _ in range(self.page_paragraphs // 2)
+                ),
+            ))
+        return rows
+
+    def hpi_inputs(self) -> List[Dict]:
+        """Company dicts for ``HPICalculator.calculate_hpi`` and the GHS calculator."""
+        inputs = []
+        for company in self.companies:
+            rng = self._rng('hpi', company['index'])
+            inputs.append({
+                'company_name': company['name'],
+                'last_funding_date': (company['filed'] - timedelta(days=rng.randint(0, 700))).strftime('%Y-%m-%d'),
+                'employee_count': company['employees'],
+                'employee_count_6m_ago': max(1, int(company['employees'] * rng.uniform(0.6, 1.1))),
+                'last_funding_amount': company['amount_musd'] * 1_000_000,
+                'company_stage': company['stage'],
+            })
+        return inputs
+
+    def pusher_artifacts(self) -> Dict[str, List[Dict]]:
+        """The four JSON artifacts ``GhostSupabasePusher.push_artifacts`` reads."""
+        sec_funding = [{
+            'company_name': company['name'], 'cik': company['cik'], 'offering_type': 'Form D',
+            'amount_usd': company['amount_musd'] * 1_000_000, 'filed_date': company['filed'].strftime('%Y-%m-%d'),
+            'edgar_url': f"https://www.sec.gov/Archives/edgar/data/{int(company['cik'])}/",
+            'accession_number': company['accession'],
+        } for company in self.companies]
+        lead_scores = [{
+            'company': row['Company Name'], 'score': row['Hiring Probability (%)'],
+            'priority': 'high' if row['Hiring Probability (%)'] >= 70 else 'medium',
+            'factors': [f"tech:{tech}" for tech in row['Tech Stack'].split(', ')[:3]],
+        } for row in self.oracle_rows]
+        return {
+            'sec_funding.json': sec_funding,
+            'linkedin_jobs.json': self.job_posts,
+            'osint_news.json': self.news_articles,
+            'lead_scores.json': lead_scores,
+        }
+
+    def write(self, output_dir: str) -> Dict[str, str]:
+        """Write the file-based corpora (feed, Oracle CSV, artifacts, sample site) to ``output_dir``."""
+        root = Path(output_dir)
+        (root / 'artifacts').mkdir(parents=True, exist_ok=True)
+        (root / 'sites').mkdir(exist_ok=True)
+        paths = {'form_d_feed': root / 'form_d_feed.atom', 'oracle_csv': root / 'oracle_predictions.csv'}
+        paths['form_d_feed'].write_text(self.form_d_feed(), encoding='utf-8')
+        with open(paths['oracle_csv'], 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(self.oracle_rows[0]))
+            writer.writeheader()
+            writer.writerows(self.oracle_rows)
+        for name, records in self.pusher_artifacts().items():
+            paths[name] = root / 'artifacts' / name
+            paths[name].write_text(json.dumps(records), encoding='utf-8')
+        for company in self.companies[:3]:
+            (root / 'sites' / f"{company['slug']}.html").write_text(self.site_page(company['slug'], '/'), encoding='utf-8')
+        return {name: str(path) for name, path in paths.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scale', type=int, default=200, help='Number of Form D filings / companies')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', required=True, help='Directory to write the corpus to')
+    args = parser.parse_args()
+
+    for name, path in SyntheticCorpus(args.scale, args.seed).write(args.output).items():
+        print(f"{name:<22}{path}")
+
+
+if __name__ == '__main__':
+    main()
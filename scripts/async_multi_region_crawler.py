@@ -0,0 +1,229 @@
+"""
+Async Multi-Region Crawler
+==========================
+Crawls every region in a single process and a single asyncio event loop.
+
+Replaces four regional GitHub Actions jobs (four cold starts, four dependency
+installs) plus the ``merge_regional_results.py`` pass:
+
+- One ``MultiRegionCrawler`` per region plans its value-ranked CSE queries
+  within its per-region quota from the shared ledger
+- Queries from all regions run concurrently, bounded by a global concurrency
+  limit and a per-host limit with minimum spacing between requests
+- Finished (country, company) results are streamed to one deduplicated CSV
+  as they complete, in the same format as ``merged_global_scraped.csv``
+
+Sharding across machines remains possible with ``--regions`` (split by
+region) or ``--shard i/N`` (split the company universe; see merge_shards.py).
+
+Usage:
+    python scripts/async_multi_region_crawler.py
+    python scripts/async_multi_region_crawler.py --regions andean_region,southern_cone
+
+Author: PulseB2B Senior Backend Engineer
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+# Add scripts directory and project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from multi_region_crawler import MultiRegionCrawler, RegionResultCollector
+from cse_budget import QuotaLedger, REGIONS, DEFAULT_LEDGER_PATH
+from src.checkpoint_journal import CheckpointJournal, open_journal
+from src.sharding import filter_shard, parse_shard, shard_suffix
+
+MERGED_FIELDNAMES = [
+    'company_name', 'country', 'country_code', 'region',
+    'job_count', 'job_urls', 'timezone_match', 'currency_type',
+    'scraped_at', 'funding_amount', 'original_region'
+]
+
+
+class HostLimiter:
+    """
+    Per-host concurrency limit with a minimum interval between request starts.
+    """
+
+    def __init__(self, per_host: int = 2, min_interval: float = 1.0):
+        self.per_host = max(1, per_host)
+        self.min_interval = min_interval
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last_start: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def limit(self, host: str):
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.per_host))
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with semaphore:
+            async with lock:
+                loop = asyncio.get_running_loop()
+                wait = self.min_interval - (loop.time() - self._last_start.get(host, float('-inf')))
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._last_start[host] = loop.time()
+            yield
+
+
+class StreamingDedupWriter:
+    """
+    Appends results to one CSV as they arrive, skipping (company, country) duplicates.
+    """
+
+    def __init__(self, output_path: str, fieldnames: List[str] = MERGED_FIELDNAMES):
+        self.output_path = Path(output_path)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._seen = set()
+        self.written = 0
+        self.duplicates = 0
+        self._file = open(self.output_path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction='ignore')
+        self._writer.writeheader()
+
+    def write(self, result: Dict) -> bool:
+        """Write a result unless already written; returns True if written."""
+        key = (result['company_name'].strip().lower(), result['country_code'])
+        if key in self._seen:
+            self.duplicates += 1
+            return False
+        self._seen.add(key)
+        row = dict(result)
+        if isinstance(row.get('job_urls'), list):
+            row['job_urls'] = '|'.join(row['job_urls'])
+        self._writer.writerow(row)
+        self._file.flush()
+        self.written += 1
+        return True
+
+    def close(self) -> None:
+        self._file.close()
+
+
+async def crawl_all_regions(
+    crawlers: List[MultiRegionCrawler],
+    companies: List[Dict],
+    writer: StreamingDedupWriter,
+    journal: Optional[CheckpointJournal] = None,
+    concurrency: int = 4,
+    per_host: int = 2,
+    min_interval: float = 1.0
+) -> Dict[str, int]:
+    """
+    Run every region's planned CSE queries in one event loop.
+
+    Args:
+        crawlers: One crawler per region (sharing a quota ledger)
+        companies: Companies to search
+        writer: Streaming deduplicated output
+        journal: Optional checkpoint journal shared by all regions
+        concurrency: Max in-flight queries across all regions
+        per_host: Max in-flight queries per host
+        min_interval: Minimum seconds between request starts per host
+
+    Returns:
+        Executed query count per region
+    """
+    global_limit = asyncio.Semaphore(max(1, concurrency))
+    host_limiter = HostLimiter(per_host, min_interval)
+
+    async def run_query(crawler: MultiRegionCrawler, collector: RegionResultCollector, planned: Dict) -> None:
+        host = urlparse(crawler.CSE_ENDPOINT).netloc
+        async with global_limit:
+            async with host_limiter.limit(host):
+                search_results = await asyncio.to_thread(
+                    crawler.execute_cse_query, planned['query'], planned['country']
+                )
+        # Back on the event loop thread: collector, journal and writer need no locks
+        for result in collector.add(planned, search_results.get('items', [])):
+            writer.write(result)
+
+    async def run_region(crawler: MultiRegionCrawler) -> int:
+        # The ledger blocks on a file lock and rewrites its JSON file: keep it off the loop
+        replayed, plan, granted = await asyncio.to_thread(crawler.plan_region, companies, journal)
+        for result in replayed:
+            writer.write(result)
+        collector = RegionResultCollector(crawler, plan, journal)
+        try:
+            await asyncio.gather(*(run_query(crawler, collector, planned) for planned in plan))
+        finally:
+            await asyncio.to_thread(crawler.finish_region, granted, collector)
+        print(f"📊 Region {crawler.region}: {collector.executed} queries")
+        return collector.executed
+
+    executed = await asyncio.gather(*(run_region(crawler) for crawler in crawlers))
+    return {crawler.region: count for crawler, count in zip(crawlers, executed)}
+
+
+def main():
+    """Crawl all (or selected) regions in one process."""
+    parser = argparse.ArgumentParser(description='Async Multi-Region Ghost Crawler')
+    parser.add_argument('--regions', default=','.join(REGIONS), help='Comma-separated regions (default: all)')
+    parser.add_argument('--output', default='data/output/merged_global_scraped.csv', help='Deduplicated output CSV')
+    parser.add_argument('--concurrency', type=int, default=4, help='Max in-flight queries across regions')
+    parser.add_argument('--per-host', type=int, default=2, help='Max in-flight queries per host')
+    parser.add_argument('--resume', metavar='RUN_ID', help='Resume an interrupted crawl from its checkpoint journal')
+    parser.add_argument('--shard', metavar='I/N', help='Only crawl companies on shard I of N (0-based)')
+    args = parser.parse_args()
+    shard = parse_shard(args.shard)
+    suffix = shard_suffix(shard)
+
+    api_key = os.getenv('GOOGLE_CSE_API_KEY', '')
+    cse_id = os.getenv('GOOGLE_CSE_ID', '')
+    if not api_key or not cse_id:
+        print("⚠️  GOOGLE_CSE_API_KEY and/or GOOGLE_CSE_ID are not set; CSE queries will return no results.")
+
+    ledger = QuotaLedger(os.getenv('CSE_QUOTA_LEDGER', DEFAULT_LEDGER_PATH),
+                         daily_quota=int(os.getenv('CSE_DAILY_QUOTA', 100)) // (shard[1] if shard else 1))
+    crawlers = []
+    for region in [r.strip() for r in args.regions.split(',') if r.strip()]:
+        crawler = MultiRegionCrawler(api_key, cse_id, region, ledger=ledger)
+        if not args.resume and not crawler.check_cooldown_status():
+            print(f"⏸️ Region {region} is in cool-down period. Skipping...")
+            continue
+        crawlers.append(crawler)
+
+    if not crawlers:
+        print("⏸️ All regions are in cool-down")
+        sys.exit(0)
+
+    companies = filter_shard(crawlers[0].load_companies_from_oracle(), shard, lambda c: c['company_name'])
+    if not companies:
+        print("⚠️ No companies to scrape")
+        sys.exit(1)
+
+    print(f"🚀 Async Multi-Region Crawl: {', '.join(c.region for c in crawlers)}")
+    output_path = args.output
+    if suffix:
+        output_path = str(Path(output_path).with_name(Path(output_path).stem + suffix + '.csv'))
+    writer = StreamingDedupWriter(output_path)
+    try:
+        with open_journal(f'crawl_all{suffix}', args.resume, 'data/checkpoints') as journal:
+            executed = asyncio.run(crawl_all_regions(
+                crawlers, companies, writer, journal,
+                concurrency=args.concurrency, per_host=args.per_host
+            ))
+    finally:
+        writer.close()
+
+    for crawler in crawlers:
+        crawler.request_count = executed.get(crawler.region, 0)
+        crawler.update_cooldown_tracker()
+        crawler.translation_memo.save()
+
+    print(f"\n✅ Async crawl complete: {writer.written} unique results "
+          f"({writer.duplicates} duplicates skipped) → {output_path}")
+    print(f"📊 Queries per region: {executed}")
+
+
+if __name__ == '__main__':
+    main()
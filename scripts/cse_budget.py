@@ -0,0 +1,271 @@
+"""
+Google CSE Budget Allocator
+===========================
+Value-aware packing of the 100/day Google Custom Search quota.
+
+Instead of spending the quota on whichever companies come first, every
+(company, country, job board) candidate is ranked by expected value:
+
+    company value (Oracle hiring probability + funding) x board yield history
+
+Candidates sharing a country and board are combined into one OR'd dork query
+(``site:board ("A" OR "B" OR "C") ...``) while the query stays within Google's
+word/length limits, and the highest-value packed queries win the budget.
+
+A file-locked quota ledger is shared by the regional crawls so parallel jobs
+on the same host (or sharing the ledger via cache) cannot overspend the daily
+quota. It also keeps per-board yield history used for the next ranking.
+
+Author: PulseB2B Senior Backend Engineer
+"""
+
+import json
+import math
+import os
+import re
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: ledger updates are not locked
+    fcntl = None
+
+DEFAULT_LEDGER_PATH = 'data/logs/cse_quota_ledger.json'
+DEFAULT_DAILY_QUOTA = 100
+REGIONS = ('north_america', 'central_america', 'andean_region', 'southern_cone')
+
+
+class QuotaLedger:
+    """
+    Shared, file-locked ledger of daily CSE usage and board yield history.
+    """
+
+    def __init__(self, path: str = DEFAULT_LEDGER_PATH, daily_quota: int = DEFAULT_DAILY_QUOTA,
+                 regions: tuple = REGIONS):
+        """
+        Initialize the ledger.
+
+        Args:
+            path: JSON ledger file shared by all regional crawls
+            daily_quota: Total CSE queries allowed per UTC day
+            regions: Regions splitting the quota
+        """
+        self.path = Path(path)
+        self.daily_quota = daily_quota
+        self.regions = regions
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def _locked(self):
+        """Yield the ledger state under an exclusive lock and persist it on exit."""
+        lock_file = open(self.path.with_suffix('.lock'), 'w')
+        try:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            state = self._read()
+            today = datetime.utcnow().strftime('%Y-%m-%d')
+            if state.get('date') != today:
+                state = {'date': today, 'used': {}, 'finished': [],
+                         'board_yield': state.get('board_yield', {})}
+            yield state
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_path, self.path)
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+    def _read(self) -> Dict:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _region_cap(self, state: Dict, region: str) -> int:
+        """Fair share plus whatever finished regions left unused."""
+        share = self.daily_quota // len(self.regions)
+        leftover = sum(
+            max(0, share - state['used'].get(r, 0))
+            for r in state['finished'] if r != region
+        )
+        return share + leftover
+
+    def reserve(self, region: str, requested: int) -> int:
+        """
+        Reserve up to ``requested`` queries for a region.
+
+        Returns:
+            Number of queries granted (may be 0)
+        """
+        with self._locked() as state:
+            used_total = sum(state['used'].values())
+            region_used = state['used'].get(region, 0)
+            granted = max(0, min(
+                requested,
+                self.daily_quota - used_total,
+                self._region_cap(state, region) - region_used
+            ))
+            state['used'][region] = region_used + granted
+        return granted
+
+    def release(self, region: str, unused: int, finished: bool = True) -> None:
+        """Return unused queries and optionally mark the region finished for today."""
+        with self._locked() as state:
+            state['used'][region] = max(0, state['used'].get(region, 0) - max(0, unused))
+            if finished and region not in state['finished']:
+                state['finished'].append(region)
+
+    def record_yields(self, yields: Dict[str, List[int]]) -> None:
+        """Add per-board ``[queries, hits]`` counts to the yield history."""
+        with self._locked() as state:
+            for board, (queries, hits) in yields.items():
+                stats = state['board_yield'].setdefault(board, {'queries': 0, 'hits': 0})
+                stats['queries'] += queries
+                stats['hits'] += hits
+
+    def board_yield(self) -> Dict[str, Dict[str, int]]:
+        """Return the board yield history (``{board: {'queries', 'hits'}}``)."""
+        return self._read().get('board_yield', {})
+
+    def usage(self) -> Dict[str, int]:
+        """Return today's per-region usage."""
+        state = self._read()
+        if state.get('date') != datetime.utcnow().strftime('%Y-%m-%d'):
+            return {}
+        return state.get('used', {})
+
+
+class CSEBudgetAllocator:
+    """
+    Ranks query candidates by expected value and packs them into OR'd queries.
+    """
+
+    # Google honors at most 32 words per query; CSE rejects very long q params
+    MAX_QUERY_WORDS = 32
+    MAX_QUERY_CHARS = 2048
+    # Results per CSE page: more OR'd names than this dilute attribution
+    MAX_COMPANIES_PER_QUERY = 5
+
+    def __init__(self, board_yield: Optional[Dict[str, Dict[str, int]]] = None):
+        """
+        Initialize the allocator.
+
+        Args:
+            board_yield: Board yield history from ``QuotaLedger.board_yield()``
+        """
+        self.board_yield = board_yield or {}
+
+    @staticmethod
+    def company_value(company: Dict) -> float:
+        """Expected value of a company lead in [0, 1]."""
+        hiring_prob = company.get('hiring_probability')
+        hiring_score = float(hiring_prob) / 100 if hiring_prob not in (None, '') else 0.5
+        funding = float(company.get('funding_amount') or 0)
+        funding_score = min(math.log1p(max(funding, 0)) / math.log1p(500), 1.0)
+        return 0.7 * hiring_score + 0.3 * funding_score
+
+    def board_value(self, job_board: str) -> float:
+        """Smoothed hits-per-query for a board in [0, 1] (0.5 prior for new boards)."""
+        stats = self.board_yield.get(job_board, {})
+        queries = stats.get('queries', 0)
+        hits = stats.get('hits', 0)
+        # Laplace-smoothed share of a full (10 result) page
+        return (hits / 10 + 1) / (queries + 2)
+
+    def rank_candidates(self, companies: List[Dict], boards_by_country: Dict[str, List[str]]) -> List[Dict]:
+        """
+        Build and rank (company, country, board) candidates.
+
+        Returns:
+            Candidates sorted by expected value (highest first)
+        """
+        candidates = []
+        for country, job_boards in boards_by_country.items():
+            for job_board in job_boards:
+                board_value = self.board_value(job_board)
+                for company in companies:
+                    candidates.append({
+                        'company': company,
+                        'country': country,
+                        'job_board': job_board,
+                        'value': self.company_value(company) * board_value
+                    })
+        candidates.sort(key=lambda c: c['value'], reverse=True)
+        return candidates
+
+    def _fits(self, query: str, names: List[str]) -> bool:
+        return (len(names) <= self.MAX_COMPANIES_PER_QUERY
+                and len(query) <= self.MAX_QUERY_CHARS
+                and len(query.split()) <= self.MAX_QUERY_WORDS)
+
+    def pack(self, candidates: List[Dict], budget: int,
+             build_query: Callable[[List[str], str, str], str]) -> List[Dict]:
+        """
+        Pack ranked candidates into at most ``budget`` OR'd queries.
+
+        Args:
+            candidates: Output of ``rank_candidates``
+            budget: Number of CSE queries available
+            build_query: ``(company_names, country, job_board) -> query``
+
+        Returns:
+            Planned queries ``{'query', 'country', 'job_board', 'companies', 'value'}``
+            sorted by total value
+        """
+        open_queries: Dict[tuple, Dict] = {}
+        planned = []
+
+        for candidate in candidates:
+            group = (candidate['country'], candidate['job_board'])
+            name = candidate['company']['company_name']
+            current = open_queries.get(group)
+
+            if current is not None:
+                names = [c['company_name'] for c in current['companies']] + [name]
+                query = build_query(names, *group)
+                if self._fits(query, names):
+                    current['companies'].append(candidate['company'])
+                    current['query'] = query
+                    current['value'] += candidate['value']
+                    continue
+
+            current = {
+                'query': build_query([name], *group),
+                'country': candidate['country'],
+                'job_board': candidate['job_board'],
+                'companies': [candidate['company']],
+                'value': candidate['value']
+            }
+            open_queries[group] = current
+            planned.append(current)
+
+        planned.sort(key=lambda q: q['value'], reverse=True)
+        return planned[:max(0, budget)]
+
+
+def attribute_items(items: List[Dict], company_names: List[str]) -> Dict[str, List[Dict]]:
+    """
+    Attribute OR'd query results back to the companies in the query.
+
+    An item belongs to every company whose name appears in its title, snippet
+    or URL. Single-company queries keep all items.
+    """
+    if len(company_names) == 1:
+        return {company_names[0]: list(items)}
+
+    attributed = {name: [] for name in company_names}
+    for item in items:
+        text = ' '.join([item.get('title', ''), item.get('snippet', ''), item.get('link', '')]).lower()
+        for name in company_names:
+            lowered = name.lower()
+            if lowered in text or re.sub(r'\s+', '-', lowered) in text:
+                attributed[name].append(item)
+    return attributed
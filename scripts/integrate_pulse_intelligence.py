@@ -20,6 +20,13 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from pulse_intelligence import PulseIntelligenceEngine
 
+# Add project root to path for shared src modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.metrics import current_stage, stage, with_metrics_dump
+from src.profiling import profiled
+from src.sharding import filter_shard, parse_shard, shard_suffix
+
 
 class PulseIntegrator:
     """
@@ -30,6 +37,7 @@ class PulseIntegrator:
         self.engine = PulseIntelligenceEngine()
         self.verbose = verbose
         
+    @stage('pulse.enhance_oracle_data')
     def enhance_oracle_data(self, oracle_df: pd.DataFrame) -> pd.DataFrame:
         """
         Enhance Oracle CSV output with Pulse Intelligence scores.
@@ -61,12 +69,21 @@ class PulseIntegrator:
             # Check if SEC funding exists
             sec_funding = row.get('funding_amount', 0) > 0
             
+            # Real job posts from ATS boards (Oracle 'Job Posts' column)
+            job_posts = None
+            raw_posts = row.get('Job Posts', row.get('job_posts'))
+            if isinstance(raw_posts, str) and raw_posts:
+                try:
+                    job_posts = json.loads(raw_posts)
+                except ValueError:
+                    job_posts = None
+            
             # Run Pulse Intelligence
             try:
                 pulse_result = self.engine.calculate_pulse_score(
                     sec_funding_detected=sec_funding,
                     text_content=text_content,
-                    job_posts=None  # Could integrate job scraping here
+                    job_posts=job_posts
                 )
                 
                 # Add Pulse fields to row
@@ -84,6 +101,7 @@ class PulseIntegrator:
                 enhanced_row['pulse_full_analysis'] = json.dumps(pulse_result['signals'])
                 
                 enhanced_rows.append(enhanced_row)
+                current_stage().add_items()
                 
             except Exception as e:
                 if self.verbose:
@@ -101,16 +119,17 @@ class PulseIntegrator:
         
         return enhanced_df
     
-    def generate_priority_report(self, enhanced_df: pd.DataFrame, output_dir: Path):
+    def generate_priority_report(self, enhanced_df: pd.DataFrame, output_dir: Path, suffix: str = ''):
         """
         Generate actionable priority reports for sales team.
         
         Args:
             enhanced_df: Enhanced DataFrame with Pulse scores
             output_dir: Directory to save reports
+            suffix: Appended to report file names (shard runs)
         """
         output_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S') + suffix
         
         # Critical opportunities (80+ score, no red flags)
         critical = enhanced_df[
@@ -166,6 +185,8 @@ class PulseIntegrator:
         print(f"   Red Flags to Avoid: {summary['red_flags']}")
 
 
+@profiled('integrate_pulse_intelligence')
+@with_metrics_dump('integrate_pulse_intelligence')
 def main():
     parser = argparse.ArgumentParser(
         description='Integrate Pulse Intelligence with Oracle detector output'
@@ -179,7 +200,8 @@ def main():
     parser.add_argument(
         '--output',
         type=str,
-        help='Path for enhanced CSV output (default: data/output/pulse_enhanced.csv)'
+        help='Path for enhanced CSV output (default: data/output/pulse_enhanced.csv, '
+             'data/output/pulse_enhanced_shardIofN.csv with --shard)'
     )
     parser.add_argument(
         '--reports-dir',
@@ -187,6 +209,11 @@ def main():
         default='data/output/pulse_reports',
         help='Directory for priority reports'
     )
+    parser.add_argument(
+        '--shard',
+        metavar='I/N',
+        help='Only score companies on shard I of N (0-based)'
+    )
     parser.add_argument(
         '--quiet',
         action='store_true',
@@ -197,12 +224,20 @@ def main():
     
     # Load Oracle data
     print(f"📂 Loading Oracle data from {args.input}...")
+    shard = None
     try:
         oracle_df = pd.read_csv(args.input)
         print(f"   Loaded {len(oracle_df)} companies\n")
+        shard = parse_shard(args.shard)
+        if shard:
+            name_column = 'Company Name' if 'Company Name' in oracle_df.columns else 'company_name'
+            rows = filter_shard(oracle_df.to_dict('records'), shard, lambda row: str(row.get(name_column, '')))
+            oracle_df = pd.DataFrame(rows, columns=oracle_df.columns)
+            print(f"   Shard {args.shard}: {len(oracle_df)} companies\n")
     except Exception as e:
         print(f"❌ Failed to load input file: {e}")
         sys.exit(1)
+    suffix = shard_suffix(shard)
     
     # Initialize integrator
     integrator = PulseIntegrator(verbose=not args.quiet)
@@ -214,7 +249,7 @@ def main():
     if args.output:
         output_path = Path(args.output)
     else:
-        output_path = Path('data/output/pulse_enhanced.csv')
+        output_path = Path(f'data/output/pulse_enhanced{suffix}.csv')
     
     output_path.parent.mkdir(parents=True, exist_ok=True)
     enhanced_df.to_csv(output_path, index=False)
@@ -222,7 +257,7 @@ def main():
     
     # Generate priority reports
     reports_dir = Path(args.reports_dir)
-    integrator.generate_priority_report(enhanced_df, reports_dir)
+    integrator.generate_priority_report(enhanced_df, reports_dir, suffix)
     
     print("\n✅ Pulse Intelligence integration complete!")
     print("\n📋 Next Steps:")
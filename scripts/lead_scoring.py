@@ -13,6 +13,7 @@ sys.path.insert(0, str(project_root))
 
 from src.web_scraper import LinkedInScraper, FallbackDataEnricher
 from src.hpi_calculator import HPICalculator
+from src.profiling import profiled
 import pandas as pd
 import numpy as np
 
@@ -151,6 +152,7 @@ def generate_report(results_df: pd.DataFrame, output_dir: str) -> dict:
     }
 
 
+@profiled('lead_scoring')
 def main():
     parser = argparse.ArgumentParser(description='Lead Scoring System for LATAM')
     parser.add_argument('--input', type=str, default='data/input/companies_latam.csv')
@@ -0,0 +1,101 @@
+"""
+Merge Shard Outputs
+===================
+Combines per-shard CSV outputs (``--shard i/N`` runs of Oracle, Pulse scoring
+or the regional crawlers) into one dataset.
+
+Guarantees:
+- Dedupe on the pipeline's key columns (company + filing / country)
+- Deterministic output: inputs are read in sorted path order, the last
+  occurrence of a key wins, and rows are ordered by the pipeline's score
+  column with the key columns as tie-breakers, so the merged file does not
+  depend on which shard finished first
+
+Usage:
+    python scripts/merge_shards.py --kind oracle --inputs "artifacts/oracle-shard-*/*.csv" \\
+        --output data/output/oracle/oracle_predictions_merged.csv
+
+Author: PulseB2B Ghost Infrastructure
+"""
+
+import argparse
+import glob
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+# Key columns and ordering per pipeline output
+MERGE_PRESETS = {
+    'oracle': {'key': ['CIK', 'Filing URL'], 'sort_by': 'Hiring Probability (%)', 'descending': True},
+    # Pulse scores either Oracle output or merged crawl output; absent columns are ignored
+    'pulse': {'key': ['Company Name', 'Filing URL', 'company_name', 'country_code'], 'sort_by': 'pulse_score', 'descending': True},
+    'crawl': {'key': ['company_name', 'country_code'], 'sort_by': 'job_count', 'descending': True},
+}
+
+
+def merge_shard_outputs(
+    paths: List[str],
+    key: List[str],
+    sort_by: Optional[str] = None,
+    descending: bool = True
+) -> pd.DataFrame:
+    """
+    Merge shard CSVs with dedupe and deterministic ordering.
+
+    Args:
+        paths: Shard CSV paths (any order)
+        key: Columns identifying a row
+        sort_by: Optional score column to order by
+        descending: Sort direction for ``sort_by``
+
+    Returns:
+        Merged DataFrame
+    """
+    frames = []
+    for path in sorted(paths):
+        df = pd.read_csv(path, dtype={column: str for column in key})
+        if not df.empty:
+            frames.append(df)
+    if not frames:
+        return pd.DataFrame()
+
+    merged = pd.concat(frames, ignore_index=True)
+    key = [column for column in key if column in merged.columns]
+    if key:
+        merged = merged.drop_duplicates(subset=key, keep='last')
+
+    order = key[:]
+    ascending = [True] * len(key)
+    if sort_by and sort_by in merged.columns:
+        order = [sort_by] + order
+        ascending = [not descending] + ascending
+    if order:
+        merged = merged.sort_values(order, ascending=ascending, kind='mergesort')
+    return merged.reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge --shard i/N outputs into one CSV')
+    parser.add_argument('--kind', choices=sorted(MERGE_PRESETS), required=True, help='Pipeline that produced the shards')
+    parser.add_argument('--inputs', nargs='+', required=True, help='Shard CSV paths or glob patterns')
+    parser.add_argument('--output', required=True, help='Merged CSV path')
+    args = parser.parse_args()
+
+    paths = sorted({path for pattern in args.inputs for path in (glob.glob(pattern) or [])})
+    if not paths:
+        print(f"❌ No shard outputs match {args.inputs}")
+        sys.exit(1)
+
+    preset = MERGE_PRESETS[args.kind]
+    print(f"🧩 Merging {len(paths)} {args.kind} shard outputs...")
+    merged = merge_shard_outputs(paths, preset['key'], preset['sort_by'], preset['descending'])
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    merged.to_csv(args.output, index=False, encoding='utf-8')
+    print(f"✅ Merged {len(merged)} unique rows → {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -22,7 +22,16 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-from deep_translator import GoogleTranslator
+import sys
+
+# Add project root to path for shared src modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.checkpoint_journal import CheckpointJournal, open_journal
+from src.sharding import filter_shard, parse_shard, shard_suffix
+sys.path.insert(0, str(Path(__file__).parent))
+from cse_budget import CSEBudgetAllocator, QuotaLedger, attribute_items, DEFAULT_LEDGER_PATH
+from translation_memo import TranslationMemo, DEFAULT_MEMO_PATH
 
 
 class MultiRegionCrawler:
@@ -130,6 +139,8 @@ class MultiRegionCrawler:
         }
     }
     
+    CSE_ENDPOINT = 'https://www.googleapis.com/customsearch/v1'
+    
     # Timezone offsets from EST (Eastern Standard Time = UTC-5)
     TIMEZONE_OFFSETS = {
         'usa': 0,           # EST baseline
@@ -193,7 +204,8 @@ class MultiRegionCrawler:
         'brazil': 'BR'
     }
     
-    def __init__(self, google_cse_api_key: str, google_cse_id: str, region: str):
+    def __init__(self, google_cse_api_key: str, google_cse_id: str, region: str,
+                 ledger: Optional[QuotaLedger] = None):
         """
         Initialize multi-region crawler.
         
@@ -201,19 +213,27 @@ class MultiRegionCrawler:
             google_cse_api_key: Google Custom Search API key
             google_cse_id: Google Custom Search Engine ID
             region: One of 'north_america', 'central_america', 'andean_region', 'southern_cone'
+            ledger: Shared daily CSE quota ledger (defaults to CSE_QUOTA_LEDGER or
+                data/logs/cse_quota_ledger.json)
         """
         self.api_key = google_cse_api_key
         self.cse_id = google_cse_id
         self.region = region
         
-        # Translation setup (English, Spanish, Portuguese)
-        self.translator_es = GoogleTranslator(source='es', target='en')
-        self.translator_pt = GoogleTranslator(source='pt', target='en')
+        # Translation setup (English, Spanish, Portuguese): local language
+        # detection, persistent memo and batched GoogleTranslator calls
+        self.translation_memo = TranslationMemo(os.getenv('TRANSLATION_MEMO_PATH', DEFAULT_MEMO_PATH))
         
         # Rate limiting state
         self.last_request_time = 0
         self.request_count = 0
-        self.max_requests_per_region = 25  # 100 daily / 4 regions = 25 per region
+        self.max_requests_per_region = 25  # Replaced by the ledger grant in scrape_region
+        
+        # Shared daily quota + board yield history across regional crawls
+        self.ledger = ledger or QuotaLedger(
+            os.getenv('CSE_QUOTA_LEDGER', DEFAULT_LEDGER_PATH),
+            daily_quota=int(os.getenv('CSE_DAILY_QUOTA', 100))
+        )
         
         # Cool-down tracking
         self.cool_down_file = Path('data/logs/cooldown_tracker.json')
@@ -230,10 +250,12 @@ class MultiRegionCrawler:
         with open(csv_path, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
+                hiring_prob = row.get('hiring_probability') or row.get('Hiring Probability (%)')
                 companies.append({
-                    'company_name': row.get('company_name', ''),
+                    'company_name': row.get('company_name') or row.get('Company Name', ''),
                     'region': row.get('region', 'USA'),
-                    'funding_amount': float(row.get('latest_funding', 0))
+                    'funding_amount': float(row.get('latest_funding') or 0),
+                    'hiring_probability': float(hiring_prob) if hiring_prob else None
                 })
         
         print(f"✅ Loaded {len(companies)} companies from Oracle")
@@ -248,14 +270,31 @@ class MultiRegionCrawler:
             country: Country name (lowercase with underscores)
             job_board: Job board domain
             
+        Returns:
+            Google search query string
+        """
+        return self.build_packed_dork_query([company_name], country, job_board)
+    
+    def build_packed_dork_query(self, company_names: List[str], country: str, job_board: str) -> str:
+        """
+        Build one dork query covering several companies on the same board.
+        
+        Args:
+            company_names: Companies to OR together
+            country: Country name (lowercase with underscores)
+            job_board: Job board domain
+            
         Returns:
             Google search query string
         """
         # Base pattern: site restriction
         query = f'site:{job_board}'
         
-        # Add company name
-        query += f' "{company_name}"'
+        # Add company name(s)
+        if len(company_names) == 1:
+            query += f' "{company_names[0]}"'
+        else:
+            query += ' (' + ' OR '.join(f'"{name}"' for name in company_names) + ')'
         
         # Add job-related keywords (multilingual)
         if 'linkedin.com' in job_board:
@@ -317,12 +356,23 @@ class MultiRegionCrawler:
         self.request_count += 1
         
         # Check if we've hit region limit
-        if self.request_count >= self.max_requests_per_region:
+        if self.request_count > self.max_requests_per_region:
             print(f"⚠️ Reached max requests for {self.region} ({self.max_requests_per_region})")
             return {'items': []}
         
-        # Build request
-        url = 'https://www.googleapis.com/customsearch/v1'
+        return self.execute_cse_query(query, country)
+    
+    def execute_cse_query(self, query: str, country: str) -> Dict:
+        """
+        Send one Google Custom Search request (no rate limiting or budget checks).
+        
+        Args:
+            query: Search query
+            country: Country code for geotargeting
+            
+        Returns:
+            Search results dictionary
+        """
         params = {
             'key': self.api_key,
             'cx': self.cse_id,
@@ -332,7 +382,7 @@ class MultiRegionCrawler:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = requests.get(self.CSE_ENDPOINT, params=params, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -341,7 +391,10 @@ class MultiRegionCrawler:
     
     def translate_to_english(self, text: str, source_language: str = 'auto') -> str:
         """
-        Translate text to English using deep-translator (free).
+        Translate text to English through the persistent translation memo.
+        
+        English text is detected locally and returned unchanged; repeated
+        snippets are served from the memo (saved at the end of the run).
         
         Args:
             text: Text to translate
@@ -350,45 +403,19 @@ class MultiRegionCrawler:
         Returns:
             Translated text in English
         """
-        if not text or len(text.strip()) == 0:
-            return text
-        
-        # Detect if text is already English (simple heuristic)
-        english_words = ['job', 'career', 'hiring', 'employment', 'engineer', 'developer']
-        text_lower = text.lower()
-        if any(word in text_lower for word in english_words):
-            return text  # Already English
-        
-        try:
-            # Try Spanish first (most common in LATAM)
-            if source_language == 'auto' or source_language == 'es':
-                try:
-                    translated = self.translator_es.translate(text[:500])  # Limit to 500 chars
-                    return translated
-                except Exception:
-                    pass
-            
-            # Try Portuguese (Brazil)
-            if source_language == 'auto' or source_language == 'pt':
-                try:
-                    translated = self.translator_pt.translate(text[:500])
-                    return translated
-                except Exception:
-                    pass
-            
-            # If both fail, return original
-            return text
-        
-        except Exception as e:
-            print(f"⚠️ Translation error: {e}")
-            return text
+        return self.translation_memo.translate(text, source_language)
     
-    def scrape_region(self, companies: List[Dict]) -> List[Dict]:
+    def scrape_region(self, companies: List[Dict], journal: Optional[CheckpointJournal] = None) -> List[Dict]:
         """
         Scrape all job boards for companies in this region.
         
+        Query candidates are ranked by expected value, packed into OR'd
+        queries and executed within the budget granted by the shared ledger.
+        
         Args:
             companies: List of company dictionaries
+            journal: Optional checkpoint journal; (country, company) pairs
+                already in it are replayed instead of re-queried
             
         Returns:
             List of scraped results with normalized data
@@ -403,55 +430,83 @@ class MultiRegionCrawler:
         print(f"{'='*80}")
         print(f"Countries: {', '.join(countries.keys())}")
         print(f"Companies to search: {len(companies)}")
-        print(f"Max requests: {self.max_requests_per_region}")
         
-        for country, job_boards in countries.items():
-            print(f"\n📍 Country: {country.upper()}")
-            
-            for company in companies[:5]:  # Limit to 5 companies per country for demo
-                company_name = company['company_name']
-                
-                print(f"  🔍 Searching: {company_name}")
-                
-                job_count = 0
-                job_urls = []
-                
-                for job_board in job_boards[:2]:  # Limit to 2 job boards per country
-                    # Build Google Dork query
-                    query = self.build_google_dork_query(company_name, country, job_board)
-                    
-                    # Execute search
-                    search_results = self.search_google_cse(query, country)
-                    
-                    # Parse results
-                    items = search_results.get('items', [])
-                    job_count += len(items)
-                    
-                    for item in items[:3]:  # Max 3 URLs per board
-                        job_urls.append(item.get('link', ''))
-                
-                # Normalize data
-                result = {
-                    'company_name': company_name,
-                    'country': country,
-                    'country_code': self.COUNTRY_CODES.get(country, 'US'),
-                    'region': self.region,
-                    'job_count': job_count,
-                    'job_urls': job_urls,
-                    'timezone_match': self.TIMEZONE_OFFSETS.get(country, 0),
-                    'currency_type': self.CURRENCIES.get(country, 'USD'),
-                    'scraped_at': datetime.utcnow().isoformat(),
-                    'funding_amount': company.get('funding_amount', 0),
-                    'original_region': company.get('region', 'USA')
-                }
-                
-                results.append(result)
+        replayed, plan, granted = self.plan_region(companies, journal)
+        results.extend(replayed)
+        collector = RegionResultCollector(self, plan, journal)
+        
+        try:
+            for planned in plan:
+                names = [c['company_name'] for c in planned['companies']]
+                print(f"  🔍 {planned['country'].upper()} | {planned['job_board']} | {', '.join(names)}")
                 
-                print(f"    ✅ Found {job_count} jobs on {len(job_boards[:2])} boards")
+                search_results = self.search_google_cse(planned['query'], planned['country'])
+                results.extend(collector.add(planned, search_results.get('items', [])))
+        finally:
+            self.finish_region(granted, collector)
         
-        print(f"\n📊 Region {self.region} complete: {len(results)} results")
+        print(f"\n📊 Region {self.region} complete: {len(results)} results from {collector.executed} queries")
         return results
     
+    def plan_region(self, companies: List[Dict],
+                    journal: Optional[CheckpointJournal] = None) -> Tuple[List[Dict], List[Dict], int]:
+        """
+        Replay checkpointed results and plan this region's CSE queries.
+        
+        Args:
+            companies: List of company dictionaries
+            journal: Optional checkpoint journal
+            
+        Returns:
+            Tuple of (replayed results, planned queries, granted budget)
+        """
+        countries = self.REGIONAL_JOB_BOARDS.get(self.region, {})
+        replayed = []
+        
+        # Replay completed (country, company) pairs
+        for country in countries:
+            for company in companies:
+                item_key = f"{country}:{company['company_name']}"
+                if journal is not None and journal.is_completed(item_key):
+                    replayed.append(journal.get(item_key))
+                    print(f"  ⏩ Replayed from checkpoint: {company['company_name']} ({country})")
+        
+        # Rank (company, country, board) candidates and pack them into queries
+        allocator = CSEBudgetAllocator(self.ledger.board_yield())
+        candidates = [
+            c for c in allocator.rank_candidates(companies, countries)
+            if journal is None or not journal.is_completed(f"{c['country']}:{c['company']['company_name']}")
+        ]
+        plan = allocator.pack(candidates, len(candidates), self.build_packed_dork_query)
+        
+        granted = self.ledger.reserve(self.region, len(plan))
+        self.max_requests_per_region = granted
+        plan = plan[:granted]
+        print(f"Planned queries for {self.region}: {len(plan)} covering {len(candidates)} candidates "
+              f"(budget granted: {granted})")
+        return replayed, plan, granted
+    
+    def finish_region(self, granted: int, collector: 'RegionResultCollector') -> None:
+        """Return unused budget to the ledger and record board yields."""
+        self.ledger.release(self.region, granted - collector.executed)
+        self.ledger.record_yields(collector.board_yields)
+    
+    def _build_result(self, company: Dict, country: str, entry: Dict) -> Dict:
+        """Normalize one (country, company) crawl result."""
+        return {
+            'company_name': company['company_name'],
+            'country': country,
+            'country_code': self.COUNTRY_CODES.get(country, 'US'),
+            'region': self.region,
+            'job_count': entry['job_count'],
+            'job_urls': entry['job_urls'],
+            'timezone_match': self.TIMEZONE_OFFSETS.get(country, 0),
+            'currency_type': self.CURRENCIES.get(country, 'USD'),
+            'scraped_at': datetime.utcnow().isoformat(),
+            'funding_amount': company.get('funding_amount', 0),
+            'original_region': company.get('region', 'USA')
+        }
+    
     def update_cooldown_tracker(self):
         """Update cool-down tracker to prevent IP flagging."""
         cooldown_data = {
@@ -523,19 +578,75 @@ class MultiRegionCrawler:
         print(f"✅ Results saved to {output_path}")
 
 
+class RegionResultCollector:
+    """
+    Folds packed-query results into per-(country, company) results.
+    
+    A result is emitted (and journaled) once all of its planned queries ran.
+    """
+    
+    def __init__(self, crawler: MultiRegionCrawler, plan: List[Dict],
+                 journal: Optional[CheckpointJournal] = None):
+        self.crawler = crawler
+        self.journal = journal
+        self.executed = 0
+        self.board_yields: Dict[str, List[int]] = {}
+        self._found: Dict[Tuple[str, str], Dict] = {}
+        self._pending: Dict[Tuple[str, str], int] = {}
+        for planned in plan:
+            for company in planned['companies']:
+                key = (planned['country'], company['company_name'])
+                self._pending[key] = self._pending.get(key, 0) + 1
+    
+    def add(self, planned: Dict, items: List[Dict]) -> List[Dict]:
+        """
+        Record one executed query.
+        
+        Returns:
+            Results for companies whose planned queries are now all done
+        """
+        country, job_board = planned['country'], planned['job_board']
+        self.executed += 1
+        stats = self.board_yields.setdefault(job_board, [0, 0])
+        stats[0] += 1
+        stats[1] += len(items)
+        
+        finished = []
+        attributed = attribute_items(items, [c['company_name'] for c in planned['companies']])
+        for company in planned['companies']:
+            key = (country, company['company_name'])
+            company_items = attributed.get(company['company_name'], [])
+            entry = self._found.setdefault(key, {'job_count': 0, 'job_urls': [], 'boards': 0})
+            entry['job_count'] += len(company_items)
+            entry['job_urls'].extend(item.get('link', '') for item in company_items[:3])  # Max 3 URLs per board
+            entry['boards'] += 1
+            
+            self._pending[key] -= 1
+            if self._pending[key] == 0:
+                result = self.crawler._build_result(company, country, entry)
+                finished.append(result)
+                if self.journal is not None:
+                    self.journal.record(f"{country}:{company['company_name']}", result)
+                print(f"    ✅ {company['company_name']} ({country}): {entry['job_count']} jobs on {entry['boards']} boards")
+        return finished
+
+
 def main():
     """
     Example usage of Multi-Region Crawler.
     """
-    import sys
+    import argparse
     
     # Get region from command line
-    if len(sys.argv) < 2:
-        print("Usage: python multi_region_crawler.py <region>")
-        print("Regions: north_america, central_america, andean_region, southern_cone")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description='Multi-Region Ghost Crawler')
+    parser.add_argument('region', help='north_america, central_america, andean_region or southern_cone')
+    parser.add_argument('--resume', metavar='RUN_ID', help='Resume an interrupted crawl from its checkpoint journal')
+    parser.add_argument('--shard', metavar='I/N', help='Only crawl companies on shard I of N (0-based)')
+    args = parser.parse_args()
     
-    region = sys.argv[1]
+    region = args.region
+    shard = parse_shard(args.shard)
+    suffix = shard_suffix(shard)
     
     # Get API keys from environment
     api_key = os.getenv('GOOGLE_CSE_API_KEY')
@@ -548,34 +659,42 @@ def main():
         use_scraping_only = True
     print(f"🚀 Multi-Region Ghost Crawler - {region.upper()}")
     print(f"{'='*80}\n")
-    # Initialize crawler
-    crawler = MultiRegionCrawler(api_key, cse_id, region)
+    # Initialize crawler (each shard gets 1/N of the daily quota)
+    ledger = QuotaLedger(
+        os.getenv('CSE_QUOTA_LEDGER', DEFAULT_LEDGER_PATH),
+        daily_quota=int(os.getenv('CSE_DAILY_QUOTA', 100)) // (shard[1] if shard else 1)
+    )
+    crawler = MultiRegionCrawler(api_key, cse_id, region, ledger=ledger)
     if use_scraping_only:
         # Si tu clase usa api_key/cse_id para decidir el modo, asegúrate que con string vacío use scraping
         pass
     
-    # Check cool-down status
-    if not crawler.check_cooldown_status():
+    # Check cool-down status (a resumed run continues regardless)
+    if not args.resume and not crawler.check_cooldown_status():
         print(f"⏸️ Region {region} is in cool-down period. Skipping...")
         sys.exit(0)
     
     # Load companies
-    companies = crawler.load_companies_from_oracle()
+    companies = filter_shard(crawler.load_companies_from_oracle(), shard, lambda c: c['company_name'])
     
     if not companies:
         print("⚠️ No companies to scrape")
         sys.exit(1)
     
-    # Scrape region
-    results = crawler.scrape_region(companies)
+    # Scrape region (checkpointed per country/company)
+    with open_journal(f'crawl_{region}{suffix}', args.resume, 'data/checkpoints') as journal:
+        results = crawler.scrape_region(companies, journal=journal)
     
     # Save results
-    output_path = f'data/output/scraped_{region}.csv'
+    output_path = f'data/output/scraped_{region}{suffix}.csv'
     crawler.save_results(results, output_path)
     
     # Update cool-down tracker
     crawler.update_cooldown_tracker()
     
+    # Persist translations for the next run (no-op when nothing was translated)
+    crawler.translation_memo.save()
+    
     print(f"\n✅ Multi-region scraping complete for {region}")
     print(f"📊 Total results: {len(results)}")
     print(f"🔄 Cool-down: Next scrape in 6 hours")
@@ -21,13 +21,33 @@ from datetime import datetime, timedelta
 import time
 import json
 import os
-from typing import Dict, List, Tuple, Optional
+import sys
+import argparse
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional, Union
 import logging
-from urllib.parse import urljoin, urlparse
 import warnings
 
 warnings.filterwarnings('ignore')
 
+# Add project root (shared src modules) and scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.resolution_index import CompanyResolutionIndex
+from src.checkpoint_journal import CheckpointJournal, open_journal
+from src.ats_adapters import detect_ats_in_urls, fetch_board_roles
+from src.sharding import filter_shard, parse_shard, shard_suffix
+from src.adaptive_throttle import AdaptiveThrottle
+from src.html_extraction import ExtractedPage, fetch_page
+from src.text_document import Document, as_document
+from src.money_amounts import extract_funding_amount
+from src.metrics import current_stage, stage, with_metrics_dump
+from src.profiling import profiled
+from oracle_watermark import FilingWatermark, merge_cumulative_results
+from oracle_triage import SKIP, FilingTriage, form_d_primary_doc_url, parse_form_d_details
+from oracle_site_crawler import CompanySiteCrawler
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -103,23 +123,35 @@ class OracleFundingDetector:
         ]
     }
     
-    # Funding Amount Patterns (for extraction)
-    FUNDING_PATTERNS = [
-        r'\$\s*(\d+(?:\.\d+)?)\s*(million|m|mm)',
-        r'\$\s*(\d+(?:\.\d+)?)\s*(billion|b)',
-        r'(\d+(?:\.\d+)?)\s*(million|m|mm)\s*(?:dollars?|usd|\$)',
-        r'raised\s+\$\s*(\d+(?:\.\d+)?)\s*(million|m|mm)',
-        r'funding\s+of\s+\$\s*(\d+(?:\.\d+)?)\s*(million|m|mm)'
-    ]
-    
-    def __init__(self, output_dir: str = '../data/output/oracle', use_google_cache: bool = True):
+    def __init__(self, output_dir: str = '../data/output/oracle', use_google_cache: bool = True,
+                 resolution_index: Optional[CompanyResolutionIndex] = None,
+                 triage: Optional[FilingTriage] = None,
+                 throttle: Optional[AdaptiveThrottle] = None):
         """Initialize the Oracle detector."""
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
         
         self.use_google_cache = use_google_cache  # Bypass bot detection
         
+        # Persistent company -> website index (skips repeat DuckDuckGo searches)
+        self.resolution_index = resolution_index or CompanyResolutionIndex(
+            os.environ.get('ORACLE_RESOLUTION_INDEX', 'data/cache/company_resolution_index.json')
+        )
+        
+        # Cheap pre-enrichment triage (skips funds, REITs, oil & gas LPs...)
+        self.triage = triage or FilingTriage.from_env()
+        self.last_triage_report: Dict = {}
+        
+        # Adaptive per-host pacing of search requests (replaces fixed sleeps);
+        # search engines are never hit more than once every 2s
+        self.throttle = throttle or AdaptiveThrottle(initial_rate=1 / 3, max_rate=1 / 2)
+        
         self.session = requests.Session()
+        self.site_crawler = CompanySiteCrawler(
+            self.session,
+            max_pages=int(os.environ.get('ORACLE_SITE_MAX_PAGES', 6)),
+            max_bytes=int(os.environ.get('ORACLE_SITE_MAX_BYTES', 3_000_000))
+        )
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -135,6 +167,7 @@ class OracleFundingDetector:
         
         logger.info(f"🔮 Oracle Funding Detector initialized (Google Cache: {use_google_cache})")
     
+    @stage('oracle.fetch_sec_filings')
     def fetch_sec_filings(self, feed_type: str = 'recent', max_items: int = 50, max_retries: int = 3, retry_delay: int = 60) -> List[Dict]:
         """
         Fetch recent Form D filings from SEC EDGAR RSS feed with retry logic.
@@ -183,11 +216,14 @@ class OracleFundingDetector:
                         'filing_date': entry.get('updated', ''),
                         'filing_url': entry.get('link', ''),
                         'summary': entry.get('summary', ''),
-                        'cik': self._extract_cik(entry.get('link', ''))
+                        'cik': self._extract_cik(entry.get('link', '')),
+                        'accession_number': self._extract_accession(entry.get('id', '') or entry.get('link', ''))
                     }
                     
-                    # Clean company name (remove form type)
+                    # Clean company name (remove form type, CIK and filer role)
                     filing['company_name'] = re.sub(r'\s*-\s*Form D.*$', '', filing['company_name']).strip()
+                    filing['company_name'] = re.sub(r'^D(/A)?\s+-\s+', '', filing['company_name'])
+                    filing['company_name'] = re.sub(r'\s*\(\d+\)\s*\(\w+\)$', '', filing['company_name']).strip()
                     
                     filings.append(filing)
                     logger.info(f"  ✓ Found: {filing['company_name']}")
@@ -224,15 +260,27 @@ class OracleFundingDetector:
     
     def _extract_cik(self, url: str) -> str:
         """Extract CIK number from SEC filing URL."""
-        match = re.search(r'CIK=(\d+)', url)
+        match = re.search(r'CIK=(\d+)', url) or re.search(r'/edgar/data/(\d+)/', url)
         return match.group(1) if match else ''
     
-    def scrape_company_info(self, company_name: str) -> Dict:
+    def _extract_accession(self, text: str) -> str:
+        """Extract accession number (e.g. 0001234567-25-000123) from an entry id or URL."""
+        match = re.search(r'(\d{10}-\d{2}-\d{6})', text)
+        if match:
+            return match.group(1)
+        match = re.search(r'/(\d{18})/', text)
+        if match:
+            raw = match.group(1)
+            return f"{raw[:10]}-{raw[10:12]}-{raw[12:]}"
+        return ''
+    
+    def scrape_company_info(self, company_name: str, cik: Optional[str] = None) -> Dict:
         """
         Scrape company information from web search + company website.
         
         Args:
             company_name: Name of the company
+            cik: Optional SEC CIK (used as resolution index key)
             
         Returns:
             Dictionary with company info (website, description, tech stack)
@@ -244,58 +292,79 @@ class OracleFundingDetector:
             'description': '',
             'about_us': '',
             'tech_stack': [],
-            'hiring_signals': 0
+            'hiring_signals': 0,
+            'ats': '',
+            'open_roles': 0,
+            'job_posts': []
         }
         
         try:
             # Step 1: Find company website via search simulation
-            website = self._find_company_website(company_name)
+            website = self._find_company_website(company_name, cik)
             if website:
                 company_info['website'] = website
                 
                 # Step 2: Scrape company website
                 website_data = self._scrape_website(website)
                 company_info.update(website_data)
-                
-            time.sleep(2)  # Respectful crawling
             
         except Exception as e:
             logger.warning(f"⚠️  Could not scrape {company_name}: {e}")
         
         return company_info
     
-    def _find_company_website(self, company_name: str) -> Optional[str]:
+    def _find_company_website(self, company_name: str, cik: Optional[str] = None) -> Optional[str]:
         """
-        Find company website using DuckDuckGo HTML search (no API needed).
+        Find company website, consulting the resolution index before searching.
         
         Args:
             company_name: Company name to search
+            cik: Optional SEC CIK
             
         Returns:
             Company website URL or None
         """
         try:
-            # Use DuckDuckGo HTML search (no API key needed)
-            search_url = f"https://html.duckduckgo.com/html/?q={company_name}+official+website"
-            
-            response = self.session.get(search_url, timeout=10)
-            if response.status_code != 200:
-                return None
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find first result link
-            result = soup.find('a', {'class': 'result__a'})
-            if result:
-                website = result.get('href', '')
-                # Clean URL
-                if website.startswith('//duckduckgo.com/l/?uddg='):
-                    # Extract actual URL from DuckDuckGo redirect
-                    website = requests.utils.unquote(website.split('uddg=')[1].split('&')[0])
-                return website
-            
+            return self.resolution_index.resolve(
+                'website', company_name, lambda: self._search_company_website(company_name),
+                cik=cik, source='duckduckgo'
+            )
         except Exception as e:
+            # Transient failures are not cached as "not found"
             logger.debug(f"Could not find website for {company_name}: {e}")
+            return None
+    
+    def _search_company_website(self, company_name: str) -> Optional[str]:
+        """
+        Search for the company website using DuckDuckGo HTML search (no API needed).
+        
+        Args:
+            company_name: Company name to search
+            
+        Returns:
+            Company website URL or None if no result was found
+            
+        Raises:
+            requests.exceptions.RequestException: On network errors
+        """
+        # Use DuckDuckGo HTML search (no API key needed)
+        search_url = f"https://html.duckduckgo.com/html/?q={company_name}+official+website"
+        
+        response = self.throttle.get(self.session, search_url, timeout=10)
+        if response.status_code != 200:
+            raise requests.exceptions.HTTPError(f"DuckDuckGo returned {response.status_code}")
+        
+        soup = BeautifulSoup(response.text, 'html.parser')
+        
+        # Find first result link
+        result = soup.find('a', {'class': 'result__a'})
+        if result:
+            website = result.get('href', '')
+            # Clean URL
+            if website.startswith('//duckduckgo.com/l/?uddg='):
+                # Extract actual URL from DuckDuckGo redirect
+                website = requests.utils.unquote(website.split('uddg=')[1].split('&')[0])
+            return website or None
         
         return None
     
@@ -314,157 +383,162 @@ class OracleFundingDetector:
             'description': '',
             'about_us': '',
             'tech_stack': [],
-            'hiring_signals': 0
+            'hiring_signals': 0,
+            'ats': '',
+            'open_roles': 0,
+            'job_posts': []
         }
         
         try:
-            # Try Google Cache first to bypass bot detection
-            if self.use_google_cache:
-                cache_url = f"https://webcache.googleusercontent.com/search?q=cache:{url}"
-                logger.debug(f"Trying Google Cache: {cache_url}")
-                
-                try:
-                    response = self.session.get(cache_url, timeout=10)
-                    if response.status_code == 200 and len(response.text) > 500:
-                        logger.debug(f"✅ Using Google Cache for {url}")
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                    else:
-                        # Fallback to direct scraping
-                        logger.debug(f"⚠️  Cache failed, trying direct: {url}")
-                        response = self.session.get(url, timeout=10)
-                        if response.status_code != 200:
-                            return data
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                except:
-                    # Fallback to direct scraping
-                    logger.debug(f"⚠️  Cache error, trying direct: {url}")
-                    response = self.session.get(url, timeout=10)
-                    if response.status_code != 200:
-                        return data
-                    soup = BeautifulSoup(response.text, 'html.parser')
-            else:
-                # Direct scraping (no cache)
-                response = self.session.get(url, timeout=10)
-                if response.status_code != 200:
-                    return data
-                soup = BeautifulSoup(response.text, 'html.parser')
+            homepage = self._fetch_homepage(url)
+            if homepage is None:
+                return data
             
             # Extract meta description
-            meta_desc = soup.find('meta', {'name': 'description'}) or \
-                       soup.find('meta', {'property': 'og:description'})
-            if meta_desc:
-                data['description'] = meta_desc.get('content', '')
+            data['description'] = homepage.description
             
-            # Find About Us page
-            about_links = soup.find_all('a', href=True)
-            about_url = None
-            for link in about_links:
-                href = link.get('href', '').lower()
-                text = link.get_text().lower()
-                if any(keyword in href or keyword in text for keyword in ['about', 'company', 'who-we-are']):
-                    about_url = urljoin(url, link['href'])
-                    break
+            # Crawl careers, jobs, about, engineering and press pages (bounded)
+            crawl = self.site_crawler.crawl(homepage, is_enough=self._site_has_enough_signal)
+            pages = crawl['pages']
+            current_stage().add_bytes(crawl['bytes'])
             
-            # Scrape About Us page
-            if about_url:
-                try:
-                    about_response = self.session.get(about_url, timeout=10)
-                    about_soup = BeautifulSoup(about_response.text, 'html.parser')
-                    
-                    # Extract text content
-                    paragraphs = about_soup.find_all('p')
-                    data['about_us'] = ' '.join([p.get_text() for p in paragraphs[:5]])
-                    
-                except Exception:
-                    pass
-            
-            # If no About page, use homepage content
-            if not data['about_us']:
-                paragraphs = soup.find_all('p')
-                data['about_us'] = ' '.join([p.get_text() for p in paragraphs[:5]])
+            # About Us text, falling back to homepage content
+            about_page = next((page for page in pages if page['kind'] == 'about'), pages[0])
+            data['about_us'] = ' '.join(about_page['page'].paragraphs[:5])
+            if not data['about_us'] and about_page is not pages[0]:
+                data['about_us'] = ' '.join(homepage.paragraphs[:5])
             
-            # Detect tech stack from page content
-            page_text = soup.get_text().lower()
-            data['tech_stack'] = self._detect_tech_stack(page_text)
+            # Detect tech stack and hiring signals across all crawled pages
+            document = Document(' '.join(page['page'].text for page in pages))
+            data['tech_stack'] = self._detect_tech_stack(document)
+            data['hiring_signals'] = self._count_hiring_signals(document)
             
-            # Count hiring signals
-            data['hiring_signals'] = self._count_hiring_signals(page_text)
+            # Real open roles from a public ATS board (Greenhouse, Lever, Ashby, Workable)
+            detected = self._detect_ats(pages)
+            open_roles = fetch_board_roles(*detected, session=self.session) if detected else None
+            if open_roles:
+                data['ats'] = open_roles['ats']
+                data['open_roles'] = open_roles['job_count']
+                data['job_posts'] = [
+                    {'title': job['title'], 'posted_date': job['posted_date']}
+                    for job in open_roles['jobs']
+                ]
             
         except Exception as e:
             logger.debug(f"Error scraping {url}: {e}")
         
         return data
     
-    def _detect_tech_stack(self, text: str) -> List[str]:
+    def _fetch_homepage(self, url: str) -> Optional[ExtractedPage]:
+        """
+        Fetch and extract a company homepage (size-capped), trying Google Cache first when enabled.
+        
+        Returns:
+            ExtractedPage, or None if the page could not be fetched
+        """
+        max_bytes = self.site_crawler.max_page_bytes
+        if self.use_google_cache:
+            cache_url = f"https://webcache.googleusercontent.com/search?q=cache:{url}"
+            logger.debug(f"Trying Google Cache: {cache_url}")
+            try:
+                page = fetch_page(self.session, cache_url, max_bytes)
+                if page is not None and page.bytes_read > 500:
+                    logger.debug(f"✅ Using Google Cache for {url}")
+                    # Resolve links against the company site, not the cache
+                    page.url = url
+                    return page
+                logger.debug(f"⚠️  Cache failed, trying direct: {url}")
+            except requests.RequestException:
+                logger.debug(f"⚠️  Cache error, trying direct: {url}")
+        
+        return fetch_page(self.session, url, max_bytes)
+    
+    @staticmethod
+    def _detect_ats(pages: List[Dict]) -> Optional[Tuple[str, str]]:
+        """First (ats, board) linked or embedded on any crawled page."""
+        for page in pages:
+            detected = detect_ats_in_urls(page['page'].urls())
+            if detected:
+                return detected
+        return None
+    
+    @classmethod
+    def _site_has_enough_signal(cls, pages: List[Dict]) -> bool:
+        """Stop crawling once an ATS board and an About page have been found."""
+        has_about = any(page['kind'] == 'about' for page in pages)
+        return has_about and cls._detect_ats(pages) is not None
+    
+    def _detect_tech_stack(self, text: Union[str, Document]) -> List[str]:
         """
         Detect tech stack keywords from text using keyword matching.
         
         Args:
-            text: Text content to analyze
+            text: Page text or shared Document
             
         Returns:
             List of detected technologies
         """
+        text = as_document(text).lower
         detected_tech = []
-        text_lower = text.lower()
         
-        for category, keywords in self.TECH_STACK_KEYWORDS.items():
-            for keyword in keywords:
-                # Use word boundaries for accurate matching
-                pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-                if re.search(pattern, text_lower):
-                    detected_tech.append(keyword)
+        for keyword, pattern in self._tech_stack_patterns():
+            if pattern.search(text):
+                detected_tech.append(keyword)
         
         return list(set(detected_tech))  # Remove duplicates
     
-    def _count_hiring_signals(self, text: str) -> int:
+    @classmethod
+    def _tech_stack_patterns(cls) -> List[Tuple[str, re.Pattern]]:
+        """Word-boundary patterns for TECH_STACK_KEYWORDS, compiled once."""
+        if '_compiled_tech_patterns' not in cls.__dict__:
+            cls._compiled_tech_patterns = [
+                # Use word boundaries for accurate matching
+                (keyword, re.compile(r'\b' + re.escape(keyword.lower()) + r'\b'))
+                for keywords in cls.TECH_STACK_KEYWORDS.values()
+                for keyword in keywords
+            ]
+        return cls._compiled_tech_patterns
+    
+    def _count_hiring_signals(self, text: Union[str, Document]) -> int:
         """
         Count hiring signals in text (weighted by strength).
         
         Args:
-            text: Text content to analyze
+            text: Page text or shared Document
             
         Returns:
             Weighted hiring signal score
         """
-        text_lower = text.lower()
+        text = as_document(text).lower
         score = 0
         
         for keyword in self.HIRING_SIGNALS['strong']:
-            if keyword in text_lower:
+            if keyword in text:
                 score += 3
         
         for keyword in self.HIRING_SIGNALS['medium']:
-            if keyword in text_lower:
+            if keyword in text:
                 score += 2
         
         for keyword in self.HIRING_SIGNALS['weak']:
-            if keyword in text_lower:
+            if keyword in text:
                 score += 1
         
         return score
     
     def extract_funding_amount(self, text: str) -> Tuple[float, str]:
         """
-        Extract funding amount from text using regex patterns.
+        Extract funding amount from text (see ``src.money_amounts``).
         
         Args:
             text: Text containing funding information
             
         Returns:
-            Tuple of (amount in millions, source text)
+            Tuple of (amount in USD millions, source text)
         """
-        for pattern in self.FUNDING_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount = float(match.group(1))
-                unit = match.group(2).lower()
-                
-                # Convert to millions
-                if unit.startswith('b'):
-                    amount *= 1000  # Billion to million
-                
-                return amount, match.group(0)
+        amount = extract_funding_amount(text)
+        if amount:
+            return amount.usd / 1_000_000, amount.text
         
         return 0.0, 'Not disclosed'
     
@@ -509,70 +583,144 @@ class OracleFundingDetector:
         
         return round(score, 2)
     
-    def process_filings(self, filings: List[Dict]) -> pd.DataFrame:
+    def _add_form_d_details(self, filings: List[Dict], journal: Optional[CheckpointJournal] = None) -> None:
+        """
+        Add industry group, issuer type and offering size from each filing's
+        Form D primary document, for triage. Filings already journaled or
+        skipped on their name alone are not fetched; ``ORACLE_FORM_D_DETAILS=0``
+        turns the lookups off.
+        """
+        if os.environ.get('ORACLE_FORM_D_DETAILS', '1').lower() in ('0', 'false', 'no'):
+            return
+        fetched = 0
+        for filing in filings:
+            if journal is not None and journal.is_completed(FilingWatermark.filing_key(filing)):
+                continue
+            decision, reasons = self.triage.classify(filing)
+            if decision == SKIP and reasons and reasons[0].startswith('name:'):
+                continue
+            url = form_d_primary_doc_url(filing)
+            if not url:
+                continue
+            try:
+                # Sequential requests stay well under SEC's 10 requests/second
+                response = self.session.get(url, timeout=10)
+                if response.status_code == 200:
+                    filing.update(parse_form_d_details(response.content))
+                    fetched += 1
+            except requests.RequestException as e:
+                logger.debug(f"Could not fetch Form D details for {filing['company_name']}: {e}")
+        logger.info(f"📄 Form D details fetched for {fetched}/{len(filings)} filings")
+    
+    def process_filing(self, filing: Dict) -> Dict:
+        """
+        Enrich and score a single filing.
+        
+        Args:
+            filing: SEC filing dictionary
+            
+        Returns:
+            Result row for the output CSV
+        """
+        # Parse filing date
+        try:
+            filing_date = datetime.strptime(filing['filing_date'][:10], '%Y-%m-%d')
+            days_since = (datetime.now() - filing_date).days
+        except:
+            filing_date = datetime.now()
+            days_since = 0
+        
+        # Scrape company info
+        company_info = self.scrape_company_info(filing['company_name'], filing.get('cik'))
+        
+        # Extract funding amount
+        combined_text = f"{filing['summary']} {company_info['description']} {company_info['about_us']}"
+        funding_amount, funding_source = self.extract_funding_amount(combined_text)
+        
+        # Calculate hiring probability
+        hiring_prob = self.calculate_hiring_probability(
+            funding_amount=funding_amount,
+            tech_stack_count=len(company_info['tech_stack']),
+            hiring_signals=company_info['hiring_signals'] + company_info['open_roles'],
+            days_since_filing=days_since
+        )
+        
+        # Build result
+        return {
+            'Company Name': filing['company_name'],
+            'Funding Date': filing_date.strftime('%Y-%m-%d'),
+            'Days Since Filing': days_since,
+            'Estimated Amount (M)': f'${funding_amount:.1f}M' if funding_amount > 0 else 'Not disclosed',
+            'Funding Source': funding_source,
+            'Tech Stack': ', '.join(company_info['tech_stack'][:10]) if company_info['tech_stack'] else 'Not detected',
+            'Tech Count': len(company_info['tech_stack']),
+            'Hiring Signals': company_info['hiring_signals'],
+            'Open Roles': company_info['open_roles'],
+            'ATS': company_info['ats'],
+            'Job Posts': json.dumps(company_info['job_posts']) if company_info['job_posts'] else '',
+            'Hiring Probability (%)': hiring_prob,
+            'Website': company_info['website'],
+            'Description': company_info['description'][:200] if company_info['description'] else '',
+            'CIK': filing['cik'],
+            'Accession Number': filing.get('accession_number', ''),
+            'Filing URL': filing['filing_url']
+        }
+    
+    @stage('oracle.process_filings')
+    def process_filings(self, filings: List[Dict], journal: Optional[CheckpointJournal] = None) -> pd.DataFrame:
         """
         Process all filings with enrichment and scoring.
         
         Args:
             filings: List of SEC filing dictionaries
+            journal: Optional checkpoint journal; completed filings are
+                replayed from it and new ones are journaled as they finish
             
         Returns:
             DataFrame with enriched data and scores
         """
         logger.info("🔮 Processing filings with Oracle AI...")
         
+        # Triage before any web enrichment; priority filings go first
+        self._add_form_d_details(filings, journal)
+        filings, self.last_triage_report = self.triage.triage_filings(filings)
+        
         results = []
+        index_before = self.resolution_index.get_stats()
         
         for idx, filing in enumerate(filings, 1):
-            logger.info(f"\n📊 Processing {idx}/{len(filings)}: {filing['company_name']}")
-            
-            # Parse filing date
-            try:
-                filing_date = datetime.strptime(filing['filing_date'][:10], '%Y-%m-%d')
-                days_since = (datetime.now() - filing_date).days
-            except:
-                filing_date = datetime.now()
-                days_since = 0
-            
-            # Scrape company info
-            company_info = self.scrape_company_info(filing['company_name'])
+            key = FilingWatermark.filing_key(filing)
+            if journal is not None and journal.is_completed(key):
+                results.append(journal.get(key))
+                logger.info(f"\n⏩ Replayed {idx}/{len(filings)} from checkpoint: {filing['company_name']}")
+                continue
             
-            # Extract funding amount
-            combined_text = f"{filing['summary']} {company_info['description']} {company_info['about_us']}"
-            funding_amount, funding_source = self.extract_funding_amount(combined_text)
-            
-            # Calculate hiring probability
-            hiring_prob = self.calculate_hiring_probability(
-                funding_amount=funding_amount,
-                tech_stack_count=len(company_info['tech_stack']),
-                hiring_signals=company_info['hiring_signals'],
-                days_since_filing=days_since
-            )
-            
-            # Build result
-            result = {
-                'Company Name': filing['company_name'],
-                'Funding Date': filing_date.strftime('%Y-%m-%d'),
-                'Days Since Filing': days_since,
-                'Estimated Amount (M)': f'${funding_amount:.1f}M' if funding_amount > 0 else 'Not disclosed',
-                'Funding Source': funding_source,
-                'Tech Stack': ', '.join(company_info['tech_stack'][:10]) if company_info['tech_stack'] else 'Not detected',
-                'Tech Count': len(company_info['tech_stack']),
-                'Hiring Signals': company_info['hiring_signals'],
-                'Hiring Probability (%)': hiring_prob,
-                'Website': company_info['website'],
-                'Description': company_info['description'][:200] if company_info['description'] else '',
-                'CIK': filing['cik'],
-                'Filing URL': filing['filing_url']
-            }
+            logger.info(f"\n📊 Processing {idx}/{len(filings)}: {filing['company_name']}")
             
+            with stage('oracle.process_filing'):
+                result = self.process_filing(filing)
             results.append(result)
-            logger.info(f"  ✓ Score: {hiring_prob}% | Tech: {result['Tech Count']} | Signals: {result['Hiring Signals']}")
-            
-            # Rate limiting
-            time.sleep(3)
+            current_stage().add_items()
+            if journal is not None:
+                journal.record(key, result)
+            logger.info(f"  ✓ Score: {result['Hiring Probability (%)']}% | Tech: {result['Tech Count']} | Signals: {result['Hiring Signals']}")
+        
+        if journal is not None:
+            journal.sync()
+        
+        # Persist newly resolved websites for the next run
+        self.resolution_index.save()
+        index_stats = self.resolution_index.get_stats()
+        current_stage().cache_hit(index_stats['hits'] + index_stats['negative_hits']
+                                  - index_before['hits'] - index_before['negative_hits'])
+        current_stage().cache_miss(index_stats['misses'] - index_before['misses'])
+        logger.info(f"🗂️  Resolution index: {index_stats['hits']} hits, {index_stats['negative_hits']} cached misses, "
+                    f"{index_stats['misses']} searches (hit rate {index_stats['hit_rate']:.0%})")
+        logger.info(f"⏱️  Search rate limits: {self.throttle.get_stats()}")
         
         df = pd.DataFrame(results)
+        if df.empty:
+            return df
         
         # Sort by hiring probability (descending)
         df = df.sort_values('Hiring Probability (%)', ascending=False)
@@ -639,6 +787,8 @@ class OracleFundingDetector:
         return summary
 
 
+@profiled('oracle_funding_detector')
+@with_metrics_dump('oracle_funding_detector')
 def main():
     """Main execution function."""
     print("\n" + "="*60)
@@ -648,6 +798,28 @@ def main():
     print("🧠 Predicting hiring needs with ML (No API costs!)")
     print("="*60 + "\n")
     
+    parser = argparse.ArgumentParser(description='Oracle Funding Detector & Hiring Predictor')
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        default=os.environ.get('ORACLE_INCREMENTAL', '').lower() in ('1', 'true', 'yes'),
+        help='Only enrich filings not scored in previous runs (env: ORACLE_INCREMENTAL)'
+    )
+    parser.add_argument(
+        '--resume',
+        metavar='RUN_ID',
+        help='Resume an interrupted run from its checkpoint journal'
+    )
+    parser.add_argument(
+        '--shard',
+        metavar='I/N',
+        default=os.environ.get('ORACLE_SHARD'),
+        help='Only enrich companies on shard I of N (0-based, env: ORACLE_SHARD)'
+    )
+    args = parser.parse_args()
+    shard = parse_shard(args.shard)
+    suffix = shard_suffix(shard)
+    
     # Initialize Oracle
     oracle = OracleFundingDetector()
     
@@ -655,14 +827,46 @@ def main():
     max_companies = int(os.environ.get('MAX_COMPANIES', 20))
     logger.info(f"🎯 Target: {max_companies} companies")
     
-    # Fetch SEC filings with retry logic
-    logger.info("🔄 Attempting to fetch SEC filings with retry logic...")
-    filings = oracle.fetch_sec_filings(
-        feed_type='recent', 
-        max_items=max_companies,
-        max_retries=3,
-        retry_delay=60
-    )
+    # Incremental mode reads the whole feed page and enriches only unseen filings
+    watermark = None
+    if args.incremental:
+        watermark = FilingWatermark(os.path.join(oracle.output_dir, 'state', f'watermark{suffix}.json'))
+        logger.info(f"🔖 Incremental mode: {len(watermark)} filings already scored")
+    
+    # Checkpoint journal: a resumed run reuses the filings list it started with
+    journal = open_journal(f'oracle{suffix}', args.resume, os.path.join(oracle.output_dir, 'checkpoints'))
+    
+    if journal.meta.get('filings'):
+        filings = journal.meta['filings']
+        logger.info(f"⏩ Resuming run {journal.run_id}: {len(journal)}/{len(filings)} filings already done")
+    else:
+        # Fetch SEC filings with retry logic
+        logger.info("🔄 Attempting to fetch SEC filings with retry logic...")
+        filings = oracle.fetch_sec_filings(
+            feed_type='recent', 
+            max_items=100 if watermark else max_companies,
+            max_retries=3,
+            retry_delay=60
+        )
+    
+    if shard and filings and not journal.meta.get('filings'):
+        filings = filter_shard(filings, shard, lambda f: f['company_name'])
+    
+    if watermark and filings and not journal.meta.get('filings'):
+        filings = watermark.filter_new(filings)[:max_companies]
+        if not filings:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            status_file = os.path.join(oracle.output_dir, f'oracle_status_{timestamp}.json')
+            with open(status_file, 'w') as f:
+                json.dump({
+                    'status': 'no_new_filings',
+                    'message': 'All Form D filings in the feed were already scored',
+                    'timestamp': timestamp,
+                    'last_accession': watermark.last_accession
+                }, f, indent=2)
+            logger.info(f"✅ No new filings since {watermark.last_accession} - status file: {status_file}")
+            journal.close()
+            return
     
     if not filings:
         logger.error("❌ No filings found after all retry attempts.")
@@ -699,32 +903,66 @@ def main():
         
         # Exit with code 0 (success) since this is not a script error
         # but a data availability issue
+        journal.close()
         return
     
     logger.info(f"✅ Successfully fetched {len(filings)} filings")
+    if not journal.meta.get('filings'):
+        journal.set_meta(filings=filings)
     
     # Process filings with enrichment
     try:
-        results_df = oracle.process_filings(filings)
+        results_df = oracle.process_filings(filings, journal=journal)
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        triage_file = os.path.join(oracle.output_dir, f'oracle_triage_{timestamp}{suffix}.json')
+        with open(triage_file, 'w') as f:
+            json.dump(oracle.last_triage_report, f, indent=2)
+        logger.info(f"🧮 Triage report: {oracle.last_triage_report['enrichments_avoided']} enrichments avoided → {triage_file}")
         
         if results_df.empty:
             logger.warning("⚠️ Processing completed but no valid results")
+            if oracle.last_triage_report.get('skipped') == len(filings):
+                # Every filing was triaged out - record a soft "no data" status
+                status_file = os.path.join(oracle.output_dir, f'oracle_status_{timestamp}.json')
+                with open(status_file, 'w') as f:
+                    json.dump({
+                        'status': 'all_filings_skipped',
+                        'message': 'All Form D filings were triaged out as non-tech leads',
+                        'timestamp': timestamp,
+                        'triage_report': triage_file
+                    }, f, indent=2)
+                if watermark:
+                    watermark.mark_processed(filings)
+                    watermark.save()
             return
         
     except Exception as e:
         logger.error(f"❌ Error processing filings: {e}")
         import traceback
         logger.error(traceback.format_exc())
+        logger.error(f"💡 Completed filings are checkpointed - rerun with --resume {journal.run_id}")
         return
+    finally:
+        journal.close()
     
     # Export to CSV
     try:
-        output_file = oracle.export_results(results_df)
+        output_file = oracle.export_results(results_df, f'oracle_predictions_{timestamp}{suffix}.csv')
         logger.info(f"✅ Results exported: {output_file}")
     except Exception as e:
         logger.error(f"❌ Error exporting results: {e}")
         return
     
+    # Advance the watermark only after results are safely on disk
+    if watermark:
+        try:
+            merge_cumulative_results(results_df, os.path.join(oracle.output_dir, f'oracle_cumulative{suffix}.csv'))
+            watermark.mark_processed(filings)
+            watermark.save()
+        except Exception as e:
+            logger.error(f"❌ Error updating incremental state: {e}")
+    
     # Generate summary
     try:
         summary = oracle.generate_summary_report(results_df)
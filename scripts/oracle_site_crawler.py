@@ -0,0 +1,173 @@
+"""
+Oracle Site Crawler
+===================
+Small bounded crawler for one company website during Oracle enrichment.
+
+Starting from the homepage, same-site links are ranked by what they are
+likely to say about hiring:
+
+    careers > jobs > about > engineering blog > press
+
+and the best ones are fetched concurrently (a few at a time) until a page
+or byte budget is spent, the frontier is empty, or the caller reports that
+enough signal has been gathered (e.g. an ATS board and an About page).
+
+Author: PulseB2B Ghost Infrastructure
+"""
+
+import heapq
+import logging
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urldefrag, urlparse
+
+import requests
+
+# Add project root to path for shared src modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.html_extraction import ExtractedPage, fetch_page
+
+logger = logging.getLogger(__name__)
+
+# Page kinds in crawl priority order (lower rank is fetched first)
+PAGE_KINDS = [
+    ('careers', ['careers', 'career', 'join-us', 'join us', 'work-with-us', 'work with us', "we're hiring", 'vagas', 'empleo']),
+    ('jobs', ['jobs', 'job', 'openings', 'open-positions', 'open positions', 'positions', 'vacancies']),
+    ('about', ['about', 'company', 'who-we-are', 'who we are', 'our-story', 'team', 'mission']),
+    ('engineering', ['engineering', 'tech-blog', 'developers', 'blog']),
+    ('press', ['press', 'news', 'newsroom', 'media', 'announcements']),
+]
+KIND_RANK = {kind: rank for rank, (kind, _) in enumerate(PAGE_KINDS)}
+
+SKIP_EXTENSIONS = re.compile(r'\.(pdf|jpe?g|png|gif|svg|webp|zip|mp4|mp3|docx?|xlsx?|pptx?|css|js|json|xml)$', re.IGNORECASE)
+
+
+def classify_link(href: str, text: str) -> Optional[str]:
+    """Return the page kind a link points to, or None if it is not interesting."""
+    path = urlparse(href).path.lower()
+    text = (text or '').strip().lower()
+    for kind, keywords in PAGE_KINDS:
+        for keyword in keywords:
+            if keyword in path or keyword == text or keyword in text.split():
+                return kind
+    return None
+
+
+def _site(url: str) -> str:
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class CompanySiteCrawler:
+    """
+    Priority-frontier crawler bounded by pages and bytes per company.
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        max_pages: int = 6,
+        max_bytes: int = 3_000_000,
+        max_page_bytes: int = 1_500_000,
+        concurrency: int = 3,
+        max_depth: int = 2,
+        timeout: int = 10
+    ):
+        """
+        Initialize the crawler.
+
+        Args:
+            session: Shared requests session
+            max_pages: Pages fetched per company, excluding the homepage
+            max_bytes: Bytes downloaded per company, including the homepage
+            max_page_bytes: Bytes read from any single page before truncating
+            concurrency: Same-site fetches in flight
+            max_depth: Link depth from the homepage
+            timeout: Request timeout in seconds
+        """
+        self.session = session or requests.Session()
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.max_page_bytes = max_page_bytes
+        self.concurrency = max(1, concurrency)
+        self.max_depth = max_depth
+        self.timeout = timeout
+
+    def _fetch(self, url: str, max_bytes: int) -> Optional[ExtractedPage]:
+        try:
+            return fetch_page(self.session, url, max_bytes, self.timeout)
+        except requests.RequestException as e:
+            logger.debug(f"Could not fetch {url}: {e}")
+            return None
+
+    def _links(self, page: ExtractedPage, depth: int) -> List[Tuple[int, int, str, str]]:
+        site = _site(page.url)
+        links = []
+        for url, text in page.links:
+            url = urldefrag(url)[0]
+            if not url.startswith('http') or _site(url) != site or SKIP_EXTENSIONS.search(urlparse(url).path):
+                continue
+            kind = classify_link(url, text)
+            if kind:
+                links.append((KIND_RANK[kind], depth + 1, url, kind))
+        return links
+
+    def crawl(
+        self,
+        homepage: ExtractedPage,
+        is_enough: Optional[Callable[[List[Dict]], bool]] = None
+    ) -> Dict:
+        """
+        Crawl the most promising pages linked from an already fetched homepage.
+
+        Args:
+            homepage: Extracted homepage (its URL defines the site)
+            is_enough: Called with the pages fetched so far after each batch;
+                returning True stops the crawl early
+
+        Returns:
+            ``{'pages': [{'url', 'kind', 'page'}], 'bytes', 'stopped_early'}``
+            with the homepage first (kind 'home')
+        """
+        pages = [{'url': homepage.url, 'kind': 'home', 'page': homepage}]
+        spent = homepage.bytes_read
+        seen = {urldefrag(homepage.url)[0].rstrip('/')}
+        frontier: List[Tuple[int, int, str, str]] = []
+
+        def push(links):
+            for item in links:
+                key = item[2].rstrip('/')
+                if key not in seen:
+                    seen.add(key)
+                    heapq.heappush(frontier, item)
+
+        push(self._links(homepage, 0))
+        fetched = 0
+        stopped_early = False
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while frontier and fetched < self.max_pages and spent < self.max_bytes:
+                if is_enough and is_enough(pages):
+                    stopped_early = True
+                    break
+                remaining = self.max_bytes - spent
+                batch = [heapq.heappop(frontier)
+                         for _ in range(min(self.concurrency, self.max_pages - fetched, len(frontier), remaining))]
+                fetched += len(batch)
+                # Split what is left of the byte budget across the batch
+                page_bytes = min(self.max_page_bytes, remaining // len(batch))
+                pages_read = executor.map(lambda item: self._fetch(item[2], page_bytes), batch)
+                for (_, depth, url, kind), page in zip(batch, pages_read):
+                    if page is None:
+                        continue
+                    spent += page.bytes_read
+                    pages.append({'url': url, 'kind': kind, 'page': page})
+                    if depth < self.max_depth:
+                        push(self._links(page, depth))
+
+        logger.debug(f"Crawled {len(pages)} pages ({spent} bytes) on {_site(homepage.url)}")
+        return {'pages': pages, 'bytes': spent, 'stopped_early': stopped_early}
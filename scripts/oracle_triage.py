@@ -0,0 +1,246 @@
+"""
+Oracle Filing Triage
+====================
+Cheap pre-enrichment triage for Form D filings.
+
+A large share of Form D volume is real-estate funds, oil & gas LPs and pooled
+investment vehicles that will never be tech hiring leads. This stage uses the entity
+name from the feed and the industry group, issuer type and offering size
+from the Form D primary document (``primary_doc.xml``, one small SEC request
+per filing, see ``parse_form_d_details``) to classify each filing as
+skip / enrich / priority before any web enrichment happens.
+
+Rules are plain JSON so they can be tuned without code changes
+(``ORACLE_TRIAGE_RULES=path/to/rules.json`` overrides any default key).
+
+Author: PulseB2B Ghost Infrastructure
+"""
+
+import json
+import logging
+import os
+import re
+import xml.etree.ElementTree as ET
+from collections import Counter
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SKIP = 'skip'
+ENRICH = 'enrich'
+PRIORITY = 'priority'
+
+
+DEFAULT_TRIAGE_RULES = {
+    # Form D industry groups that are never tech hiring leads
+    'skip_industry_groups': [
+        'pooled investment fund', 'reits and finance', 'commercial', 'residential',
+        'other real estate', 'construction', 'oil and gas', 'coal mining',
+        'lodging and conventions', 'restaurants', 'agriculture', 'investing',
+        'commercial banking', 'insurance', 'other banking and financial services'
+    ],
+    # Industry groups that go to the front of the enrichment queue
+    'priority_industry_groups': [
+        'computers', 'telecommunications', 'other technology', 'biotechnology',
+        'business services', 'other health care'
+    ],
+    'skip_issuer_types': ['limited partnership', 'general partnership', 'business trust'],
+    # Entity-name patterns that mark investment vehicles (hard skip)
+    'skip_name_patterns': [
+        r'\bfund\b', r'\bfund\s+[ivx\d]+\b', r'\bl\.?\s?p\.?$', r'\blp\b', r'\breit\b',
+        r'\brealty\b', r'\breal estate\b', r'\bproperties\b', r'\bapartments?\b',
+        r'\boil\b', r'\bgas\b', r'\bpetroleum\b', r'\bminerals?\b', r'\broyalt(y|ies)\b',
+        r'\bmaster\b', r'\bfeeder\b', r'\bspv\b', r'\bopportunity zone\b',
+        r'\bco-?invest', r'\bseries \d+\b.*\ba series of\b'
+    ],
+    # Weaker negative hints (each subtracts one point)
+    'weak_negative_name_patterns': [
+        r'\bholdings?\b', r'\bcapital\b', r'\bpartners\b', r'\binvestors?\b',
+        r'\binvestments?\b', r'\btrust\b', r'\bacquisition\b', r'\bventures\b'
+    ],
+    # Tech-sounding names (each adds two points and overrides name-pattern skips)
+    'tech_name_patterns': [
+        r'\blabs?\b', r'\btech(nologies|nology)?\b', r'\bsoftware\b', r'\bai\b',
+        r'\brobotics\b', r'\bsystems\b', r'\bdata\b', r'\bcloud\b', r'\banalytics\b',
+        r'\bcomputing\b', r'\bnetworks?\b', r'\bplatforms?\b', r'\bapp\b',
+        r'\bdigital\b', r'\bcyber', r'\bquantum\b', r'\bbio\w*\b', r'\.io\b'
+    ],
+    # Offering size thresholds (USD); unknown amounts are never penalized
+    'min_offering_usd': 250000,
+    'priority_offering_usd': 5000000,
+    'skip_score': -2,
+    'priority_score': 3,
+}
+
+
+# Form D primary document element -> triage filing field (first occurrence wins,
+# so the primary issuer's entity type is used, not a related issuer's)
+FORM_D_FIELDS = {
+    'industryGroupType': 'industry_group',
+    'entityType': 'issuer_type',
+    'totalOfferingAmount': 'offering_amount',
+    'totalAmountSold': 'amount_raised',
+}
+
+
+def form_d_primary_doc_url(filing: Dict) -> Optional[str]:
+    """EDGAR URL of a filing's Form D primary document, from its CIK and accession number."""
+    cik = str(filing.get('cik') or '').strip()
+    accession = str(filing.get('accession_number') or '').replace('-', '')
+    if not cik.isdigit() or not accession.isdigit():
+        return None
+    return f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/{accession}/primary_doc.xml"
+
+
+def parse_form_d_details(xml_text: Union[str, bytes]) -> Dict:
+    """
+    Extract the triage fields (``industry_group``, ``issuer_type``,
+    ``offering_amount``, ``amount_raised``) from a Form D primary document.
+
+    Returns:
+        Dict with the fields found (empty for unparseable documents)
+    """
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError:
+        return {}
+    details = {}
+    for element in root.iter():
+        field = FORM_D_FIELDS.get(element.tag.rsplit('}', 1)[-1])
+        if field and field not in details and (element.text or '').strip():
+            details[field] = element.text.strip()
+    return details
+
+
+class FilingTriage:
+    """
+    Rule-based skip / enrich / priority classifier for Form D filings.
+    """
+
+    def __init__(self, rules: Optional[Dict] = None):
+        """
+        Initialize triage with default rules, overridden by ``rules`` keys.
+        """
+        self.rules = {**DEFAULT_TRIAGE_RULES, **(rules or {})}
+        self._skip_names = [re.compile(p, re.IGNORECASE) for p in self.rules['skip_name_patterns']]
+        self._weak_names = [re.compile(p, re.IGNORECASE) for p in self.rules['weak_negative_name_patterns']]
+        self._tech_names = [re.compile(p, re.IGNORECASE) for p in self.rules['tech_name_patterns']]
+        self._skip_industries = {g.lower() for g in self.rules['skip_industry_groups']}
+        self._priority_industries = {g.lower() for g in self.rules['priority_industry_groups']}
+        self._skip_issuers = {t.lower() for t in self.rules['skip_issuer_types']}
+
+    @classmethod
+    def from_env(cls) -> 'FilingTriage':
+        """Build triage from ``ORACLE_TRIAGE_RULES`` (JSON file) if set."""
+        rules_path = os.environ.get('ORACLE_TRIAGE_RULES')
+        if not rules_path:
+            return cls()
+        with open(rules_path, 'r', encoding='utf-8') as f:
+            rules = json.load(f)
+        logger.info(f"🧮 Triage rules loaded from {rules_path}")
+        return cls(rules)
+
+    @staticmethod
+    def _normalize_industry(value: Optional[str]) -> str:
+        text = (value or '').lower().replace('&', 'and')
+        return re.sub(r'\s+', ' ', text).strip()
+
+    @staticmethod
+    def _offering_amount(filing: Dict) -> Optional[float]:
+        for field in ('offering_amount', 'total_offering_amount', 'amount_raised'):
+            value = filing.get(field)
+            if value in (None, '', 'Indefinite'):
+                continue
+            try:
+                return float(str(value).replace(',', '').replace('$', ''))
+            except ValueError:
+                continue
+        return None
+
+    def classify(self, filing: Dict) -> Tuple[str, List[str]]:
+        """
+        Classify a filing.
+
+        Args:
+            filing: Filing dict (``company_name`` plus any of ``industry_group``,
+                ``issuer_type``, ``offering_amount`` from ``parse_form_d_details``)
+
+        Returns:
+            Tuple of (decision, reasons)
+        """
+        name = filing.get('company_name', '') or ''
+        industry = self._normalize_industry(filing.get('industry_group') or filing.get('industry'))
+        issuer_type = (filing.get('issuer_type') or filing.get('entity_type') or '').lower().strip()
+        amount = self._offering_amount(filing)
+
+        if industry and industry in self._skip_industries:
+            return SKIP, [f'industry:{industry}']
+        if issuer_type and issuer_type in self._skip_issuers:
+            return SKIP, [f'issuer_type:{issuer_type}']
+
+        tech_hits = [p.pattern for p in self._tech_names if p.search(name)]
+        skip_hits = [p.pattern for p in self._skip_names if p.search(name)]
+        if skip_hits and not tech_hits:
+            return SKIP, [f'name:{skip_hits[0]}']
+
+        if amount is not None and 0 < amount < self.rules['min_offering_usd']:
+            return SKIP, [f'offering_below:{int(amount)}']
+
+        score = 0
+        reasons = []
+        for pattern in self._weak_names:
+            if pattern.search(name):
+                score -= 1
+                reasons.append(f'weak_name:{pattern.pattern}')
+        if tech_hits:
+            score += 2 * len(tech_hits)
+            reasons.append(f'tech_name:{tech_hits[0]}')
+        if industry in self._priority_industries:
+            score += 3
+            reasons.append(f'priority_industry:{industry}')
+        if amount is not None and amount >= self.rules['priority_offering_usd']:
+            score += 2
+            reasons.append(f'offering:{int(amount)}')
+
+        if score <= self.rules['skip_score']:
+            return SKIP, reasons
+        if score >= self.rules['priority_score']:
+            return PRIORITY, reasons
+        return ENRICH, reasons
+
+    def triage_filings(self, filings: List[Dict]) -> Tuple[List[Dict], Dict]:
+        """
+        Triage a batch of filings.
+
+        Returns:
+            Tuple of (filings to enrich with priority ones first, triage report)
+        """
+        priority, enrich, skipped = [], [], []
+        reason_counts = Counter()
+
+        for filing in filings:
+            decision, reasons = self.classify(filing)
+            filing['triage_decision'] = decision
+            filing['triage_reasons'] = reasons
+            if decision == SKIP:
+                skipped.append(filing)
+                reason_counts[reasons[0].split(':')[0] if reasons else 'score'] += 1
+            elif decision == PRIORITY:
+                priority.append(filing)
+            else:
+                enrich.append(filing)
+
+        report = {
+            'total_filings': len(filings),
+            'priority': len(priority),
+            'enrich': len(enrich),
+            'skipped': len(skipped),
+            'enrichments_avoided': len(skipped),
+            'avoided_pct': round(100 * len(skipped) / len(filings), 1) if filings else 0.0,
+            'skip_reasons': dict(reason_counts),
+            'skipped_companies': [f.get('company_name') for f in skipped]
+        }
+        logger.info(f"🧮 Triage: {report['priority']} priority, {report['enrich']} enrich, "
+                    f"{report['skipped']} skipped ({report['avoided_pct']}% enrichments avoided)")
+        return priority + enrich, report
+
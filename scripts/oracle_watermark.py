@@ -0,0 +1,143 @@
+"""
+Oracle Filing Watermark
+=======================
+Persistent seen-filing watermark for incremental Oracle runs.
+
+Keeps the last processed accession number / feed timestamp plus the set of
+processed CIK+accession pairs, so each run only enriches filings it has not
+scored before. New results are merged into a cumulative results store.
+
+Author: PulseB2B Ghost Infrastructure
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class FilingWatermark:
+    """
+    Tracks which Form D filings have already been scored.
+    """
+
+    # Cap on remembered CIK+accession pairs (oldest are evicted first)
+    MAX_PROCESSED_KEYS = 50000
+
+    def __init__(self, state_path: str):
+        """
+        Initialize the watermark.
+
+        Args:
+            state_path: JSON file holding the watermark state
+        """
+        self.state_path = Path(state_path)
+        self.last_accession: Optional[str] = None
+        self.last_updated: Optional[str] = None
+        self.runs = 0
+        self._processed: Dict[str, None] = {}  # insertion-ordered set
+        self._load()
+
+    @staticmethod
+    def filing_key(filing: Dict) -> str:
+        """Build the CIK+accession key for a filing dict."""
+        cik = str(filing.get('cik') or '').lstrip('0')
+        accession = filing.get('accession_number') or filing.get('filing_url') or ''
+        return f"{cik}:{accession}"
+
+    def _load(self) -> None:
+        if not self.state_path.exists():
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Could not read watermark {self.state_path}: {e}")
+            return
+
+        self.last_accession = state.get('last_accession')
+        self.last_updated = state.get('last_updated')
+        self.runs = state.get('runs', 0)
+        self._processed = dict.fromkeys(state.get('processed', []))
+
+    def __len__(self) -> int:
+        return len(self._processed)
+
+    def is_processed(self, filing: Dict) -> bool:
+        """Return True if the filing was scored in a previous run."""
+        return self.filing_key(filing) in self._processed
+
+    def filter_new(self, filings: List[Dict]) -> List[Dict]:
+        """Return only filings not yet processed, preserving feed order."""
+        new_filings = [f for f in filings if not self.is_processed(f)]
+        logger.info(f"🔖 Watermark: {len(filings) - len(new_filings)} already scored, {len(new_filings)} new")
+        return new_filings
+
+    def mark_processed(self, filings: List[Dict]) -> None:
+        """Record filings as scored and advance the watermark."""
+        for filing in filings:
+            key = self.filing_key(filing)
+            self._processed.pop(key, None)
+            self._processed[key] = None
+
+            updated = filing.get('filing_date') or ''
+            if updated and (not self.last_updated or updated >= self.last_updated):
+                self.last_updated = updated
+                self.last_accession = filing.get('accession_number') or self.last_accession
+
+        overflow = len(self._processed) - self.MAX_PROCESSED_KEYS
+        if overflow > 0:
+            for key in list(self._processed)[:overflow]:
+                del self._processed[key]
+
+    def save(self) -> None:
+        """Persist the watermark atomically."""
+        self.runs += 1
+        state = {
+            'last_accession': self.last_accession,
+            'last_updated': self.last_updated,
+            'runs': self.runs,
+            'saved_at': datetime.utcnow().isoformat(),
+            'processed': list(self._processed)
+        }
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(self.state_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+        logger.info(f"🔖 Watermark saved: {len(self._processed)} filings, last {self.last_accession}")
+
+
+def merge_cumulative_results(new_df: pd.DataFrame, store_path: str) -> pd.DataFrame:
+    """
+    Merge newly scored filings into the cumulative results store.
+
+    Rows are keyed by CIK + Filing URL; a re-scored filing replaces its older
+    row. The store is kept sorted by hiring probability like the per-run CSV.
+
+    Args:
+        new_df: Results DataFrame from the current run
+        store_path: Path of the cumulative CSV
+
+    Returns:
+        The merged DataFrame (also written to ``store_path``)
+    """
+    if os.path.exists(store_path):
+        existing = pd.read_csv(store_path, dtype={'CIK': str})
+        merged = pd.concat([existing, new_df.astype({'CIK': str})], ignore_index=True)
+    else:
+        merged = new_df.astype({'CIK': str}).copy()
+
+    merged = merged.drop_duplicates(subset=['CIK', 'Filing URL'], keep='last')
+    merged = merged.sort_values('Hiring Probability (%)', ascending=False)
+
+    Path(store_path).parent.mkdir(parents=True, exist_ok=True)
+    merged.to_csv(store_path, index=False, encoding='utf-8')
+    logger.info(f"📚 Cumulative store: {len(merged)} companies → {store_path}")
+    return merged
@@ -9,14 +9,21 @@ Memory Footprint: <500MB (GitHub Actions compatible)
 """
 
 import re
+import sys
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional, Union
 from collections import Counter
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.preprocessing import MinMaxScaler
 
+# Add project root to path for shared src modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.text_document import Document, as_document
+
 
 class PulseIntelligenceEngine:
     """
@@ -110,25 +117,57 @@ class PulseIntelligenceEngine:
     
     def __init__(self):
         """Initialize the Pulse Intelligence Engine."""
+        # Uni- to tri-grams come from the shared Document tokens (words of 2+
+        # characters, as with the default TfidfVectorizer token pattern)
         self.vectorizer = TfidfVectorizer(
             vocabulary=self.EXPANSION_KEYWORDS,
-            lowercase=True,
-            max_features=100,
-            ngram_range=(1, 3)
+            analyzer=lambda document: document.ngrams(3, min_length=2)
         )
         self.scaler = MinMaxScaler(feature_range=(0, 100))
+    
+    @classmethod
+    def _patterns(cls) -> Dict[str, any]:
+        """Tech stack, red-flag and executive-hire patterns, compiled once."""
+        if '_compiled_patterns' not in cls.__dict__:
+            titles = '|'.join(cls.C_LEVEL_TITLES)
+            cls._compiled_patterns = {
+                # (literal, pattern): every tech pattern is a \b-bounded literal, so a
+                # substring check on the lowercase text rules most of them out cheaply
+                'tech_stack': {
+                    category: [
+                        (re.sub(r'\\(.)', r'\1', pattern.replace(r'\b', '')).lower(),
+                         re.compile(pattern, re.IGNORECASE))
+                        for pattern in patterns
+                    ]
+                    for category, patterns in cls.TECH_STACK.items()
+                },
+                'negative': [
+                    (keyword, re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE))
+                    for keyword in cls.NEGATIVE_KEYWORDS
+                ],
+                # Common patterns for hire announcements
+                'c_level_hires': [
+                    re.compile(pattern.format(titles), re.IGNORECASE) for pattern in (
+                        r'(joined|joining|appointed|hired|announced|welcomes?)\s+.*?\s+as\s+({})',
+                        r'({})\s+.*?\s+(joined|joining|appointed|hired)',
+                        r'new\s+({})\s+'
+                    )
+                ]
+            }
+        return cls._compiled_patterns
         
-    def analyze_growth_signals(self, text_content: str) -> Dict[str, any]:
+    def analyze_growth_signals(self, text_content: Union[str, Document]) -> Dict[str, any]:
         """
         Analyze text content for expansion/growth signals using TF-IDF.
         
         Args:
-            text_content: Raw text from company website, job posts, news, etc.
+            text_content: Raw text (or shared Document) from company website, job posts, news, etc.
             
         Returns:
             Dictionary with density scores and detected keywords
         """
-        if not text_content or len(text_content.strip()) < 50:
+        document = as_document(text_content)
+        if len(document) < 50:
             return {
                 'expansion_density': 0.0,
                 'detected_keywords': [],
@@ -138,7 +177,7 @@ class PulseIntelligenceEngine:
         
         try:
             # Fit and transform the text
-            tfidf_matrix = self.vectorizer.fit_transform([text_content.lower()])
+            tfidf_matrix = self.vectorizer.fit_transform([document])
             feature_names = self.vectorizer.get_feature_names_out()
             
             # Get TF-IDF scores
@@ -185,23 +224,26 @@ class PulseIntelligenceEngine:
                 'confidence': 'error'
             }
     
-    def detect_tech_stack(self, text_content: str) -> Dict[str, List[str]]:
+    def detect_tech_stack(self, text_content: Union[str, Document]) -> Dict[str, List[str]]:
         """
         Detect technology stack using regex pattern matching.
         
         Args:
-            text_content: Raw text from job descriptions or company pages
+            text_content: Raw text (or shared Document) from job descriptions or company pages
             
         Returns:
             Dictionary with detected tech by category
         """
+        document = as_document(text_content)
         detected_tech = {}
         all_tech = []
         
-        for category, patterns in self.TECH_STACK.items():
+        for category, patterns in self._patterns()['tech_stack'].items():
             category_matches = []
-            for pattern in patterns:
-                matches = re.findall(pattern, text_content, re.IGNORECASE)
+            for literal, pattern in patterns:
+                if literal not in document.lower:
+                    continue
+                matches = pattern.findall(document.text)
                 if matches:
                     # Normalize and deduplicate
                     normalized = list(set([m.strip() for m in matches]))
@@ -221,21 +263,24 @@ class PulseIntelligenceEngine:
             'categories_present': list(detected_tech.keys())
         }
     
-    def detect_negative_signals(self, text_content: str) -> Dict[str, any]:
+    def detect_negative_signals(self, text_content: Union[str, Document]) -> Dict[str, any]:
         """
         Detect negative keywords that indicate company distress.
         
         Args:
-            text_content: Raw text to analyze
+            text_content: Raw text (or shared Document) to analyze
             
         Returns:
             Dictionary with detected red flags
         """
+        document = as_document(text_content)
         detected_negatives = []
         
-        for keyword in self.NEGATIVE_KEYWORDS:
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
+        for keyword, pattern in self._patterns()['negative']:
+            # Cheap substring check before the word-boundary regex
+            if keyword not in document.lower:
+                continue
+            matches = pattern.findall(document.text)
             if matches:
                 detected_negatives.append({
                     'keyword': keyword,
@@ -252,12 +297,13 @@ class PulseIntelligenceEngine:
             'is_risky': len(detected_negatives) > 0
         }
     
-    def detect_c_level_hires(self, text_content: str, recent_date_threshold: Optional[datetime] = None) -> Dict[str, any]:
+    def detect_c_level_hires(self, text_content: Union[str, Document],
+                             recent_date_threshold: Optional[datetime] = None) -> Dict[str, any]:
         """
         Detect recent C-level executive hires.
         
         Args:
-            text_content: Text containing hire announcements or LinkedIn updates
+            text_content: Text (or shared Document) containing hire announcements or LinkedIn updates
             recent_date_threshold: Consider hires after this date as "recent"
             
         Returns:
@@ -266,17 +312,11 @@ class PulseIntelligenceEngine:
         if recent_date_threshold is None:
             recent_date_threshold = datetime.now() - timedelta(days=90)  # Last 3 months
         
+        text = as_document(text_content).text
         detected_hires = []
         
-        # Common patterns for hire announcements
-        hire_patterns = [
-            r'(joined|joining|appointed|hired|announced|welcomes?)\s+.*?\s+as\s+({})'.format('|'.join(self.C_LEVEL_TITLES)),
-            r'({})\s+.*?\s+(joined|joining|appointed|hired)'.format('|'.join(self.C_LEVEL_TITLES)),
-            r'new\s+({})\s+'.format('|'.join(self.C_LEVEL_TITLES))
-        ]
-        
-        for pattern in hire_patterns:
-            matches = re.finditer(pattern, text_content, re.IGNORECASE)
+        for pattern in self._patterns()['c_level_hires']:
+            matches = pattern.finditer(text)
             for match in matches:
                 detected_hires.append({
                     'context': match.group(0),
@@ -320,6 +360,9 @@ class PulseIntelligenceEngine:
                 posted_date = post.get('posted_date')
                 if isinstance(posted_date, str):
                     posted_date = datetime.fromisoformat(posted_date.replace('Z', '+00:00'))
+                if posted_date and posted_date.tzinfo is not None:
+                    # ATS boards report UTC timestamps; compare in local naive time
+                    posted_date = posted_date.astimezone().replace(tzinfo=None)
                 
                 if posted_date and posted_date >= cutoff_time:
                     recent_posts.append(post)
@@ -341,24 +384,25 @@ class PulseIntelligenceEngine:
     
     def calculate_pulse_score(self, 
                             sec_funding_detected: bool,
-                            text_content: str,
+                            text_content: Union[str, Document],
                             job_posts: Optional[List[Dict]] = None) -> Dict[str, any]:
         """
         Calculate comprehensive Pulse Intelligence Score.
         
         Args:
             sec_funding_detected: Whether SEC funding was detected
-            text_content: Combined text from website, jobs, news
+            text_content: Combined text (or shared Document) from website, jobs, news
             job_posts: List of job posting dictionaries (optional)
             
         Returns:
             Standardized JSON output with all signals and final score
         """
-        # Run all analysis modules
-        growth_signals = self.analyze_growth_signals(text_content)
-        tech_analysis = self.detect_tech_stack(text_content)
-        negative_signals = self.detect_negative_signals(text_content)
-        c_level_analysis = self.detect_c_level_hires(text_content)
+        # Run all analysis modules on one shared Document
+        document = as_document(text_content)
+        growth_signals = self.analyze_growth_signals(document)
+        tech_analysis = self.detect_tech_stack(document)
+        negative_signals = self.detect_negative_signals(document)
+        c_level_analysis = self.detect_c_level_hires(document)
         
         # Job velocity (if data available)
         if job_posts:
@@ -8,9 +8,17 @@ Critical Score: 95% if US company + LATAM expansion detected
 """
 
 import re
-from typing import Dict, List, Tuple, Optional
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional, Union
 from collections import Counter
 
+# Add project root to path for shared src modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.text_document import Document, as_document
+from src.money_amounts import extract_funding_amount
+
 
 class RegionalEntityRecognizer:
     """
@@ -60,36 +68,46 @@ class RegionalEntityRecognizer:
         'expandiendo operaciones', 'expansión internacional', 'expansión regional'
     ]
     
-    # Funding event patterns
-    FUNDING_PATTERNS = [
-        r'\$(\d+(?:\.\d+)?)\s*(M|million|B|billion)',
-        r'raised\s+\$?(\d+(?:\.\d+)?)\s*(M|million|B|billion)',
-        r'secured\s+\$?(\d+(?:\.\d+)?)\s*(M|million|B|billion)',
-        r'closed\s+\$?(\d+(?:\.\d+)?)\s*(M|million|B|billion)',
-        r'(Series [A-D]|Seed|Pre-seed)\s+round',
-    ]
+    LATAM_COUNTRIES = ['Colombia', 'Argentina', 'Costa Rica', 'Uruguay', 'Chile', 'Mexico']
     
     def __init__(self):
         """Initialize entity recognizer."""
         pass
     
-    def analyze_text(self, text: str, company_name: str = None) -> Dict[str, any]:
+    @classmethod
+    def _patterns(cls) -> Dict[str, List[re.Pattern]]:
+        """Entity patterns, compiled once."""
+        if '_compiled_patterns' not in cls.__dict__:
+            cls._compiled_patterns = {
+                name: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+                for name, patterns in (
+                    ('us_canada', cls.US_CANADA_INDICATORS),
+                    ('latam_based', cls.LATAM_BASED_INDICATORS),
+                    ('delivery_center', cls.DELIVERY_CENTER_PATTERNS),
+                    ('latam_country', [r'\b' + re.escape(country) + r'\b' for country in cls.LATAM_COUNTRIES]),
+                )
+            }
+        return cls._compiled_patterns
+    
+    def analyze_text(self, text: Union[str, Document], company_name: str = None) -> Dict[str, any]:
         """
         Analyze text for funding + LATAM expansion signals.
         
         Args:
-            text: Content to analyze (news article, company description, etc.)
+            text: Content (or shared Document) to analyze (news article, company description, etc.)
             company_name: Optional company name for context
             
         Returns:
             Analysis results with critical hiring score
         """
+        document = as_document(text)
+        
         # Detect entities
-        is_us_canada_company = self._detect_us_canada(text)
-        funding_amount = self._extract_funding_amount(text)
-        latam_regions = self._detect_latam_expansion(text)
-        has_expansion_intent = self._detect_expansion_intent(text)
-        delivery_centers = self._extract_delivery_centers(text)
+        is_us_canada_company = self._detect_us_canada(document)
+        funding_amount = self._extract_funding_amount(document)
+        latam_regions = self._detect_latam_expansion(document)
+        has_expansion_intent = self._detect_expansion_intent(document)
+        delivery_centers = self._extract_delivery_centers(document)
         
         # Calculate critical hiring score
         critical_score = self._calculate_critical_score(
@@ -121,64 +139,58 @@ class RegionalEntityRecognizer:
             'recommendation': self._generate_recommendation(critical_score, latam_regions)
         }
     
-    def _detect_us_canada(self, text: str) -> bool:
+    def _detect_us_canada(self, document: Document) -> bool:
         """Detect if company is US or Canadian."""
+        # Every indicator is an "X-based" / "X based" / "... company|startup|firm" phrase
+        if not any(word in document.lower for word in ('based', 'company', 'startup', 'firm')):
+            return False
+        
         # First check if it's LATAM-based (exclude these)
-        for pattern in self.LATAM_BASED_INDICATORS:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in self._patterns()['latam_based']:
+            if pattern.search(document.text):
                 return False
         
         # Then check for US/Canada indicators
-        for pattern in self.US_CANADA_INDICATORS:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in self._patterns()['us_canada']:
+            if pattern.search(document.text):
                 return True
         return False
     
-    def _extract_funding_amount(self, text: str) -> Optional[float]:
-        """Extract funding amount in USD."""
-        for pattern in self.FUNDING_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    amount = float(match.group(1))
-                    unit = match.group(2).lower() if len(match.groups()) > 1 else 'm'
-                    
-                    if 'b' in unit:
-                        return amount * 1_000_000_000
-                    else:  # million
-                        return amount * 1_000_000
-                except (IndexError, ValueError):
-                    continue
-        
-        return None
+    def _extract_funding_amount(self, document: Document) -> Optional[float]:
+        """Extract funding amount in USD (see ``src.money_amounts``)."""
+        amount = extract_funding_amount(document.text)
+        return amount.usd if amount else None
     
-    def _detect_latam_expansion(self, text: str) -> List[str]:
+    def _detect_latam_expansion(self, document: Document) -> List[str]:
         """Detect mentioned LATAM countries."""
-        latam_countries = ['Colombia', 'Argentina', 'Costa Rica', 'Uruguay', 'Chile', 'Mexico']
-        detected = []
+        def detect(document: Document) -> List[str]:
+            return [
+                country
+                for country, pattern in zip(self.LATAM_COUNTRIES, self._patterns()['latam_country'])
+                if country.lower() in document.lower and pattern.search(document.text)
+            ]
         
-        for country in latam_countries:
-            if re.search(r'\b' + re.escape(country) + r'\b', text, re.IGNORECASE):
-                detected.append(country)
-        
-        return detected
+        return list(document.feature('regional.latam_countries', detect))
     
-    def _detect_expansion_intent(self, text: str) -> bool:
+    def _detect_expansion_intent(self, document: Document) -> bool:
         """Detect expansion intent keywords."""
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in self.EXPANSION_INTENT)
+        return any(keyword in document.lower for keyword in self.EXPANSION_INTENT)
     
-    def _extract_delivery_centers(self, text: str) -> List[Dict[str, str]]:
+    def _extract_delivery_centers(self, document: Document) -> List[Dict[str, str]]:
         """Extract delivery center mentions with location."""
         centers = []
         
-        for pattern in self.DELIVERY_CENTER_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        # Every delivery-center pattern names one of the LATAM countries
+        if not self._detect_latam_expansion(document):
+            return centers
+        
+        for pattern in self._patterns()['delivery_center']:
+            matches = pattern.finditer(document.text)
             for match in matches:
                 # Extract location from match groups
                 location = None
                 for group in match.groups():
-                    if group in ['Colombia', 'Argentina', 'Costa Rica', 'Uruguay', 'Chile', 'Mexico']:
+                    if group in self.LATAM_COUNTRIES:
                         location = group
                         break
                 
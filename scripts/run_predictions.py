@@ -14,6 +14,7 @@ sys.path.append(str(Path(__file__).parent.parent / 'src'))
 
 from ml_predictor import HiringProbabilityPredictor
 from feature_engineering import FeatureEngineer, CompanyFeatures
+from profiling import profiled
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -187,6 +188,7 @@ def load_companies_from_watchlist() -> list:
     return companies
 
 
+@profiled('run_predictions')
 def main():
     """Script principal de predicción"""
     
@@ -0,0 +1,243 @@
+"""
+Translation Memo
+================
+Persistent, batched translation layer for the regional crawlers.
+
+- Detects English / Spanish / Portuguese locally (stopword profile) and never
+  sends English text to the translator
+- Memoizes translations by (source language, normalized text hash) in a JSON
+  file, so recurring boilerplate ("Ofertas de empleo en ...") is translated once
+- Packs several snippets into one remote call (up to the translator's
+  character limit) and splits the result back
+
+Author: PulseB2B Senior Backend Engineer
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_MEMO_PATH = 'data/cache/translation_memo.json'
+
+# Small stopword profiles; enough to tell en/es/pt apart on job-board snippets
+LANGUAGE_PROFILES = {
+    'en': {'the', 'and', 'of', 'to', 'in', 'for', 'with', 'is', 'are', 'we', 'you', 'our', 'job', 'jobs',
+           'hiring', 'engineer', 'developer', 'career', 'careers', 'apply', 'remote', 'team', 'at'},
+    'es': {'el', 'la', 'los', 'las', 'de', 'del', 'y', 'en', 'para', 'con', 'una', 'un', 'por', 'que', 'se',
+           'empleo', 'empleos', 'trabajo', 'ofertas', 'vacante', 'vacantes', 'desarrollador', 'busca', 'ingeniero'},
+    'pt': {'o', 'os', 'as', 'da', 'do', 'das', 'dos', 'e', 'em', 'para', 'com', 'uma', 'um', 'que', 'não',
+           'vaga', 'vagas', 'emprego', 'empregos', 'desenvolvedor', 'trabalho', 'engenheiro', 'você', 'na', 'no'},
+}
+# Characters that only appear in one of the Romance languages
+LANGUAGE_MARKERS = {'es': re.compile(r'[ñ¿¡]'), 'pt': re.compile(r'[ãõç]|ção\b')}
+
+# Line used to join snippets in one remote call; translators keep it intact
+BATCH_SEPARATOR = '\n||\n'
+
+
+def detect_language(text: str) -> str:
+    """
+    Detect 'en', 'es' or 'pt' from stopword overlap.
+
+    Returns:
+        Language code, or 'unknown' when there is no clear signal
+    """
+    words = re.findall(r"[a-záéíóúñãõçâêôü]+", (text or '').lower())
+    if not words:
+        return 'unknown'
+
+    scores = {lang: sum(1 for w in words if w in profile) for lang, profile in LANGUAGE_PROFILES.items()}
+    for lang, marker in LANGUAGE_MARKERS.items():
+        if marker.search(text.lower()):
+            scores[lang] += 2
+
+    best = max(scores, key=scores.get)
+    ranked = sorted(scores.values(), reverse=True)
+    if ranked[0] == 0 or ranked[0] == ranked[1]:
+        return 'unknown'
+    return best
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r'\s+', ' ', text).strip().casefold()
+
+
+class TranslationMemo:
+    """
+    Persistent memo of translations to English with batched remote calls.
+    """
+
+    def __init__(
+        self,
+        memo_path: str = DEFAULT_MEMO_PATH,
+        translate_fn: Optional[Callable[[str, str], str]] = None,
+        max_batch_chars: int = 4500
+    ):
+        """
+        Initialize the memo.
+
+        Args:
+            memo_path: JSON file with memoized translations
+            translate_fn: ``(source_language, text) -> english`` remote call;
+                defaults to deep_translator's GoogleTranslator
+            max_batch_chars: Max characters per remote call (Google limit is 5000)
+        """
+        self.memo_path = Path(memo_path)
+        self.translate_fn = translate_fn or self._google_translate
+        self.max_batch_chars = max_batch_chars
+
+        self._memo: Dict[str, str] = {}
+        self._new_keys = set()
+        self._lock = threading.Lock()
+        self._translators = {}
+
+        self.stats = {'lookups': 0, 'memo_hits': 0, 'english_skipped': 0, 'remote_calls': 0, 'translated': 0}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.memo_path.exists():
+            return
+        try:
+            with open(self.memo_path, 'r', encoding='utf-8') as f:
+                self._memo = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read translation memo {self.memo_path}: {e}")
+
+    def _google_translate(self, source_language: str, text: str) -> str:
+        if source_language not in self._translators:
+            from deep_translator import GoogleTranslator
+            self._translators[source_language] = GoogleTranslator(source=source_language, target='en')
+        return self._translators[source_language].translate(text)
+
+    @staticmethod
+    def memo_key(source_language: str, text: str) -> str:
+        """Build the memo key for a snippet."""
+        digest = hashlib.sha1(_normalize(text).encode('utf-8')).hexdigest()
+        return f"{source_language}:{digest}"
+
+    def translate(self, text: str, source_language: str = 'auto') -> str:
+        """Translate one snippet to English (see ``translate_many``)."""
+        return self.translate_many([text], source_language)[0]
+
+    def translate_many(self, texts: List[str], source_language: str = 'auto') -> List[str]:
+        """
+        Translate snippets to English.
+
+        English and empty snippets are returned unchanged, memoized ones are
+        served locally, and the rest are sent in as few remote calls as
+        possible. Snippets the translator fails on are returned unchanged.
+
+        Args:
+            texts: Snippets to translate
+            source_language: 'es', 'pt' or 'auto' (detect per snippet)
+
+        Returns:
+            Translations in input order
+        """
+        output = list(texts)
+        misses: Dict[str, List[int]] = {}  # language -> indexes
+        keys = {}
+
+        with self._lock:
+            for idx, text in enumerate(texts):
+                if not text or not text.strip():
+                    continue
+                self.stats['lookups'] += 1
+                language = detect_language(text) if source_language == 'auto' else source_language
+                if language == 'en':
+                    self.stats['english_skipped'] += 1
+                    continue
+                if language == 'unknown':
+                    language = 'es'  # Most common non-English language on LATAM boards
+
+                key = self.memo_key(language, text)
+                keys[idx] = key
+                if key in self._memo:
+                    self.stats['memo_hits'] += 1
+                    output[idx] = self._memo[key]
+                else:
+                    misses.setdefault(language, []).append(idx)
+
+        for language, indexes in misses.items():
+            for batch in self._batches(indexes, texts):
+                translations = self._translate_batch(language, [texts[i] for i in batch])
+                with self._lock:
+                    for idx, translated in zip(batch, translations):
+                        if translated is None:
+                            continue
+                        output[idx] = translated
+                        self._memo[keys[idx]] = translated
+                        self._new_keys.add(keys[idx])
+                        self.stats['translated'] += 1
+
+        return output
+
+    def _batches(self, indexes: List[int], texts: List[str]) -> List[List[int]]:
+        batches, current, size = [], [], 0
+        for idx in indexes:
+            length = len(texts[idx]) + len(BATCH_SEPARATOR)
+            if current and size + length > self.max_batch_chars:
+                batches.append(current)
+                current, size = [], 0
+            current.append(idx)
+            size += length
+        if current:
+            batches.append(current)
+        return batches
+
+    def _remote(self, language: str, text: str) -> Optional[str]:
+        with self._lock:
+            self.stats['remote_calls'] += 1
+        try:
+            return self.translate_fn(language, text[:self.max_batch_chars])
+        except Exception as e:
+            print(f"⚠️ Translation error ({language}): {e}")
+            return None
+
+    def _translate_batch(self, language: str, snippets: List[str]) -> List[Optional[str]]:
+        if len(snippets) == 1:
+            return [self._remote(language, snippets[0])]
+
+        joined = self._remote(language, BATCH_SEPARATOR.join(snippets))
+        parts = [p.strip() for p in joined.split('||')] if joined else []
+        if len(parts) == len(snippets):
+            return parts
+
+        # Separator was mangled: fall back to one call per snippet
+        return [self._remote(language, snippet) for snippet in snippets]
+
+    def save(self) -> None:
+        """Persist the memo atomically, merging entries saved by other processes."""
+        with self._lock:
+            if not self._new_keys:
+                return
+            merged = {}
+            if self.memo_path.exists():
+                try:
+                    with open(self.memo_path, 'r', encoding='utf-8') as f:
+                        merged = json.load(f)
+                except (OSError, ValueError):
+                    merged = {}
+            merged.update({key: self._memo[key] for key in self._new_keys})
+
+            self.memo_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.memo_path.with_suffix(self.memo_path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(merged, f, ensure_ascii=False)
+            os.replace(tmp_path, self.memo_path)
+            self._memo = merged
+            self._new_keys.clear()
+
+    def get_stats(self) -> Dict:
+        """Return lookup counters plus memo/local hit rates."""
+        stats = dict(self.stats)
+        lookups = stats['lookups']
+        local = stats['memo_hits'] + stats['english_skipped']
+        stats['memo_hit_rate'] = stats['memo_hits'] / lookups if lookups else 0.0
+        stats['local_rate'] = local / lookups if lookups else 0.0
+        stats['memo_size'] = len(self._memo)
+        return stats
@@ -0,0 +1,198 @@
+"""
+Adaptive Throttle - AIMD Rate and Concurrency Control per Host
+--------------------------------------------------------------
+Replaces fixed sleeps in the search-engine scrapers with a controller that
+runs each host as fast as it tolerates:
+
+- Additive increase: every successful response raises the host's request
+  rate by ``rate_increase`` req/s and its concurrency limit by ~1 per window
+- Multiplicative decrease: a throttling signal (HTTP 429/503, a CAPTCHA /
+  "unusual traffic" page, or a timeout) multiplies both by ``decrease``
+  and honours ``Retry-After`` when the server sends one
+- Latency: responses much slower than the host's running baseline count as
+  congestion and hold the rate instead of increasing it
+
+State is per host and thread-safe, so one controller can be shared by
+concurrent workers.
+"""
+
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUS_CODES = {429, 503}
+CAPTCHA_PATTERN = re.compile(
+    r'unusual traffic|captcha|/sorry/index|are you a robot|anomaly-modal|challenge-form',
+    re.IGNORECASE
+)
+
+
+def is_throttle_response(response) -> bool:
+    """True for 429/503 responses and CAPTCHA / bot-challenge pages."""
+    if response.status_code in THROTTLE_STATUS_CODES:
+        return True
+    if response.status_code == 200 and len(response.text) < 200000:
+        return bool(CAPTCHA_PATTERN.search(response.text))
+    return False
+
+
+def _retry_after(response) -> Optional[float]:
+    value = response.headers.get('Retry-After') if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None  # HTTP-date form is rare on search engines; fall back to AIMD
+
+
+class _HostState:
+    def __init__(self, rate: float, concurrency: float):
+        self.rate = rate
+        self.concurrency = concurrency
+        self.in_flight = 0
+        self.next_start = 0.0
+        self.blocked_until = 0.0
+        self.latency_ewma: Optional[float] = None
+        self.stats = {'requests': 0, 'successes': 0, 'throttled': 0, 'slow': 0}
+
+
+class AdaptiveThrottle:
+    """
+    AIMD controller of request rate and concurrency per host.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 0.5,
+        min_rate: float = 0.05,
+        max_rate: float = 5.0,
+        rate_increase: float = 0.05,
+        initial_concurrency: int = 1,
+        max_concurrency: int = 4,
+        decrease: float = 0.5,
+        latency_factor: float = 3.0
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            initial_rate: Starting requests/second for a new host
+            min_rate: Floor for the request rate
+            max_rate: Ceiling for the request rate
+            rate_increase: Additive rate increase (req/s) per success
+            initial_concurrency: Starting in-flight limit for a new host
+            max_concurrency: Ceiling for the in-flight limit
+            decrease: Multiplicative factor applied on throttling
+            latency_factor: Latency above factor x baseline counts as congestion
+        """
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate_increase = rate_increase
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+
+        self._hosts: Dict[str, _HostState] = {}
+        self._condition = threading.Condition()
+
+    def _host(self, host: str) -> _HostState:
+        if host not in self._hosts:
+            self._hosts[host] = _HostState(self.initial_rate, self.initial_concurrency)
+        return self._hosts[host]
+
+    @contextmanager
+    def slot(self, host: str):
+        """Wait until ``host`` admits another request under its current limits."""
+        with self._condition:
+            state = self._host(host)
+            while True:
+                now = time.monotonic()
+                start = max(state.next_start, state.blocked_until)
+                if state.in_flight < int(state.concurrency) and start <= now:
+                    break
+                timeout = start - now if start > now else None
+                self._condition.wait(timeout)
+            state.in_flight += 1
+            state.next_start = now + 1.0 / state.rate
+            state.stats['requests'] += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                state.in_flight -= 1
+                self._condition.notify_all()
+
+    def record(self, host: str, throttled: bool, latency: Optional[float] = None,
+               retry_after: Optional[float] = None) -> None:
+        """
+        Feed one outcome back into the host's limits.
+
+        Args:
+            host: Host the request went to
+            throttled: Whether the response was a throttling signal
+            latency: Response time in seconds
+            retry_after: Server-requested pause in seconds
+        """
+        with self._condition:
+            state = self._host(host)
+            if throttled:
+                state.stats['throttled'] += 1
+                state.rate = max(self.min_rate, state.rate * self.decrease)
+                state.concurrency = max(1.0, state.concurrency * self.decrease)
+                pause = retry_after if retry_after is not None else 1.0 / state.rate
+                state.blocked_until = max(state.blocked_until, time.monotonic() + pause)
+                logger.info(f"Throttled by {host}: rate {state.rate:.2f}/s, concurrency {int(state.concurrency)}")
+            else:
+                state.stats['successes'] += 1
+                slow = (latency is not None and state.latency_ewma is not None
+                        and latency > self.latency_factor * state.latency_ewma)
+                if slow:
+                    state.stats['slow'] += 1
+                else:
+                    state.rate = min(self.max_rate, state.rate + self.rate_increase)
+                    state.concurrency = min(float(self.max_concurrency),
+                                            state.concurrency + 1.0 / state.concurrency)
+                if latency is not None:
+                    state.latency_ewma = latency if state.latency_ewma is None else 0.8 * state.latency_ewma + 0.2 * latency
+            self._condition.notify_all()
+
+    def request(self, session, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Issue a request through the controller.
+
+        Timeouts and connection errors count as throttling and are re-raised;
+        the response is returned as-is so callers keep their status handling.
+        """
+        host = urlparse(url).netloc
+        with self.slot(host):
+            started = time.monotonic()
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+                self.record(host, throttled=True)
+                raise
+        throttled = is_throttle_response(response)
+        self.record(host, throttled, time.monotonic() - started,
+                    _retry_after(response) if throttled else None)
+        return response
+
+    def get(self, session, url: str, **kwargs) -> requests.Response:
+        """GET ``url`` through the controller."""
+        return self.request(session, 'GET', url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Current limits and counters per host."""
+        with self._condition:
+            return {
+                host: {**state.stats, 'rate': round(state.rate, 3), 'concurrency': int(state.concurrency)}
+                for host, state in self._hosts.items()
+            }
@@ -0,0 +1,195 @@
+"""
+ATS Job-Board Adapters
+----------------------
+Direct job counts from public Applicant Tracking System (ATS) job boards.
+
+Many startups host their careers page on Greenhouse, Lever, Ashby or
+Workable, which all publish the full list of open roles as public JSON.
+Detecting the ATS from the links and embeds on a company's careers page
+(collected by the site crawler) lets us fetch every open role (title, location, posting date) in a single request instead
+of inferring hiring intent from homepage keywords or Google dorking.
+
+Jobs are normalized to ``{'title', 'location', 'posted_date', 'url', 'ats'}``
+dicts, where ``posted_date`` is an ISO-8601 UTC timestamp accepted by
+``PulseIntelligenceEngine.detect_job_post_velocity``.
+"""
+
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+def _to_iso(value) -> Optional[str]:
+    """Normalize epoch milliseconds / ISO strings / dates to an ISO UTC timestamp."""
+    if value in (None, ''):
+        return None
+    try:
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value / 1000, tz=timezone.utc).isoformat()
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc).isoformat()
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+class ATSAdapter:
+    """
+    Base adapter: board-URL detection, API URL and payload normalization.
+    """
+
+    name = ''
+    # Regexes capturing the board token from a careers/job-board URL
+    URL_PATTERNS: List[str] = []
+
+    def match(self, url: str) -> Optional[str]:
+        """Return the board token if ``url`` points at this ATS."""
+        for pattern in self.URL_PATTERNS:
+            match = re.search(pattern, url, re.IGNORECASE)
+            if match:
+                return match.group(1)
+        return None
+
+    def api_url(self, board: str) -> str:
+        raise NotImplementedError
+
+    def parse(self, payload) -> List[Dict]:
+        raise NotImplementedError
+
+    def _job(self, title, location, posted_date, url) -> Dict:
+        return {
+            'title': title or 'Unknown',
+            'location': location or '',
+            'posted_date': _to_iso(posted_date),
+            'url': url or '',
+            'ats': self.name
+        }
+
+    def fetch_jobs(self, board: str, session: Optional[requests.Session] = None, timeout: int = 10) -> List[Dict]:
+        """
+        Fetch and normalize all open roles for a board in one request.
+
+        Raises:
+            requests.RequestException: On network errors or non-2xx responses
+        """
+        http = session or requests
+        response = http.get(self.api_url(board), timeout=timeout)
+        response.raise_for_status()
+        return self.parse(response.json())
+
+
+class GreenhouseAdapter(ATSAdapter):
+    name = 'greenhouse'
+    URL_PATTERNS = [
+        r'(?:boards|job-boards)(?:\.eu)?\.greenhouse\.io/embed/job_board(?:/js)?\?for=([\w-]+)',
+        r'(?:boards|job-boards)(?:\.eu)?\.greenhouse\.io/(?!embed)([\w-]+)',
+    ]
+
+    def api_url(self, board: str) -> str:
+        return f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs"
+
+    def parse(self, payload) -> List[Dict]:
+        return [
+            self._job(job.get('title'), (job.get('location') or {}).get('name'),
+                      job.get('first_published') or job.get('updated_at'), job.get('absolute_url'))
+            for job in payload.get('jobs', [])
+        ]
+
+
+class LeverAdapter(ATSAdapter):
+    name = 'lever'
+    URL_PATTERNS = [r'jobs(?:\.eu)?\.lever\.co/([\w-]+)']
+
+    def api_url(self, board: str) -> str:
+        return f"https://api.lever.co/v0/postings/{board}?mode=json"
+
+    def parse(self, payload) -> List[Dict]:
+        return [
+            self._job(job.get('text'), (job.get('categories') or {}).get('location'),
+                      job.get('createdAt'), job.get('hostedUrl'))
+            for job in payload
+        ]
+
+
+class AshbyAdapter(ATSAdapter):
+    name = 'ashby'
+    URL_PATTERNS = [r'jobs\.ashbyhq\.com/([\w.-]+)']
+
+    def api_url(self, board: str) -> str:
+        return f"https://api.ashbyhq.com/posting-api/job-board/{board}"
+
+    def parse(self, payload) -> List[Dict]:
+        return [
+            self._job(job.get('title'), job.get('location'), job.get('publishedAt'), job.get('jobUrl'))
+            for job in payload.get('jobs', [])
+        ]
+
+
+class WorkableAdapter(ATSAdapter):
+    name = 'workable'
+    URL_PATTERNS = [r'apply\.workable\.com/(?!api/)([\w-]+)', r'([\w-]+)\.workable\.com']
+
+    def api_url(self, board: str) -> str:
+        return f"https://apply.workable.com/api/v1/widget/accounts/{board}"
+
+    def parse(self, payload) -> List[Dict]:
+        jobs = []
+        for job in payload.get('jobs', []):
+            location = ', '.join(filter(None, [job.get('city'), job.get('country')]))
+            jobs.append(self._job(job.get('title'), location,
+                                  job.get('published_on') or job.get('created_at'), job.get('url')))
+        return jobs
+
+
+ATS_ADAPTERS: Dict[str, ATSAdapter] = {
+    adapter.name: adapter
+    for adapter in (GreenhouseAdapter(), LeverAdapter(), AshbyAdapter(), WorkableAdapter())
+}
+
+
+def detect_ats(url: str) -> Optional[Tuple[str, str]]:
+    """
+    Detect the ATS behind a URL.
+
+    Returns:
+        Tuple of (ats name, board token), or None
+    """
+    for adapter in ATS_ADAPTERS.values():
+        board = adapter.match(url)
+        if board and board.lower() not in ('www', 'apply', 'api'):
+            return adapter.name, board
+    return None
+
+
+def detect_ats_in_urls(urls: List[str]) -> Optional[Tuple[str, str]]:
+    """Detect an ATS from the first matching URL (links, iframes, embed scripts)."""
+    for url in urls:
+        detected = detect_ats(url)
+        if detected:
+            return detected
+    return None
+
+
+def fetch_board_roles(ats: str, board: str,
+                      session: Optional[requests.Session] = None, timeout: int = 10) -> Optional[Dict]:
+    """
+    Fetch open roles from a detected ATS board.
+
+    Returns:
+        ``{'ats', 'board', 'job_count', 'jobs'}`` or None if the board
+        could not be fetched
+    """
+    try:
+        jobs = ATS_ADAPTERS[ats].fetch_jobs(board, session=session, timeout=timeout)
+    except (requests.RequestException, ValueError) as e:
+        logger.debug(f"Could not fetch {ats} board '{board}': {e}")
+        return None
+
+    logger.info(f"📋 {ats.title()} board '{board}': {len(jobs)} open roles")
+    return {'ats': ats, 'board': board, 'job_count': len(jobs), 'jobs': jobs}
@@ -0,0 +1,161 @@
+"""
+Checkpoint Journal - Resumable Long Runs
+----------------------------------------
+Append-only, per-item checkpoint journal for long batch pipelines (Oracle
+enrichment, market scans, regional crawls).
+
+Each completed item is written as one JSON line keyed by item key, and the
+file is fsync'd in batches. A run restarted with the same run id replays
+completed items from the journal instead of recomputing them, so retrying a
+run that died at item 180 of 200 only does the last 20 items.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOURNAL_DIR = 'data/checkpoints'
+
+
+def new_run_id(prefix: str) -> str:
+    """Generate a run id like ``oracle_20251222_101500``."""
+    return f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+
+class CheckpointJournal:
+    """
+    Append-only JSONL journal of completed work items for one run.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        journal_dir: str = DEFAULT_JOURNAL_DIR,
+        fsync_every: int = 10
+    ):
+        """
+        Open (or resume) the journal for a run.
+
+        Args:
+            run_id: Run identifier; reusing an id resumes that run
+            journal_dir: Directory holding ``<run_id>.jsonl`` journals
+            fsync_every: Number of records between fsync calls
+        """
+        self.run_id = run_id
+        self.path = Path(journal_dir) / f"{run_id}.jsonl"
+        self.fsync_every = max(1, fsync_every)
+
+        self._completed: Dict[str, Any] = {}
+        self.meta: Dict[str, Any] = {}
+        self.replayed = 0
+        self._pending = 0
+
+        if self.path.exists():
+            self._replay()
+            logger.info(f"Resuming run {run_id}: {len(self._completed)} items already completed")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        if self._ends_with_torn_line():
+            # Terminate the torn line so new records start on their own line
+            self._file.write('\n')
+
+    @property
+    def resumed(self) -> bool:
+        """True if the journal contained completed items when opened."""
+        return bool(self._completed)
+
+    def _replay(self) -> None:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A crash mid-write leaves at most one torn line at the end
+                    logger.warning(f"Skipping torn journal line {line_no} in {self.path}")
+                    continue
+                if record.get('type') == 'meta':
+                    self.meta.update(record.get('data', {}))
+                elif 'key' in record:
+                    self._completed[record['key']] = record.get('result')
+
+    def _ends_with_torn_line(self) -> bool:
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return False
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b'\n'
+
+    def _append(self, record: Dict) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        self._file.flush()
+        self._pending += 1
+        if self._pending >= self.fsync_every:
+            self.sync()
+
+    def is_completed(self, key: str) -> bool:
+        """Return True if ``key`` was completed in this run (or a resumed one)."""
+        return key in self._completed
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the stored result for a completed item and count it as replayed."""
+        if key in self._completed:
+            self.replayed += 1
+            return self._completed[key]
+        return default
+
+    def record(self, key: str, result: Any) -> None:
+        """Journal a completed item."""
+        self._completed[key] = result
+        self._append({'key': key, 'result': result, 'ts': datetime.utcnow().isoformat()})
+
+    def set_meta(self, **data) -> None:
+        """Journal run-level metadata (e.g. the input item list) for resumes."""
+        self.meta.update(data)
+        self._append({'type': 'meta', 'data': data, 'ts': datetime.utcnow().isoformat()})
+        self.sync()
+
+    def sync(self) -> None:
+        """Flush and fsync pending records to disk."""
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def close(self) -> None:
+        """Sync and close the journal file."""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def open_journal(prefix: str, resume_run_id: Optional[str] = None,
+                 journal_dir: str = DEFAULT_JOURNAL_DIR) -> CheckpointJournal:
+    """
+    Open a journal for a new run, or resume ``resume_run_id`` if given.
+    """
+    run_id = resume_run_id or new_run_id(prefix)
+    journal = CheckpointJournal(run_id, journal_dir=journal_dir)
+    if resume_run_id and not journal.path.stat().st_size:
+        logger.warning(f"No checkpoint found for run {resume_run_id}; starting fresh")
+    logger.info(f"Checkpoint journal: {journal.path} (resume with --resume {run_id})")
+    return journal
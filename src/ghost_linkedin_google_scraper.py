@@ -11,7 +11,7 @@ This is a FREE alternative to LinkedIn's Talent Solutions API.
 import requests
 from bs4 import BeautifulSoup
 import logging
-import time
+import os
 import json
 from datetime import datetime
 from typing import List, Dict, Optional
@@ -20,6 +20,8 @@ import re
 from urllib.parse import quote_plus, urlparse, parse_qs
 
 from ghost_supabase_client import SupabaseClient
+from seen_job_filter import SeenJobFilter
+from adaptive_throttle import AdaptiveThrottle
 
 logging.basicConfig(
     level=logging.INFO,
@@ -76,7 +78,9 @@ class LinkedInGoogleScraper:
     def __init__(
         self,
         supabase_client: Optional[SupabaseClient] = None,
-        use_google_api: bool = False
+        use_google_api: bool = False,
+        seen_filter: Optional[SeenJobFilter] = None,
+        throttle: Optional[AdaptiveThrottle] = None
     ):
         """
         Initialize LinkedIn Google scraper.
@@ -84,9 +88,18 @@ class LinkedInGoogleScraper:
         Args:
             supabase_client: SupabaseClient instance
             use_google_api: If True, use Google Custom Search API (requires key)
+            seen_filter: Cross-run filter of already ingested postings
+                (default: SEEN_JOBS_FILTER_PATH or data/cache/seen_linkedin_jobs.json)
+            throttle: Per-host AIMD rate controller (starts at one Google request
+                per 3s, never more than one per 2s)
         """
         self.supabase = supabase_client or SupabaseClient()
         self.use_google_api = use_google_api
+        self.seen_filter = seen_filter or SeenJobFilter(
+            os.getenv('SEEN_JOBS_FILTER_PATH', 'data/cache/seen_linkedin_jobs.json'),
+            rotation_days=int(os.getenv('SEEN_JOBS_ROTATION_DAYS', 30))
+        )
+        self.throttle = throttle or AdaptiveThrottle(initial_rate=1 / 3, max_rate=1 / 2)
         
         # Headers to mimic browser
         self.headers = {
@@ -150,7 +163,7 @@ class LinkedInGoogleScraper:
             url = f"https://www.google.com/search?q={encoded_query}&num={max_results}"
             
             # Make request
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.throttle.get(requests, url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             # Parse HTML
@@ -203,9 +216,6 @@ class LinkedInGoogleScraper:
                     logger.error(f"Error parsing search result: {e}")
                     continue
             
-            # Respect rate limiting
-            time.sleep(2)
-            
         except Exception as e:
             logger.error(f"Error searching Google: {e}")
         
@@ -246,7 +256,7 @@ class LinkedInGoogleScraper:
                 'num': min(max_results, 10)  # API limit is 10 per request
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.throttle.get(requests, url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -336,19 +346,19 @@ class LinkedInGoogleScraper:
                     
                     logger.info(f"    Found {len(jobs)} jobs")
                     
-                    # Rate limiting (important!)
-                    time.sleep(3)
-                    
                 except Exception as e:
                     logger.error(f"Error scraping {keyword} in {main_city}: {e}")
         
-        # Remove duplicates
+        # Remove duplicates, then postings already ingested by earlier runs
         unique_jobs = self._deduplicate_jobs(all_jobs)
+        new_jobs = self.seen_filter.filter_new(unique_jobs)
         
         logger.info(f"\nTotal jobs scraped: {len(all_jobs)}")
         logger.info(f"Unique jobs: {len(unique_jobs)}")
+        logger.info(f"New jobs (not seen in earlier runs): {len(new_jobs)}")
+        logger.info(f"Search rate limits: {self.throttle.get_stats()}")
         
-        return unique_jobs
+        return new_jobs
     
     def _deduplicate_jobs(self, jobs: List[Dict]) -> List[Dict]:
         """Remove duplicate jobs based on job_id."""
@@ -399,6 +409,11 @@ class LinkedInGoogleScraper:
         # Insert into Supabase
         result = self.supabase.insert_job_postings(job_postings)
         
+        # Only remember postings once they are stored, so failed pushes are retried
+        if result.get('success'):
+            self.seen_filter.mark_seen(jobs)
+            self.seen_filter.save()
+        
         logger.info(f"Successfully pushed jobs to Supabase: {result}")
         
         return result
@@ -475,4 +490,10 @@ if __name__ == "__main__":
                 print(f"   Keywords: {job.get('keywords')}")
                 print(f"   URL: {job.get('url')}")
     
+    filter_stats = scraper.seen_filter.get_stats()
+    print(f"Seen-job filter: {filter_stats['seen']} already-ingested postings skipped, "
+          f"{filter_stats['postings']} remembered, "
+          f"{filter_stats['memory_bytes'] / 1024:.1f} KiB, "
+          f"est. false-positive rate {filter_stats['estimated_fpr']:.5f}")
+    
     logger.info("LinkedIn scraper completed successfully")
@@ -18,6 +18,11 @@ except ImportError:
     from src.osint_lead_scorer import OSINTLeadScorer
     from src.ghost_supabase_client import GhostSupabaseClient
 
+try:
+    from metrics import current_stage, stage, with_metrics_dump
+except ImportError:
+    from src.metrics import current_stage, stage, with_metrics_dump
+
 
 class GhostOSINTPipeline:
     """Orchestrates OSINT lead scoring and pushes results to Supabase"""
@@ -43,6 +48,7 @@ class GhostOSINTPipeline:
         print(f"✅ Ghost OSINT Pipeline initialized")
         print(f"   Supabase: {self.supabase_url[:30]}...")
     
+    @stage('osint_pipeline.market_scan')
     def run_market_scan(
         self,
         company_names: List[str],
@@ -108,6 +114,8 @@ class GhostOSINTPipeline:
                         print(f"   ⚠️  {error_msg}")
                         results["errors"].append(error_msg)
             
+            current_stage().add_items(results["companies_analyzed"])
+            
             # Mark pipeline run as completed
             results["completed_at"] = datetime.utcnow().isoformat()
             self._complete_pipeline_run(
@@ -264,6 +272,7 @@ class GhostOSINTPipeline:
         )
 
 
+@with_metrics_dump('ghost_osint_pipeline')
 def main():
     """Example usage"""
     
@@ -19,6 +19,11 @@ import json
 
 from ghost_supabase_client import SupabaseClient
 
+try:
+    from money_amounts import extract_labeled_amount
+except ImportError:
+    from src.money_amounts import extract_labeled_amount
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -202,14 +207,10 @@ class SECRSSFeedScraper:
             
             details = {}
             
-            # Extract offering amount (simplified regex)
-            amount_match = re.search(r'Total Offering Amount.*?(\d[\d,]+)', content, re.IGNORECASE)
-            if amount_match:
-                amount_str = amount_match.group(1).replace(',', '')
-                try:
-                    details['offering_amount'] = float(amount_str)
-                except ValueError:
-                    pass
+            # Extract offering amount
+            amount = extract_labeled_amount(content, 'Total Offering Amount')
+            if amount:
+                details['offering_amount'] = amount.usd
             
             # Extract industry
             industry_match = re.search(r'Industry Group Description.*?<td[^>]*>([^<]+)</td>', content, re.IGNORECASE)
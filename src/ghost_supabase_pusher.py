@@ -17,6 +17,16 @@ try:
 except ImportError:
     from src.ghost_supabase_client import GhostSupabaseClient
 
+try:
+    from metrics import current_stage, stage, with_metrics_dump
+except ImportError:
+    from src.metrics import current_stage, stage, with_metrics_dump
+
+try:
+    from profiling import profiled
+except ImportError:
+    from src.profiling import profiled
+
 
 class GhostSupabasePusher:
     """Consolidates and pushes GitHub Actions artifacts to Supabase"""
@@ -40,6 +50,7 @@ class GhostSupabasePusher:
         print(f"✅ Ghost Supabase Pusher initialized")
         print(f"   Supabase: {self.supabase_url[:30]}...")
     
+    @stage('supabase.push_artifacts')
     def push_artifacts(self, artifacts_dir: str) -> Dict:
         """
         Push all artifacts from GitHub Actions to Supabase
@@ -96,7 +107,11 @@ class GhostSupabasePusher:
                 print("\n📊 Pushing lead scores...")
                 scores_stats = self._push_lead_scores(scores_file)
                 stats["lead_scores_inserted"] += scores_stats.get("scores", 0)
-            
+
+            artifact_files = [sec_file, jobs_file, news_file, scores_file]
+            current_stage().add_bytes(sum(path.stat().st_size for path in artifact_files if path.exists()))
+            current_stage().add_items(sum(value for key, value in stats.items() if key.endswith("_inserted")))
+
             stats["completed_at"] = datetime.utcnow().isoformat()
             
             print(f"\n✅ All artifacts pushed successfully!")
@@ -277,6 +292,8 @@ class GhostSupabasePusher:
                 print(f"   - {error}")
 
 
+@profiled('ghost_supabase_pusher')
+@with_metrics_dump('ghost_supabase_pusher')
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -0,0 +1,250 @@
+"""
+HTML Extraction - Memory-Bounded Page Parsing
+---------------------------------------------
+Streaming extraction of the parts of a web page the enrichment detectors
+actually use, without building a document tree.
+
+- ``fetch_page`` streams the response body into an lxml parser chunk by
+  chunk and stops reading at ``max_bytes``
+- Parser events (lxml target interface) are filtered on the fly: script,
+  style, SVG, noscript and template contents are dropped as they arrive,
+  so multi-MB inline bundles are never kept (script ``src`` attributes are,
+  since ATS embeds are detected from them)
+- Only title, meta description, links, iframe/script sources, paragraphs
+  and headings/list items are kept, plus one whitespace-normalized,
+  lowercased text buffer for the keyword detectors
+"""
+
+import codecs
+import logging
+import re
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1_500_000
+CHUNK_SIZE = 65536
+
+SKIP_TAGS = {'script', 'style', 'svg', 'noscript', 'template'}
+TEXT_TAGS = {'title', 'a', 'h1', 'h2', 'h3', 'h4', 'p', 'li'}
+
+_WHITESPACE = re.compile(r'\s+')
+_CHARSET = re.compile(r'charset=([\w-]+)', re.IGNORECASE)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+
+def _clean(text: str) -> str:
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def _decoder(encoding: Optional[str], first_chunk: bytes):
+    """Incremental decoder for the declared, sniffed (meta charset) or default UTF-8 encoding."""
+    if not encoding:
+        match = _META_CHARSET.search(first_chunk[:8192])
+        encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return codecs.getincrementaldecoder(encoding)(errors='replace')
+    except LookupError:
+        return codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+
+class ExtractedPage:
+    """
+    Targeted content of one HTML page.
+
+    Attributes:
+        url: Page URL (base for the absolute link URLs)
+        title: Document title
+        description: Meta / Open Graph description
+        links: ``(absolute_url, link_text)`` for every ``<a href>``
+        resource_urls: Absolute ``src`` of scripts and iframes
+        paragraphs: Text of each ``<p>``
+        text: Normalized, lowercased text of the title, headings,
+            paragraphs, list items and links (each counted once)
+        bytes_read: Body bytes parsed
+        truncated: Whether the body was cut at the byte cap
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.title = ''
+        self.description = ''
+        self.links: List[Tuple[str, str]] = []
+        self.resource_urls: List[str] = []
+        self.paragraphs: List[str] = []
+        self.text = ''
+        self.bytes_read = 0
+        self.truncated = False
+
+    def urls(self) -> List[str]:
+        """All link and resource URLs on the page."""
+        return [url for url, _ in self.links] + self.resource_urls
+
+
+class _ExtractionTarget:
+    """lxml parser target collecting ``ExtractedPage`` fields from parse events."""
+
+    def __init__(self, page: ExtractedPage):
+        self.page = page
+        self.skip_depth = 0
+        self.text_depth = 0
+        self.text_parts: List[str] = []
+        self.block: Optional[List[str]] = None
+        self.link: Optional[Tuple[str, List[str]]] = None
+        self.paragraph: Optional[List[str]] = None
+        self.title: Optional[List[str]] = None
+        self.meta: Dict[str, str] = {}
+
+    def start(self, tag, attrib):
+        if tag in SKIP_TAGS:
+            self.skip_depth += 1
+            if tag == 'script' and attrib.get('src'):
+                self.page.resource_urls.append(urljoin(self.page.url, attrib['src']))
+            return
+        if tag == 'iframe' and attrib.get('src'):
+            self.page.resource_urls.append(urljoin(self.page.url, attrib['src']))
+        elif tag == 'meta':
+            key = (attrib.get('name') or attrib.get('property') or '').lower()
+            if key in ('description', 'og:description') and key not in self.meta:
+                self.meta[key] = attrib.get('content', '')
+        if self.skip_depth:
+            return
+        if tag in TEXT_TAGS:
+            # Nested text tags (a inside p, p inside li) share the outer block
+            if self.text_depth == 0:
+                self.block = []
+            self.text_depth += 1
+        if tag == 'a' and attrib.get('href') is not None:
+            self.link = (attrib['href'].strip(), [])
+        elif tag == 'p':
+            self.paragraph = []
+        elif tag == 'title':
+            self.title = []
+
+    def data(self, data):
+        if self.skip_depth:
+            return
+        for buffer in (self.block, self.paragraph, self.title):
+            if buffer is not None:
+                buffer.append(data)
+        if self.link is not None:
+            self.link[1].append(data)
+
+    def end(self, tag):
+        if tag in SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+            return
+        if self.skip_depth:
+            return
+        if tag == 'a' and self.link is not None:
+            href, text = self.link
+            self.page.links.append((urljoin(self.page.url, href), _clean(''.join(text))))
+            self.link = None
+        elif tag == 'p' and self.paragraph is not None:
+            self.page.paragraphs.append(_clean(''.join(self.paragraph)))
+            self.paragraph = None
+        elif tag == 'title' and self.title is not None:
+            self.page.title = _clean(''.join(self.title))
+            self.title = None
+        if tag in TEXT_TAGS and self.text_depth:
+            self.text_depth -= 1
+            if self.text_depth == 0 and self.block is not None:
+                self.text_parts.append(''.join(self.block))
+                self.block = None
+
+    def comment(self, text):
+        pass
+
+    def close(self) -> ExtractedPage:
+        self.page.description = self.meta.get('description') or self.meta.get('og:description', '')
+        self.page.text = _clean(' '.join(self.text_parts)).lower()
+        return self.page
+
+
+def extract_page(
+    content: Union[bytes, str, Iterable[bytes]],
+    url: str,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    encoding: Optional[str] = None
+) -> ExtractedPage:
+    """
+    Extract targeted content from HTML.
+
+    Args:
+        content: Whole document (bytes or str) or an iterable of byte chunks
+        url: Page URL (resolves relative links)
+        max_bytes: Stop parsing after this many bytes
+        encoding: Declared charset; taken from a ``<meta charset>`` in the
+            first chunk, else UTF-8, when None
+
+    Returns:
+        ExtractedPage
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+        encoding = 'utf-8'
+    if isinstance(content, (bytes, bytearray)):
+        data = content
+        content = (data[start:start + CHUNK_SIZE] for start in range(0, len(data), CHUNK_SIZE))
+
+    target = _ExtractionTarget(ExtractedPage(url))
+    page = target.page
+    parser = etree.HTMLParser(target=target, remove_comments=True, no_network=True)
+    decoder = None
+    for chunk in content:
+        if not chunk:
+            continue
+        # Decode here so any Python codec works and lxml never guesses
+        decoder = decoder or _decoder(encoding, chunk)
+        remaining = max_bytes - page.bytes_read
+        if len(chunk) >= remaining:
+            parser.feed(decoder.decode(chunk[:remaining], final=True))
+            page.bytes_read += remaining
+            page.truncated = len(chunk) > remaining
+            if page.truncated:
+                logger.debug(f"Truncated {url} at {max_bytes} bytes")
+            break
+        parser.feed(decoder.decode(chunk))
+        page.bytes_read += len(chunk)
+
+    if not page.bytes_read:
+        return page
+    try:
+        return parser.close()
+    except etree.XMLSyntaxError:
+        # Body without any parseable markup
+        return target.close()
+
+
+def fetch_page(
+    session,
+    url: str,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    timeout: int = 10
+) -> Optional[ExtractedPage]:
+    """
+    GET a page and extract it while streaming, reading at most ``max_bytes``.
+
+    Args:
+        session: requests session (or the ``requests`` module)
+        url: Page URL
+        max_bytes: Body bytes to read before truncating
+        timeout: Request timeout in seconds
+
+    Returns:
+        ExtractedPage, or None for non-200 or non-HTML responses
+
+    Raises:
+        requests.exceptions.RequestException: On network errors
+    """
+    with session.get(url, timeout=timeout, stream=True) as response:
+        content_type = response.headers.get('Content-Type', 'text/html')
+        if response.status_code != 200 or 'html' not in content_type:
+            return None
+        # Only trust an explicit charset; requests defaults text/* to ISO-8859-1
+        charset = _CHARSET.search(content_type)
+        return extract_page(response.iter_content(chunk_size=CHUNK_SIZE), url, max_bytes,
+                            charset.group(1) if charset else None)
@@ -19,6 +19,21 @@ from osint_lead_scorer import OSINTLeadScorer
 from intent_classifier import OutsourcingIntentClassifier
 from global_hiring_score import GlobalHiringScoreCalculator
 
+try:
+    from checkpoint_journal import open_journal
+except ImportError:
+    from src.checkpoint_journal import open_journal
+
+try:
+    from money_amounts import extract_funding_amount
+except ImportError:
+    from src.money_amounts import extract_funding_amount
+
+try:
+    from metrics import current_stage, stage
+except ImportError:
+    from src.metrics import current_stage, stage
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -226,19 +241,25 @@ class IntentClassificationEngine:
         
         return analysis
     
+    @stage('market_scan')
     def run_market_scan(
         self,
         target_tickers: Optional[List[str]] = None,
         news_queries: Optional[List[str]] = None,
-        output_dir: str = "data/output/market_intelligence"
+        output_dir: str = "data/output/market_intelligence",
+        resume_run_id: Optional[str] = None
     ) -> Dict:
         """
         Run a comprehensive market scan across multiple data sources.
         
+        Each SEC lookup and news query is checkpointed as it completes, so an
+        interrupted scan can be resumed without repeating finished queries.
+        
         Args:
             target_tickers: List of ticker symbols to monitor
             news_queries: List of news search queries
             output_dir: Directory to save results
+            resume_run_id: Run id of an interrupted scan to resume
         
         Returns:
             Dictionary with scan results and summary
@@ -250,8 +271,18 @@ class IntentClassificationEngine:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
+        journal = open_journal('market_scan', resume_run_id, str(output_path / 'checkpoints'))
+        try:
+            return self._run_market_scan(target_tickers, news_queries, output_path, journal)
+        finally:
+            journal.close()
+    
+    def _run_market_scan(self, target_tickers, news_queries, output_path: Path, journal) -> Dict:
+        """Market scan body; see run_market_scan."""
+        
         results = {
             'scan_timestamp': datetime.now().isoformat(),
+            'run_id': journal.run_id,
             'sec_filings': [],
             'osint_leads': [],
             'qualified_leads': [],
@@ -262,10 +293,19 @@ class IntentClassificationEngine:
         if target_tickers:
             logger.info(f"\n[1/3] Scanning SEC Form D for {len(target_tickers)} companies")
             try:
-                filings = self.sec_scraper.scrape_recent_form_d(
-                    ticker_symbols=target_tickers,
-                    limit=10
-                )
+                sec_key = f"sec:{','.join(target_tickers)}"
+                if journal.is_completed(sec_key):
+                    filings = journal.get(sec_key)
+                    current_stage().cache_hit()
+                else:
+                    current_stage().cache_miss()
+                    with stage('market_scan.sec_filings') as run:
+                        filings = self.sec_scraper.scrape_recent_form_d(
+                            ticker_symbols=target_tickers,
+                            limit=10
+                        )
+                        run.add_items(len(filings))
+                    journal.record(sec_key, filings)
                 results['sec_filings'] = filings
                 logger.info(f"Found {len(filings)} Form D filings")
             except Exception as e:
@@ -283,14 +323,24 @@ class IntentClassificationEngine:
         all_osint_leads = []
         
         for query in news_queries:
+            query_key = f"news:{query}"
+            if journal.is_completed(query_key):
+                all_osint_leads.extend(journal.get(query_key))
+                current_stage().cache_hit()
+                logger.info(f"Replayed query '{query}' from checkpoint")
+                continue
+            current_stage().cache_miss()
             try:
-                leads = self.osint_scorer.score_news_batch(
-                    query=query,
-                    regions=["US"],
-                    period="7d",
-                    max_results_per_region=20,
-                    min_score=30
-                )
+                with stage('market_scan.osint_news') as run:
+                    leads = self.osint_scorer.score_news_batch(
+                        query=query,
+                        regions=["US"],
+                        period="7d",
+                        max_results_per_region=20,
+                        min_score=30
+                    )
+                    run.add_items(len(leads))
+                journal.record(query_key, leads)
                 all_osint_leads.extend(leads)
             except Exception as e:
                 logger.error(f"OSINT scan error for query '{query}': {e}")
@@ -341,6 +391,7 @@ class IntentClassificationEngine:
                     results['qualified_leads'].append(qualified_lead)
             except Exception as e:
                 logger.debug(f"Could not qualify lead: {e}")
+        current_stage().add_items(len(results['qualified_leads']))
         
         # Generate Summary
         results['summary'] = {
@@ -372,27 +423,9 @@ class IntentClassificationEngine:
         return results
     
     def _extract_funding_from_text(self, text: str) -> Optional[float]:
-        """Extract funding amount from text (e.g., '$5M', '$10 million')."""
-        import re
-        
-        # Patterns for funding amounts
-        patterns = [
-            r'\$(\d+(?:\.\d+)?)\s*(?:million|M)\b',
-            r'\$(\d+(?:\.\d+)?)\s*(?:billion|B)\b',
-            r'raised\s+\$(\d+(?:\.\d+)?)\s*(?:million|M)\b',
-            r'secured\s+\$(\d+(?:\.\d+)?)\s*(?:million|M)\b',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount = float(match.group(1))
-                if 'billion' in pattern.lower() or 'B' in pattern:
-                    return amount * 1_000_000_000
-                else:
-                    return amount * 1_000_000
-        
-        return None
+        """Extract funding amount in USD from text (e.g., '$5M', '$10 million', 'R$ 50 milhões')."""
+        amount = extract_funding_amount(text)
+        return amount.usd if amount else None
     
     def _generate_recommendation(self, analysis: Dict) -> Dict:
         """Generate actionable recommendation based on analysis."""
@@ -476,6 +509,12 @@ class IntentClassificationEngine:
 
 # Main execution
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Intent Classification Engine")
+    parser.add_argument('--resume', metavar='RUN_ID', help='Resume an interrupted market scan')
+    args = parser.parse_args()
+    
     # Initialize engine
     engine = IntentClassificationEngine(
         company_name="PulseB2B Market Intelligence",
@@ -512,7 +551,8 @@ if __name__ == "__main__":
             "tech startup series B funding",
             "SaaS company raises",
             "remote-first company hiring"
-        ]
+        ],
+        resume_run_id=args.resume
     )
     
     print(f"\nScan complete. Found {scan_results['summary']['qualified_leads']} qualified leads")
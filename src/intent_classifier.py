@@ -7,10 +7,15 @@ and job postings. Identifies keywords like 'Remote-friendly', 'Global team',
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 import re
 
+try:
+    from text_document import Document, as_document
+except ImportError:
+    from src.text_document import Document, as_document
+
 try:
     from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
     import torch
@@ -170,6 +175,41 @@ class OutsourcingIntentClassifier:
         ]
     }
     
+    # Job-posting indicators (matched on lowercase text)
+    LOCATION_PATTERNS = {
+        'work_from_anywhere': r'work from anywhere|location independent',
+        'specific_regions': r'latam|emea|europe|asia|specific region',
+        'timezone_mentioned': r'timezone|time zone|gmt|utc',
+        'relocation_not_required': r'no relocation|relocation not required'
+    }
+    
+    SALARY_PATTERNS = [
+        r'\$\d+k?\s*-\s*\$\d+k?',
+        r'\d+k?\s*-\s*\d+k?\s*(?:usd|dollars)',
+        r'competitive salary',
+        r'market rate',
+        r'based on experience'
+    ]
+    
+    @classmethod
+    def _patterns(cls) -> Dict[str, List]:
+        """KEYWORD_PATTERNS, LOCATION_PATTERNS and SALARY_PATTERNS, compiled once."""
+        if '_compiled_patterns' not in cls.__dict__:
+            cls._compiled_patterns = {
+                category: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+                for category, patterns in cls.KEYWORD_PATTERNS.items()
+            }
+            # One alternation per category: a single scan rules out categories with no hits
+            cls._compiled_patterns['any'] = {
+                category: re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+                for category, patterns in cls.KEYWORD_PATTERNS.items()
+            }
+            cls._compiled_patterns['location'] = [
+                (name, re.compile(pattern)) for name, pattern in cls.LOCATION_PATTERNS.items()
+            ]
+            cls._compiled_patterns['salary'] = [re.compile(pattern) for pattern in cls.SALARY_PATTERNS]
+        return cls._compiled_patterns
+    
     def __init__(self, use_transformers: bool = True, device: str = "cpu"):
         """
         Initialize the intent classifier.
@@ -214,28 +254,29 @@ class OutsourcingIntentClassifier:
     
     def detect_outsourcing_intent(
         self,
-        text: str,
+        text: Union[str, Document],
         use_ml: bool = True
     ) -> Dict:
         """
         Detect outsourcing intent in text using NLP and keyword analysis.
         
         Args:
-            text: Text to analyze (company description, job post, etc.)
+            text: Text (or shared Document) to analyze (company description, job post, etc.)
             use_ml: Whether to use ML models (if available)
         
         Returns:
             Dictionary with intent classification results
         """
-        text_lower = text.lower()
+        document = as_document(text)
         
-        # 1. Keyword-based signal detection
-        signals = self._detect_keyword_signals(text_lower)
+        # 1. Keyword-based signal detection (shared by job-posting and description analysis)
+        signals = document.feature('intent.keyword_signals',
+                                   lambda document: self._detect_keyword_signals(document.lower))
         
         # 2. ML-based classification (if available and requested)
         ml_scores = None
         if use_ml and self.use_transformers and self.classifier:
-            ml_scores = self._classify_with_ml(text)
+            ml_scores = self._classify_with_ml(document.text)
         
         # 3. Calculate intent score
         intent_score = self._calculate_intent_score(signals, ml_scores)
@@ -263,36 +304,36 @@ class OutsourcingIntentClassifier:
             OutsourcingSignals object with detected keywords
         """
         signals = OutsourcingSignals()
+        patterns = {
+            category: compiled if self._patterns()['any'][category].search(text) else []
+            for category, compiled in self._patterns().items()
+            if category in self.KEYWORD_PATTERNS
+        }
         
         # Remote work signals
-        for pattern in self.KEYWORD_PATTERNS['remote_work']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            signals.remote_work_signals.extend(matches)
+        for pattern in patterns['remote_work']:
+            signals.remote_work_signals.extend(pattern.findall(text))
         
         # Global team signals
-        for pattern in self.KEYWORD_PATTERNS['global_team']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            signals.global_team_signals.extend(matches)
+        for pattern in patterns['global_team']:
+            signals.global_team_signals.extend(pattern.findall(text))
         
         # Timezone signals
-        for pattern in self.KEYWORD_PATTERNS['timezone']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            signals.timezone_signals.extend(matches)
+        for pattern in patterns['timezone']:
+            signals.timezone_signals.extend(pattern.findall(text))
         
         # Distribution signals
         for pattern in (
-            self.KEYWORD_PATTERNS['distribution'] +
-            self.KEYWORD_PATTERNS['offshore_explicit'] +
-            self.KEYWORD_PATTERNS['latam_specific'] +
-            self.KEYWORD_PATTERNS['emea_specific']
+            patterns['distribution'] +
+            patterns['offshore_explicit'] +
+            patterns['latam_specific'] +
+            patterns['emea_specific']
         ):
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            signals.distribution_signals.extend(matches)
+            signals.distribution_signals.extend(pattern.findall(text))
         
         # Cost efficiency signals
-        for pattern in self.KEYWORD_PATTERNS['cost_efficiency']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            signals.cost_efficiency_signals.extend(matches)
+        for pattern in patterns['cost_efficiency']:
+            signals.cost_efficiency_signals.extend(pattern.findall(text))
         
         return signals
     
@@ -427,49 +468,53 @@ class OutsourcingIntentClassifier:
         else:
             return signal_confidence
     
-    def analyze_job_posting(self, job_text: str) -> Dict:
+    def analyze_job_posting(self, job_text: Union[str, Document]) -> Dict:
         """
         Analyze a job posting for outsourcing intent.
         
         Args:
-            job_text: Job posting text
+            job_text: Job posting text (or shared Document)
         
         Returns:
             Dictionary with analysis results
         """
+        document = as_document(job_text)
+        
         # Detect intent
-        intent_analysis = self.detect_outsourcing_intent(job_text)
+        intent_analysis = self.detect_outsourcing_intent(document)
         
         # Extract additional job-specific signals
-        location_flexibility = self._detect_location_flexibility(job_text)
-        salary_indicators = self._detect_salary_indicators(job_text)
+        location_flexibility = self._detect_location_flexibility(document)
+        salary_indicators = self._detect_salary_indicators(document)
         
         return {
             **intent_analysis,
             'location_flexibility': location_flexibility,
             'salary_indicators': salary_indicators,
-            'text_length': len(job_text),
+            'text_length': len(document.raw),
             'analysis_type': 'job_posting'
         }
     
-    def analyze_company_description(self, description: str) -> Dict:
+    def analyze_company_description(self, description: Union[str, Document]) -> Dict:
         """
         Analyze a company description for outsourcing culture.
         
         Args:
-            description: Company description text
+            description: Company description text (or shared Document)
         
         Returns:
             Dictionary with analysis results
         """
+        document = as_document(description)
+        
         # Detect intent
-        intent_analysis = self.detect_outsourcing_intent(description)
+        intent_analysis = self.detect_outsourcing_intent(document)
         
         # Sentiment analysis
         sentiment = None
         if self.sentiment_analyzer:
             try:
-                sentiment_result = self.sentiment_analyzer(description[:512])
+                sentiment_result = self.sentiment_analyzer(document.text[:512])
                 sentiment = {
                     'label': sentiment_result[0]['label'],
                     'score': sentiment_result[0]['score']
@@ -480,19 +525,15 @@ class OutsourcingIntentClassifier:
         return {
             **intent_analysis,
             'sentiment': sentiment,
-            'text_length': len(description),
+            'text_length': len(document.raw),
             'analysis_type': 'company_description'
         }
     
-    def _detect_location_flexibility(self, text: str) -> Dict:
+    def _detect_location_flexibility(self, document: Document) -> Dict:
         """Detect location flexibility indicators in job postings."""
-        text_lower = text.lower()
-        
         indicators = {
-            'work_from_anywhere': bool(re.search(r'work from anywhere|location independent', text_lower)),
-            'specific_regions': bool(re.search(r'latam|emea|europe|asia|specific region', text_lower)),
-            'timezone_mentioned': bool(re.search(r'timezone|time zone|gmt|utc', text_lower)),
-            'relocation_not_required': bool(re.search(r'no relocation|relocation not required', text_lower))
+            name: bool(pattern.search(document.lower))
+            for name, pattern in self._patterns()['location']
         }
         
         return {
@@ -500,23 +541,14 @@ class OutsourcingIntentClassifier:
             'flexibility_score': sum(indicators.values()) * 25  # 0-100
         }
     
-    def _detect_salary_indicators(self, text: str) -> Dict:
+    def _detect_salary_indicators(self, document: Document) -> Dict:
         """Detect salary range indicators that suggest offshore hiring."""
-        text_lower = text.lower()
+        text_lower = document.lower
         
         # Look for salary mentions
-        salary_patterns = [
-            r'\$\d+k?\s*-\s*\$\d+k?',
-            r'\d+k?\s*-\s*\d+k?\s*(?:usd|dollars)',
-            r'competitive salary',
-            r'market rate',
-            r'based on experience'
-        ]
-        
         salary_mentions = []
-        for pattern in salary_patterns:
-            matches = re.findall(pattern, text_lower)
-            salary_mentions.extend(matches)
+        for pattern in self._patterns()['salary']:
+            salary_mentions.extend(pattern.findall(text_lower))
         
         return {
             'salary_mentioned': len(salary_mentions) > 0,
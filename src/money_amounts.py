@@ -0,0 +1,213 @@
+"""
+Money Amounts - Single-Scan Currency Amount Extraction
+------------------------------------------------------
+One compiled pattern finds every currency amount in a text in a single
+pass, replacing the per-module funding regex lists (Oracle, regional NLP,
+intent engine, Form D parsers) that each re-scanned the text once per
+pattern and disagreed on what they accepted.
+
+Handles:
+
+- Currencies: ``$``, ``US$``, ``USD``, "dollars"/"dólares" (USD), ``R$``,
+  ``BRL``, "reais" (BRL), ``MX$``, ``MXN``, "pesos mexicanos" (MXN)
+- Scales: k/thousand/mil, M/mm/mn/million, B/bn/billion, and Spanish /
+  Portuguese words (millón/millones, milhão/milhões, mil millones,
+  bilhão/bilhões, billón/billones)
+- Separators: ``1,500,000.50`` and ``1.500.000,50``; a lone separator is
+  read with the convention of the text around it (Spanish/Portuguese scale
+  words and ``R$`` use ``,`` as the decimal mark)
+
+Values are normalized to USD with ``FX_TO_USD`` (approximate reference
+rates; pass ``fx_rates`` to override). Funding lookups also accept amounts
+without a currency when they are in millions or more and follow a funding
+verb ("raised 5 million", "closed a 3.5 billion round").
+"""
+
+import re
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Pattern, Tuple
+
+FX_TO_USD = {'USD': 1.0, 'BRL': 0.18, 'MXN': 0.055}
+
+# Amounts below this are prices and salaries, not funding rounds, unless
+# they were written in millions ("$0.5 million")
+FUNDING_MIN_USD = 1_000_000
+
+SCALES = {
+    'k': 1e3, 'thousand': 1e3, 'mil': 1e3,
+    'm': 1e6, 'mm': 1e6, 'mn': 1e6, 'million': 1e6, 'millions': 1e6,
+    'millón': 1e6, 'millon': 1e6, 'millones': 1e6,
+    'milhão': 1e6, 'milhao': 1e6, 'milhões': 1e6, 'milhoes': 1e6,
+    'b': 1e9, 'bn': 1e9, 'billion': 1e9, 'billions': 1e9,
+    'mil millones': 1e9, 'mil milhões': 1e9, 'mil milhoes': 1e9,
+    'bilhão': 1e9, 'bilhao': 1e9, 'bilhões': 1e9, 'bilhoes': 1e9,
+    'billón': 1e12, 'billon': 1e12, 'billones': 1e12,
+}
+
+# Scale words that imply "," as the decimal mark
+_LATIN_SCALES = {
+    'mil', 'millón', 'millon', 'millones', 'milhão', 'milhao', 'milhões', 'milhoes',
+    'mil millones', 'mil milhões', 'mil milhoes', 'bilhão', 'bilhao', 'bilhões', 'bilhoes',
+    'billón', 'billon', 'billones',
+}
+
+_CURRENCIES = {
+    '$': 'USD', 'us$': 'USD', 'usd': 'USD', 'dollar': 'USD', 'dollars': 'USD',
+    'us dollar': 'USD', 'us dollars': 'USD', 'dólares': 'USD', 'dolares': 'USD',
+    'r$': 'BRL', 'brl': 'BRL', 'reais': 'BRL',
+    'mx$': 'MXN', 'mxn': 'MXN', 'pesos mexicanos': 'MXN',
+}
+
+# Starts with a bare \d so the regex engine can skip ahead to digits (an
+# optional prefix or a leading group makes it try every position); the
+# currency prefix is matched separately on the few characters before
+_MONEY = re.compile(
+    r'''
+    (?P<number>\d(?:\d{0,2}(?:[.,]\d{3})+(?:[.,]\d+)?|\d*(?:[.,]\d+)?))
+    (?!\d)
+    (?:\s?(?P<scale>mil\s+mill[oó]nes|mil\s+milh[õo]es|billones|bill[oó]n|billions?|bilh[õo]es|bilh[ãa]o|bn
+        |millones|mill[oó]n|milh[õo]es|milh[ãa]o|millions?|mm|mn|thousand|mil|m|b|k)(?!\w))?
+    (?:\s+(?:de\s+)?(?P<suffix>usd|us\s+dollars?|dollars?|d[óo]lares|reais|brl|mxn|pesos\s+mexicanos)(?!\w))?
+    ''',
+    re.IGNORECASE | re.VERBOSE
+)
+_PREFIX = re.compile(r'(?:(?<![a-z])(?:us\s?\$|r\s?\$|mx\s?\$|usd|brl|mxn)|\$)\s?$', re.IGNORECASE)
+_PREFIX_WINDOW = 5
+_SPACE = re.compile(r'\s+')
+
+# Funding verbs that make a currency-less amount a funding amount, matched
+# on the few characters before the number
+FUNDING_CONTEXT = re.compile(
+    r'''(?<!\w)(?:rais(?:ed|es|ing)|secur(?:ed|es|ing)|clos(?:ed|es|ing)|land(?:ed|s)
+        |(?:funding|round|investment)\s+of|levant[óo]u?|recaud[óo]|capt[óo]u?|arrecadou)
+        \s+(?:(?:a|an|um|uma|un|una)\s+)?$''',
+    re.IGNORECASE | re.VERBOSE
+)
+_CONTEXT_WINDOW = 24
+
+
+@dataclass(frozen=True)
+class MoneyAmount:
+    """One currency amount found in a text."""
+    usd: float
+    amount: float
+    currency: str
+    scale: float
+    span: Tuple[int, int]
+    text: str
+
+
+def _parse_number(number: str, latin: bool) -> float:
+    """Parse digits with thousands / decimal separators."""
+    separators = [char for char in number if char in '.,']
+    if not separators:
+        return float(number)
+    if len(set(separators)) == 2:
+        # Both present: the last one is the decimal mark
+        decimal = separators[-1]
+    elif len(separators) > 1:
+        # The same separator repeated only groups thousands
+        return float(number.replace(separators[0], ''))
+    else:
+        separator = separators[0]
+        decimal_mark = ',' if latin else '.'
+        digits_after = len(number) - number.index(separator) - 1
+        decimal = separator if separator == decimal_mark or digits_after != 3 else None
+        if decimal is None:
+            return float(number.replace(separator, ''))
+    thousands = ',' if decimal == '.' else '.'
+    return float(number.replace(thousands, '').replace(decimal, '.'))
+
+
+def find_money_amounts(
+    text: str,
+    require_currency: bool = True,
+    fx_rates: Optional[Dict[str, float]] = None,
+    bare_context: Optional[Pattern] = None
+) -> List[MoneyAmount]:
+    """
+    Find every currency amount in ``text`` in one scan.
+
+    Args:
+        text: Text to scan
+        require_currency: Skip bare numbers; when False they are read as USD
+            (e.g. a Form D "Total Offering Amount" cell)
+        fx_rates: Currency -> USD rates (defaults to ``FX_TO_USD``)
+        bare_context: With ``require_currency``, still accept a bare amount
+            in millions or more (read as USD) when this pattern matches the
+            text just before it (e.g. ``FUNDING_CONTEXT``)
+
+    Returns:
+        Amounts in text order
+    """
+    fx_rates = fx_rates or FX_TO_USD
+    amounts = []
+    text = text or ''
+    for match in _MONEY.finditer(text):
+        start = match.start()
+        if start > 1 and text[start - 1] in '.,' and text[start - 2].isdigit():
+            continue  # tail of a longer number, e.g. "1.2.3"
+        prefix_match = _PREFIX.search(text, max(0, start - _PREFIX_WINDOW), start)
+        prefix = prefix_match.group(0).strip() if prefix_match else None
+        suffix, scale_word = match.group('suffix', 'scale')
+        bare = not (prefix or suffix or require_currency is False)
+        if bare and not (bare_context and match.group('scale')
+                         and bare_context.search(text, max(0, start - _CONTEXT_WINDOW), start)):
+            continue
+        if prefix_match:
+            start = prefix_match.start()
+
+        prefix_currency = _CURRENCIES.get(_SPACE.sub('', prefix.lower())) if prefix else None
+        suffix_currency = _CURRENCIES.get(_SPACE.sub(' ', suffix.lower())) if suffix else None
+        # A bare "$" also prefixes MXN amounts ("$5 millones MXN")
+        currency = suffix_currency if suffix_currency and prefix_currency in (None, 'USD') else prefix_currency
+        currency = currency or 'USD'
+
+        scale_key = _SPACE.sub(' ', scale_word.lower()) if scale_word else None
+        scale = SCALES.get(scale_key, 1.0) if scale_key else 1.0
+        latin = scale_key in _LATIN_SCALES or currency == 'BRL'
+        if bare and scale < 1e6:
+            continue
+        try:
+            amount = _parse_number(match.group('number'), latin) * scale
+        except ValueError:
+            continue
+
+        amounts.append(MoneyAmount(
+            usd=amount * fx_rates.get(currency, 1.0),
+            amount=amount,
+            currency=currency,
+            scale=scale,
+            span=(start, match.end()),
+            text=text[start:match.end()]
+        ))
+    return amounts
+
+
+def extract_funding_amount(text: str, fx_rates: Optional[Dict[str, float]] = None) -> Optional[MoneyAmount]:
+    """
+    First funding-sized amount in ``text``: stated in millions or more, or
+    at least ``FUNDING_MIN_USD``. Amounts without a currency count when they
+    follow a funding verb (``FUNDING_CONTEXT``) and are in millions or more.
+    """
+    for amount in find_money_amounts(text, fx_rates=fx_rates, bare_context=FUNDING_CONTEXT):
+        if amount.scale >= 1e6 or amount.usd >= FUNDING_MIN_USD:
+            return amount
+    return None
+
+
+def extract_labeled_amount(text: str, label: str) -> Optional[MoneyAmount]:
+    """
+    First amount on the same line after ``label`` (case-insensitive), with
+    or without a currency sign, e.g. Form D "Total Offering Amount".
+    """
+    match = re.search(re.escape(label), text or '', re.IGNORECASE)
+    if not match:
+        return None
+    start = match.end()
+    line_end = text.find('\n', start)
+    amounts = find_money_amounts(text[start:line_end if line_end != -1 else len(text)], require_currency=False)
+    if not amounts:
+        return None
+    first = amounts[0]
+    return replace(first, span=(first.span[0] + start, first.span[1] + start))
@@ -16,10 +16,15 @@ import json
 import re
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from pathlib import Path
 from collections import defaultdict
 
+try:
+    from text_document import Document, as_document
+except ImportError:
+    from src.text_document import Document, as_document
+
 try:
     from GoogleNews import GoogleNews
 except ImportError:
@@ -246,17 +251,17 @@ class OSINTLeadScorer:
         
         return None
     
-    def calculate_heuristic_score(self, text: str) -> Tuple[int, List[str], Dict]:
+    def calculate_heuristic_score(self, text: Union[str, Document]) -> Tuple[int, List[str], Dict]:
         """
         Calculate heuristic score based on keyword matching.
         
         Args:
-            text: Article text (title + description)
+            text: Article text (title + description), or a shared Document
         
         Returns:
             Tuple of (total_score, matched_signals, signal_details)
         """
-        text_lower = text.lower()
+        text_lower = as_document(text).lower
         total_score = 0
         matched_signals = []
         signal_details = defaultdict(list)
@@ -347,16 +352,16 @@ class OSINTLeadScorer:
             Scored lead dictionary
         """
         # Combine title and description for analysis
-        text = f"{article.get('title', '')} {article.get('description', '')}"
+        document = Document(f"{article.get('title', '')} {article.get('description', '')}")
         
         # Extract company name
         company_name = self.extract_company_name(article.get('title', ''))
         
         # Calculate heuristic score
-        heuristic_score, signals, signal_details = self.calculate_heuristic_score(text)
+        heuristic_score, signals, signal_details = self.calculate_heuristic_score(document)
         
         # Analyze sentiment
-        sentiment = self.analyze_sentiment(text)
+        sentiment = self.analyze_sentiment(document.text)
         
         # Adjust score based on sentiment
         sentiment_boost = int(sentiment.get('polarity', 0) * 20)
@@ -0,0 +1,212 @@
+"""
+Profiling - Opt-in CPU and Memory Profiles for Batch Scripts
+------------------------------------------------------------
+``@profiled('oracle_funding_detector')`` on a script's ``main()`` profiles
+the run when ``PULSE_PROFILE`` is set; otherwise ``main()`` is called
+directly (one environment lookup per run):
+
+- ``cpu``: cProfile for the whole run, written as ``*_cpu.pstats`` (load
+  with ``pstats``/snakeviz) plus ``*_cpu_top.txt`` (top functions by
+  cumulative time), and a wall-clock stack sampler for all threads written
+  as ``*_cpu.collapsed`` - one ``root;caller;callee count`` line per stack,
+  ready for flamegraph.pl or speedscope
+- ``mem``: tracemalloc from start to end of the run, written as
+  ``*_mem_top.txt`` (peak and the top allocation sites still alive at the
+  end) and ``*_mem.collapsed`` (allocation tracebacks weighted by bytes)
+
+``PULSE_PROFILE=cpu,mem`` (or ``all``) enables both. Artifacts go to
+``data/output/profiles/`` (``PULSE_PROFILE_DIR``); ``PULSE_PROFILE_INTERVAL_MS``
+sets the sampling interval, ``PULSE_PROFILE_TOP`` the number of entries in
+the top lists and ``PULSE_PROFILE_FRAMES`` the tracemalloc traceback depth.
+Artifacts are written however the run ends, including ``sys.exit``.
+"""
+
+import cProfile
+import functools
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ('cpu', 'mem')
+DEFAULT_PROFILE_DIR = Path(__file__).parent.parent / 'data' / 'output' / 'profiles'
+
+
+def parse_profile_modes(value: Optional[str]) -> Set[str]:
+    """
+    Parse a ``PULSE_PROFILE`` value ('cpu', 'mem', 'cpu,mem', 'all').
+
+    Raises:
+        ValueError: For an unknown mode
+    """
+    modes = {mode.strip().lower() for mode in (value or '').split(',') if mode.strip()}
+    if 'all' in modes:
+        return set(PROFILE_MODES)
+    unknown = modes - set(PROFILE_MODES)
+    if unknown:
+        raise ValueError(f"Unknown PULSE_PROFILE mode(s) {', '.join(sorted(unknown))} (expected cpu, mem or all)")
+    return modes
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Samples the stacks of all other threads every ``interval`` seconds into collapsed-stack counts."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='pulse-stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, f'thread-{ident}'))
+                self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def write_collapsed(self, path: Path) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class RunProfiler:
+    """Profiles one run in the given modes and writes its artifacts (see module docstring)."""
+
+    def __init__(self, run_name: str, modes: Set[str], output_dir: Optional[str] = None):
+        self.run_name = run_name
+        self.modes = modes
+        self.output_dir = Path(output_dir or os.environ.get('PULSE_PROFILE_DIR') or DEFAULT_PROFILE_DIR)
+        self.interval = int(os.environ.get('PULSE_PROFILE_INTERVAL_MS', 5)) / 1000
+        self.top = int(os.environ.get('PULSE_PROFILE_TOP', 30))
+        self.frames = int(os.environ.get('PULSE_PROFILE_FRAMES', 25))
+        self.artifacts: List[str] = []
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StackSampler] = None
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> 'RunProfiler':
+        if 'mem' in self.modes and not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracemalloc = True
+        if 'cpu' in self.modes:
+            self._sampler = StackSampler(self.interval)
+            self._sampler.start()
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        if self._profile is not None:
+            self._profile.disable()
+            self._sampler.stop()
+        snapshot = peak = None
+        if tracemalloc.is_tracing() and 'mem' in self.modes:
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        try:
+            self._write(snapshot, peak)
+        except Exception as e:
+            logger.warning(f"Could not write profile artifacts: {e}")
+        return False
+
+    def _path(self, suffix: str) -> Path:
+        path = self.output_dir / f"{self.run_name}_{self._timestamp}_{suffix}"
+        self.artifacts.append(str(path))
+        return path
+
+    def _write(self, snapshot, peak: Optional[int]) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if self._profile is not None:
+            self._profile.dump_stats(str(self._path('cpu.pstats')))
+            report = io.StringIO()
+            pstats.Stats(self._profile, stream=report).sort_stats('cumulative').print_stats(self.top)
+            self._path('cpu_top.txt').write_text(report.getvalue(), encoding='utf-8')
+            self._sampler.write_collapsed(self._path('cpu.collapsed'))
+        if snapshot is not None:
+            snapshot = snapshot.filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+            ))
+            self._path('mem_top.txt').write_text(self._memory_report(snapshot, peak), encoding='utf-8')
+            self._write_memory_stacks(snapshot, self._path('mem.collapsed'))
+        logger.info(f"🔬 Profile artifacts: {', '.join(self.artifacts)}")
+
+    def _memory_report(self, snapshot, peak: Optional[int]) -> str:
+        statistics = snapshot.statistics('lineno')
+        total = sum(stat.size for stat in statistics)
+        lines = [
+            f"Run: {self.run_name}",
+            f"Peak traced memory: {peak / 2**20:.1f} MiB" if peak is not None else "Peak traced memory: n/a",
+            f"Live at end: {total / 2**20:.1f} MiB in {sum(stat.count for stat in statistics)} blocks",
+            "",
+            f"Top {self.top} allocation sites (live at end):",
+        ]
+        for rank, stat in enumerate(statistics[:self.top], 1):
+            frame = stat.traceback[0]
+            lines.append(f"{rank:>3}. {stat.size / 1024:>10.1f} KiB {stat.count:>8} blocks  {frame.filename}:{frame.lineno}")
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _write_memory_stacks(snapshot, path: Path) -> None:
+        stacks: Dict[str, int] = Counter()
+        for stat in snapshot.statistics('traceback'):
+            # Tracebacks are most-recent-last, as collapsed stacks expect
+            labels = [f"{os.path.basename(frame.filename)}:{frame.lineno}" for frame in stat.traceback]
+            stacks[';'.join(labels)] += stat.size
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, size in stacks.most_common():
+                f.write(f"{stack} {size}\n")
+
+
+def profiled(run_name: str, output_dir: Optional[str] = None) -> Callable:
+    """
+    Decorator for a batch script's ``main()``: profile the run when
+    ``PULSE_PROFILE`` is set (read at call time), otherwise just call it.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            modes = os.environ.get('PULSE_PROFILE')
+            if not modes:
+                return func(*args, **kwargs)
+            with RunProfiler(run_name, parse_profile_modes(modes), output_dir):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,288 @@
+"""
+Company Resolution Index
+------------------------
+Persistent company -> website / LinkedIn URL index shared by the Oracle
+detector and the LinkedIn scraper.
+
+Every run used to repeat a full DuckDuckGo / Google round trip for company
+names it had already resolved. The index stores each resolution keyed by CIK
+and normalized company name, together with a confidence score and timestamp.
+"Not found" results are cached too, with a shorter TTL, so unknown companies
+are retried periodically instead of on every run.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+# Legal-entity suffixes stripped before comparing company names
+LEGAL_SUFFIXES = {
+    'inc', 'incorporated', 'llc', 'l l c', 'ltd', 'limited', 'corp',
+    'corporation', 'co', 'company', 'plc', 'lp', 'l p', 'llp', 'sa', 'srl',
+    'gmbh', 'ag', 'bv', 'pbc'
+}
+
+DEFAULT_INDEX_PATH = 'data/cache/company_resolution_index.json'
+
+
+def normalize_company_name(name: str) -> str:
+    """
+    Normalize a company name for index lookups.
+
+    Lowercases, strips punctuation and trailing legal suffixes so that
+    "Acme, Inc." and "ACME INC" map to the same key.
+    """
+    if not name:
+        return ''
+
+    text = name.lower().replace('&', ' and ')
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    tokens = text.split(' ')
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    # Handle split suffixes like "l l c" / "l p"
+    joined = ' '.join(tokens)
+    for suffix in ('l l c', 'l p'):
+        if joined.endswith(' ' + suffix):
+            joined = joined[:-len(suffix) - 1]
+
+    return joined.strip()
+
+
+def estimate_url_confidence(company_name: str, url: Optional[str]) -> float:
+    """
+    Estimate how likely a resolved URL belongs to the company (0.0-1.0).
+
+    Uses token overlap between the normalized company name and the URL's
+    domain/path, which is cheap and good enough to rank search results.
+    """
+    if not url:
+        return 0.0
+
+    parsed = urlparse(url if '://' in url else f'https://{url}')
+    haystack = f"{parsed.netloc} {parsed.path}".lower()
+    compact_haystack = re.sub(r'[^a-z0-9]', '', haystack)
+
+    tokens = [t for t in normalize_company_name(company_name).split() if len(t) > 2]
+    if not tokens:
+        return 0.5
+
+    compact_name = ''.join(tokens)
+    if compact_name and compact_name in compact_haystack:
+        return 0.95
+
+    matched = sum(1 for token in tokens if token in compact_haystack)
+    return round(0.3 + 0.6 * (matched / len(tokens)), 2)
+
+
+class CompanyResolutionIndex:
+    """
+    Persistent index of resolved company URLs with negative caching.
+
+    Entries are grouped by kind ('website', 'linkedin') and stored under
+    both ``cik:<cik>`` and ``name:<normalized name>`` keys, so a company is
+    found either by its SEC identifier or by name.
+    """
+
+    DEFAULT_TTL_DAYS = 90
+    NEGATIVE_TTL_DAYS = 7
+
+    def __init__(
+        self,
+        index_path: str = DEFAULT_INDEX_PATH,
+        ttl_days: int = DEFAULT_TTL_DAYS,
+        negative_ttl_days: int = NEGATIVE_TTL_DAYS
+    ):
+        """
+        Initialize the resolution index.
+
+        Args:
+            index_path: JSON file backing the index
+            ttl_days: Days a positive resolution stays valid
+            negative_ttl_days: Days a "not found" result stays valid
+        """
+        self.index_path = Path(index_path)
+        self.ttl = timedelta(days=ttl_days)
+        self.negative_ttl = timedelta(days=negative_ttl_days)
+
+        self._entries: Dict[str, Dict[str, Dict]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        self.stats = {'hits': 0, 'negative_hits': 0, 'misses': 0, 'expired': 0, 'recorded': 0}
+
+        self._entries = self._read_file()
+        logger.info(f"Resolution index loaded: {len(self._entries)} keys from {self.index_path}")
+
+    @staticmethod
+    def _normalize_cik(cik: Optional[str]) -> Optional[str]:
+        return (str(cik).lstrip('0') or '0') if cik else None
+
+    @classmethod
+    def _keys(cls, company_name: str, cik: Optional[str] = None):
+        keys = []
+        if cik:
+            keys.append(f"cik:{cls._normalize_cik(cik)}")
+        normalized = normalize_company_name(company_name)
+        if normalized:
+            keys.append(f"name:{normalized}")
+        return keys
+
+    def _is_fresh(self, entry: Dict, now: datetime) -> bool:
+        try:
+            resolved_at = datetime.fromisoformat(entry['resolved_at'])
+        except (KeyError, TypeError, ValueError):
+            return False
+        ttl = self.ttl if entry.get('url') else self.negative_ttl
+        return now - resolved_at < ttl
+
+    def lookup(self, kind: str, company_name: str, cik: Optional[str] = None) -> Optional[Dict]:
+        """
+        Look up a cached resolution.
+
+        Args:
+            kind: Resolution kind ('website' or 'linkedin')
+            company_name: Company name as filed/searched
+            cik: Optional SEC CIK
+
+        Returns:
+            The cached entry (``url`` is None for negative entries), or None
+            when the company is unknown or its entry has expired. With a
+            CIK, name matches recorded under a different CIK are ignored.
+        """
+        now = datetime.utcnow()
+        cik = self._normalize_cik(cik)
+        with self._lock:
+            for key in self._keys(company_name, cik):
+                entry = self._entries.get(key, {}).get(kind)
+                if not entry:
+                    continue
+                if cik and entry.get('cik') and entry['cik'] != cik:
+                    continue
+                if not self._is_fresh(entry, now):
+                    self.stats['expired'] += 1
+                    continue
+                if entry.get('url'):
+                    self.stats['hits'] += 1
+                else:
+                    self.stats['negative_hits'] += 1
+                return dict(entry)
+
+            self.stats['misses'] += 1
+        return None
+
+    def record(
+        self,
+        kind: str,
+        company_name: str,
+        url: Optional[str],
+        confidence: Optional[float] = None,
+        cik: Optional[str] = None,
+        source: Optional[str] = None
+    ) -> Dict:
+        """
+        Store a resolution result. ``url=None`` records a negative result.
+        """
+        if url and confidence is None:
+            confidence = estimate_url_confidence(company_name, url)
+
+        entry = {
+            'url': url or None,
+            'confidence': round(float(confidence or 0.0), 2),
+            'resolved_at': datetime.utcnow().isoformat(),
+            'company_name': company_name,
+            'cik': self._normalize_cik(cik),
+            'source': source
+        }
+
+        with self._lock:
+            for key in self._keys(company_name, cik):
+                self._entries.setdefault(key, {})[kind] = entry
+            self._dirty = True
+            self.stats['recorded'] += 1
+
+        return dict(entry)
+
+    def record_not_found(self, kind: str, company_name: str, cik: Optional[str] = None,
+                         source: Optional[str] = None) -> Dict:
+        """Store a negative ("not found") result with the short TTL."""
+        return self.record(kind, company_name, None, confidence=0.0, cik=cik, source=source)
+
+    def resolve(
+        self,
+        kind: str,
+        company_name: str,
+        resolver: Callable[[], Optional[str]],
+        cik: Optional[str] = None,
+        source: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Return the cached URL, or call ``resolver`` on a miss and cache its result.
+
+        Exceptions raised by ``resolver`` are not cached as negatives, so
+        transient network errors are retried next time.
+        """
+        cached = self.lookup(kind, company_name, cik)
+        if cached is not None:
+            return cached.get('url')
+
+        url = resolver()
+        self.record(kind, company_name, url, cik=cik, source=source)
+        return url
+
+    def _read_file(self) -> Dict[str, Dict[str, Dict]]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data.get('entries', {}) if isinstance(data, dict) else {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read resolution index {self.index_path}: {e}")
+            return {}
+
+    def save(self) -> None:
+        """
+        Persist the index atomically.
+
+        Entries written concurrently by another process are merged in, keeping
+        whichever resolution is newer.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+
+            merged = self._read_file()
+            for key, kinds in self._entries.items():
+                target = merged.setdefault(key, {})
+                for kind, entry in kinds.items():
+                    existing = target.get(kind)
+                    if not existing or existing.get('resolved_at', '') <= entry.get('resolved_at', ''):
+                        target[kind] = entry
+            self._entries = merged
+
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(self.index_path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'updated_at': datetime.utcnow().isoformat(), 'entries': merged}, f)
+            os.replace(tmp_path, self.index_path)
+            self._dirty = False
+
+        logger.info(f"Resolution index saved: {len(self._entries)} keys -> {self.index_path}")
+
+    def get_stats(self) -> Dict:
+        """Return lookup statistics including the hit rate."""
+        lookups = self.stats['hits'] + self.stats['negative_hits'] + self.stats['misses']
+        hit_rate = (self.stats['hits'] + self.stats['negative_hits']) / lookups if lookups else 0.0
+        return {**self.stats, 'lookups': lookups, 'hit_rate': round(hit_rate, 3)}
@@ -23,6 +23,11 @@ except ImportError:
         "pip install sec-edgar-downloader"
     )
 
+try:
+    from money_amounts import extract_labeled_amount
+except ImportError:
+    from src.money_amounts import extract_labeled_amount
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -233,14 +238,10 @@ class SECFormDScraper:
         if name_match:
             details["company_name"] = name_match.group(1).strip()
         
-        # Extract offering amount (simplified)
-        amount_match = re.search(r'Total Offering Amount.*?(\d[\d,]+)', content, re.IGNORECASE)
-        if amount_match:
-            amount_str = amount_match.group(1).replace(',', '')
-            try:
-                details["total_offering_amount"] = float(amount_str)
-            except ValueError:
-                pass
+        # Extract offering amount
+        amount = extract_labeled_amount(content, 'Total Offering Amount')
+        if amount:
+            details["total_offering_amount"] = amount.usd
         
         # Extract industry classification
         industry_match = re.search(r'STANDARD INDUSTRIAL CLASSIFICATION:.*?\[(\d+)\]', content)
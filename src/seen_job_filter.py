@@ -0,0 +1,275 @@
+"""
+Seen-Job Filter - Cross-Run Job Deduplication
+---------------------------------------------
+Persistent, scalable and rotating Bloom filter of job postings already
+ingested, so each scraper run only enriches and pushes new postings.
+
+- ``ScalableBloomFilter`` grows by adding larger slices with tighter error
+  rates when full, keeping the compound false-positive rate bounded
+- ``SeenJobFilter`` keeps two generations (current + previous) and rotates
+  every ``rotation_days``, so memory stays bounded while postings are
+  remembered for at least one full rotation period
+- Keys are LinkedIn job ids when available, otherwise canonical job URLs
+
+A false positive only means a genuinely new posting is skipped in one run;
+there are no false negatives, so nothing already stored is re-pushed.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FILTER_PATH = 'data/cache/seen_linkedin_jobs.json'
+
+
+class BloomFilter:
+    """
+    Fixed-capacity Bloom filter with double hashing.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / self.capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+    def estimated_fpr(self) -> float:
+        """False-positive rate at the current fill level."""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def to_dict(self) -> Dict:
+        return {
+            'capacity': self.capacity,
+            'error_rate': self.error_rate,
+            'count': self.count,
+            'bits': base64.b64encode(zlib.compress(bytes(self.bits))).decode('ascii')
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'BloomFilter':
+        bloom = cls(data['capacity'], data['error_rate'])
+        bloom.bits = bytearray(zlib.decompress(base64.b64decode(data['bits'])))
+        bloom.count = data['count']
+        return bloom
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that adds slices (x2 capacity, x0.5 error rate) when full.
+    """
+
+    GROWTH = 2
+    TIGHTENING = 0.5
+
+    def __init__(self, initial_capacity: int = 10000, error_rate: float = 0.001):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.slices: List[BloomFilter] = []
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in bloom for bloom in self.slices)
+
+    def __len__(self) -> int:
+        return sum(bloom.count for bloom in self.slices)
+
+    def add(self, key: str) -> bool:
+        """Add a key; returns False if it was (probably) already present."""
+        if key in self:
+            return False
+        if not self.slices or self.slices[-1].is_full:
+            n = len(self.slices)
+            # First slice gets error_rate * (1 - r) so the compound rate stays <= error_rate
+            self.slices.append(BloomFilter(
+                self.initial_capacity * self.GROWTH ** n,
+                self.error_rate * (1 - self.TIGHTENING) * self.TIGHTENING ** n
+            ))
+        self.slices[-1].add(key)
+        return True
+
+    def memory_bytes(self) -> int:
+        return sum(len(bloom.bits) for bloom in self.slices)
+
+    def estimated_fpr(self) -> float:
+        survive = 1.0
+        for bloom in self.slices:
+            survive *= 1 - bloom.estimated_fpr()
+        return 1 - survive
+
+    def to_dict(self) -> Dict:
+        return {
+            'initial_capacity': self.initial_capacity,
+            'error_rate': self.error_rate,
+            'slices': [bloom.to_dict() for bloom in self.slices]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ScalableBloomFilter':
+        scalable = cls(data['initial_capacity'], data['error_rate'])
+        scalable.slices = [BloomFilter.from_dict(s) for s in data.get('slices', [])]
+        return scalable
+
+
+def job_key(job: Dict) -> Optional[str]:
+    """Stable key for a job posting (LinkedIn job id, else canonical URL)."""
+    job_id = job.get('job_id')
+    url = job.get('url') or job.get('job_url') or ''
+    if not job_id:
+        match = re.search(r'/jobs/view/(?:[^/?#]*-)?(\d+)', url)
+        job_id = match.group(1) if match else None
+    if job_id:
+        return f"linkedin:{job_id}"
+    if url:
+        parsed = urlparse(url)
+        return f"url:{parsed.netloc.lower()}{parsed.path.rstrip('/')}"
+    return None
+
+
+class SeenJobFilter:
+    """
+    Persistent two-generation Bloom filter of ingested job postings.
+    """
+
+    def __init__(
+        self,
+        filter_path: str = DEFAULT_FILTER_PATH,
+        rotation_days: int = 30,
+        initial_capacity: int = 10000,
+        error_rate: float = 0.001
+    ):
+        """
+        Load (or create) the filter.
+
+        Args:
+            filter_path: JSON file holding both generations
+            rotation_days: Age after which the current generation becomes
+                the previous one (postings are remembered 1-2 periods)
+            initial_capacity: Expected postings per generation
+            error_rate: Target false-positive rate per generation
+        """
+        self.filter_path = Path(filter_path)
+        self.rotation_days = rotation_days
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+
+        self.current = ScalableBloomFilter(initial_capacity, error_rate)
+        self.previous: Optional[ScalableBloomFilter] = None
+        self.current_started = datetime.utcnow()
+        self.stats = {'checked': 0, 'seen': 0, 'new': 0, 'unkeyed': 0}
+
+        self._load()
+        self._maybe_rotate()
+
+    def _load(self) -> None:
+        if not self.filter_path.exists():
+            return
+        try:
+            with open(self.filter_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.current = ScalableBloomFilter.from_dict(state['current'])
+            if state.get('previous'):
+                self.previous = ScalableBloomFilter.from_dict(state['previous'])
+            self.current_started = datetime.fromisoformat(state['current_started'])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not read seen-job filter {self.filter_path}: {e}")
+
+    def _maybe_rotate(self) -> None:
+        if datetime.utcnow() - self.current_started >= timedelta(days=self.rotation_days):
+            logger.info(f"Rotating seen-job filter ({len(self.current)} postings in retiring generation)")
+            self.previous = self.current
+            self.current = ScalableBloomFilter(self.initial_capacity, self.error_rate)
+            self.current_started = datetime.utcnow()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.current or (self.previous is not None and key in self.previous)
+
+    def filter_new(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Return postings not seen in previous runs (also deduped within the batch).
+
+        Postings without a job id or URL cannot be tracked and are passed
+        through (counted as ``unkeyed``). Postings are not marked as seen;
+        call ``mark_seen`` once they are stored.
+        """
+        new_jobs = []
+        batch_keys = set()
+        for job in jobs:
+            key = job_key(job)
+            if key is None:
+                self.stats['unkeyed'] += 1
+                new_jobs.append(job)
+                continue
+            if key in batch_keys:
+                continue
+            self.stats['checked'] += 1
+            if key in self:
+                self.stats['seen'] += 1
+                continue
+            batch_keys.add(key)
+            new_jobs.append(job)
+        self.stats['new'] += len(new_jobs)
+        return new_jobs
+
+    def mark_seen(self, jobs: List[Dict]) -> None:
+        """Record postings as ingested."""
+        for job in jobs:
+            key = job_key(job)
+            if key is not None and key not in self:
+                self.current.add(key)
+
+    def save(self) -> None:
+        """Persist both generations atomically."""
+        state = {
+            'current_started': self.current_started.isoformat(),
+            'current': self.current.to_dict(),
+            'previous': self.previous.to_dict() if self.previous else None
+        }
+        self.filter_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.filter_path.with_suffix(self.filter_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.filter_path)
+
+    def get_stats(self) -> Dict:
+        """Return run counters plus size, memory and false-positive estimates."""
+        generations = [g for g in (self.current, self.previous) if g is not None]
+        survive = 1.0
+        for generation in generations:
+            survive *= 1 - generation.estimated_fpr()
+        return {
+            **self.stats,
+            'postings': sum(len(g) for g in generations),
+            'memory_bytes': sum(g.memory_bytes() for g in generations),
+            'estimated_fpr': 1 - survive,
+            'generation_started': self.current_started.isoformat()
+        }
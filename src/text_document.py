@@ -0,0 +1,152 @@
+"""
+Text Document - Analyze-Once Text Shared by the Signal Detectors
+-----------------------------------------------------------------
+The same company text used to be lowercased, tokenized and scanned
+separately by every detector (Pulse Intelligence, the outsourcing intent
+classifier, the OSINT heuristic scorer, the regional entity recognizer and
+Oracle's website detectors). A ``Document`` is built once per text and
+passed to all of them:
+
+- ``text``: Unicode-normalized (NFC) text with runs of spaces/tabs
+  collapsed and line breaks kept, so line-bounded patterns behave as before
+- ``lower``: Lowercase view for substring and keyword checks
+- ``tokens`` / ``sentences``: ``(start, end)`` offsets into ``text``
+- ``words`` / ``word_set``: Lowercase token strings
+- ``feature(name, compute)``: Any other derived value, computed on first
+  use and cached on the document
+
+Every view is computed lazily, so a detector that only needs ``lower``
+never pays for tokenization. Detectors accept either a ``str`` or a
+``Document`` (see ``as_document``).
+"""
+
+import re
+import unicodedata
+from functools import cached_property
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple, Union
+
+_HORIZONTAL_SPACE = re.compile(r'[^\S\n]+')
+_LINE_BREAKS = re.compile(r'\s*\n\s*')
+_TOKEN = re.compile(r'\w+')
+_SENTENCE_END = re.compile(r'[.!?]+(?=\s|$)|\n+')
+
+
+def normalize_text(text: str) -> str:
+    """NFC-normalize, collapse spaces/tabs and blank lines, and strip."""
+    text = unicodedata.normalize('NFC', text or '')
+    text = _HORIZONTAL_SPACE.sub(' ', text)
+    return _LINE_BREAKS.sub('\n', text).strip()
+
+
+class Document:
+    """
+    One piece of text with lazily computed, cached views.
+
+    Attributes:
+        raw: Text as given
+        text: Normalized text; all offsets refer to it
+        lower: Lowercase ``text``
+        tokens: ``(start, end)`` of each word (``\\w+``)
+        words: Lowercase token strings
+        word_set: Distinct lowercase words
+        sentences: ``(start, end)`` of each sentence (split on ``.!?`` and
+            line breaks)
+    """
+
+    def __init__(self, text: str):
+        self.raw = text or ''
+        self.text = normalize_text(self.raw)
+        self._features: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        preview = self.text[:40] + ('...' if len(self.text) > 40 else '')
+        return f"Document({preview!r})"
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def tokens(self) -> List[Tuple[int, int]]:
+        return [match.span() for match in _TOKEN.finditer(self.text)]
+
+    @cached_property
+    def words(self) -> List[str]:
+        lower = self.lower
+        if len(lower) != len(self.text):
+            # A few characters change length when lowercased; re-tokenize
+            return _TOKEN.findall(lower)
+        return [lower[start:end] for start, end in self.tokens]
+
+    @cached_property
+    def word_set(self) -> FrozenSet[str]:
+        return frozenset(self.words)
+
+    @cached_property
+    def sentences(self) -> List[Tuple[int, int]]:
+        spans = []
+        start = 0
+        for match in _SENTENCE_END.finditer(self.text):
+            if self.text[start:match.end()].strip():
+                spans.append((start, match.end()))
+            start = match.end()
+        if self.text[start:].strip():
+            spans.append((start, len(self.text)))
+        return [self._strip_span(start, end) for start, end in spans]
+
+    def _strip_span(self, start: int, end: int) -> Tuple[int, int]:
+        while start < end and self.text[start].isspace():
+            start += 1
+        while end > start and self.text[end - 1].isspace():
+            end -= 1
+        return start, end
+
+    def sentence_texts(self) -> List[str]:
+        """Text of each sentence."""
+        return [self.text[start:end] for start, end in self.sentences]
+
+    def feature(self, name: str, compute: Callable[['Document'], Any]) -> Any:
+        """
+        Return a derived feature, computing and caching it on first use.
+
+        Args:
+            name: Cache key; detectors should namespace it (e.g. ``'pulse.tech'``)
+            compute: Called with this document when the feature is missing
+        """
+        if name not in self._features:
+            self._features[name] = compute(self)
+        return self._features[name]
+
+    def ngrams(self, max_n: int, min_length: int = 1) -> List[str]:
+        """
+        Word n-grams (1..max_n) over the lowercase words, cached.
+
+        Args:
+            max_n: Longest n-gram
+            min_length: Ignore words shorter than this (2 matches the
+                scikit-learn default token pattern)
+        """
+        def compute(document: 'Document') -> List[str]:
+            words = [word for word in document.words if len(word) >= min_length]
+            grams = list(words)
+            for n in range(2, max_n + 1):
+                grams.extend(' '.join(words[i:i + n]) for i in range(len(words) - n + 1))
+            return grams
+
+        return self.feature(f'ngrams:{max_n}:{min_length}', compute)
+
+
+def as_document(text: Union[str, Document, None]) -> Document:
+    """Return ``text`` itself if it is already a Document, else wrap it."""
+    # Checked by type of str rather than Document: this module can be loaded
+    # twice (as ``text_document`` and ``src.text_document``) depending on
+    # sys.path, and a Document from either copy should pass through
+    if text is None or isinstance(text, str):
+        return Document(text or '')
+    return text
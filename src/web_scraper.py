@@ -2,12 +2,17 @@
 
 import requests
 from bs4 import BeautifulSoup
-import time
 import re
 import logging
 from typing import Dict, Optional, List
 from urllib.parse import quote_plus
-import random
+
+try:
+    from resolution_index import CompanyResolutionIndex, DEFAULT_INDEX_PATH
+    from adaptive_throttle import AdaptiveThrottle
+except ImportError:
+    from src.resolution_index import CompanyResolutionIndex, DEFAULT_INDEX_PATH
+    from src.adaptive_throttle import AdaptiveThrottle
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -16,8 +21,17 @@ logger = logging.getLogger(__name__)
 class LinkedInScraper:
     """Scraper for LinkedIn company employee data"""
     
-    def __init__(self, delay_range: tuple = (2, 5)):
+    def __init__(self, delay_range: tuple = (2, 5), resolution_index: Optional[CompanyResolutionIndex] = None,
+                 throttle: Optional[AdaptiveThrottle] = None):
         self.delay_range = delay_range
+        self.resolution_index = resolution_index or CompanyResolutionIndex(DEFAULT_INDEX_PATH)
+        # Starts at the mean of delay_range, then adapts per host (AIMD) but
+        # never paces faster than the shortest configured delay
+        mean_delay = sum(delay_range) / 2
+        self.throttle = throttle or AdaptiveThrottle(
+            initial_rate=1 / mean_delay if mean_delay > 0 else 5.0,
+            max_rate=1 / delay_range[0] if delay_range[0] > 0 else 5.0
+        )
         self.session = requests.Session()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -25,38 +39,45 @@ class LinkedInScraper:
             'Accept-Language': 'en-US,en;q=0.5'
         }
     
-    def _random_delay(self):
-        time.sleep(random.uniform(*self.delay_range))
-    
     def search_company_linkedin(self, company_name: str, country: str = None) -> Optional[str]:
+        # The search is narrowed by country, so resolutions are cached per country
+        kind = f'linkedin:{country.strip().lower()}' if country else 'linkedin'
         try:
-            query = f'site:linkedin.com/company/{company_name} employees'
-            if country:
-                query += f' {country}'
-            
-            search_url = f'https://www.google.com/search?q={quote_plus(query)}'
-            self._random_delay()
-            response = self.session.get(search_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if 'linkedin.com/company/' in href and '/url?q=' in href:
-                    linkedin_url = href.split('/url?q=')[1].split('&')[0]
-                    if linkedin_url.startswith('http'):
-                        return linkedin_url
-            
-            return None
+            linkedin_url = self.resolution_index.resolve(
+                kind, company_name, lambda: self._google_company_linkedin(company_name, country),
+                source='google'
+            )
         except Exception as e:
             logger.error(f"Error searching: {e}")
             return None
+        
+        # Persist right away so single lookups are not lost (no-op on cache hits)
+        self.resolution_index.save()
+        return linkedin_url
+    
+    def _google_company_linkedin(self, company_name: str, country: str = None) -> Optional[str]:
+        query = f'site:linkedin.com/company/{company_name} employees'
+        if country:
+            query += f' {country}'
+        
+        search_url = f'https://www.google.com/search?q={quote_plus(query)}'
+        response = self.throttle.get(self.session, search_url, headers=self.headers, timeout=10)
+        response.raise_for_status()
+        
+        soup = BeautifulSoup(response.text, 'html.parser')
+        
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if 'linkedin.com/company/' in href and '/url?q=' in href:
+                linkedin_url = href.split('/url?q=')[1].split('&')[0]
+                if linkedin_url.startswith('http'):
+                    return linkedin_url
+        
+        return None
     
     def extract_employee_count(self, linkedin_url: str) -> Optional[int]:
         try:
-            self._random_delay()
-            response = self.session.get(linkedin_url, headers=self.headers, timeout=10)
+            response = self.throttle.get(self.session, linkedin_url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -0,0 +1,124 @@
+"""
+Tests for the AIMD adaptive throttle, including a simulation against a
+local HTTP server that rate-limits its clients
+"""
+
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import Mock
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.adaptive_throttle import AdaptiveThrottle, is_throttle_response
+
+
+class ThrottlingHandler(BaseHTTPRequestHandler):
+    """Allows ``capacity`` requests per second; answers 429 (or a CAPTCHA page) beyond that."""
+
+    capacity = 20
+    lock = threading.Lock()
+    window = [0.0, 0]
+    served = {'ok': 0, 'throttled': 0}
+
+    def do_GET(self):
+        with self.lock:
+            now = time.monotonic()
+            if now - self.window[0] >= 1.0:
+                self.window[0], self.window[1] = now, 0
+            self.window[1] += 1
+            allowed = self.window[1] <= self.capacity
+            self.served['ok' if allowed else 'throttled'] += 1
+        if allowed:
+            body, status = b'<html>results</html>', 200
+        elif self.path.startswith('/captcha'):
+            body, status = b'<html>Our systems have detected unusual traffic</html>', 200
+        else:
+            body, status = b'slow down', 429
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestAdaptiveThrottle(unittest.TestCase):
+
+    def setUp(self):
+        ThrottlingHandler.window[:] = [time.monotonic(), 0]
+        ThrottlingHandler.served.update(ok=0, throttled=0)
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), ThrottlingHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def simulate(self, path: str, seconds: float = 3.0, workers: int = 6) -> AdaptiveThrottle:
+        throttle = AdaptiveThrottle(initial_rate=10, max_rate=200, rate_increase=2.0, max_concurrency=6)
+        deadline = time.monotonic() + seconds
+
+        def worker():
+            session = requests.Session()
+            while time.monotonic() < deadline:
+                throttle.get(session, f'{self.base_url}{path}', timeout=5)
+
+        threads = [threading.Thread(target=worker) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return throttle
+
+    def assert_converges(self, throttle: AdaptiveThrottle):
+        stats = next(iter(throttle.get_stats().values()))
+        served = ThrottlingHandler.served
+        # Backs off when throttled...
+        self.assertGreater(stats['throttled'], 0)
+        self.assertLess(served['throttled'] / (served['ok'] + served['throttled']), 0.3)
+        # ...but still uses most of the server's capacity (20/s for 3s)
+        self.assertGreater(served['ok'], 0.6 * 20 * 3)
+
+    def test_converges_on_429_server(self):
+        self.assert_converges(self.simulate('/search'))
+
+    def test_converges_on_captcha_pages(self):
+        self.assert_converges(self.simulate('/captcha'))
+
+    def test_multiplicative_decrease_and_retry_after(self):
+        throttle = AdaptiveThrottle(initial_rate=2.0, initial_concurrency=4, max_concurrency=4)
+        throttle.record('google.com', throttled=True, retry_after=0.2)
+        stats = throttle.get_stats()['google.com']
+        self.assertEqual(stats['rate'], 1.0)
+        self.assertEqual(stats['concurrency'], 2)
+
+        started = time.monotonic()
+        with throttle.slot('google.com'):
+            pass
+        self.assertGreaterEqual(time.monotonic() - started, 0.15)
+
+    def test_slow_responses_hold_rate(self):
+        throttle = AdaptiveThrottle(initial_rate=1.0, rate_increase=0.5)
+        throttle.record('ddg', throttled=False, latency=0.1)
+        throttle.record('ddg', throttled=False, latency=1.0)
+        stats = throttle.get_stats()['ddg']
+        self.assertEqual(stats['rate'], 1.5)
+        self.assertEqual(stats['slow'], 1)
+
+    def test_is_throttle_response(self):
+        self.assertTrue(is_throttle_response(Mock(status_code=503, text='')))
+        self.assertTrue(is_throttle_response(Mock(status_code=200, text='<form id="captcha-form">')))
+        self.assertFalse(is_throttle_response(Mock(status_code=200, text='<div class="g">result</div>')))
+        self.assertFalse(is_throttle_response(Mock(status_code=404, text='')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests for the single-process async multi-region crawl
+"""
+
+import asyncio
+import csv
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from async_multi_region_crawler import StreamingDedupWriter, crawl_all_regions
+from cse_budget import QuotaLedger
+from multi_region_crawler import MultiRegionCrawler
+
+
+class TestAsyncCrawl(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.ledger = QuotaLedger(str(Path(self.tmp.name) / 'ledger.json'), daily_quota=8)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _crawler(self, region, boards):
+        crawler = MultiRegionCrawler('', '', region, ledger=self.ledger)
+        crawler.REGIONAL_JOB_BOARDS = {region: boards}
+
+        def fake_execute(query, country):
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                self.calls.append((region, query))
+            time.sleep(0.05)
+            with self.lock:
+                self.in_flight -= 1
+            return {'items': [{'title': 'Engineer', 'link': f'https://{country}.example/job'}]}
+
+        crawler.execute_cse_query = fake_execute
+        return crawler
+
+    def test_all_regions_stream_into_one_deduplicated_output(self):
+        crawlers = [
+            self._crawler('andean_region', {'peru': ['linkedin.com/jobs'], 'colombia': ['linkedin.com/jobs']}),
+            self._crawler('southern_cone', {'chile': ['linkedin.com/jobs', 'laborum.cl']}),
+        ]
+        companies = [{'company_name': 'Acme'}, {'company_name': 'Nimbus'}]
+        output = Path(self.tmp.name) / 'merged.csv'
+        writer = StreamingDedupWriter(str(output))
+
+        executed = asyncio.run(crawl_all_regions(
+            crawlers, companies, writer, concurrency=4, per_host=2, min_interval=0))
+        writer.close()
+
+        # Per-region quota: fair share of 8/day across 4 regions is 2 queries each
+        self.assertEqual(executed, {'andean_region': 2, 'southern_cone': 2})
+        self.assertEqual({region for region, _ in self.calls}, {'andean_region', 'southern_cone'})
+        # All CSE calls go to one host, so the per-host limit caps concurrency
+        self.assertEqual(self.max_in_flight, 2)
+
+        with open(output, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(len({(r['company_name'], r['country_code']) for r in rows}), 6)
+        self.assertEqual(rows[0]['job_urls'].count('|'), 0)
+
+    def test_ledger_updates_run_off_the_event_loop(self):
+        threads = []
+        for method in ('reserve', 'release'):
+            original = getattr(self.ledger, method)
+
+            def wrapped(*args, original=original):
+                threads.append(threading.current_thread())
+                return original(*args)
+
+            setattr(self.ledger, method, wrapped)
+        crawler = self._crawler('andean_region', {'peru': ['linkedin.com/jobs']})
+        writer = StreamingDedupWriter(str(Path(self.tmp.name) / 'out.csv'))
+
+        asyncio.run(crawl_all_regions([crawler], [{'company_name': 'Acme'}], writer, min_interval=0))
+        writer.close()
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_writer_skips_duplicates(self):
+        writer = StreamingDedupWriter(str(Path(self.tmp.name) / 'out.csv'))
+        row = {'company_name': 'Acme', 'country_code': 'PE', 'job_urls': ['a', 'b']}
+        self.assertTrue(writer.write(row))
+        self.assertFalse(writer.write(dict(row, company_name='acme ')))
+        writer.close()
+        self.assertEqual((writer.written, writer.duplicates), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Tests for ATS job-board adapters (recorded fixtures, no network)
+"""
+
+import json
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from src.ats_adapters import ATS_ADAPTERS, detect_ats, detect_ats_in_urls, fetch_board_roles
+from src.html_extraction import extract_page
+from pulse_intelligence import PulseIntelligenceEngine
+
+FIXTURES = Path(__file__).parent / 'fixtures' / 'ats'
+
+
+class FakeResponse:
+
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+
+class RecordedSession:
+    """Serves recorded fixtures by URL and records requested URLs."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requested = []
+
+    def get(self, url, timeout=None):
+        self.requested.append(url)
+        if url not in self.routes:
+            return FakeResponse('', status_code=404)
+        return FakeResponse((FIXTURES / self.routes[url]).read_text(encoding='utf-8'))
+
+
+class TestATSDetection(unittest.TestCase):
+
+    def test_board_urls(self):
+        cases = {
+            'https://boards.greenhouse.io/nimbuscloud': ('greenhouse', 'nimbuscloud'),
+            'https://boards.greenhouse.io/embed/job_board/js?for=nimbuscloud': ('greenhouse', 'nimbuscloud'),
+            'https://jobs.lever.co/quantumlabs/5c2b1a4e': ('lever', 'quantumlabs'),
+            'https://jobs.ashbyhq.com/orbital': ('ashby', 'orbital'),
+            'https://apply.workable.com/andes-robotics/': ('workable', 'andes-robotics'),
+        }
+        for url, expected in cases.items():
+            self.assertEqual(detect_ats(url), expected, url)
+        self.assertIsNone(detect_ats('https://nimbuscloud.io/careers'))
+
+    def test_recorded_payloads_are_normalized(self):
+        cases = [
+            ('greenhouse', 'greenhouse_jobs.json', 3, 'Senior Backend Engineer', '2025-12-02T14:00:00+00:00'),
+            ('lever', 'lever_postings.json', 2, 'Machine Learning Engineer', '2025-12-03T12:00:00+00:00'),
+            ('ashby', 'ashby_job_board.json', 1, 'Platform Engineer', '2025-12-01T14:22:31.845000+00:00'),
+            ('workable', 'workable_account.json', 2, 'Robotics Software Engineer', '2025-12-02T00:00:00+00:00'),
+        ]
+        for ats, fixture, count, title, posted in cases:
+            jobs = ATS_ADAPTERS[ats].parse(json.loads((FIXTURES / fixture).read_text()))
+            self.assertEqual(len(jobs), count, ats)
+            self.assertEqual(jobs[0]['title'], title)
+            self.assertEqual(jobs[0]['posted_date'], posted)
+            self.assertEqual(jobs[0]['ats'], ats)
+
+
+class TestFetchBoardRoles(unittest.TestCase):
+
+    def test_careers_page_embed_leads_to_board(self):
+        page = extract_page((FIXTURES / 'careers.html').read_bytes(), 'https://nimbuscloud.io/careers')
+        session = RecordedSession({
+            'https://boards-api.greenhouse.io/v1/boards/nimbuscloud/jobs': 'greenhouse_jobs.json',
+        })
+
+        detected = detect_ats_in_urls(page.urls())
+        result = fetch_board_roles(*detected, session=session)
+
+        self.assertEqual(detected, ('greenhouse', 'nimbuscloud'))
+        self.assertEqual(result['job_count'], 3)
+        self.assertEqual(len(session.requested), 1)
+
+    def test_unsupported_or_failing_board_returns_none(self):
+        self.assertIsNone(detect_ats_in_urls(['https://quiet.io/about', 'https://twitter.com/quiet']))
+        self.assertIsNone(fetch_board_roles('lever', 'gone', session=RecordedSession({})))
+
+    def test_jobs_feed_pulse_job_velocity(self):
+        jobs = ATS_ADAPTERS['greenhouse'].parse(
+            json.loads((FIXTURES / 'greenhouse_jobs.json').read_text()))
+        # Window reaching back to 2025-12-01: both December postings count
+        hours = int((datetime.now() - datetime(2025, 12, 1)).total_seconds() // 3600)
+
+        velocity = PulseIntelligenceEngine().detect_job_post_velocity(jobs, hours_window=hours)
+
+        self.assertEqual(velocity['posts_in_window'], 2)
+        self.assertEqual(velocity['recent_job_titles'], ['Senior Backend Engineer', 'Data Engineer'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Tests for the checkpoint journal used by resumable long runs
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from src.checkpoint_journal import CheckpointJournal, open_journal
+from multi_region_crawler import MultiRegionCrawler
+from cse_budget import QuotaLedger
+
+
+class TestCheckpointJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_completed_items_are_replayed_on_resume(self):
+        with CheckpointJournal('run_1', journal_dir=self.dir, fsync_every=2) as journal:
+            journal.set_meta(items=['a', 'b', 'c'])
+            journal.record('a', {'score': 1})
+            journal.record('b', {'score': 2})
+
+        resumed = CheckpointJournal('run_1', journal_dir=self.dir)
+        self.assertTrue(resumed.resumed)
+        self.assertEqual(resumed.meta['items'], ['a', 'b', 'c'])
+        self.assertTrue(resumed.is_completed('b'))
+        self.assertFalse(resumed.is_completed('c'))
+        self.assertEqual(resumed.get('a'), {'score': 1})
+        self.assertEqual(resumed.replayed, 1)
+        resumed.close()
+
+    def test_torn_last_line_is_ignored(self):
+        with CheckpointJournal('run_2', journal_dir=self.dir) as journal:
+            journal.record('a', 1)
+        with open(Path(self.dir) / 'run_2.jsonl', 'a') as f:
+            f.write('{"key": "b", "res')
+
+        resumed = CheckpointJournal('run_2', journal_dir=self.dir)
+        self.assertEqual(len(resumed), 1)
+        resumed.record('b', 2)
+        resumed.close()
+
+        self.assertEqual(len(CheckpointJournal('run_2', journal_dir=self.dir)), 2)
+
+    def test_open_journal_generates_run_id(self):
+        journal = open_journal('oracle', journal_dir=self.dir)
+        self.assertTrue(journal.run_id.startswith('oracle_'))
+        self.assertFalse(journal.resumed)
+        journal.close()
+
+
+class TestCrawlerResume(unittest.TestCase):
+
+    def test_resumed_crawl_skips_completed_companies(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            ledger = QuotaLedger(str(Path(tmp) / 'ledger.json'))
+            crawler = MultiRegionCrawler('', '', 'andean_region', ledger=ledger)
+            crawler.REGIONAL_JOB_BOARDS = {'andean_region': {'peru': ['linkedin.com/jobs']}}
+            queries = []
+
+            def fake_search(query, country):
+                queries.append(query)
+                return {'items': [{'link': 'https://example.com/job'}]}
+
+            crawler.search_google_cse = fake_search
+            companies = [{'company_name': 'Alpha'}, {'company_name': 'Beta'}]
+
+            # First run "dies" after Alpha: journal only Alpha
+            with CheckpointJournal('crawl', journal_dir=tmp) as journal:
+                crawler.scrape_region(companies[:1], journal=journal)
+            self.assertEqual(len(queries), 1)
+
+            with CheckpointJournal('crawl', journal_dir=tmp) as journal:
+                results = crawler.scrape_region(companies, journal=journal)
+
+            self.assertEqual(len(queries), 2)
+            self.assertEqual([r['company_name'] for r in results], ['Alpha', 'Beta'])
+            self.assertEqual(results[0]['job_count'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Tests for the value-aware Google CSE budget allocator
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from cse_budget import CSEBudgetAllocator, QuotaLedger, attribute_items
+from multi_region_crawler import MultiRegionCrawler
+
+
+def _query(names, country, board):
+    return f'site:{board} (' + ' OR '.join(f'"{n}"' for n in names) + f') "{country}"'
+
+
+class TestQuotaLedger(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.tmp.name) / 'ledger.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_regions_cannot_overspend_shared_quota(self):
+        ledger = QuotaLedger(self.path, daily_quota=100)
+        self.assertEqual(ledger.reserve('north_america', 40), 25)
+        # A second process sharing the ledger file sees the same usage
+        other = QuotaLedger(self.path, daily_quota=100)
+        self.assertEqual(other.reserve('north_america', 5), 0)
+        self.assertEqual(other.reserve('andean_region', 10), 10)
+        self.assertEqual(ledger.usage(), {'north_america': 25, 'andean_region': 10})
+
+    def test_finished_regions_leave_budget_to_others(self):
+        ledger = QuotaLedger(self.path, daily_quota=100)
+        granted = ledger.reserve('andean_region', 25)
+        ledger.release('andean_region', granted - 5)
+        self.assertEqual(ledger.reserve('southern_cone', 60), 45)
+
+    def test_board_yield_history_persists(self):
+        ledger = QuotaLedger(self.path)
+        ledger.record_yields({'linkedin.com/jobs': [2, 15]})
+        ledger.record_yields({'linkedin.com/jobs': [1, 5]})
+        self.assertEqual(QuotaLedger(self.path).board_yield(),
+                         {'linkedin.com/jobs': {'queries': 3, 'hits': 20}})
+
+
+class TestCSEBudgetAllocator(unittest.TestCase):
+
+    def test_high_value_companies_win_the_budget(self):
+        allocator = CSEBudgetAllocator({
+            'good-board.com': {'queries': 10, 'hits': 90},
+            'dead-board.com': {'queries': 10, 'hits': 0},
+        })
+        companies = [
+            {'company_name': 'Low', 'hiring_probability': 10, 'funding_amount': 0},
+            {'company_name': 'High', 'hiring_probability': 95, 'funding_amount': 50},
+        ]
+        candidates = allocator.rank_candidates(companies, {'peru': ['dead-board.com', 'good-board.com']})
+
+        self.assertEqual((candidates[0]['company']['company_name'], candidates[0]['job_board']),
+                         ('High', 'good-board.com'))
+        self.assertEqual(candidates[-1]['job_board'], 'dead-board.com')
+
+    def test_candidates_are_packed_into_or_queries(self):
+        allocator = CSEBudgetAllocator()
+        companies = [{'company_name': f'Company {i}', 'hiring_probability': 90 - i} for i in range(7)]
+        candidates = allocator.rank_candidates(companies, {'peru': ['board.pe']})
+
+        plan = allocator.pack(candidates, budget=10, build_query=_query)
+
+        self.assertEqual([len(q['companies']) for q in plan], [5, 2])
+        self.assertIn('"Company 0" OR "Company 1"', plan[0]['query'])
+
+        plan = allocator.pack(candidates, budget=1, build_query=_query)
+        self.assertEqual(len(plan), 1)
+
+    def test_query_word_limit_is_respected(self):
+        allocator = CSEBudgetAllocator()
+        companies = [{'company_name': 'Very Long Company Name Number %d Incorporated' % i} for i in range(4)]
+        plan = allocator.pack(allocator.rank_candidates(companies, {'peru': ['board.pe']}), 10, _query)
+        for planned in plan:
+            self.assertLessEqual(len(planned['query'].split()), allocator.MAX_QUERY_WORDS)
+        self.assertGreater(len(plan), 1)
+
+    def test_results_are_attributed_to_companies(self):
+        items = [
+            {'title': 'Backend Engineer - Nimbus Cloud', 'link': 'https://board.pe/job/1'},
+            {'title': 'Data Analyst', 'link': 'https://board.pe/orbital-labs/2'},
+            {'title': 'Unrelated', 'link': 'https://board.pe/job/3'},
+        ]
+        attributed = attribute_items(items, ['Nimbus Cloud', 'Orbital Labs'])
+        self.assertEqual(len(attributed['Nimbus Cloud']), 1)
+        self.assertEqual(len(attributed['Orbital Labs']), 1)
+
+
+class TestCrawlerBudget(unittest.TestCase):
+
+    def test_crawl_stays_within_granted_budget(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            ledger = QuotaLedger(str(Path(tmp) / 'ledger.json'), daily_quota=8)
+            crawler = MultiRegionCrawler('', '', 'andean_region', ledger=ledger)
+            crawler.REGIONAL_JOB_BOARDS = {'andean_region': {
+                'peru': ['linkedin.com/jobs', 'bumeran.com.pe'],
+                'colombia': ['linkedin.com/jobs', 'elempleo.com'],
+            }}
+            queries = []
+
+            def fake_search(query, country):
+                queries.append(query)
+                return {'items': [{'title': 'Acme 0 - Engineer', 'link': 'https://example.com/job'}]}
+
+            crawler.search_google_cse = fake_search
+            companies = [{'company_name': f'Acme {i}', 'hiring_probability': 50} for i in range(10)]
+
+            results = crawler.scrape_region(companies)
+
+            # 40 (company, country, board) candidates pack into 8 OR'd queries;
+            # the region's fair share of an 8/day quota is 2
+            self.assertEqual(len(queries), 2)
+            self.assertTrue(all(' OR ' in q for q in queries))
+            self.assertEqual(ledger.usage(), {'andean_region': 2})
+            self.assertIn('Acme 0', [r['company_name'] for r in results])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Tests for streaming, memory-bounded HTML extraction
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ats_adapters import detect_ats_in_urls
+from src.html_extraction import extract_page, fetch_page
+
+URL = 'https://www.nimbus.io/careers/'
+PAGE = """<!DOCTYPE html>
+<html><head>
+  <title>Careers at  Nimbus</title>
+  <meta name="description" content="Nimbus builds analytics.">
+  <style>.hiring { color: red }</style>
+</head><body>
+  <svg><text>python</text></svg>
+  <h1>We are hiring</h1>
+  <p>Join our <a href="/careers/backend">Backend</a> team.</p>
+  <ul><li><p>Remote-first</p></li></ul>
+  <!-- kubernetes -->
+  <script>var stack = "kubernetes react";</script>
+  <script src="https://boards.greenhouse.io/embed/job_board/js?for=nimbus"></script>
+  <iframe src="//jobs.lever.co/nimbus"></iframe>
+</body></html>
+"""
+
+
+class FakeResponse:
+
+    def __init__(self, body, status_code=200, content_type='text/html'):
+        self.body = body
+        self.status_code = status_code
+        self.headers = {'Content-Type': content_type}
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeSession:
+
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url, timeout=None, stream=False):
+        return self.response
+
+
+class TestExtractPage(unittest.TestCase):
+
+    def test_targeted_fields(self):
+        page = extract_page(PAGE, URL)
+
+        self.assertEqual(page.title, 'Careers at Nimbus')
+        self.assertEqual(page.description, 'Nimbus builds analytics.')
+        self.assertEqual(page.links, [('https://www.nimbus.io/careers/backend', 'Backend')])
+        self.assertEqual(page.paragraphs, ['Join our Backend team.', 'Remote-first'])
+        self.assertFalse(page.truncated)
+
+    def test_text_skips_code_and_counts_nested_text_once(self):
+        text = extract_page(PAGE, URL).text
+
+        self.assertEqual(text, 'careers at nimbus we are hiring join our backend team. remote-first')
+        for dropped in ('python', 'kubernetes', 'color'):
+            self.assertNotIn(dropped, text)
+
+    def test_keeps_embed_sources_for_ats_detection(self):
+        page = extract_page(PAGE, URL)
+
+        self.assertEqual(page.resource_urls, [
+            'https://boards.greenhouse.io/embed/job_board/js?for=nimbus',
+            'https://jobs.lever.co/nimbus',
+        ])
+        self.assertEqual(detect_ats_in_urls(page.urls()), ('greenhouse', 'nimbus'))
+
+    def test_byte_cap_truncates(self):
+        body = ('<html><body>' + '<p>hiring</p>' * 1000 + '</body></html>').encode('utf-8')
+        chunks = (body[start:start + 100] for start in range(0, len(body), 100))
+        page = extract_page(chunks, URL, max_bytes=1050)
+
+        self.assertTrue(page.truncated)
+        self.assertEqual(page.bytes_read, 1050)
+        self.assertLess(len(page.paragraphs), 100)
+
+    def test_charset_from_meta_and_default_utf8(self):
+        latin = '<html><head><meta charset="iso-8859-1"></head><body><p>São Paulo</p></body></html>'
+        self.assertEqual(extract_page([latin.encode('latin-1')], URL).paragraphs, ['São Paulo'])
+        utf8 = '<html><body><p>Bogotá</p></body></html>'
+        self.assertEqual(extract_page([utf8.encode('utf-8')], URL).paragraphs, ['Bogotá'])
+
+
+class TestFetchPage(unittest.TestCase):
+
+    def test_streams_html(self):
+        page = fetch_page(FakeSession(FakeResponse(PAGE.encode('utf-8'))), URL)
+        self.assertEqual(page.title, 'Careers at Nimbus')
+        self.assertEqual(page.bytes_read, len(PAGE.encode('utf-8')))
+
+    def test_skips_errors_and_non_html(self):
+        self.assertIsNone(fetch_page(FakeSession(FakeResponse(b'', status_code=404)), URL))
+        self.assertIsNone(fetch_page(FakeSession(FakeResponse(b'%PDF', content_type='application/pdf')), URL))
+
+
+if __name__ == '__main__':
+    unittest.main()
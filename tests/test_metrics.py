@@ -0,0 +1,151 @@
+"""
+Tests for the metrics registry, pipeline stage timing and the
+Prometheus / JSON outputs
+"""
+
+import json
+import sys
+import threading
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.metrics import (MetricsRegistry, current_stage, dump_json, stage, stage_summaries,
+                         with_metrics_dump)
+
+
+class TestRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = self.registry.histogram('latency_seconds', 'Latency.', ('route',), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, route='/a')
+
+        self.assertEqual(histogram.get(route='/a'),
+                         {'count': 4, 'sum': 3.65, 'buckets': {'0.1': 2, '1.0': 3, '+Inf': 4}})
+
+    def test_prometheus_text_format(self):
+        self.registry.counter('jobs_total', 'Jobs run.', ('kind',)).inc(2, kind='say "hi"\n')
+        self.registry.histogram('wait_seconds', 'Wait.', buckets=(1.0,)).observe(0.5)
+
+        text = self.registry.render_prometheus()
+        self.assertIn('# HELP jobs_total Jobs run.\n# TYPE jobs_total counter\n', text)
+        self.assertIn('jobs_total{kind="say \\"hi\\"\\n"} 2.0\n', text)
+        self.assertIn('wait_seconds_bucket{le="1.0"} 1\n', text)
+        self.assertIn('wait_seconds_bucket{le="+Inf"} 1\n', text)
+        self.assertIn('wait_seconds_sum 0.5\nwait_seconds_count 1\n', text)
+
+    def test_labels_and_kinds_are_checked(self):
+        counter = self.registry.counter('items_total', 'Items.', ('stage',))
+        self.assertIs(self.registry.counter('items_total', 'Items.', ('stage',)), counter)
+        with self.assertRaises(ValueError):
+            counter.inc(stage='a', extra='b')
+        with self.assertRaises(ValueError):
+            counter.inc(-1, stage='a')
+        with self.assertRaises(ValueError):
+            self.registry.histogram('items_total', 'Items.', ('stage',))
+
+    def test_concurrent_increments(self):
+        counter = self.registry.counter('hits_total', 'Hits.')
+        threads = [threading.Thread(target=lambda: [counter.inc() for _ in range(1000)]) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(counter.value(), 8000)
+
+
+class TestStages(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_context_manager_records_counts_and_duration(self):
+        with stage('fetch', self.registry) as run:
+            run.add_items(3)
+            run.add_bytes(1024)
+            run.cache_hit(3)
+            run.cache_miss()
+
+        summary = stage_summaries(self.registry)['fetch']
+        self.assertEqual(summary['runs'], 1)
+        self.assertEqual(summary['errors'], 0)
+        self.assertEqual((summary['items'], summary['bytes']), (3, 1024))
+        self.assertEqual(summary['cache_hit_rate'], 0.75)
+        self.assertAlmostEqual(summary['seconds'], run.duration, places=5)
+
+    def test_decorator_runs_are_separate_and_reach_current_stage(self):
+        @stage('score', self.registry)
+        def score(rows):
+            for _ in rows:
+                current_stage().add_items()
+            if not rows:
+                raise ValueError('empty')
+
+        score([1, 2])
+        score([3])
+        with self.assertRaises(ValueError):
+            score([])
+
+        summary = stage_summaries(self.registry)['score']
+        self.assertEqual((summary['runs'], summary['errors'], summary['items']), (3, 1, 3))
+
+    def test_nested_stage_restores_outer_stage(self):
+        with stage('outer', self.registry) as outer:
+            with stage('inner', self.registry):
+                current_stage().add_items()
+            self.assertIs(current_stage(), outer)
+            current_stage().add_items(2)
+
+        summaries = stage_summaries(self.registry)
+        self.assertEqual((summaries['outer']['items'], summaries['inner']['items']), (2, 1))
+
+    def test_short_lived_registries_each_get_their_own_families(self):
+        # Registries created and dropped in a loop often reuse the same id()
+        for _ in range(200):
+            registry = MetricsRegistry()
+            with stage('x', registry) as run:
+                run.add_items()
+            self.assertEqual(stage_summaries(registry)['x']['items'], 1)
+
+    def test_current_stage_outside_a_stage_discards_counts(self):
+        current_stage().add_items(5)
+        current_stage().add_bytes(10)
+        self.assertEqual(stage_summaries(self.registry), {})
+
+
+class TestJsonDump(unittest.TestCase):
+
+    def test_dump_contains_stage_summaries_and_series(self):
+        registry = MetricsRegistry()
+        with stage('push', registry) as run:
+            run.add_items(7)
+
+        with TemporaryDirectory() as tmp:
+            path = dump_json('pusher', tmp, registry)
+            data = json.loads(Path(path).read_text())
+
+        self.assertTrue(Path(path).name.startswith('pusher_metrics_'))
+        self.assertEqual(data['run'], 'pusher')
+        self.assertEqual(data['stages']['push']['items'], 7)
+        self.assertEqual(data['metrics']['pulse_stage_items_total']['series'],
+                         [{'labels': {'stage': 'push'}, 'value': 7.0}])
+
+    def test_main_wrapper_dumps_on_sys_exit(self):
+        with TemporaryDirectory() as tmp:
+            @with_metrics_dump('batch', tmp)
+            def main():
+                sys.exit(1)
+
+            with self.assertRaises(SystemExit):
+                main()
+            self.assertEqual(len(list(Path(tmp).glob('batch_metrics_*.json'))), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Tests for the shared single-scan money amount extractor (golden corpus)
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.money_amounts import extract_funding_amount, extract_labeled_amount, find_money_amounts
+
+GOLDEN = Path(__file__).parent / 'fixtures' / 'money' / 'golden_amounts.json'
+
+
+class TestGoldenCorpus(unittest.TestCase):
+
+    def test_golden_corpus(self):
+        for case in json.loads(GOLDEN.read_text(encoding='utf-8')):
+            with self.subTest(text=case['text']):
+                found = find_money_amounts(case['text'])
+                self.assertEqual([(amount.currency, amount.text) for amount in found],
+                                 [(amount['currency'], amount['text']) for amount in case['amounts']])
+                for amount, expected in zip(found, case['amounts']):
+                    self.assertAlmostEqual(amount.usd, expected['usd'], places=2)
+                    self.assertEqual(case['text'][slice(*amount.span)], amount.text)
+                if 'funding' in case:
+                    funding = extract_funding_amount(case['text'])
+                    expected = case['funding']
+                    self.assertEqual(funding and (funding.usd, funding.text),
+                                     expected and (expected['usd'], expected['text']))
+
+
+class TestFundingAmount(unittest.TestCase):
+
+    def test_skips_prices_and_salaries(self):
+        amount = extract_funding_amount('Plans from $29/month. Engineers earn $150k. We raised $0.5 million.')
+        self.assertEqual(amount.text, '$0.5 million')
+        self.assertIsNone(extract_funding_amount('Plans from $29/month and salaries up to $250k.'))
+
+    def test_custom_fx_rates(self):
+        amount = extract_funding_amount('R$ 10 milhões', fx_rates={'BRL': 0.2})
+        self.assertAlmostEqual(amount.usd, 2_000_000)
+
+    def test_labeled_amount_without_currency(self):
+        content = 'Industry: Technology\n<td>Total Offering Amount</td><td>2,500,000</td>\nTotal Amount Sold: $1,000,000'
+        amount = extract_labeled_amount(content, 'Total Offering Amount')
+        self.assertEqual(amount.usd, 2_500_000)
+        self.assertEqual(content[slice(*amount.span)], '2,500,000')
+        self.assertIsNone(extract_labeled_amount('Total Offering Amount: Indefinite\n$5,000', 'Total Offering Amount'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Tests for the bounded priority-frontier company site crawler
+"""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from oracle_site_crawler import CompanySiteCrawler, classify_link
+from src.html_extraction import extract_page
+
+HOME = 'https://www.nimbus.io/'
+HOMEPAGE = """
+<html><body>
+  <a href="/press">Press</a>
+  <a href="/blog/engineering">Engineering blog</a>
+  <a href="/about-us">About</a>
+  <a href="https://nimbus.io/jobs#top">Open positions</a>
+  <a href="/careers">Careers</a>
+  <a href="https://twitter.com/nimbus">Twitter careers</a>
+  <a href="/careers/benefits.pdf">Benefits</a>
+  <a href="mailto:jobs@nimbus.io">Email</a>
+  <a href="/pricing">Pricing</a>
+</body></html>
+"""
+PAGES = {
+    'https://www.nimbus.io/careers': '<html><body><h1>Join us</h1><a href="/careers/backend">Backend jobs</a>'
+                                     '<script src="https://boards.greenhouse.io/embed/job_board/js?for=nimbus"></script></body></html>',
+    'https://nimbus.io/jobs': '<html><body><p>We are hiring Python engineers</p></body></html>',
+    'https://www.nimbus.io/about-us': '<html><body><p>Nimbus builds analytics.</p></body></html>',
+    'https://www.nimbus.io/blog/engineering': '<html><body><p>How we run Kubernetes</p></body></html>',
+    'https://www.nimbus.io/press': '<html><body><p>Nimbus raises Series A</p></body></html>',
+    'https://www.nimbus.io/careers/backend': '<html><body><p>Backend engineer, Go</p></body></html>',
+}
+
+
+class FakeResponse:
+
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.content = text.encode('utf-8')
+        self.status_code = status_code
+        self.encoding = 'utf-8'
+        self.headers = {'Content-Type': 'text/html; charset=utf-8'}
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeSession:
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def get(self, url, timeout=None, stream=False):
+        with self.lock:
+            self.requested.append(url)
+        if url not in self.pages:
+            return FakeResponse('', status_code=404)
+        return FakeResponse(self.pages[url])
+
+
+def crawl(session, **kwargs):
+    is_enough = kwargs.pop('is_enough', None)
+    crawler = CompanySiteCrawler(session, **kwargs)
+    return crawler.crawl(extract_page(HOMEPAGE, HOME), is_enough=is_enough)
+
+
+class TestCompanySiteCrawler(unittest.TestCase):
+
+    def test_classify_link(self):
+        self.assertEqual(classify_link('https://a.com/careers', ''), 'careers')
+        self.assertEqual(classify_link('https://a.com/x', 'Open positions'), 'jobs')
+        self.assertEqual(classify_link('https://a.com/about-us', ''), 'about')
+        self.assertEqual(classify_link('https://a.com/newsroom', ''), 'press')
+        self.assertIsNone(classify_link('https://a.com/pricing', 'Pricing'))
+
+    def test_fetches_in_priority_order_within_page_budget(self):
+        session = FakeSession(PAGES)
+        result = crawl(session, max_pages=3, concurrency=1)
+
+        # Careers sub-pages found on the careers page outrank the jobs link
+        self.assertEqual(session.requested, [
+            'https://www.nimbus.io/careers',
+            'https://www.nimbus.io/careers/backend',
+            'https://nimbus.io/jobs',
+        ])
+        self.assertEqual([page['kind'] for page in result['pages']], ['home', 'careers', 'careers', 'jobs'])
+
+    def test_skips_off_site_assets_and_mail_links(self):
+        session = FakeSession(PAGES)
+        crawl(session, max_pages=20)
+
+        self.assertEqual(len(session.requested), len(PAGES))
+        self.assertFalse(any('twitter' in url or url.endswith('.pdf') for url in session.requested))
+
+    def test_byte_budget(self):
+        session = FakeSession(PAGES)
+        result = crawl(session, max_pages=20, concurrency=1, max_bytes=len(HOMEPAGE) + 150)
+
+        self.assertLess(len(session.requested), len(PAGES))
+        self.assertEqual(result['bytes'], len(HOMEPAGE) + 150)
+
+    def test_byte_budget_holds_across_a_batch(self):
+        session = FakeSession(PAGES)
+        result = crawl(session, max_pages=20, concurrency=3, max_bytes=len(HOMEPAGE) + 200)
+
+        self.assertLessEqual(result['bytes'], len(HOMEPAGE) + 200)
+        self.assertTrue(all(page['page'].bytes_read <= 66 for page in result['pages'][1:]))
+
+    def test_stops_early_once_enough_signal(self):
+        session = FakeSession(PAGES)
+        result = crawl(session, max_pages=20, concurrency=2,
+                       is_enough=lambda pages: {'careers', 'jobs'} <= {page['kind'] for page in pages})
+
+        self.assertTrue(result['stopped_early'])
+        self.assertEqual(len(session.requested), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
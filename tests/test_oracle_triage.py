@@ -0,0 +1,128 @@
+"""
+Tests for the Oracle pre-enrichment filing triage
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from oracle_triage import FilingTriage, SKIP, ENRICH, PRIORITY, form_d_primary_doc_url, parse_form_d_details
+
+SEC_FIXTURES = Path(__file__).parent / 'fixtures' / 'sec'
+
+
+class FixtureResponse:
+
+    def __init__(self, path: Path):
+        self.status_code = 200 if path.exists() else 404
+        self.content = path.read_bytes() if path.exists() else b''
+
+
+class FixtureSession:
+    """Serves ``primary_doc_<cik>.xml`` fixtures and records the requested URLs."""
+
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        cik = url.split('/edgar/data/')[1].split('/')[0]
+        return FixtureResponse(SEC_FIXTURES / f'primary_doc_{int(cik):010d}.xml')
+
+
+class TestFilingTriage(unittest.TestCase):
+
+    def setUp(self):
+        self.triage = FilingTriage()
+
+    def test_investment_vehicles_are_skipped(self):
+        for name in ['Blackstone Real Estate Partners X L.P.', 'Permian Oil & Gas Royalty LP',
+                     'Acme Growth Fund II', 'Sunbelt Apartments REIT']:
+            decision, reasons = self.triage.classify({'company_name': name})
+            self.assertEqual(decision, SKIP, name)
+            self.assertTrue(reasons[0].startswith('name:'))
+
+    def test_feed_fields_drive_decisions(self):
+        decision, reasons = self.triage.classify(
+            {'company_name': 'Acme Inc', 'industry_group': 'Pooled Investment Fund'})
+        self.assertEqual((decision, reasons), (SKIP, ['industry:pooled investment fund']))
+
+        decision, _ = self.triage.classify(
+            {'company_name': 'Acme Inc', 'issuer_type': 'Limited Partnership'})
+        self.assertEqual(decision, SKIP)
+
+        decision, _ = self.triage.classify(
+            {'company_name': 'Acme Inc', 'industry_group': 'Other Technology', 'offering_amount': '12,000,000'})
+        self.assertEqual(decision, PRIORITY)
+
+    def test_tech_names_override_name_skips(self):
+        self.assertEqual(self.triage.classify({'company_name': 'Fund Software Labs Inc'})[0], PRIORITY)
+        self.assertEqual(self.triage.classify({'company_name': 'Acme Corp'})[0], ENRICH)
+        self.assertEqual(self.triage.classify({'company_name': 'Acme Capital Holdings'})[0], SKIP)
+
+    def test_rules_are_configurable(self):
+        triage = FilingTriage({'skip_name_patterns': [r'\bacme\b']})
+        self.assertEqual(triage.classify({'company_name': 'Acme Corp'})[0], SKIP)
+        self.assertEqual(triage.classify({'company_name': 'Growth Fund I'})[0], ENRICH)
+
+    def test_report_counts_enrichments_avoided(self):
+        filings = [
+            {'company_name': 'Acme Corp'},
+            {'company_name': 'Nimbus Cloud Analytics Inc'},
+            {'company_name': 'Harbor Realty Fund LP'},
+            {'company_name': 'Delta Minerals LLC'},
+        ]
+        to_enrich, report = self.triage.triage_filings(filings)
+
+        self.assertEqual([f['company_name'] for f in to_enrich],
+                         ['Nimbus Cloud Analytics Inc', 'Acme Corp'])
+        self.assertEqual(report['enrichments_avoided'], 2)
+        self.assertEqual(report['avoided_pct'], 50.0)
+        self.assertEqual(report['skip_reasons'], {'name': 2})
+
+
+
+class TestFormDDetails(unittest.TestCase):
+
+    def test_parse_primary_doc(self):
+        details = parse_form_d_details((SEC_FIXTURES / 'primary_doc_0001987002.xml').read_bytes())
+        self.assertEqual(details, {'industry_group': 'Pooled Investment Fund',
+                                   'issuer_type': 'Limited Liability Company',
+                                   'offering_amount': 'Indefinite', 'amount_raised': '40000000'})
+        self.assertEqual(parse_form_d_details('<not xml'), {})
+
+    def test_primary_doc_url(self):
+        self.assertEqual(form_d_primary_doc_url({'cik': '0001987001', 'accession_number': '0001987001-25-000004'}),
+                         'https://www.sec.gov/Archives/edgar/data/1987001/000198700125000004/primary_doc.xml')
+        self.assertIsNone(form_d_primary_doc_url({'cik': '', 'accession_number': ''}))
+
+    def test_triage_on_fetched_feed_filings(self):
+        from oracle_funding_detector import OracleFundingDetector
+
+        # Only the feed and Form D lookups are exercised; skip the NLTK/network setup of __init__
+        detector = OracleFundingDetector.__new__(OracleFundingDetector)
+        detector.SEC_RSS_FEEDS = {'recent': str(SEC_FIXTURES / 'getcurrent_form_d.atom')}
+        detector.triage = FilingTriage()
+        detector.session = FixtureSession()
+
+        filings = detector.fetch_sec_filings(max_retries=1)
+        self.assertEqual(set(filings[0]), {'company_name', 'filing_date', 'filing_url', 'summary', 'cik',
+                                           'accession_number'})
+        # On feed fields alone only the name rules can act
+        self.assertEqual([detector.triage.classify(dict(f))[0] for f in filings], [ENRICH, ENRICH, ENRICH, SKIP])
+
+        detector._add_form_d_details(filings)
+        to_enrich, report = detector.triage.triage_filings(filings)
+
+        self.assertEqual(len(detector.session.urls), 3)  # the name-skipped fund is not fetched
+        self.assertEqual([f['company_name'] for f in to_enrich], ['Northwind Robotics Inc'])
+        self.assertEqual(to_enrich[0]['triage_decision'], PRIORITY)
+        self.assertIn('priority_industry:other technology', to_enrich[0]['triage_reasons'])
+        self.assertEqual(report['skip_reasons'], {'industry': 1, 'offering_below': 1, 'name': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
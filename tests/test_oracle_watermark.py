@@ -0,0 +1,90 @@
+"""
+Tests for incremental Oracle runs (seen-filing watermark)
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from oracle_watermark import FilingWatermark, merge_cumulative_results
+
+
+def _filing(cik, accession, date):
+    return {
+        'company_name': f'Company {cik}',
+        'cik': cik,
+        'accession_number': accession,
+        'filing_date': date,
+        'filing_url': f'https://www.sec.gov/Archives/edgar/data/{cik}/{accession}-index.htm'
+    }
+
+
+class TestFilingWatermark(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.state_path = Path(self.tmp.name) / 'state' / 'watermark.json'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_second_run_only_sees_new_filings(self):
+        day1 = [
+            _filing('111', '0000000111-25-000001', '2025-12-01T10:00:00-05:00'),
+            _filing('222', '0000000222-25-000001', '2025-12-01T11:00:00-05:00'),
+        ]
+        watermark = FilingWatermark(str(self.state_path))
+        self.assertEqual(len(watermark.filter_new(day1)), 2)
+        watermark.mark_processed(day1)
+        watermark.save()
+
+        day2 = [_filing('333', '0000000333-25-000001', '2025-12-02T09:00:00-05:00')] + day1
+        reloaded = FilingWatermark(str(self.state_path))
+        new = reloaded.filter_new(day2)
+        self.assertEqual([f['cik'] for f in new], ['333'])
+        self.assertEqual(reloaded.last_accession, '0000000222-25-000001')
+        self.assertEqual(reloaded.runs, 1)
+
+    def test_leading_zeros_in_cik_are_ignored(self):
+        watermark = FilingWatermark(str(self.state_path))
+        watermark.mark_processed([_filing('0000111', 'acc-1', '2025-12-01')])
+        self.assertTrue(watermark.is_processed(_filing('111', 'acc-1', '2025-12-01')))
+
+    def test_processed_set_is_bounded(self):
+        watermark = FilingWatermark(str(self.state_path))
+        watermark.MAX_PROCESSED_KEYS = 3
+        watermark.mark_processed([_filing(str(i), f'acc-{i}', '2025-12-01') for i in range(5)])
+        self.assertEqual(len(watermark), 3)
+        self.assertFalse(watermark.is_processed(_filing('0', 'acc-0', '2025-12-01')))
+        self.assertTrue(watermark.is_processed(_filing('4', 'acc-4', '2025-12-01')))
+
+
+class TestCumulativeStore(unittest.TestCase):
+
+    def test_merge_replaces_rescored_filings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = str(Path(tmp) / 'oracle_cumulative.csv')
+            first = pd.DataFrame([
+                {'CIK': '111', 'Filing URL': 'u1', 'Hiring Probability (%)': 40.0},
+                {'CIK': '222', 'Filing URL': 'u2', 'Hiring Probability (%)': 60.0},
+            ])
+            merge_cumulative_results(first, store)
+
+            second = pd.DataFrame([
+                {'CIK': '111', 'Filing URL': 'u1', 'Hiring Probability (%)': 80.0},
+                {'CIK': '333', 'Filing URL': 'u3', 'Hiring Probability (%)': 10.0},
+            ])
+            merged = merge_cumulative_results(second, store)
+
+            self.assertEqual(len(merged), 3)
+            self.assertEqual(list(merged['CIK']), ['111', '222', '333'])
+            self.assertEqual(merged.iloc[0]['Hiring Probability (%)'], 80.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests for the opt-in batch-script profiler (PULSE_PROFILE)
+"""
+
+import os
+import pstats
+import sys
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.profiling import parse_profile_modes, profiled
+
+
+def busy_loop(seconds: float) -> int:
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+KEPT = []
+
+
+def allocate_blocks() -> None:
+    KEPT.append([bytearray(1024) for _ in range(2000)])
+
+
+class TestProfiled(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.output = Path(self.tmp.name)
+
+    def run_main(self, mode, main):
+        with patch.dict(os.environ, {'PULSE_PROFILE': mode}):
+            return profiled('batch', str(self.output))(main)()
+
+    def artifacts(self):
+        return sorted(path.name.split('_', 3)[-1] for path in self.output.iterdir())
+
+    def test_disabled_runs_main_without_artifacts(self):
+        self.assertEqual(self.run_main('', lambda: 42), 42)
+        self.assertEqual(list(self.output.iterdir()), [])
+
+    def test_cpu_profile_writes_pstats_top_and_collapsed_stacks(self):
+        self.run_main('cpu', lambda: busy_loop(0.2))
+
+        self.assertEqual(self.artifacts(), ['cpu.collapsed', 'cpu.pstats', 'cpu_top.txt'])
+        stats = pstats.Stats(str(next(self.output.glob('*_cpu.pstats'))))
+        self.assertTrue(any(name == 'busy_loop' for (_, _, name) in stats.stats))
+
+        lines = next(self.output.glob('*_cpu.collapsed')).read_text().splitlines()
+        stack, count = lines[0].rsplit(' ', 1)
+        self.assertTrue(stack.startswith('MainThread;'))
+        self.assertIn('busy_loop (test_profiling.py:', stack)
+        self.assertGreater(int(count), 5)
+
+    def test_mem_profile_reports_top_allocation_sites(self):
+        self.run_main('mem', allocate_blocks)
+
+        self.assertEqual(self.artifacts(), ['mem.collapsed', 'mem_top.txt'])
+        report = next(self.output.glob('*_mem_top.txt')).read_text()
+        self.assertIn('Peak traced memory:', report)
+        top_site = report.split('allocation sites (live at end):\n')[1].splitlines()[0]
+        self.assertIn('test_profiling.py:', top_site)
+
+        stacks = next(self.output.glob('*_mem.collapsed')).read_text()
+        self.assertIn('test_profiling.py:', stacks.splitlines()[0])
+
+    def test_artifacts_written_on_sys_exit(self):
+        def main():
+            sys.exit(2)
+
+        with self.assertRaises(SystemExit):
+            self.run_main('all', main)
+        self.assertEqual(len(self.artifacts()), 5)
+
+    def test_parse_modes(self):
+        self.assertEqual(parse_profile_modes('CPU, mem'), {'cpu', 'mem'})
+        self.assertEqual(parse_profile_modes('all'), {'cpu', 'mem'})
+        self.assertEqual(parse_profile_modes(''), set())
+        with self.assertRaises(ValueError):
+            parse_profile_modes('gpu')
+
+
+if __name__ == '__main__':
+    unittest.main()
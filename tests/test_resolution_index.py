@@ -0,0 +1,153 @@
+"""
+Tests for the persistent company resolution index
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.resolution_index import (
+    CompanyResolutionIndex,
+    estimate_url_confidence,
+    normalize_company_name,
+)
+from src.web_scraper import LinkedInScraper
+
+
+class TestNormalization(unittest.TestCase):
+
+    def test_legal_suffixes_are_stripped(self):
+        self.assertEqual(normalize_company_name('Acme, Inc.'), 'acme')
+        self.assertEqual(normalize_company_name('ACME INC'), 'acme')
+        self.assertEqual(normalize_company_name('Acme Robotics L.L.C.'), 'acme robotics')
+
+    def test_confidence_prefers_matching_domain(self):
+        self.assertGreater(
+            estimate_url_confidence('Acme Robotics Inc', 'https://acmerobotics.com'),
+            estimate_url_confidence('Acme Robotics Inc', 'https://example.org')
+        )
+        self.assertEqual(estimate_url_confidence('Acme', None), 0.0)
+
+
+class TestCompanyResolutionIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'index.json'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lookup_by_cik_and_name_after_reload(self):
+        index = CompanyResolutionIndex(str(self.path))
+        index.record('website', 'Acme, Inc.', 'https://acme.com', cik='0001234')
+        index.save()
+
+        reloaded = CompanyResolutionIndex(str(self.path))
+        self.assertEqual(reloaded.lookup('website', 'Other Name', cik='1234')['url'], 'https://acme.com')
+        self.assertEqual(reloaded.lookup('website', 'ACME INC')['url'], 'https://acme.com')
+        self.assertIsNone(reloaded.lookup('linkedin', 'ACME INC'))
+
+    def test_name_match_under_another_cik_is_ignored(self):
+        index = CompanyResolutionIndex(str(self.path))
+        index.record('website', 'Acme, Inc.', 'https://acme.com', cik='1234')
+        index.record('linkedin', 'Acme, Inc.', 'https://www.linkedin.com/company/acme')
+
+        self.assertIsNone(index.lookup('website', 'Acme LLC', cik='5678'))
+        self.assertEqual(index.lookup('website', 'Acme LLC', cik='0001234')['url'], 'https://acme.com')
+        # Entries recorded without a CIK still match by name
+        self.assertEqual(index.lookup('linkedin', 'Acme LLC', cik='5678')['url'],
+                         'https://www.linkedin.com/company/acme')
+
+    def test_negative_results_use_shorter_ttl(self):
+        index = CompanyResolutionIndex(str(self.path), ttl_days=90, negative_ttl_days=7)
+        index.record_not_found('website', 'Ghost Fund LP')
+        index.record('website', 'Real Co', 'https://realco.com')
+
+        entry = index.lookup('website', 'Ghost Fund LP')
+        self.assertIsNotNone(entry)
+        self.assertIsNone(entry['url'])
+
+        # Age both entries by 10 days: the negative one expires, the positive stays
+        stale = (datetime.utcnow() - timedelta(days=10)).isoformat()
+        for kinds in index._entries.values():
+            kinds['website']['resolved_at'] = stale
+        self.assertIsNone(index.lookup('website', 'Ghost Fund LP'))
+        self.assertEqual(index.lookup('website', 'Real Co')['url'], 'https://realco.com')
+
+    def test_resolve_only_calls_resolver_on_miss(self):
+        index = CompanyResolutionIndex(str(self.path))
+        calls = []
+
+        def resolver():
+            calls.append(1)
+            return None
+
+        self.assertIsNone(index.resolve('website', 'Nowhere Corp', resolver))
+        self.assertIsNone(index.resolve('website', 'Nowhere Corp', resolver))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(index.get_stats()['negative_hits'], 1)
+
+    def test_save_merges_concurrent_writers(self):
+        first = CompanyResolutionIndex(str(self.path))
+        second = CompanyResolutionIndex(str(self.path))
+        first.record('website', 'Alpha', 'https://alpha.io')
+        second.record('website', 'Beta', 'https://beta.io')
+        first.save()
+        second.save()
+
+        with open(self.path) as f:
+            entries = json.load(f)['entries']
+        self.assertIn('name:alpha', entries)
+        self.assertIn('name:beta', entries)
+
+
+class TestLinkedInScraperUsesIndex(unittest.TestCase):
+
+    def test_search_is_skipped_for_known_companies(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            index = CompanyResolutionIndex(str(Path(tmp) / 'index.json'))
+            scraper = LinkedInScraper(delay_range=(0, 0), resolution_index=index)
+            calls = []
+
+            def fake_google(company_name, country=None):
+                calls.append(company_name)
+                return 'https://www.linkedin.com/company/acme'
+
+            scraper._google_company_linkedin = fake_google
+
+            self.assertEqual(scraper.search_company_linkedin('Acme'), 'https://www.linkedin.com/company/acme')
+            self.assertEqual(scraper.search_company_linkedin('Acme Inc'), 'https://www.linkedin.com/company/acme')
+            self.assertEqual(calls, ['Acme'])
+
+    def test_country_is_part_of_the_key_and_lookups_are_saved(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'index.json'
+            scraper = LinkedInScraper(delay_range=(0, 0), resolution_index=CompanyResolutionIndex(str(path)))
+            calls = []
+
+            def fake_google(company_name, country=None):
+                calls.append(country)
+                return 'https://www.linkedin.com/company/acme-mx' if country else None
+
+            scraper._google_company_linkedin = fake_google
+
+            self.assertIsNone(scraper.search_company_linkedin('Acme'))
+            self.assertEqual(scraper.search_company_linkedin('Acme', 'Mexico'), 'https://www.linkedin.com/company/acme-mx')
+            self.assertEqual(calls, [None, 'Mexico'])
+
+            # Each lookup was saved on its own, so a fresh scraper sees both
+            reloaded = LinkedInScraper(delay_range=(0, 0), resolution_index=CompanyResolutionIndex(str(path)))
+            reloaded._google_company_linkedin = fake_google
+            self.assertEqual(reloaded.search_company_linkedin('Acme', 'mexico'), 'https://www.linkedin.com/company/acme-mx')
+            self.assertIsNone(reloaded.search_company_linkedin('Acme'))
+            self.assertEqual(calls, [None, 'Mexico'])
+
+
+if __name__ == '__main__':
+    unittest.main()
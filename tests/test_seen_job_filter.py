@@ -0,0 +1,102 @@
+"""
+Tests for the cross-run seen-job Bloom filter
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.seen_job_filter import ScalableBloomFilter, SeenJobFilter, job_key
+
+
+def make_job(job_id):
+    return {'job_id': str(job_id), 'url': f'https://www.linkedin.com/jobs/view/{job_id}', 'title': f'Job {job_id}'}
+
+
+class TestSeenJobFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / 'seen.json'
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_job_key_prefers_linkedin_id(self):
+        self.assertEqual(job_key({'url': 'https://br.linkedin.com/jobs/view/python-dev-at-acme-3812345678?trk=x'}),
+                         'linkedin:3812345678')
+        self.assertEqual(job_key(make_job(42)), 'linkedin:42')
+        self.assertEqual(job_key({'url': 'https://boards.greenhouse.io/acme/jobs/1/'}),
+                         'url:boards.greenhouse.io/acme/jobs/1')
+        self.assertIsNone(job_key({'title': 'No url'}))
+
+    def test_scalable_filter_keeps_false_positive_rate_bounded(self):
+        bloom = ScalableBloomFilter(initial_capacity=500, error_rate=0.01)
+        for i in range(5000):
+            bloom.add(f'seen-{i}')
+
+        self.assertGreater(len(bloom.slices), 1)
+        self.assertTrue(all(f'seen-{i}' in bloom for i in range(5000)))
+        false_positives = sum(1 for i in range(20000) if f'other-{i}' in bloom)
+        self.assertLess(false_positives / 20000, 0.02)
+        self.assertLessEqual(bloom.estimated_fpr(), 0.01)
+
+    def test_only_new_postings_survive_across_runs(self):
+        first = SeenJobFilter(str(self.path))
+        batch = [make_job(i) for i in range(100)] + [make_job(5)]
+        new = first.filter_new(batch)
+        self.assertEqual(len(new), 100)
+        first.mark_seen(new)
+        first.save()
+
+        second = SeenJobFilter(str(self.path))
+        new = second.filter_new([make_job(i) for i in range(90, 120)])
+        self.assertEqual([job['job_id'] for job in new], [str(i) for i in range(100, 120)])
+        stats = second.get_stats()
+        self.assertEqual(stats['seen'], 10)
+        self.assertEqual(stats['postings'], 100)
+        self.assertGreater(stats['memory_bytes'], 0)
+
+    def test_unmarked_postings_are_retried(self):
+        seen = SeenJobFilter(str(self.path))
+        seen.filter_new([make_job(1)])
+        seen.save()
+
+        self.assertEqual(len(SeenJobFilter(str(self.path)).filter_new([make_job(1)])), 1)
+
+    def test_postings_without_key_pass_through(self):
+        seen = SeenJobFilter(str(self.path))
+        unkeyed = {'title': 'No id or url'}
+        new = seen.filter_new([make_job(1), unkeyed, dict(unkeyed)])
+
+        self.assertEqual(len(new), 3)
+        self.assertEqual(seen.get_stats()['unkeyed'], 2)
+        self.assertEqual(seen.get_stats()['new'], 3)
+
+    def test_rotation_forgets_after_two_periods(self):
+        seen = SeenJobFilter(str(self.path), rotation_days=30)
+        seen.mark_seen([make_job(1)])
+        seen.save()
+
+        def age_generation(days):
+            state = json.loads(self.path.read_text())
+            state['current_started'] = (datetime.utcnow() - timedelta(days=days)).isoformat()
+            self.path.write_text(json.dumps(state))
+
+        age_generation(31)
+        rotated = SeenJobFilter(str(self.path), rotation_days=30)
+        self.assertIsNotNone(rotated.previous)
+        self.assertEqual(rotated.filter_new([make_job(1)]), [])
+        rotated.save()
+
+        age_generation(31)
+        self.assertEqual(len(SeenJobFilter(str(self.path), rotation_days=30).filter_new([make_job(1)])), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Tests for consistent-hash company sharding and shard merging
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from src.sharding import ConsistentHashRing, filter_shard, parse_shard, shard_key, shard_suffix
+from merge_shards import merge_shard_outputs, MERGE_PRESETS
+
+
+class TestSharding(unittest.TestCase):
+
+    def setUp(self):
+        self.companies = [{'company_name': f'Company {i} Inc'} for i in range(2000)]
+
+    def test_parse_shard(self):
+        self.assertEqual(parse_shard('1/4'), (1, 4))
+        self.assertIsNone(parse_shard(None))
+        self.assertEqual(shard_suffix((1, 4)), '_shard1of4')
+        for bad in ('4/4', '-1/2', 'a/b', '3'):
+            with self.assertRaises(ValueError):
+                parse_shard(bad)
+
+    def test_shards_are_disjoint_complete_and_balanced(self):
+        shards = [filter_shard(self.companies, (i, 4), lambda c: c['company_name']) for i in range(4)]
+        names = [c['company_name'] for shard in shards for c in shard]
+
+        self.assertEqual(sorted(names), sorted(c['company_name'] for c in self.companies))
+        for shard in shards:
+            self.assertGreater(len(shard), 2000 / 4 * 0.75)
+            self.assertLess(len(shard), 2000 / 4 * 1.25)
+
+    def test_name_variants_share_a_shard(self):
+        ring = ConsistentHashRing(8)
+        self.assertEqual(ring.shard_for(shard_key('Acme, Inc.')), ring.shard_for(shard_key('ACME INC')))
+
+    def test_growing_the_ring_moves_few_keys(self):
+        keys = [shard_key(c['company_name']) for c in self.companies]
+        before = ConsistentHashRing(4)
+        after = ConsistentHashRing(5)
+        moved = sum(1 for key in keys if before.shard_for(key) != after.shard_for(key))
+        # Ideal is 1/5 of keys; modulo hashing would move ~4/5
+        self.assertLess(moved / len(keys), 0.35)
+
+
+class TestMergeShards(unittest.TestCase):
+
+    def test_merge_dedupes_and_orders_independently_of_shard_order(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            shard0 = Path(tmp) / 'oracle_shard0of2.csv'
+            shard1 = Path(tmp) / 'oracle_shard1of2.csv'
+            pd.DataFrame([
+                {'CIK': '0001', 'Filing URL': 'u1', 'Hiring Probability (%)': 50.0},
+                {'CIK': '0002', 'Filing URL': 'u2', 'Hiring Probability (%)': 70.0},
+            ]).to_csv(shard0, index=False)
+            pd.DataFrame([
+                {'CIK': '0003', 'Filing URL': 'u3', 'Hiring Probability (%)': 70.0},
+                {'CIK': '0001', 'Filing URL': 'u1', 'Hiring Probability (%)': 55.0},
+            ]).to_csv(shard1, index=False)
+
+            preset = MERGE_PRESETS['oracle']
+            merged = merge_shard_outputs([str(shard1), str(shard0)], preset['key'], preset['sort_by'])
+            again = merge_shard_outputs([str(shard0), str(shard1)], preset['key'], preset['sort_by'])
+
+            self.assertEqual(list(merged['CIK']), ['0002', '0003', '0001'])
+            self.assertEqual(merged.iloc[2]['Hiring Probability (%)'], 55.0)
+            pd.testing.assert_frame_equal(merged, again)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests for the shared analyze-once Document and the detectors that accept it
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+from sklearn.feature_extraction.text import CountVectorizer
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from src.text_document import Document, as_document
+from src.intent_classifier import OutsourcingIntentClassifier
+from src.osint_lead_scorer import OSINTLeadScorer
+from pulse_intelligence import PulseIntelligenceEngine
+from regional_nlp_recognizer import RegionalEntityRecognizer
+
+TEXT = """San Francisco-based Nimbus raised $40 million in a Series B funding round.
+The company is scaling  its remote-first, global team and opening office in Colombia.
+
+We announced our new CTO Jane Smith, who joined from Stripe! Stack: Python, React, AWS and Kubernetes."""
+
+
+class TestDocument(unittest.TestCase):
+
+    def test_normalizes_whitespace_but_keeps_lines(self):
+        document = Document('  Hello\t\tworld  \n\n\n Second   line ')
+        self.assertEqual(document.text, 'Hello world\nSecond line')
+        self.assertEqual(document.raw, '  Hello\t\tworld  \n\n\n Second   line ')
+
+    def test_views_share_offsets(self):
+        document = Document(TEXT)
+        self.assertEqual(document.words[:3], ['san', 'francisco', 'based'])
+        start, end = document.tokens[1]
+        self.assertEqual(document.text[start:end], 'Francisco')
+        self.assertIn('colombia', document.word_set)
+        self.assertEqual(document.sentence_texts()[0],
+                         'San Francisco-based Nimbus raised $40 million in a Series B funding round.')
+        self.assertEqual(len(document.sentences), 4)
+
+    def test_features_are_computed_once(self):
+        document = Document(TEXT)
+        calls = []
+        compute = lambda doc: calls.append(1) or len(doc.words)
+        self.assertEqual(document.feature('count', compute), document.feature('count', compute))
+        self.assertEqual(len(calls), 1)
+        self.assertIs(document.ngrams(3, min_length=2), document.ngrams(3, min_length=2))
+
+    def test_ngrams_match_sklearn_word_analyzer(self):
+        analyzer = CountVectorizer(ngram_range=(1, 3)).build_analyzer()
+        self.assertEqual(sorted(Document(TEXT).ngrams(3, min_length=2)), sorted(analyzer(TEXT)))
+
+    def test_as_document_passes_documents_through(self):
+        document = Document(TEXT)
+        self.assertIs(as_document(document), document)
+        self.assertEqual(as_document(None).text, '')
+
+
+class TestDetectorsAcceptDocument(unittest.TestCase):
+    """Every detector gives the same answer for a str and a shared Document."""
+
+    def test_pulse_intelligence(self):
+        engine = PulseIntelligenceEngine()
+        from_text = engine.calculate_pulse_score(True, TEXT)
+        from_document = engine.calculate_pulse_score(True, Document(TEXT))
+        for result in (from_text, from_document):
+            result.pop('timestamp')
+        self.assertEqual(from_text, from_document)
+        self.assertGreater(from_text['signals']['growth']['expansion_density'], 0)
+        self.assertTrue(from_text['signals']['hiring']['c_level_hires']['has_recent_executives'])
+
+    def test_shared_document_across_engines(self):
+        document = Document(TEXT)
+        intent = OutsourcingIntentClassifier(use_transformers=False).analyze_company_description(document)
+        score, signals, _ = OSINTLeadScorer(use_nltk=False).calculate_heuristic_score(document)
+        regional = RegionalEntityRecognizer().analyze_text(document, 'Nimbus')
+
+        self.assertEqual(intent, OutsourcingIntentClassifier(use_transformers=False).analyze_company_description(TEXT))
+        self.assertEqual(intent['text_length'], len(TEXT))
+        self.assertIn('remote-first', intent['signals']['remote_work'])
+        self.assertEqual((score, signals), OSINTLeadScorer(use_nltk=False).calculate_heuristic_score(TEXT)[:2])
+        self.assertEqual(regional, RegionalEntityRecognizer().analyze_text(TEXT, 'Nimbus'))
+        self.assertEqual(regional['latam_regions'], ['Colombia'])
+        self.assertTrue(regional['is_us_canada_company'])
+
+
+if __name__ == '__main__':
+    unittest.main()
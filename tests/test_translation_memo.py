@@ -0,0 +1,116 @@
+"""
+Tests for the persistent translation memo
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from translation_memo import TranslationMemo, detect_language, BATCH_SEPARATOR
+
+
+class FakeTranslator:
+    """Uppercases text and records every remote call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, language, text):
+        self.calls.append((language, text))
+        return text.upper()
+
+
+class TestDetectLanguage(unittest.TestCase):
+
+    def test_detects_job_board_languages(self):
+        self.assertEqual(detect_language('Senior Backend Engineer - we are hiring for our team'), 'en')
+        self.assertEqual(detect_language('Ofertas de empleo en Bogotá para desarrollador'), 'es')
+        self.assertEqual(detect_language('Vagas de emprego para desenvolvedor em São Paulo'), 'pt')
+        self.assertEqual(detect_language('12345'), 'unknown')
+
+
+class TestTranslationMemo(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.tmp.name) / 'memo.json')
+        self.snippets = [
+            'Ofertas de empleo en Lima',
+            'Senior Data Engineer at Acme - remote job',
+            'Vagas de emprego para desenvolvedor',
+            'Desarrollador backend con experiencia en Python',
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_english_is_skipped_and_misses_are_batched(self):
+        translator = FakeTranslator()
+        memo = TranslationMemo(self.path, translate_fn=translator)
+
+        result = memo.translate_many(self.snippets)
+
+        self.assertEqual(result[1], self.snippets[1])
+        self.assertEqual(result[0], 'OFERTAS DE EMPLEO EN LIMA')
+        self.assertEqual(result[2], 'VAGAS DE EMPREGO PARA DESENVOLVEDOR')
+        # One call for the two Spanish snippets, one for Portuguese
+        self.assertEqual(sorted(lang for lang, _ in translator.calls), ['es', 'pt'])
+        self.assertIn(BATCH_SEPARATOR, dict(translator.calls)['es'])
+        self.assertEqual(memo.get_stats()['english_skipped'], 1)
+
+    def test_rerun_is_served_from_persistent_memo(self):
+        memo = TranslationMemo(self.path, translate_fn=FakeTranslator())
+        first = memo.translate_many(self.snippets)
+        memo.save()
+
+        translator = FakeTranslator()
+        rerun = TranslationMemo(self.path, translate_fn=translator)
+        # Whitespace/case differences hit the same memo entry
+        second = rerun.translate_many(self.snippets[:1] + ['  ofertas de EMPLEO en lima '] + self.snippets[1:])
+
+        self.assertEqual(translator.calls, [])
+        self.assertEqual(second[0], first[0])
+        self.assertEqual(second[1], first[0])
+        stats = rerun.get_stats()
+        self.assertEqual(stats['memo_hits'], 4)
+        self.assertEqual(stats['local_rate'], 1.0)
+
+    def test_mangled_separator_falls_back_to_single_calls(self):
+        translator = FakeTranslator()
+        memo = TranslationMemo(self.path, translate_fn=lambda lang, text: translator(lang, text.replace('||', '')))
+
+        result = memo.translate_many([self.snippets[0], self.snippets[3]], source_language='es')
+
+        self.assertEqual(len(translator.calls), 3)
+        self.assertEqual(result[1], self.snippets[3].upper())
+
+    def test_failed_translation_returns_original(self):
+        def failing(language, text):
+            raise RuntimeError('quota exceeded')
+
+        memo = TranslationMemo(self.path, translate_fn=failing)
+        self.assertEqual(memo.translate('Ofertas de empleo en Lima'), 'Ofertas de empleo en Lima')
+        memo.save()
+        self.assertFalse(Path(self.path).exists())
+
+
+    def test_crawler_translates_through_the_memo(self):
+        from cse_budget import QuotaLedger
+        from multi_region_crawler import MultiRegionCrawler
+
+        crawler = MultiRegionCrawler('', '', 'andean_region',
+                                     ledger=QuotaLedger(str(Path(self.tmp.name) / 'ledger.json')))
+        translator = FakeTranslator()
+        crawler.translation_memo = TranslationMemo(self.path, translate_fn=translator)
+
+        self.assertEqual(crawler.translate_to_english(self.snippets[1]), self.snippets[1])
+        self.assertEqual(crawler.translate_to_english(self.snippets[0]), 'OFERTAS DE EMPLEO EN LIMA')
+        self.assertEqual(crawler.translate_to_english(self.snippets[0]), 'OFERTAS DE EMPLEO EN LIMA')
+        self.assertEqual(len(translator.calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()